@@ -2,19 +2,94 @@
 Authentication middleware to populate context state with user information
 """
 
+import hashlib
 import jwt
 import logging
 import os
 import time
 from types import SimpleNamespace
+from typing import Any, Dict, Optional
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 from fastmcp.server.dependencies import get_http_headers
 
-from auth.oauth21_session_store import ensure_session_from_access_token
+from auth.oauth21_session_store import ensure_session_from_access_token_async
+from core.cache import TTLCache
+from core.tracing import SPAN_KIND_SERVER, start_span
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Bearer-token verification cache. With an external provider, verify_token is a
+# remote tokeninfo round-trip; caching the result means a session pays it once
+# per token instead of once per tool call. Positive results live until the
+# token expires (capped at the TTL); rejected tokens are remembered briefly.
+TOKEN_CACHE_ENABLED = (
+    os.getenv("WORKSPACE_MCP_TOKEN_CACHE_ENABLED", "true").lower() != "false"
+)
+TOKEN_CACHE_TTL = float(os.getenv("WORKSPACE_MCP_TOKEN_CACHE_TTL", "300"))
+TOKEN_CACHE_NEGATIVE_TTL = float(
+    os.getenv("WORKSPACE_MCP_TOKEN_CACHE_NEGATIVE_TTL", "30")
+)
+TOKEN_CACHE_SIZE = int(os.getenv("WORKSPACE_MCP_TOKEN_CACHE_SIZE", "1024"))
+
+_REJECTED = object()
+_verification_cache = TTLCache(
+    maxsize=TOKEN_CACHE_SIZE, ttl=TOKEN_CACHE_TTL, name="token_verification"
+)
+
+
+def _token_cache_key(auth_provider: Any, token: str) -> tuple:
+    # Never keep raw tokens as cache keys
+    return (id(auth_provider), hashlib.sha256(token.encode("utf-8")).hexdigest())
+
+
+async def verify_token_cached(auth_provider: Any, token: str) -> Optional[Any]:
+    """
+    Verify a bearer token through the auth provider, caching the result.
+
+    Errors raised by the provider are not cached, so a transient tokeninfo
+    failure is retried on the next call.
+
+    Args:
+        auth_provider: Provider exposing an async verify_token(token)
+        token: The bearer token
+
+    Returns:
+        The verified access token, or None if the provider rejected it
+    """
+    if not TOKEN_CACHE_ENABLED:
+        return await auth_provider.verify_token(token)
+
+    key = _token_cache_key(auth_provider, token)
+    cached = _verification_cache.get(key)
+    if cached is _REJECTED:
+        return None
+    if cached is not None:
+        return cached
+
+    verified = await auth_provider.verify_token(token)
+    if verified is None:
+        _verification_cache.set(key, _REJECTED, ttl=TOKEN_CACHE_NEGATIVE_TTL)
+        return None
+
+    # Entries never outlive the token itself
+    expires_at = getattr(verified, "expires_at", None)
+    ttl = expires_at - time.time() if expires_at else None
+    _verification_cache.set(key, verified, ttl=ttl)
+    return verified
+
+
+def clear_token_verification_cache() -> None:
+    """Forget all cached token verifications."""
+    _verification_cache.clear()
+
+
+def get_token_verification_stats() -> Dict[str, Any]:
+    """Get hit/miss statistics for the token verification cache."""
+    stats = _verification_cache.get_stats()
+    stats["enabled"] = TOKEN_CACHE_ENABLED
+    return stats
+
 
 class AuthInfoMiddleware(Middleware):
     """
@@ -62,8 +137,8 @@ class AuthInfoMiddleware(Middleware):
                         if auth_provider:
                             try:
                                 # Verify the token
-                                verified_auth = await auth_provider.verify_token(
-                                    token_str
+                                verified_auth = await verify_token_cached(
+                                    auth_provider, token_str
                                 )
                                 if verified_auth:
                                     # Extract user info from verified token
@@ -107,7 +182,7 @@ class AuthInfoMiddleware(Middleware):
                                     mcp_session_id = getattr(
                                         context.fastmcp_context, "session_id", None
                                     )
-                                    ensure_session_from_access_token(
+                                    await ensure_session_from_access_token_async(
                                         verified_auth,
                                         user_email,
                                         mcp_session_id,
@@ -309,6 +384,7 @@ class AuthInfoMiddleware(Middleware):
                         store = get_oauth21_session_store()
 
                         # Check if user has a recent session
+                        await store.refresh_from_backend(user_email=requested_user)
                         if store.has_session(requested_user):
                             logger.debug(
                                 f"Using recent stdio session for {requested_user}"
@@ -365,6 +441,7 @@ class AuthInfoMiddleware(Middleware):
                         store = get_oauth21_session_store()
 
                         # Check if this MCP session is bound to a user
+                        await store.refresh_from_backend(session_id=mcp_session_id)
                         bound_user = store.get_user_by_mcp_session(mcp_session_id)
                         if bound_user:
                             logger.debug(f"MCP session bound to {bound_user}")
@@ -384,23 +461,37 @@ class AuthInfoMiddleware(Middleware):
         """Extract auth info from token and set in context state"""
         logger.debug("Processing tool call authentication")
 
-        try:
-            await self._process_request_for_auth(context)
-
-            logger.debug("Passing to next handler")
-            result = await call_next(context)
-            logger.debug("Handler completed")
-            return result
-
-        except Exception as e:
-            # Check if this is an authentication error - don't log traceback for these
-            if "GoogleAuthenticationError" in str(
-                type(e)
-            ) or "Access denied: Cannot retrieve credentials" in str(e):
-                logger.info(f"Authentication check failed: {e}")
-            else:
-                logger.error(f"Error in on_call_tool middleware: {e}", exc_info=True)
-            raise
+        tool_name = getattr(context.message, "name", None) or "unknown"
+        with start_span(
+            f"tools/call {tool_name}",
+            {"mcp.method.name": "tools/call", "mcp.tool.name": tool_name},
+            kind=SPAN_KIND_SERVER,
+            traceparent=get_http_headers().get("traceparent"),
+        ) as span:
+            try:
+                await self._process_request_for_auth(context)
+                if span and context.fastmcp_context:
+                    span.set_attribute(
+                        "mcp.auth.method",
+                        context.fastmcp_context.get_state("authenticated_via"),
+                    )
+
+                logger.debug("Passing to next handler")
+                result = await call_next(context)
+                logger.debug("Handler completed")
+                return result
+
+            except Exception as e:
+                # Check if this is an authentication error - don't log traceback for these
+                if "GoogleAuthenticationError" in str(
+                    type(e)
+                ) or "Access denied: Cannot retrieve credentials" in str(e):
+                    logger.info(f"Authentication check failed: {e}")
+                else:
+                    logger.error(
+                        f"Error in on_call_tool middleware: {e}", exc_info=True
+                    )
+                raise
 
     async def on_get_prompt(self, context: MiddlewareContext, call_next):
         """Extract auth info for prompt requests too"""
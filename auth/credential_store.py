@@ -5,14 +5,21 @@ This module provides a standardized interface for credential storage and retriev
 supporting multiple backends configurable via environment variables.
 """
 
+import argparse
 import os
 import json
 import logging
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Any, Dict, Iterable, Optional, List, Tuple
 from datetime import datetime
 from google.oauth2.credentials import Credentials
 
+
 logger = logging.getLogger(__name__)
 
 
@@ -69,6 +76,82 @@ class CredentialStore(ABC):
         """
         pass
 
+    def get_credentials_batch(
+        self, user_emails: Iterable[str]
+    ) -> Dict[str, Credentials]:
+        """
+        Get credentials for several users at once.
+
+        Args:
+            user_emails: User email addresses
+
+        Returns:
+            Mapping of user email to credentials for the users that were found
+        """
+        found = {}
+        for user_email in user_emails:
+            credentials = self.get_credential(user_email)
+            if credentials is not None:
+                found[user_email] = credentials
+        return found
+
+
+def _credentials_to_dict(credentials: Credentials) -> Dict[str, Any]:
+    return {
+        "token": credentials.token,
+        "refresh_token": credentials.refresh_token,
+        "token_uri": credentials.token_uri,
+        "client_id": credentials.client_id,
+        "client_secret": credentials.client_secret,
+        "scopes": credentials.scopes,
+        "expiry": credentials.expiry.isoformat() if credentials.expiry else None,
+    }
+
+
+def _credentials_from_dict(user_email: str, creds_data: Dict[str, Any]) -> Credentials:
+    # Parse expiry if present
+    expiry = None
+    if creds_data.get("expiry"):
+        try:
+            expiry = datetime.fromisoformat(creds_data["expiry"])
+            # Ensure timezone-naive datetime for Google auth library compatibility
+            if expiry.tzinfo is not None:
+                expiry = expiry.replace(tzinfo=None)
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Could not parse expiry time for {user_email}: {e}")
+
+    return Credentials(
+        token=creds_data.get("token"),
+        refresh_token=creds_data.get("refresh_token"),
+        token_uri=creds_data.get("token_uri"),
+        client_id=creds_data.get("client_id"),
+        client_secret=creds_data.get("client_secret"),
+        scopes=creds_data.get("scopes"),
+        expiry=expiry,
+    )
+
+
+def _file_signature(stat_result: os.stat_result) -> Tuple[int, int, int]:
+    return (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+
+
+def _default_credentials_dir() -> str:
+    if os.getenv("GOOGLE_MCP_CREDENTIALS_DIR"):
+        return os.getenv("GOOGLE_MCP_CREDENTIALS_DIR")
+    home_dir = os.path.expanduser("~")
+    if home_dir and home_dir != "~":
+        return os.path.join(home_dir, ".google_workspace_mcp", "credentials")
+    return os.path.join(os.getcwd(), ".credentials")
+
+
+def _default_credentials_db() -> str:
+    if os.getenv("GOOGLE_MCP_CREDENTIALS_DB"):
+        return os.getenv("GOOGLE_MCP_CREDENTIALS_DB")
+    home_dir = os.path.expanduser("~")
+    if home_dir and home_dir != "~":
+        return os.path.join(home_dir, ".google_workspace_mcp", "credentials.db")
+    return os.path.join(os.getcwd(), ".credentials.db")
+
 
 class LocalDirectoryCredentialStore(CredentialStore):
     """Credential store that uses local JSON files for storage."""
@@ -84,86 +167,92 @@ class LocalDirectoryCredentialStore(CredentialStore):
                      variable is not set.
         """
         if base_dir is None:
-            if os.getenv("GOOGLE_MCP_CREDENTIALS_DIR"):
-                base_dir = os.getenv("GOOGLE_MCP_CREDENTIALS_DIR")
-            else:
-                home_dir = os.path.expanduser("~")
-                if home_dir and home_dir != "~":
-                    base_dir = os.path.join(
-                        home_dir, ".google_workspace_mcp", "credentials"
-                    )
-                else:
-                    base_dir = os.path.join(os.getcwd(), ".credentials")
+            base_dir = _default_credentials_dir()
 
         self.base_dir = base_dir
+        self._dir_ready = False
+        # user_email -> (file signature, parsed JSON). A lookup costs one stat()
+        # while the file is unchanged; edits by other processes change the
+        # signature and are picked up on the next read.
+        self._cache: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
         logger.info(f"LocalJsonCredentialStore initialized with base_dir: {base_dir}")
 
     def _get_credential_path(self, user_email: str) -> str:
         """Get the file path for a user's credentials."""
-        if not os.path.exists(self.base_dir):
-            os.makedirs(self.base_dir)
-            logger.info(f"Created credentials directory: {self.base_dir}")
+        if not self._dir_ready:
+            if not os.path.exists(self.base_dir):
+                os.makedirs(self.base_dir, exist_ok=True)
+                logger.info(f"Created credentials directory: {self.base_dir}")
+            self._dir_ready = True
         return os.path.join(self.base_dir, f"{user_email}.json")
 
     def get_credential(self, user_email: str) -> Optional[Credentials]:
         """Get credentials from local JSON file."""
         creds_path = self._get_credential_path(user_email)
 
-        if not os.path.exists(creds_path):
+        try:
+            signature = _file_signature(os.stat(creds_path))
+        except FileNotFoundError:
+            with self._lock:
+                self._cache.pop(user_email, None)
             logger.debug(f"No credential file found for {user_email} at {creds_path}")
             return None
+        except OSError as e:
+            logger.error(f"Error reading credentials for {user_email}: {e}")
+            return None
 
-        try:
-            with open(creds_path, "r") as f:
-                creds_data = json.load(f)
-
-            # Parse expiry if present
-            expiry = None
-            if creds_data.get("expiry"):
-                try:
-                    expiry = datetime.fromisoformat(creds_data["expiry"])
-                    # Ensure timezone-naive datetime for Google auth library compatibility
-                    if expiry.tzinfo is not None:
-                        expiry = expiry.replace(tzinfo=None)
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"Could not parse expiry time for {user_email}: {e}")
-
-            credentials = Credentials(
-                token=creds_data.get("token"),
-                refresh_token=creds_data.get("refresh_token"),
-                token_uri=creds_data.get("token_uri"),
-                client_id=creds_data.get("client_id"),
-                client_secret=creds_data.get("client_secret"),
-                scopes=creds_data.get("scopes"),
-                expiry=expiry,
-            )
-
+        with self._lock:
+            cached = self._cache.get(user_email)
+            if cached is not None and cached[0] == signature:
+                self._hits += 1
+                creds_data = cached[1]
+            else:
+                self._misses += 1
+                creds_data = None
+
+        if creds_data is None:
+            try:
+                with open(creds_path, "r") as f:
+                    creds_data = json.load(f)
+                    signature = _file_signature(os.fstat(f.fileno()))
+            except (IOError, json.JSONDecodeError, KeyError) as e:
+                logger.error(
+                    f"Error loading credentials for {user_email} from {creds_path}: {e}"
+                )
+                return None
+            with self._lock:
+                self._cache[user_email] = (signature, creds_data)
             logger.debug(f"Loaded credentials for {user_email} from {creds_path}")
-            return credentials
 
-        except (IOError, json.JSONDecodeError, KeyError) as e:
-            logger.error(
-                f"Error loading credentials for {user_email} from {creds_path}: {e}"
-            )
-            return None
+        # A new object per call: callers refresh credentials in place
+        return _credentials_from_dict(user_email, creds_data)
 
     def store_credential(self, user_email: str, credentials: Credentials) -> bool:
-        """Store credentials to local JSON file."""
+        """Store credentials to local JSON file (atomically, readable by owner only)."""
         creds_path = self._get_credential_path(user_email)
+        creds_data = _credentials_to_dict(credentials)
 
-        creds_data = {
-            "token": credentials.token,
-            "refresh_token": credentials.refresh_token,
-            "token_uri": credentials.token_uri,
-            "client_id": credentials.client_id,
-            "client_secret": credentials.client_secret,
-            "scopes": credentials.scopes,
-            "expiry": credentials.expiry.isoformat() if credentials.expiry else None,
-        }
-
+        tmp_path = None
         try:
-            with open(creds_path, "w") as f:
+            # Write a sibling temp file and rename it into place so readers
+            # never see a partially written file
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.base_dir, prefix=f".{user_email}.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w") as f:
                 json.dump(creds_data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, creds_path)
+            tmp_path = None
+
+            signature = _file_signature(os.stat(creds_path))
+            with self._lock:
+                self._cache[user_email] = (signature, creds_data)
             logger.info(f"Stored credentials for {user_email} to {creds_path}")
             return True
         except IOError as e:
@@ -171,10 +260,18 @@ class LocalDirectoryCredentialStore(CredentialStore):
                 f"Error storing credentials for {user_email} to {creds_path}: {e}"
             )
             return False
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
 
     def delete_credential(self, user_email: str) -> bool:
         """Delete credential file for a user."""
         creds_path = self._get_credential_path(user_email)
+        with self._lock:
+            self._cache.pop(user_email, None)
 
         try:
             if os.path.exists(creds_path):
@@ -211,6 +308,212 @@ class LocalDirectoryCredentialStore(CredentialStore):
 
         return sorted(users)
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get statistics for the in-memory credential cache."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "cached_users": len(self._cache),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / total if total else 0.0,
+            }
+
+
+class SQLiteCredentialStore(CredentialStore):
+    """
+    Credential store backed by a single SQLite database.
+
+    Suited to deployments with many users: lookups go through the primary-key
+    index instead of one file per user, and list_users is a single query.
+    The database runs in WAL mode, so any number of readers (across threads
+    and worker processes) proceed while one writer commits.
+    """
+
+    # SQLite's default limit on host parameters is 999
+    _BATCH_SIZE = 500
+
+    def __init__(self, db_path: Optional[str] = None, timeout: float = 30.0):
+        """
+        Initialize the SQLite credential store.
+
+        Args:
+            db_path: Database file. If None, uses GOOGLE_MCP_CREDENTIALS_DB or
+                     defaults to ~/.google_workspace_mcp/credentials.db
+            timeout: Seconds to wait for a lock held by another writer
+        """
+        self.db_path = db_path or _default_credentials_db()
+        self.timeout = timeout
+        self._local = threading.local()
+
+        db_dir = os.path.dirname(os.path.abspath(self.db_path))
+        os.makedirs(db_dir, exist_ok=True)
+        # SQLite creates the -wal and -shm files with the database file's
+        # mode, so the database must be private before the first connect.
+        os.close(os.open(self.db_path, os.O_CREAT | os.O_RDWR, 0o600))
+        self._restrict_permissions()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS credentials (
+                    user_email TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                ) WITHOUT ROWID
+                """
+            )
+        self._restrict_permissions()
+        logger.info(f"SQLiteCredentialStore initialized with db_path: {self.db_path}")
+
+    def _restrict_permissions(self) -> None:
+        """Make the database and its WAL and shared-memory files 0600."""
+        for path in (self.db_path, f"{self.db_path}-wal", f"{self.db_path}-shm"):
+            try:
+                os.chmod(path, 0o600)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not restrict permissions on {path}: {e}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.timeout * 1000)}")
+            self._local.conn = conn
+        return conn
+
+    def get_credential(self, user_email: str) -> Optional[Credentials]:
+        """Get credentials for a user from the database."""
+        try:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT data FROM credentials WHERE user_email = ?", (user_email,)
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Error loading credentials for {user_email}: {e}")
+            return None
+
+        if row is None:
+            logger.debug(f"No credentials found for {user_email} in {self.db_path}")
+            return None
+        return _credentials_from_dict(user_email, json.loads(row[0]))
+
+    def get_credentials_batch(
+        self, user_emails: Iterable[str]
+    ) -> Dict[str, Credentials]:
+        """Get credentials for several users with one query per 500 users."""
+        emails = list(dict.fromkeys(user_emails))
+        found = {}
+        try:
+            conn = self._connect()
+            for start in range(0, len(emails), self._BATCH_SIZE):
+                chunk = emails[start : start + self._BATCH_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    "SELECT user_email, data FROM credentials "
+                    f"WHERE user_email IN ({placeholders})",
+                    chunk,
+                )
+                for user_email, data in rows:
+                    found[user_email] = _credentials_from_dict(
+                        user_email, json.loads(data)
+                    )
+        except sqlite3.Error as e:
+            logger.error(f"Error loading credentials batch: {e}")
+        return found
+
+    def store_credential(self, user_email: str, credentials: Credentials) -> bool:
+        """Store credentials for a user in the database."""
+        return self._upsert([(user_email, _credentials_to_dict(credentials))]) == 1
+
+    def _upsert(
+        self, entries: List[Tuple[str, Dict[str, Any]]], overwrite: bool = True
+    ) -> int:
+        conflict = (
+            "DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at"
+            if overwrite
+            else "DO NOTHING"
+        )
+        now = time.time()
+        try:
+            conn = self._connect()
+            with conn:
+                cursor = conn.executemany(
+                    "INSERT INTO credentials (user_email, data, updated_at) "
+                    f"VALUES (?, ?, ?) ON CONFLICT(user_email) {conflict}",
+                    [(email, json.dumps(data), now) for email, data in entries],
+                )
+            for email, _ in entries:
+                logger.debug(f"Stored credentials for {email} in {self.db_path}")
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Error storing credentials in {self.db_path}: {e}")
+            return 0
+
+    def delete_credential(self, user_email: str) -> bool:
+        """Delete credentials for a user."""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "DELETE FROM credentials WHERE user_email = ?", (user_email,)
+                )
+            logger.info(f"Deleted credentials for {user_email} from {self.db_path}")
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Error deleting credentials for {user_email}: {e}")
+            return False
+
+    def list_users(self) -> List[str]:
+        """List all users with stored credentials."""
+        try:
+            rows = self._connect().execute(
+                "SELECT user_email FROM credentials ORDER BY user_email"
+            )
+            return [row[0] for row in rows]
+        except sqlite3.Error as e:
+            logger.error(f"Error listing users in {self.db_path}: {e}")
+            return []
+
+    def migrate_from_directory(self, source_dir: str, overwrite: bool = False) -> int:
+        """
+        Import credentials from a LocalDirectoryCredentialStore directory.
+
+        Args:
+            source_dir: Directory of <email>.json credential files
+            overwrite: Replace credentials already in the database
+
+        Returns:
+            Number of users imported
+        """
+        entries = []
+        for user_email in LocalDirectoryCredentialStore(source_dir).list_users():
+            path = os.path.join(source_dir, f"{user_email}.json")
+            try:
+                with open(path, "r") as f:
+                    entries.append((user_email, json.load(f)))
+            except (IOError, json.JSONDecodeError) as e:
+                logger.warning(f"Skipping unreadable credential file {path}: {e}")
+        if not entries:
+            return 0
+        imported = self._upsert(entries, overwrite=overwrite)
+        logger.info(f"Migrated {imported} users from {source_dir} to {self.db_path}")
+        return imported
+
+    def close(self) -> None:
+        """Close this thread's database connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
 
 # Global credential store instance
 _credential_store: Optional[CredentialStore] = None
@@ -226,14 +529,24 @@ def get_credential_store() -> CredentialStore:
     global _credential_store
 
     if _credential_store is None:
-        # always use LocalJsonCredentialStore as the default
-        # Future enhancement: support other backends via environment variables
-        _credential_store = LocalDirectoryCredentialStore()
+        backend = os.getenv("GOOGLE_MCP_CREDENTIAL_STORE", "local").lower()
+        if backend == "sqlite":
+            _credential_store = SQLiteCredentialStore()
+        else:
+            _credential_store = LocalDirectoryCredentialStore()
         logger.info(f"Initialized credential store: {type(_credential_store).__name__}")
 
     return _credential_store
 
 
+def get_credential_cache_stats() -> Optional[Dict[str, Any]]:
+    """Get in-memory cache statistics for the global store, if it has a cache."""
+    store = _credential_store
+    if isinstance(store, LocalDirectoryCredentialStore):
+        return store.get_cache_stats()
+    return None
+
+
 def set_credential_store(store: CredentialStore):
     """
     Set the global credential store instance.
@@ -244,3 +557,40 @@ def set_credential_store(store: CredentialStore):
     global _credential_store
     _credential_store = store
     logger.info(f"Set credential store: {type(store).__name__}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Manage stored Google credentials")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    migrate_parser = subparsers.add_parser(
+        "migrate", help="Copy credentials from a JSON directory into SQLite"
+    )
+    migrate_parser.add_argument(
+        "--from",
+        dest="source_dir",
+        default=None,
+        help="Credentials directory (default: GOOGLE_MCP_CREDENTIALS_DIR)",
+    )
+    migrate_parser.add_argument(
+        "--to",
+        dest="db_path",
+        default=None,
+        help="SQLite database (default: GOOGLE_MCP_CREDENTIALS_DB)",
+    )
+    migrate_parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Replace credentials already present in the database",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "migrate":
+        source_dir = args.source_dir or _default_credentials_dir()
+        store = SQLiteCredentialStore(args.db_path)
+        imported = store.migrate_from_directory(source_dir, overwrite=args.overwrite)
+        print(f"Imported {imported} users from {source_dir} into {store.db_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
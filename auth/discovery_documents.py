@@ -0,0 +1,195 @@
+"""
+Offline Google API discovery documents.
+
+googleapiclient's ``build()`` re-reads and re-parses the discovery document for
+an API every time a service is built. This module loads the document for each
+API once, keeps the parsed document in memory and builds services from it with
+``build_from_document``, so building a service never touches the network or
+the discovery file cache.
+
+Documents are read from ``WORKSPACE_MCP_DISCOVERY_DIR`` when set (files named
+``<api>.<version>.json``), otherwise from the static documents bundled with
+google-api-python-client. To vendor documents for an air-gapped deployment:
+
+    python -m auth.discovery_documents export ./discovery
+
+Configuration:
+    WORKSPACE_MCP_DISCOVERY_DIR: Directory of discovery documents to use
+        instead of the documents bundled with google-api-python-client
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httplib2
+from google.oauth2.credentials import Credentials
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
+
+from core.http_pool import build_authorized_http
+
+logger = logging.getLogger(__name__)
+
+DISCOVERY_DIR = os.getenv("WORKSPACE_MCP_DISCOVERY_DIR")
+
+_documents: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+_documents_lock = threading.Lock()
+
+
+def _document_filename(service_name: str, version: str) -> str:
+    return f"{service_name}.{version}.json"
+
+
+def _read_document(service_name: str, version: str) -> Optional[str]:
+    """Read the raw discovery document from the configured source."""
+    if DISCOVERY_DIR:
+        path = os.path.join(DISCOVERY_DIR, _document_filename(service_name, version))
+        if os.path.isfile(path):
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        logger.warning(
+            f"Discovery document {path} not found, falling back to bundled document"
+        )
+    return discovery_cache.get_static_doc(service_name, version)
+
+
+def _prepare_document(document: Dict[str, Any]) -> None:
+    """
+    Apply googleapiclient's discovery fix-ups to every method up front.
+
+    build_from_document adds library-specific parameters to each method
+    description the first time a resource is created. Walking the whole
+    resource tree once here means later builds sharing this document only
+    reassign existing keys and never mutate its structure concurrently.
+    """
+    root = build_from_document(document, http=httplib2.Http())
+
+    def walk(resource: Any) -> None:
+        for name in list(getattr(resource, "_dynamic_attrs", [])):
+            attr = getattr(resource, name, None)
+            if getattr(attr, "__is_resource__", False):
+                walk(attr())
+
+    walk(root)
+
+
+def get_discovery_document(service_name: str, version: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the parsed discovery document for an API, loading it on first use.
+
+    Returns:
+        The discovery document, or None if no offline document is available
+    """
+    key = (service_name, version)
+    if key in _documents:
+        return _documents[key]
+
+    with _documents_lock:
+        if key in _documents:
+            return _documents[key]
+
+        document = None
+        try:
+            content = _read_document(service_name, version)
+            if content:
+                document = json.loads(content)
+                _prepare_document(document)
+        except Exception as e:
+            logger.warning(
+                f"Could not load discovery document for {service_name} {version}: {e}"
+            )
+            document = None
+
+        if document is None:
+            logger.info(
+                f"No offline discovery document for {service_name} {version}; "
+                "using googleapiclient discovery"
+            )
+        _documents[key] = document
+        return document
+
+
+def preload_discovery_documents(services: Iterable[Tuple[str, str]]) -> int:
+    """
+    Load discovery documents for the given (service_name, version) pairs.
+
+    Returns:
+        Number of documents available in memory
+    """
+    loaded = 0
+    for service_name, version in services:
+        if get_discovery_document(service_name, version) is not None:
+            loaded += 1
+    logger.debug(f"Preloaded {loaded} discovery document(s)")
+    return loaded
+
+
+def build_service(service_name: str, version: str, credentials: Credentials) -> Any:
+    """
+    Build a Google API service from the in-memory discovery document.
+
+    Services use a pooled, thread-safe authorized HTTP object so a cached
+    service can be shared by concurrent calls. Falls back to googleapiclient's
+    build() if no offline document exists.
+    """
+    http = build_authorized_http(credentials)
+    document = get_discovery_document(service_name, version)
+    if document is None:
+        return build(service_name, version, http=http)
+    return build_from_document(document, http=http)
+
+
+def export_discovery_documents(
+    output_dir: str, services: Iterable[Tuple[str, str]]
+) -> List[str]:
+    """
+    Write the discovery documents for the given APIs to output_dir.
+
+    Returns:
+        Paths of the written files
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    for service_name, version in services:
+        content = discovery_cache.get_static_doc(service_name, version)
+        if not content:
+            raise ValueError(
+                f"No bundled discovery document for {service_name} {version}"
+            )
+        path = os.path.join(output_dir, _document_filename(service_name, version))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        written.append(path)
+    return written
+
+
+def _configured_services() -> List[Tuple[str, str]]:
+    from auth.service_decorator import SERVICE_CONFIGS
+
+    return [(c["service"], c["version"]) for c in SERVICE_CONFIGS.values()]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Manage offline Google API discovery documents"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export_parser = subparsers.add_parser(
+        "export", help="Write discovery documents for all configured services"
+    )
+    export_parser.add_argument("output_dir", help="Directory to write documents to")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        for path in export_discovery_documents(args.output_dir, _configured_services()):
+            print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,5 @@
 # auth/google_auth.py
 
-import asyncio
 import json
 import jwt
 import logging
@@ -11,19 +10,22 @@ from urllib.parse import parse_qs, urlparse
 
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
-from google.auth.transport.requests import Request
 from google.auth.exceptions import RefreshError
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from auth.scopes import SCOPES, get_current_scopes  # noqa
 from auth.oauth21_session_store import get_oauth21_session_store
 from auth.credential_store import get_credential_store
+from auth.service_cache import get_or_build_service, invalidate_user_services
+from auth.token_refresh import refresh_credentials
 from auth.oauth_config import get_oauth_config, is_stateless_mode
 from core.config import (
     get_transport_mode,
     get_oauth_redirect_uri,
 )
 from core.context import get_fastmcp_session_id
+from core.executors import run_io
+from core.tracing import start_span
 
 # Try to import FastMCP dependencies (may not be available in all environments)
 try:
@@ -368,7 +370,7 @@ async def start_auth_flow(
             )
 
         store = get_oauth21_session_store()
-        store.store_oauth_state(oauth_state, session_id=session_id)
+        await store.store_oauth_state_async(oauth_state, session_id=session_id)
 
         logger.info(
             f"Auth flow started for {user_display_name}. State: {oauth_state[:8]}... Advise user to visit: {auth_url}"
@@ -522,6 +524,52 @@ def handle_auth_callback(
         raise  # Re-raise for the caller
 
 
+def save_refreshed_credentials(
+    credentials: Credentials,
+    user_google_email: Optional[str],
+    session_id: Optional[str] = None,
+) -> None:
+    """
+    Persist credentials that were just refreshed.
+
+    Drops the user's cached services, then saves the credentials to the
+    credential store (unless in stateless mode) and the OAuth 2.1 session store.
+
+    Args:
+        credentials: The refreshed credentials.
+        user_google_email: The user they belong to; nothing is saved if None.
+        session_id: Optional MCP session ID to bind the session to.
+    """
+    invalidate_user_services(user_google_email)
+
+    # Save refreshed credentials (skip file save in stateless mode)
+    if not user_google_email:
+        return
+    if not is_stateless_mode():
+        credential_store = get_credential_store()
+        credential_store.store_credential(user_google_email, credentials)
+    else:
+        logger.info(
+            "Skipping credential file save in stateless mode for %s",
+            user_google_email,
+        )
+
+    # Also update OAuth21SessionStore
+    store = get_oauth21_session_store()
+    store.store_session(
+        user_email=user_google_email,
+        access_token=credentials.token,
+        refresh_token=credentials.refresh_token,
+        token_uri=credentials.token_uri,
+        client_id=credentials.client_id,
+        client_secret=credentials.client_secret,
+        scopes=credentials.scopes,
+        expiry=credentials.expiry,
+        mcp_session_id=session_id,
+        issuer="https://accounts.google.com",  # Add issuer for Google tokens
+    )
+
+
 def get_credentials(
     user_google_email: Optional[str],  # Can be None if relying on session_id
     required_scopes: List[str],
@@ -553,13 +601,16 @@ def get_credentials(
             credentials = store.get_credentials_by_mcp_session(session_id)
             if credentials:
                 logger.info(
-                    f"[get_credentials] Found OAuth 2.1 credentials for MCP session {session_id}"
+                    "[get_credentials] Found OAuth 2.1 credentials for MCP session %s",
+                    session_id,
                 )
 
                 # Check scopes
                 if not all(scope in credentials.scopes for scope in required_scopes):
                     logger.warning(
-                        f"[get_credentials] OAuth 2.1 credentials lack required scopes. Need: {required_scopes}, Have: {credentials.scopes}"
+                        "[get_credentials] OAuth 2.1 credentials lack required scopes. Need: %s, Have: %s",
+                        required_scopes,
+                        credentials.scopes,
                     )
                     return None
 
@@ -569,31 +620,38 @@ def get_credentials(
                 elif credentials.expired and credentials.refresh_token:
                     # Try to refresh
                     try:
-                        credentials.refresh(Request())
+                        user_email = store.get_user_by_mcp_session(session_id)
+
+                        def _persist_oauth21(refreshed: Credentials) -> None:
+                            invalidate_user_services(user_email)
+                            if user_email:
+                                store.store_session(
+                                    user_email=user_email,
+                                    access_token=refreshed.token,
+                                    refresh_token=refreshed.refresh_token,
+                                    scopes=refreshed.scopes,
+                                    expiry=refreshed.expiry,
+                                    mcp_session_id=session_id,
+                                )
+
+                        refresh_credentials(
+                            credentials, persist=_persist_oauth21, user_email=user_email
+                        )
                         logger.info(
-                            f"[get_credentials] Refreshed OAuth 2.1 credentials for session {session_id}"
+                            "[get_credentials] Refreshed OAuth 2.1 credentials for session %s",
+                            session_id,
                         )
-                        # Update stored credentials
-                        user_email = store.get_user_by_mcp_session(session_id)
-                        if user_email:
-                            store.store_session(
-                                user_email=user_email,
-                                access_token=credentials.token,
-                                refresh_token=credentials.refresh_token,
-                                scopes=credentials.scopes,
-                                expiry=credentials.expiry,
-                                mcp_session_id=session_id,
-                            )
                         return credentials
                     except Exception as e:
                         logger.error(
-                            f"[get_credentials] Failed to refresh OAuth 2.1 credentials: {e}"
+                            "[get_credentials] Failed to refresh OAuth 2.1 credentials: %s",
+                            e,
                         )
                         return None
         except ImportError:
             pass  # OAuth 2.1 store not available
         except Exception as e:
-            logger.debug(f"[get_credentials] Error checking OAuth 2.1 store: {e}")
+            logger.debug("[get_credentials] Error checking OAuth 2.1 store: %s", e)
 
     # Check for single-user mode
     if os.getenv("MCP_SINGLE_USER_MODE") == "1":
@@ -603,7 +661,8 @@ def get_credentials(
         credentials = _find_any_credentials(credentials_base_dir)
         if not credentials:
             logger.info(
-                f"[get_credentials] Single-user mode: No credentials found in {credentials_base_dir}"
+                "[get_credentials] Single-user mode: No credentials found in %s",
+                credentials_base_dir,
             )
             return None
 
@@ -615,11 +674,13 @@ def get_credentials(
                 if user_info and "email" in user_info:
                     user_google_email = user_info["email"]
                     logger.debug(
-                        f"[get_credentials] Single-user mode: extracted user email {user_google_email} from credentials"
+                        "[get_credentials] Single-user mode: extracted user email %s from credentials",
+                        user_google_email,
                     )
             except Exception as e:
                 logger.debug(
-                    f"[get_credentials] Single-user mode: could not extract user email: {e}"
+                    "[get_credentials] Single-user mode: could not extract user email: %s",
+                    e,
                 )
     else:
         credentials: Optional[Credentials] = None
@@ -629,31 +690,39 @@ def get_credentials(
             logger.debug("[get_credentials] No session_id provided")
 
         logger.debug(
-            f"[get_credentials] Called for user_google_email: '{user_google_email}', session_id: '{session_id}', required_scopes: {required_scopes}"
+            "[get_credentials] Called for user_google_email: '%s', session_id: '%s', required_scopes: %s",
+            user_google_email,
+            session_id,
+            required_scopes,
         )
 
         if session_id:
             credentials = load_credentials_from_session(session_id)
             if credentials:
                 logger.debug(
-                    f"[get_credentials] Loaded credentials from session for session_id '{session_id}'."
+                    "[get_credentials] Loaded credentials from session for session_id '%s'.",
+                    session_id,
                 )
 
         if not credentials and user_google_email:
             if not is_stateless_mode():
                 logger.debug(
-                    f"[get_credentials] No session credentials, trying credential store for user_google_email '{user_google_email}'."
+                    "[get_credentials] No session credentials, trying credential store for user_google_email '%s'.",
+                    user_google_email,
                 )
                 store = get_credential_store()
                 credentials = store.get_credential(user_google_email)
             else:
                 logger.debug(
-                    f"[get_credentials] No session credentials, skipping file store in stateless mode for user_google_email '{user_google_email}'."
+                    "[get_credentials] No session credentials, skipping file store in stateless mode for user_google_email '%s'.",
+                    user_google_email,
                 )
 
             if credentials and session_id:
                 logger.debug(
-                    f"[get_credentials] Loaded from file for user '{user_google_email}', caching to session '{session_id}'."
+                    "[get_credentials] Loaded from file for user '%s', caching to session '%s'.",
+                    user_google_email,
+                    session_id,
                 )
                 save_credentials_to_session(
                     session_id, credentials
@@ -661,75 +730,78 @@ def get_credentials(
 
         if not credentials:
             logger.info(
-                f"[get_credentials] No credentials found for user '{user_google_email}' or session '{session_id}'."
+                "[get_credentials] No credentials found for user '%s' or session '%s'.",
+                user_google_email,
+                session_id,
             )
             return None
 
     logger.debug(
-        f"[get_credentials] Credentials found. Scopes: {credentials.scopes}, Valid: {credentials.valid}, Expired: {credentials.expired}"
+        "[get_credentials] Credentials found. Scopes: %s, Valid: %s, Expired: %s",
+        credentials.scopes,
+        credentials.valid,
+        credentials.expired,
     )
 
     if not all(scope in credentials.scopes for scope in required_scopes):
         logger.warning(
-            f"[get_credentials] Credentials lack required scopes. Need: {required_scopes}, Have: {credentials.scopes}. User: '{user_google_email}', Session: '{session_id}'"
+            "[get_credentials] Credentials lack required scopes. Need: %s, Have: %s. User: '%s', Session: '%s'",
+            required_scopes,
+            credentials.scopes,
+            user_google_email,
+            session_id,
         )
         return None  # Re-authentication needed for scopes
 
     logger.debug(
-        f"[get_credentials] Credentials have sufficient scopes. User: '{user_google_email}', Session: '{session_id}'"
+        "[get_credentials] Credentials have sufficient scopes. User: '%s', Session: '%s'",
+        user_google_email,
+        session_id,
     )
 
     if credentials.valid:
         logger.debug(
-            f"[get_credentials] Credentials are valid. User: '{user_google_email}', Session: '{session_id}'"
+            "[get_credentials] Credentials are valid. User: '%s', Session: '%s'",
+            user_google_email,
+            session_id,
         )
         return credentials
     elif credentials.expired and credentials.refresh_token:
         logger.info(
-            f"[get_credentials] Credentials expired. Attempting refresh. User: '{user_google_email}', Session: '{session_id}'"
+            "[get_credentials] Credentials expired. Attempting refresh. User: '%s', Session: '%s'",
+            user_google_email,
+            session_id,
         )
         try:
             logger.debug(
                 "[get_credentials] Refreshing token using embedded client credentials"
             )
             # client_config = load_client_secrets(client_secrets_path) # Not strictly needed if creds have client_id/secret
-            credentials.refresh(Request())
-            logger.info(
-                f"[get_credentials] Credentials refreshed successfully. User: '{user_google_email}', Session: '{session_id}'"
-            )
 
-            # Save refreshed credentials (skip file save in stateless mode)
-            if user_google_email:  # Always save to credential store if email is known
-                if not is_stateless_mode():
-                    credential_store = get_credential_store()
-                    credential_store.store_credential(user_google_email, credentials)
-                else:
-                    logger.info(
-                        f"Skipping credential file save in stateless mode for {user_google_email}"
-                    )
+            def _persist(refreshed: Credentials) -> None:
+                save_refreshed_credentials(refreshed, user_google_email, session_id)
 
-                # Also update OAuth21SessionStore
-                store = get_oauth21_session_store()
-                store.store_session(
-                    user_email=user_google_email,
-                    access_token=credentials.token,
-                    refresh_token=credentials.refresh_token,
-                    token_uri=credentials.token_uri,
-                    client_id=credentials.client_id,
-                    client_secret=credentials.client_secret,
-                    scopes=credentials.scopes,
-                    expiry=credentials.expiry,
-                    mcp_session_id=session_id,
-                    issuer="https://accounts.google.com",  # Add issuer for Google tokens
-                )
+            # Concurrent callers for this user share one refresh and one write
+            refresh_credentials(
+                credentials, persist=_persist, user_email=user_google_email
+            )
+            logger.info(
+                "[get_credentials] Credentials refreshed successfully. User: '%s', Session: '%s'",
+                user_google_email,
+                session_id,
+            )
 
             if session_id:  # Update session cache if it was the source or is active
                 save_credentials_to_session(session_id, credentials)
             return credentials
         except RefreshError as e:
             logger.warning(
-                f"[get_credentials] RefreshError - token expired/revoked: {e}. User: '{user_google_email}', Session: '{session_id}'"
+                "[get_credentials] RefreshError - token expired/revoked: %s. User: '%s', Session: '%s'",
+                e,
+                user_google_email,
+                session_id,
             )
+            invalidate_user_services(user_google_email)
             # For RefreshError, we should return None to trigger reauthentication
             return None
         except Exception as e:
@@ -740,7 +812,11 @@ def get_credentials(
             return None  # Failed to refresh
     else:
         logger.warning(
-            f"[get_credentials] Credentials invalid/cannot refresh. Valid: {credentials.valid}, Refresh Token: {credentials.refresh_token is not None}. User: '{user_google_email}', Session: '{session_id}'"
+            "[get_credentials] Credentials invalid/cannot refresh. Valid: %s, Refresh Token: %s. User: '%s', Session: '%s'",
+            credentials.valid,
+            credentials.refresh_token is not None,
+            user_google_email,
+            session_id,
         )
         return None
 
@@ -855,13 +931,14 @@ async def get_authenticated_google_service(
         logger.info(f"[{tool_name}] {error_msg}")
         raise GoogleAuthenticationError(error_msg)
 
-    credentials = await asyncio.to_thread(
-        get_credentials,
-        user_google_email=user_google_email,
-        required_scopes=required_scopes,
-        client_secrets_path=CONFIG_CLIENT_SECRETS_PATH,
-        session_id=session_id,  # Pass through session context
-    )
+    with start_span("credentials.lookup", {"auth.source": "credential_store"}):
+        credentials = await run_io(
+            get_credentials,
+            user_google_email=user_google_email,
+            required_scopes=required_scopes,
+            client_secrets_path=CONFIG_CLIENT_SECRETS_PATH,
+            session_id=session_id,  # Pass through session context
+        )
 
     if not credentials or not credentials.valid:
         logger.warning(
@@ -896,7 +973,9 @@ async def get_authenticated_google_service(
         raise GoogleAuthenticationError(auth_response)
 
     try:
-        service = build(service_name, version, credentials=credentials)
+        service = get_or_build_service(
+            service_name, version, credentials, user_google_email
+        )
         log_user_email = user_google_email
 
         # Try to get email from credentials if needed for validation
@@ -6,9 +6,14 @@ that can be accessed by Google service decorators. It also includes
 session context management and credential conversion functionality.
 """
 
+import asyncio
+import contextlib
 import contextvars
+import heapq
 import logging
-from typing import Dict, Optional, Any, Tuple
+import os
+import time
+from typing import Dict, Iterator, Optional, Any, Tuple
 from threading import RLock
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
@@ -16,6 +21,14 @@ from dataclasses import dataclass
 from fastmcp.server.auth import AccessToken
 from google.oauth2.credentials import Credentials
 
+from auth.service_cache import invalidate_user_services
+from auth.session_backend import (
+    SessionBackend,
+    SessionBackendError,
+    create_session_backend_from_env,
+)
+from core.executors import run_io
+
 logger = logging.getLogger(__name__)
 
 
@@ -177,6 +190,51 @@ def extract_session_from_headers(headers: Dict[str, str]) -> Optional[str]:
 # =============================================================================
 
 
+# MCP session -> user mappings are kept for this long after last use
+SESSION_IDLE_TTL = float(os.getenv("WORKSPACE_MCP_SESSION_IDLE_TTL", "86400"))
+# Upper bound on tracked session IDs; least recently used are dropped first
+SESSION_MAX_MAPPINGS = int(os.getenv("WORKSPACE_MCP_SESSION_MAX_MAPPINGS", "10000"))
+# Minimum seconds between idle sweeps
+SESSION_SWEEP_INTERVAL = 60.0
+# With a shared backend, local copies are re-read after this many seconds so
+# removals and refreshes made by other replicas are picked up
+SESSION_BACKEND_CACHE_TTL = float(
+    os.getenv("WORKSPACE_MCP_SESSION_BACKEND_CACHE_TTL", "5")
+)
+
+# Namespaces that decide which user a session may act as. When the backend
+# cannot be read, these are treated as absent (deny) rather than served from
+# a possibly stale local copy.
+_SECURITY_NAMESPACES = ("binding", "mcp_session")
+
+# Datetime fields that are stored as ISO strings in the shared backend
+_DATETIME_FIELDS = ("expiry", "issued_at", "expires_at", "created_at")
+
+
+def _encode_for_backend(info: Dict[str, Any]) -> Dict[str, Any]:
+    encoded = dict(info)
+    for field in _DATETIME_FIELDS:
+        if isinstance(encoded.get(field), datetime):
+            encoded[field] = encoded[field].isoformat()
+    return encoded
+
+
+def _decode_from_backend(info: Dict[str, Any]) -> Dict[str, Any]:
+    decoded = dict(info)
+    for field in _DATETIME_FIELDS:
+        if isinstance(decoded.get(field), str):
+            decoded[field] = datetime.fromisoformat(decoded[field])
+    return decoded
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
 class OAuth21SessionStore:
     """
     Global store for OAuth 2.1 authenticated sessions.
@@ -187,9 +245,40 @@ class OAuth21SessionStore:
 
     Security: Sessions are bound to specific users and can only access
     their own credentials.
+
+    Concurrency: entries are replaced rather than mutated, so lookups read the
+    dictionaries without locking and tool calls for different users never
+    wait on each other. Only writes (logins, token refreshes, removals) take
+    the lock.
+
+    Session IDs that have not been used for SESSION_IDLE_TTL seconds, or
+    beyond the SESSION_MAX_MAPPINGS most recently used, are evicted along with
+    their bindings.
+
+    Shared state: with a SessionBackend, every write is also stored in the
+    backend, and lookups that miss locally (or whose local copy is older than
+    SESSION_BACKEND_CACHE_TTL) read from it. Replicas and workers then share
+    sessions, bindings and pending OAuth states. Session bindings are claimed
+    atomically in the backend, so first-binding-wins holds across replicas;
+    if the backend cannot be reached, bindings are refused rather than made
+    locally.
+
+    Lookups made on the event loop never block on the backend: they use local
+    state only, and async callers await refresh_from_backend first, which
+    reads the backend on the I/O pool. Lookups from worker threads read
+    through directly. Likewise, writes from the event loop go through the
+    *_async variants, which run them on the I/O pool; the synchronous write
+    methods are for worker threads (e.g. token refresh persist callbacks).
+    Writes that leave a session or mapping unchanged skip the backend.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        idle_ttl: float = SESSION_IDLE_TTL,
+        max_mappings: int = SESSION_MAX_MAPPINGS,
+        backend: Optional[SessionBackend] = None,
+        backend_cache_ttl: float = SESSION_BACKEND_CACHE_TTL,
+    ):
         self._sessions: Dict[str, Dict[str, Any]] = {}
         self._mcp_session_mapping: Dict[
             str, str
@@ -200,6 +289,253 @@ class OAuth21SessionStore:
         self._oauth_states: Dict[str, Dict[str, Any]] = {}
         self._lock = RLock()
 
+        self.idle_ttl = idle_ttl
+        self.max_mappings = max_mappings
+        # Session ID -> monotonic time of last use, for mappings and bindings
+        self._session_last_seen: Dict[str, float] = {}
+        self._next_sweep = time.monotonic() + SESSION_SWEEP_INTERVAL
+        self._evictions = 0
+        self._lock_acquisitions = 0
+        self._lock_contentions = 0
+        self._lock_wait_seconds = 0.0
+
+        self._backend = backend
+        self._backend_cache_ttl = backend_cache_ttl
+        # (namespace, key) -> monotonic time the local copy was read from the backend
+        self._backend_checked: Dict[Tuple[str, str], float] = {}
+        self._backend_errors = 0
+
+    def _backend_call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Call the shared backend, logging (not raising) if it is unavailable."""
+        if self._backend is None:
+            return None
+        try:
+            return getattr(self._backend, method)(*args, **kwargs)
+        except SessionBackendError as e:
+            self._backend_errors += 1
+            logger.error(f"Session backend {method} failed: {e}")
+            return None
+
+    def _needs_backend_read(
+        self, namespace: str, local: Dict[str, Any], key: Optional[str]
+    ) -> bool:
+        if self._backend is None or not key:
+            return False
+        if local.get(key) is None:
+            return True
+        checked = self._backend_checked.get((namespace, key))
+        return not checked or time.monotonic() - checked >= self._backend_cache_ttl
+
+    def _read_backend(
+        self,
+        namespace: str,
+        local: Dict[str, Any],
+        key: str,
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """Refresh one key's local copy from the backend (blocking)."""
+        try:
+            remote = self._backend.get(namespace, key, ttl=ttl)
+        except SessionBackendError as e:
+            self._backend_errors += 1
+            if namespace in _SECURITY_NAMESPACES:
+                logger.warning(
+                    f"Session backend unavailable, denying {namespace} lookup: {e}"
+                )
+                local.pop(key, None)
+                self._backend_checked.pop((namespace, key), None)
+                return None
+            logger.warning(f"Session backend unavailable, using local state: {e}")
+            return local.get(key)
+
+        now = time.monotonic()
+        if remote is None:
+            # Removed (or expired) elsewhere
+            local.pop(key, None)
+            self._backend_checked.pop((namespace, key), None)
+            return None
+        if isinstance(remote, dict):
+            remote = _decode_from_backend(remote)
+        local[key] = remote
+        self._backend_checked[(namespace, key)] = now
+        if namespace in _SECURITY_NAMESPACES:
+            self._session_last_seen.setdefault(key, now)
+        return remote
+
+    def _read_through(
+        self,
+        namespace: str,
+        local: Dict[str, Any],
+        key: Optional[str],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """Look up a key locally, falling back to (and refreshing from) the backend."""
+        if not self._needs_backend_read(namespace, local, key) or _on_event_loop():
+            # Backend I/O would stall every request on this worker; async
+            # callers refresh the local copy first (refresh_from_backend).
+            return local.get(key) if key else None
+        return self._read_backend(namespace, local, key, ttl)
+
+    async def refresh_from_backend(
+        self, user_email: Optional[str] = None, session_id: Optional[str] = None
+    ) -> None:
+        """
+        Bring a user's session and a session ID's mapping and binding up to
+        date from the shared backend, reading it on the I/O pool.
+
+        Call this before synchronous lookups made on the event loop, which
+        only consult local state.
+        """
+        lookups = []
+        if user_email:
+            lookups.append(("session", self._sessions, user_email, None))
+        if session_id:
+            lookups.append(
+                ("binding", self._session_auth_binding, session_id, self.idle_ttl)
+            )
+            lookups.append(
+                ("mcp_session", self._mcp_session_mapping, session_id, self.idle_ttl)
+            )
+        stale = [
+            lookup for lookup in lookups if self._needs_backend_read(*lookup[:3])
+        ]
+        if not stale:
+            return
+
+        def _read_all() -> None:
+            for lookup in stale:
+                self._read_backend(*lookup)
+
+        await run_io(_read_all)
+
+    async def _write_async(self, method: Any, *args: Any, **kwargs: Any) -> Any:
+        """Run a write on the I/O pool if it may talk to the shared backend."""
+        if self._backend is None:
+            return method(*args, **kwargs)
+        return await run_io(method, *args, **kwargs)
+
+    async def store_oauth_state_async(self, *args: Any, **kwargs: Any) -> None:
+        """Async variant of store_oauth_state for callers on the event loop."""
+        await self._write_async(self.store_oauth_state, *args, **kwargs)
+
+    async def store_session_async(self, *args: Any, **kwargs: Any) -> None:
+        """Async variant of store_session for callers on the event loop."""
+        await self._write_async(self.store_session, *args, **kwargs)
+
+    def _get_session(self, user_email: str) -> Optional[Dict[str, Any]]:
+        return self._read_through("session", self._sessions, user_email)
+
+    def _get_mcp_user(self, session_id: Optional[str]) -> Optional[str]:
+        return self._read_through(
+            "mcp_session", self._mcp_session_mapping, session_id, ttl=self.idle_ttl
+        )
+
+    def _get_bound_user(self, session_id: Optional[str]) -> Optional[str]:
+        return self._read_through(
+            "binding", self._session_auth_binding, session_id, ttl=self.idle_ttl
+        )
+
+    def _bind_session_locked(self, session_id: str, user_email: str) -> str:
+        """Bind a session ID to a user unless already bound. Returns the bound user."""
+        bound_user = self._session_auth_binding.get(session_id)
+        if bound_user is None and self._backend is not None:
+            try:
+                bound_user = self._backend.set_if_absent(
+                    "binding", session_id, user_email, ttl=self.idle_ttl
+                )
+            except SessionBackendError as e:
+                # Binding locally could let another replica bind the same
+                # session to a different user; refuse instead.
+                self._backend_errors += 1
+                logger.error(
+                    f"SECURITY: Cannot bind session {session_id}, "
+                    f"session backend unavailable: {e}"
+                )
+                raise
+        if bound_user is None:
+            bound_user = user_email
+        self._session_auth_binding[session_id] = bound_user
+        return bound_user
+
+    def _save_session_locked(
+        self,
+        user_email: str,
+        session_info: Dict[str, Any],
+        previous: Optional[Dict[str, Any]] = None,
+    ):
+        self._sessions[user_email] = session_info
+        if self._backend is not None and session_info != previous:
+            self._backend_call(
+                "set", "session", user_email, _encode_for_backend(session_info)
+            )
+            self._backend_checked[("session", user_email)] = time.monotonic()
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the write lock, recording how often and how long callers wait."""
+        if not self._lock.acquire(blocking=False):
+            started = time.perf_counter()
+            self._lock.acquire()
+            self._lock_contentions += 1
+            self._lock_wait_seconds += time.perf_counter() - started
+        try:
+            self._lock_acquisitions += 1
+            yield
+        finally:
+            self._lock.release()
+
+    def _touch(self, session_id: Optional[str]) -> None:
+        """Record use of a session ID (lock-free; a lost update only delays eviction)."""
+        if session_id and session_id in self._session_last_seen:
+            self._session_last_seen[session_id] = time.monotonic()
+
+    def _forget_session_id_locked(self, session_id: str) -> None:
+        self._mcp_session_mapping.pop(session_id, None)
+        self._session_auth_binding.pop(session_id, None)
+        self._session_last_seen.pop(session_id, None)
+        self._backend_checked.pop(("mcp_session", session_id), None)
+        self._backend_checked.pop(("binding", session_id), None)
+
+    def _evict_sessions_locked(self, force: bool = False) -> int:
+        """Drop idle and excess session IDs. Caller must hold lock."""
+        now = time.monotonic()
+        over_limit = len(self._session_last_seen) > self.max_mappings
+        if not force and not over_limit and now < self._next_sweep:
+            return 0
+        self._next_sweep = now + SESSION_SWEEP_INTERVAL
+
+        last_seen = list(self._session_last_seen.items())
+        cutoff = now - self.idle_ttl
+        evict = [sid for sid, seen in last_seen if seen < cutoff]
+        excess = len(last_seen) - len(evict) - self.max_mappings
+        if excess > 0:
+            idle = set(evict)
+            evict.extend(
+                sid
+                for sid, _ in heapq.nsmallest(
+                    excess,
+                    ((sid, seen) for sid, seen in last_seen if sid not in idle),
+                    key=lambda item: item[1],
+                )
+            )
+
+        for session_id in evict:
+            self._forget_session_id_locked(session_id)
+        if evict:
+            self._evictions += len(evict)
+            logger.debug(f"Evicted {len(evict)} idle OAuth 2.1 session mappings")
+        return len(evict)
+
+    def evict_idle_sessions(self) -> int:
+        """
+        Evict idle and excess session mappings now.
+
+        Returns:
+            Number of session IDs evicted
+        """
+        with self._locked():
+            return self._evict_sessions_locked(force=True)
+
     def _cleanup_expired_oauth_states_locked(self):
         """Remove expired OAuth state entries. Caller must hold lock."""
         now = datetime.now(timezone.utc)
@@ -227,7 +563,7 @@ class OAuth21SessionStore:
         if expires_in_seconds < 0:
             raise ValueError("expires_in_seconds must be non-negative")
 
-        with self._lock:
+        with self._locked():
             self._cleanup_expired_oauth_states_locked()
             now = datetime.now(timezone.utc)
             expiry = now + timedelta(seconds=expires_in_seconds)
@@ -236,6 +572,14 @@ class OAuth21SessionStore:
                 "expires_at": expiry,
                 "created_at": now,
             }
+            # The callback may be served by another replica
+            self._backend_call(
+                "set",
+                "oauth_state",
+                state,
+                _encode_for_backend(self._oauth_states[state]),
+                ttl=expires_in_seconds,
+            )
             logger.debug(
                 "Stored OAuth state %s (expires at %s)",
                 state[:8] if len(state) > 8 else state,
@@ -263,9 +607,27 @@ class OAuth21SessionStore:
         if not state:
             raise ValueError("Missing OAuth state parameter")
 
-        with self._lock:
+        with self._locked():
             self._cleanup_expired_oauth_states_locked()
             state_info = self._oauth_states.get(state)
+            if self._backend is not None:
+                # The shared copy is authoritative: consuming it means a state
+                # can be used once across all replicas
+                try:
+                    remote_info = self._backend.pop("oauth_state", state)
+                except SessionBackendError as e:
+                    self._backend_errors += 1
+                    logger.error(f"Session backend pop failed: {e}")
+                else:
+                    self._oauth_states.pop(state, None)
+                    state_info = None
+                    if remote_info:
+                        state_info = _decode_from_backend(remote_info)
+                        expires_at = state_info.get("expires_at")
+                        if expires_at and expires_at <= datetime.now(timezone.utc):
+                            state_info = None
+                        else:
+                            self._oauth_states[state] = state_info
 
             if not state_info:
                 logger.error(
@@ -321,8 +683,13 @@ class OAuth21SessionStore:
             session_id: OAuth 2.1 session ID
             mcp_session_id: FastMCP session ID to map to this user
             issuer: Token issuer (e.g., "https://accounts.google.com")
+
+        Raises:
+            ValueError: If mcp_session_id is already bound to another user
+            SessionBackendError: If a shared backend is configured and the
+                session binding cannot be claimed in it
         """
-        with self._lock:
+        with self._locked():
             normalized_expiry = _normalize_expiry_to_naive_utc(expiry)
             session_info = {
                 "access_token": access_token,
@@ -335,28 +702,49 @@ class OAuth21SessionStore:
                 "session_id": session_id,
                 "mcp_session_id": mcp_session_id,
                 "issuer": issuer,
+                # When this access token was obtained, for proactive refresh scheduling
+                "issued_at": _normalize_expiry_to_naive_utc(datetime.now(timezone.utc)),
             }
 
-            self._sessions[user_email] = session_info
+            previous = self._get_session(user_email)
+            if previous and previous.get("access_token") != access_token:
+                # Services built with the old token are now stale
+                invalidate_user_services(user_email)
+            elif previous and previous.get("issued_at"):
+                # Same token stored again; keep its original issue time
+                session_info["issued_at"] = previous["issued_at"]
+
+            self._save_session_locked(user_email, session_info, previous)
 
             # Store MCP session mapping if provided
             if mcp_session_id:
                 # Create immutable session binding (first binding wins, cannot be changed)
-                if mcp_session_id not in self._session_auth_binding:
-                    self._session_auth_binding[mcp_session_id] = user_email
-                    logger.info(
-                        f"Created immutable session binding: {mcp_session_id} -> {user_email}"
-                    )
-                elif self._session_auth_binding[mcp_session_id] != user_email:
+                was_bound = mcp_session_id in self._session_auth_binding
+                bound_user = self._bind_session_locked(mcp_session_id, user_email)
+                if bound_user != user_email:
                     # Security: Attempt to bind session to different user
                     logger.error(
-                        f"SECURITY: Attempt to rebind session {mcp_session_id} from {self._session_auth_binding[mcp_session_id]} to {user_email}"
+                        f"SECURITY: Attempt to rebind session {mcp_session_id} from {bound_user} to {user_email}"
                     )
                     raise ValueError(
                         f"Session {mcp_session_id} is already bound to a different user"
                     )
+                if not was_bound:
+                    logger.info(
+                        f"Created immutable session binding: {mcp_session_id} -> {user_email}"
+                    )
 
+                mapped = self._mcp_session_mapping.get(mcp_session_id) == user_email
                 self._mcp_session_mapping[mcp_session_id] = user_email
+                self._session_last_seen[mcp_session_id] = time.monotonic()
+                if not mapped:
+                    self._backend_call(
+                        "set",
+                        "mcp_session",
+                        mcp_session_id,
+                        user_email,
+                        ttl=self.idle_ttl,
+                    )
                 logger.info(
                     f"Stored OAuth 2.1 session for {user_email} (session_id: {session_id}, mcp_session_id: {mcp_session_id})"
                 )
@@ -367,7 +755,11 @@ class OAuth21SessionStore:
 
             # Also create binding for the OAuth session ID
             if session_id and session_id not in self._session_auth_binding:
-                self._session_auth_binding[session_id] = user_email
+                self._bind_session_locked(session_id, user_email)
+            if session_id:
+                self._session_last_seen[session_id] = time.monotonic()
+
+            self._evict_sessions_locked()
 
     def get_credentials(self, user_email: str) -> Optional[Credentials]:
         """
@@ -379,30 +771,70 @@ class OAuth21SessionStore:
         Returns:
             Google Credentials object or None
         """
-        with self._lock:
-            session_info = self._sessions.get(user_email)
-            if not session_info:
-                logger.debug(f"No OAuth 2.1 session found for {user_email}")
-                return None
+        session_info = self._get_session(user_email)
+        if not session_info:
+            logger.debug(f"No OAuth 2.1 session found for {user_email}")
+            return None
 
-            try:
-                # Create Google credentials from session info
-                credentials = Credentials(
-                    token=session_info["access_token"],
-                    refresh_token=session_info.get("refresh_token"),
-                    token_uri=session_info["token_uri"],
-                    client_id=session_info.get("client_id"),
-                    client_secret=session_info.get("client_secret"),
-                    scopes=session_info.get("scopes", []),
-                    expiry=session_info.get("expiry"),
-                )
+        try:
+            # Create Google credentials from session info
+            credentials = Credentials(
+                token=session_info["access_token"],
+                refresh_token=session_info.get("refresh_token"),
+                token_uri=session_info["token_uri"],
+                client_id=session_info.get("client_id"),
+                client_secret=session_info.get("client_secret"),
+                scopes=session_info.get("scopes", []),
+                expiry=session_info.get("expiry"),
+            )
 
-                logger.debug(f"Retrieved OAuth 2.1 credentials for {user_email}")
-                return credentials
+            logger.debug(f"Retrieved OAuth 2.1 credentials for {user_email}")
+            return credentials
 
-            except Exception as e:
-                logger.error(f"Failed to create credentials for {user_email}: {e}")
-                return None
+        except Exception as e:
+            logger.error(f"Failed to create credentials for {user_email}: {e}")
+            return None
+
+    def update_session_tokens(
+        self,
+        user_email: str,
+        access_token: str,
+        expiry: Optional[Any] = None,
+        refresh_token: Optional[str] = None,
+    ) -> bool:
+        """
+        Update the tokens of an existing session after a refresh.
+
+        Unlike store_session, this keeps the session's bindings, issuer and
+        other metadata intact.
+
+        Args:
+            user_email: User's email address
+            access_token: New access token
+            expiry: New token expiry time
+            refresh_token: New refresh token, if the provider rotated it
+
+        Returns:
+            True if a session was updated, False if none exists
+        """
+        with self._locked():
+            session_info = self._get_session(user_email)
+            if not session_info:
+                return False
+
+            if session_info.get("access_token") != access_token:
+                invalidate_user_services(user_email)
+            updated = dict(session_info)
+            updated["access_token"] = access_token
+            updated["expiry"] = _normalize_expiry_to_naive_utc(expiry)
+            updated["issued_at"] = _normalize_expiry_to_naive_utc(
+                datetime.now(timezone.utc)
+            )
+            if refresh_token:
+                updated["refresh_token"] = refresh_token
+            self._save_session_locked(user_email, updated, session_info)
+            logger.debug(f"Updated OAuth 2.1 session tokens for {user_email}")
+            return True
 
     def get_credentials_by_mcp_session(
         self, mcp_session_id: str
@@ -416,15 +848,15 @@ class OAuth21SessionStore:
         Returns:
             Google Credentials object or None
         """
-        with self._lock:
-            # Look up user email from MCP session mapping
-            user_email = self._mcp_session_mapping.get(mcp_session_id)
-            if not user_email:
-                logger.debug(f"No user mapping found for MCP session {mcp_session_id}")
-                return None
+        # Look up user email from MCP session mapping
+        user_email = self._get_mcp_user(mcp_session_id)
+        self._touch(mcp_session_id)
+        if not user_email:
+            logger.debug(f"No user mapping found for MCP session {mcp_session_id}")
+            return None
 
-            logger.debug(f"Found user {user_email} for MCP session {mcp_session_id}")
-            return self.get_credentials(user_email)
+        logger.debug(f"Found user {user_email} for MCP session {mcp_session_id}")
+        return self.get_credentials(user_email)
 
     def get_credentials_with_validation(
         self,
@@ -447,72 +879,72 @@ class OAuth21SessionStore:
         Returns:
             Google Credentials object if validation passes, None otherwise
         """
-        with self._lock:
-            # Priority 1: Check auth token email (most secure, from verified JWT)
-            if auth_token_email:
-                if auth_token_email != requested_user_email:
+        # Priority 1: Check auth token email (most secure, from verified JWT)
+        if auth_token_email:
+            if auth_token_email != requested_user_email:
+                logger.error(
+                    f"SECURITY VIOLATION: Token for {auth_token_email} attempted to access "
+                    f"credentials for {requested_user_email}"
+                )
+                return None
+            # Token email matches, allow access
+            return self.get_credentials(requested_user_email)
+
+        # Priority 2: Check session binding
+        if session_id:
+            self._touch(session_id)
+            bound_user = self._get_bound_user(session_id)
+            if bound_user:
+                if bound_user != requested_user_email:
                     logger.error(
-                        f"SECURITY VIOLATION: Token for {auth_token_email} attempted to access "
-                        f"credentials for {requested_user_email}"
+                        f"SECURITY VIOLATION: Session {session_id} (bound to {bound_user}) "
+                        f"attempted to access credentials for {requested_user_email}"
                     )
                     return None
-                # Token email matches, allow access
+                # Session binding matches, allow access
                 return self.get_credentials(requested_user_email)
 
-            # Priority 2: Check session binding
-            if session_id:
-                bound_user = self._session_auth_binding.get(session_id)
-                if bound_user:
-                    if bound_user != requested_user_email:
-                        logger.error(
-                            f"SECURITY VIOLATION: Session {session_id} (bound to {bound_user}) "
-                            f"attempted to access credentials for {requested_user_email}"
-                        )
-                        return None
-                    # Session binding matches, allow access
-                    return self.get_credentials(requested_user_email)
-
-                # Check if this is an MCP session
-                mcp_user = self._mcp_session_mapping.get(session_id)
-                if mcp_user:
-                    if mcp_user != requested_user_email:
-                        logger.error(
-                            f"SECURITY VIOLATION: MCP session {session_id} (user {mcp_user}) "
-                            f"attempted to access credentials for {requested_user_email}"
-                        )
-                        return None
-                    # MCP session matches, allow access
-                    return self.get_credentials(requested_user_email)
-
-            # Special case: Allow access if user has recently authenticated (for clients that don't send tokens)
-            # CRITICAL SECURITY: This is ONLY allowed in stdio mode, NEVER in OAuth 2.1 mode
-            if allow_recent_auth and requested_user_email in self._sessions:
-                # Check transport mode to ensure this is only used in stdio
-                try:
-                    from core.config import get_transport_mode
-
-                    transport_mode = get_transport_mode()
-                    if transport_mode != "stdio":
-                        logger.error(
-                            f"SECURITY: Attempted to use allow_recent_auth in {transport_mode} mode. "
-                            f"This is only allowed in stdio mode!"
-                        )
-                        return None
-                except Exception as e:
-                    logger.error(f"Failed to check transport mode: {e}")
+            # Check if this is an MCP session
+            mcp_user = self._get_mcp_user(session_id)
+            if mcp_user:
+                if mcp_user != requested_user_email:
+                    logger.error(
+                        f"SECURITY VIOLATION: MCP session {session_id} (user {mcp_user}) "
+                        f"attempted to access credentials for {requested_user_email}"
+                    )
                     return None
-
-                logger.info(
-                    f"Allowing credential access for {requested_user_email} based on recent authentication "
-                    f"(stdio mode only - client not sending bearer token)"
-                )
+                # MCP session matches, allow access
                 return self.get_credentials(requested_user_email)
 
-            # No session or token info available - deny access for security
-            logger.warning(
-                f"Credential access denied for {requested_user_email}: No valid session or token"
+        # Special case: Allow access if user has recently authenticated (for clients that don't send tokens)
+        # CRITICAL SECURITY: This is ONLY allowed in stdio mode, NEVER in OAuth 2.1 mode
+        if allow_recent_auth and self._get_session(requested_user_email) is not None:
+            # Check transport mode to ensure this is only used in stdio
+            try:
+                from core.config import get_transport_mode
+
+                transport_mode = get_transport_mode()
+                if transport_mode != "stdio":
+                    logger.error(
+                        f"SECURITY: Attempted to use allow_recent_auth in {transport_mode} mode. "
+                        f"This is only allowed in stdio mode!"
+                    )
+                    return None
+            except Exception as e:
+                logger.error(f"Failed to check transport mode: {e}")
+                return None
+
+            logger.info(
+                f"Allowing credential access for {requested_user_email} based on recent authentication "
+                f"(stdio mode only - client not sending bearer token)"
             )
-            return None
+            return self.get_credentials(requested_user_email)
+
+        # No session or token info available - deny access for security
+        logger.warning(
+            f"Credential access denied for {requested_user_email}: No valid session or token"
+        )
+        return None
 
     def get_user_by_mcp_session(self, mcp_session_id: str) -> Optional[str]:
         """
@@ -524,8 +956,8 @@ class OAuth21SessionStore:
         Returns:
             User email or None
         """
-        with self._lock:
-            return self._mcp_session_mapping.get(mcp_session_id)
+        self._touch(mcp_session_id)
+        return self._get_mcp_user(mcp_session_id)
 
     def get_session_info(self, user_email: str) -> Optional[Dict[str, Any]]:
         """
@@ -537,27 +969,32 @@ class OAuth21SessionStore:
         Returns:
             Session information dictionary or None
         """
-        with self._lock:
-            return self._sessions.get(user_email)
+        return self._get_session(user_email)
 
     def remove_session(self, user_email: str):
         """Remove session for a user."""
-        with self._lock:
-            if user_email in self._sessions:
+        with self._locked():
+            session_info = self._get_session(user_email)
+            if session_info is not None:
                 # Get session IDs to clean up mappings
-                session_info = self._sessions.get(user_email, {})
                 mcp_session_id = session_info.get("mcp_session_id")
                 session_id = session_info.get("session_id")
 
                 # Remove from sessions
-                del self._sessions[user_email]
+                self._sessions.pop(user_email, None)
+                self._backend_checked.pop(("session", user_email), None)
+                invalidate_user_services(user_email)
+                if self._backend is not None:
+                    self._backend_call("delete", "session", user_email)
+                    for sid in (mcp_session_id, session_id):
+                        if sid:
+                            self._backend_call("delete", "mcp_session", sid)
+                            self._backend_call("delete", "binding", sid)
 
                 # Remove from MCP mapping if exists
                 if mcp_session_id and mcp_session_id in self._mcp_session_mapping:
-                    del self._mcp_session_mapping[mcp_session_id]
-                    # Also remove from auth binding
-                    if mcp_session_id in self._session_auth_binding:
-                        del self._session_auth_binding[mcp_session_id]
+                    # Also removes the auth binding
+                    self._forget_session_id_locked(mcp_session_id)
                     logger.info(
                         f"Removed OAuth 2.1 session for {user_email} and MCP mapping for {mcp_session_id}"
                     )
@@ -565,40 +1002,44 @@ class OAuth21SessionStore:
                 # Remove OAuth session binding if exists
                 if session_id and session_id in self._session_auth_binding:
                     del self._session_auth_binding[session_id]
+                    self._session_last_seen.pop(session_id, None)
 
                 if not mcp_session_id:
                     logger.info(f"Removed OAuth 2.1 session for {user_email}")
 
     def has_session(self, user_email: str) -> bool:
         """Check if a user has an active session."""
-        with self._lock:
-            return user_email in self._sessions
+        return self._get_session(user_email) is not None
 
     def has_mcp_session(self, mcp_session_id: str) -> bool:
         """Check if an MCP session has an associated user session."""
-        with self._lock:
-            return mcp_session_id in self._mcp_session_mapping
+        return self._get_mcp_user(mcp_session_id) is not None
 
     def get_single_user_email(self) -> Optional[str]:
         """Return the sole authenticated user email when exactly one session exists."""
-        with self._lock:
-            if len(self._sessions) == 1:
-                return next(iter(self._sessions))
-            return None
+        users = list(self._sessions)
+        return users[0] if len(users) == 1 else None
 
     def get_stats(self) -> Dict[str, Any]:
         """Get store statistics."""
-        with self._lock:
+        with self._locked():
             return {
                 "total_sessions": len(self._sessions),
                 "users": list(self._sessions.keys()),
                 "mcp_session_mappings": len(self._mcp_session_mapping),
                 "mcp_sessions": list(self._mcp_session_mapping.keys()),
+                "session_bindings": len(self._session_auth_binding),
+                "evictions": self._evictions,
+                "lock_acquisitions": self._lock_acquisitions,
+                "lock_contentions": self._lock_contentions,
+                "lock_wait_seconds": round(self._lock_wait_seconds, 6),
+                "backend": type(self._backend).__name__ if self._backend else None,
+                "backend_errors": self._backend_errors,
             }
 
 
 # Global instance
-_global_store = OAuth21SessionStore()
+_global_store = OAuth21SessionStore(backend=create_session_backend_from_env())
 
 
 def get_oauth21_session_store() -> OAuth21SessionStore:
@@ -702,16 +1143,10 @@ def _build_credentials_from_provider(
     )
 
 
-def ensure_session_from_access_token(
-    access_token: AccessToken,
-    user_email: Optional[str],
-    mcp_session_id: Optional[str] = None,
-) -> Optional[Credentials]:
-    """Ensure credentials derived from an access token are cached and returned."""
-
-    if not access_token:
-        return None
-
+def _credentials_from_access_token(
+    access_token: AccessToken, user_email: Optional[str]
+) -> Tuple[Optional[str], Credentials, Optional[datetime]]:
+    """Build credentials for an access token; returns (email, credentials, expiry)."""
     email = user_email
     if not email and getattr(access_token, "claims", None):
         email = access_token.claims.get("email")
@@ -743,21 +1178,72 @@ def ensure_session_from_access_token(
     else:
         store_expiry = credentials.expiry
 
+    return email, credentials, store_expiry
+
+
+def _access_token_session(
+    email: str,
+    credentials: Credentials,
+    expiry: Optional[datetime],
+    mcp_session_id: Optional[str],
+) -> Dict[str, Any]:
+    """store_session arguments for credentials derived from an access token."""
+    return {
+        "user_email": email,
+        "access_token": credentials.token,
+        "refresh_token": credentials.refresh_token,
+        "token_uri": credentials.token_uri,
+        "client_id": credentials.client_id,
+        "client_secret": credentials.client_secret,
+        "scopes": credentials.scopes,
+        "expiry": expiry,
+        "session_id": f"google_{email}",
+        "mcp_session_id": mcp_session_id,
+        "issuer": "https://accounts.google.com",
+    }
+
+
+def ensure_session_from_access_token(
+    access_token: AccessToken,
+    user_email: Optional[str],
+    mcp_session_id: Optional[str] = None,
+) -> Optional[Credentials]:
+    """Ensure credentials derived from an access token are cached and returned."""
+
+    if not access_token:
+        return None
+
+    email, credentials, store_expiry = _credentials_from_access_token(
+        access_token, user_email
+    )
     if email:
         try:
-            store = get_oauth21_session_store()
-            store.store_session(
-                user_email=email,
-                access_token=credentials.token,
-                refresh_token=credentials.refresh_token,
-                token_uri=credentials.token_uri,
-                client_id=credentials.client_id,
-                client_secret=credentials.client_secret,
-                scopes=credentials.scopes,
-                expiry=store_expiry,
-                session_id=f"google_{email}",
-                mcp_session_id=mcp_session_id,
-                issuer="https://accounts.google.com",
+            get_oauth21_session_store().store_session(
+                **_access_token_session(email, credentials, store_expiry, mcp_session_id)
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.debug(f"Failed to cache credentials for {email}: {exc}")
+
+    return credentials
+
+
+async def ensure_session_from_access_token_async(
+    access_token: AccessToken,
+    user_email: Optional[str],
+    mcp_session_id: Optional[str] = None,
+) -> Optional[Credentials]:
+    """Async variant of ensure_session_from_access_token for the event loop."""
+
+    if not access_token:
+        return None
+
+    email, credentials, store_expiry = _credentials_from_access_token(
+        access_token, user_email
+    )
+    if email:
+        try:
+            await get_oauth21_session_store().store_session_async(
+                **_access_token_session(email, credentials, store_expiry, mcp_session_id)
             )
         except Exception as exc:  # pragma: no cover - defensive
             logger.debug(f"Failed to cache credentials for {email}: {exc}")
@@ -25,6 +25,7 @@ from auth.oauth_responses import (
 )
 from auth.google_auth import handle_auth_callback, check_client_secrets
 from auth.oauth_config import get_oauth_redirect_uri
+from core.executors import run_io
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +91,8 @@ class MinimalOAuthServer:
 
                 # Exchange code for credentials
                 redirect_uri = get_oauth_redirect_uri()
-                verified_user_id, credentials = handle_auth_callback(
+                verified_user_id, credentials = await run_io(
+                    handle_auth_callback,
                     scopes=get_current_scopes(),
                     authorization_response=str(request.url),
                     redirect_uri=redirect_uri,
@@ -0,0 +1,320 @@
+"""
+Proactive background token refresh.
+
+Access tokens are otherwise refreshed lazily, so the first tool call after a
+token expires pays the token-endpoint round-trip. When enabled, this scheduler
+tracks users with recent tool activity and refreshes their tokens ahead of
+expiry (by default at 80% of the token lifetime), with per-token jitter so
+refreshes for many users don't line up, and a cap on concurrent refreshes.
+
+Refreshes go through the single-flight coordinator in auth.token_refresh, so a
+proactive refresh and an inline one for the same user never both hit the
+token endpoint. Counters for proactive versus inline refreshes are exposed by
+get_refresh_scheduler_stats().
+
+Configuration:
+    WORKSPACE_MCP_PROACTIVE_REFRESH: Set to "true" to enable (default: false)
+    WORKSPACE_MCP_PROACTIVE_REFRESH_FRACTION: Fraction of token lifetime after
+        which to refresh (default: 0.8)
+    WORKSPACE_MCP_PROACTIVE_REFRESH_JITTER: Random spread around that point, as
+        a fraction of lifetime (default: 0.05)
+    WORKSPACE_MCP_PROACTIVE_REFRESH_CONCURRENCY: Maximum concurrent refreshes (default: 4)
+    WORKSPACE_MCP_PROACTIVE_REFRESH_INTERVAL: Seconds between scans (default: 30)
+    WORKSPACE_MCP_PROACTIVE_REFRESH_IDLE: Seconds without tool activity after
+        which a user is no longer tracked (default: 3600)
+"""
+
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Set, Tuple
+
+from google.oauth2.credentials import Credentials
+
+from auth.token_refresh import get_token_refresh_coordinator
+from core.executors import run_io
+
+logger = logging.getLogger(__name__)
+
+PROACTIVE_REFRESH_ENABLED = (
+    os.getenv("WORKSPACE_MCP_PROACTIVE_REFRESH", "false").lower() == "true"
+)
+PROACTIVE_REFRESH_FRACTION = float(
+    os.getenv("WORKSPACE_MCP_PROACTIVE_REFRESH_FRACTION", "0.8")
+)
+PROACTIVE_REFRESH_JITTER = float(
+    os.getenv("WORKSPACE_MCP_PROACTIVE_REFRESH_JITTER", "0.05")
+)
+PROACTIVE_REFRESH_CONCURRENCY = int(
+    os.getenv("WORKSPACE_MCP_PROACTIVE_REFRESH_CONCURRENCY", "4")
+)
+PROACTIVE_REFRESH_INTERVAL = float(
+    os.getenv("WORKSPACE_MCP_PROACTIVE_REFRESH_INTERVAL", "30")
+)
+PROACTIVE_REFRESH_IDLE = float(
+    os.getenv("WORKSPACE_MCP_PROACTIVE_REFRESH_IDLE", "3600")
+)
+
+# Google access tokens last one hour; used when the issue time is unknown
+DEFAULT_TOKEN_LIFETIME = timedelta(hours=1)
+
+
+def _utcnow() -> datetime:
+    # Expiry values in the stores are naive UTC
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class ProactiveTokenRefresher:
+    """Background task that refreshes active users' tokens before they expire."""
+
+    def __init__(
+        self,
+        refresh_fraction: float = PROACTIVE_REFRESH_FRACTION,
+        jitter: float = PROACTIVE_REFRESH_JITTER,
+        max_concurrency: int = PROACTIVE_REFRESH_CONCURRENCY,
+        interval: float = PROACTIVE_REFRESH_INTERVAL,
+        idle_timeout: float = PROACTIVE_REFRESH_IDLE,
+    ):
+        if not 0 < refresh_fraction < 1:
+            raise ValueError("refresh_fraction must be between 0 and 1")
+        self.refresh_fraction = refresh_fraction
+        self.jitter = jitter
+        self.max_concurrency = max_concurrency
+        self.interval = interval
+        self.idle_timeout = idle_timeout
+
+        self._lock = threading.Lock()
+        self._active_users: Dict[str, float] = {}
+        # (user, access token) -> scheduled refresh time; jitter is rolled once per token
+        self._due: Dict[Tuple[str, str], datetime] = {}
+        self._in_flight: Set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._users_refreshed = 0
+        self._failures = 0
+        self._scans = 0
+
+    def record_activity(self, user_email: str) -> None:
+        """Mark a user as active so their token is kept fresh."""
+        if user_email:
+            with self._lock:
+                self._active_users[user_email] = time.monotonic()
+
+    def _active(self) -> list:
+        cutoff = time.monotonic() - self.idle_timeout
+        with self._lock:
+            for user in [u for u, seen in self._active_users.items() if seen < cutoff]:
+                del self._active_users[user]
+            return list(self._active_users)
+
+    def refresh_due_at(
+        self,
+        user_email: str,
+        access_token: str,
+        expiry: datetime,
+        issued_at: Optional[datetime] = None,
+    ) -> datetime:
+        """Return (and remember) when this token should be refreshed."""
+        key = (user_email, access_token)
+        with self._lock:
+            due = self._due.get(key)
+            if due is not None:
+                return due
+
+            lifetime = (expiry - issued_at) if issued_at else DEFAULT_TOKEN_LIFETIME
+            if lifetime <= timedelta(0):
+                lifetime = DEFAULT_TOKEN_LIFETIME
+            offset = self.refresh_fraction + random.uniform(-self.jitter, self.jitter)
+            offset = min(max(offset, 0.0), 1.0)
+            due = expiry - lifetime * (1 - offset)
+            # Drop schedules for this user's previous tokens
+            for stale in [k for k in self._due if k[0] == user_email]:
+                del self._due[stale]
+            self._due[key] = due
+            return due
+
+    def _load(self, user_email: str) -> Optional[Tuple[Credentials, Any, str]]:
+        """Load a user's current credentials and where they came from."""
+        from auth.oauth21_session_store import get_oauth21_session_store
+
+        session_store = get_oauth21_session_store()
+        session_info = session_store.get_session_info(user_email)
+        if session_info and session_info.get("refresh_token"):
+            credentials = session_store.get_credentials(user_email)
+            if credentials:
+                return credentials, session_info.get("issued_at"), "session"
+
+        from auth.oauth_config import is_stateless_mode
+
+        if is_stateless_mode():
+            return None
+        from auth.credential_store import get_credential_store
+
+        credentials = get_credential_store().get_credential(user_email)
+        if credentials and credentials.refresh_token:
+            return credentials, None, "file"
+        return None
+
+    def _persist(self, user_email: str, source: str, credentials: Credentials) -> None:
+        from auth.oauth21_session_store import get_oauth21_session_store
+        from auth.service_cache import invalidate_user_services
+
+        invalidate_user_services(user_email)
+        get_oauth21_session_store().update_session_tokens(
+            user_email,
+            access_token=credentials.token,
+            expiry=credentials.expiry,
+            refresh_token=credentials.refresh_token,
+        )
+        if source == "file":
+            from auth.credential_store import get_credential_store
+
+            get_credential_store().store_credential(user_email, credentials)
+
+    async def _refresh_user(self, user_email: str) -> None:
+        try:
+            async with self._semaphore:
+                loaded = await run_io(self._load, user_email)
+                if not loaded:
+                    return
+                credentials, issued_at, source = loaded
+                if not credentials.expiry:
+                    return
+                due = self.refresh_due_at(
+                    user_email, credentials.token, credentials.expiry, issued_at
+                )
+                if _utcnow() < due:
+                    return
+
+                logger.info(f"Proactively refreshing access token for {user_email}")
+                await get_token_refresh_coordinator().refresh_async(
+                    credentials,
+                    persist=lambda c: self._persist(user_email, source, c),
+                    user_email=user_email,
+                    reason="proactive",
+                )
+                with self._lock:
+                    self._users_refreshed += 1
+        except Exception as e:
+            with self._lock:
+                self._failures += 1
+            logger.warning(f"Proactive token refresh failed for {user_email}: {e}")
+        finally:
+            with self._lock:
+                self._in_flight.discard(user_email)
+
+    async def scan_once(self) -> int:
+        """
+        Check every active user and refresh those whose tokens are due.
+
+        Returns:
+            Number of users whose refresh was started
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        with self._lock:
+            self._scans += 1
+
+        tasks = []
+        for user_email in self._active():
+            with self._lock:
+                if user_email in self._in_flight:
+                    continue
+                self._in_flight.add(user_email)
+            tasks.append(asyncio.create_task(self._refresh_user(user_email)))
+        if tasks:
+            await asyncio.gather(*tasks)
+        return len(tasks)
+
+    async def _run(self) -> None:
+        logger.info(
+            f"Proactive token refresh started (refresh at {self.refresh_fraction:.0%} of lifetime)"
+        )
+        while True:
+            try:
+                await self.scan_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Proactive token refresh scan failed: {e}", exc_info=True)
+            # Spread scans so multiple replicas don't poll in lockstep
+            await asyncio.sleep(self.interval * random.uniform(0.9, 1.1))
+
+    def start(self) -> None:
+        """Start the background task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics."""
+        with self._lock:
+            return {
+                "running": self.running,
+                "active_users": len(self._active_users),
+                "scans": self._scans,
+                "users_refreshed": self._users_refreshed,
+                "failures": self._failures,
+            }
+
+
+_refresher = ProactiveTokenRefresher()
+_lifespan_users = 0
+
+
+def get_proactive_refresher() -> ProactiveTokenRefresher:
+    """Return the process-wide proactive refresher."""
+    return _refresher
+
+
+def record_user_activity(user_email: Optional[str]) -> None:
+    """Note a tool call for a user (no-op when proactive refresh is disabled)."""
+    if PROACTIVE_REFRESH_ENABLED and user_email:
+        _refresher.record_activity(user_email)
+
+
+async def start_proactive_refresh() -> None:
+    """Start the scheduler if enabled. Calls nest; the last stop shuts it down."""
+    global _lifespan_users
+    if not PROACTIVE_REFRESH_ENABLED:
+        return
+    _lifespan_users += 1
+    _refresher.start()
+
+
+async def stop_proactive_refresh() -> None:
+    """Release one start_proactive_refresh call."""
+    global _lifespan_users
+    if not PROACTIVE_REFRESH_ENABLED or _lifespan_users == 0:
+        return
+    _lifespan_users -= 1
+    if _lifespan_users == 0:
+        await _refresher.stop()
+
+
+def get_refresh_scheduler_stats() -> Dict[str, Any]:
+    """Proactive scheduler state plus ahead-of-time versus inline refresh counts."""
+    stats = _refresher.get_stats()
+    stats["enabled"] = PROACTIVE_REFRESH_ENABLED
+    refresh_stats = get_token_refresh_coordinator().get_stats()
+    stats["proactive_refreshes"] = refresh_stats["proactive_refreshes"]
+    stats["inline_refreshes"] = refresh_stats["inline_refreshes"]
+    return stats
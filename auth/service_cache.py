@@ -0,0 +1,135 @@
+"""
+Google API service object cache.
+
+Building a googleapiclient service re-parses the API discovery document and
+rebuilds the whole resource tree, which is a large fixed cost on every tool
+call. This module keeps recently built services keyed by user, API, version
+and credential identity so repeated calls for the same user reuse a ready
+service object.
+
+Configuration:
+    WORKSPACE_MCP_SERVICE_CACHE_TTL: Entry lifetime in seconds (default: 1800)
+    WORKSPACE_MCP_SERVICE_CACHE_SIZE: Maximum cached services (default: 256)
+    WORKSPACE_MCP_SERVICE_CACHE_ENABLED: Set to "false" to disable caching
+"""
+
+import hashlib
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from google.oauth2.credentials import Credentials
+from auth.discovery_documents import build_service
+
+from core.cache import TTLCache
+from core.tracing import start_span
+
+logger = logging.getLogger(__name__)
+
+SERVICE_CACHE_TTL = float(os.getenv("WORKSPACE_MCP_SERVICE_CACHE_TTL", "1800"))
+SERVICE_CACHE_MAX_SIZE = int(os.getenv("WORKSPACE_MCP_SERVICE_CACHE_SIZE", "256"))
+SERVICE_CACHE_ENABLED = (
+    os.getenv("WORKSPACE_MCP_SERVICE_CACHE_ENABLED", "true").lower() != "false"
+)
+
+# Keys are (user_email, service_name, version, credential_fingerprint)
+ServiceCacheKey = Tuple[str, str, str, str]
+
+_service_cache = TTLCache(
+    maxsize=SERVICE_CACHE_MAX_SIZE, ttl=SERVICE_CACHE_TTL, name="google_services"
+)
+
+
+def _credential_fingerprint(credentials: Credentials) -> Optional[str]:
+    """Return a short, non-reversible identifier for the credential's access token."""
+    token = getattr(credentials, "token", None)
+    if not token:
+        return None
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+def _seconds_until_expiry(credentials: Credentials) -> Optional[float]:
+    """Seconds until the access token expires, or None if expiry is unknown."""
+    expiry = getattr(credentials, "expiry", None)
+    if not isinstance(expiry, datetime):
+        return None
+    # google-auth stores expiry as naive UTC
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return (expiry - now).total_seconds()
+
+
+def _build_traced(
+    service_name: str, version: str, credentials: Credentials, cached: bool
+) -> Any:
+    with start_span(
+        f"service.build {service_name} {version}",
+        {"google.api.service": service_name, "service.cacheable": cached},
+    ):
+        return build_service(service_name, version, credentials)
+
+
+def get_or_build_service(
+    service_name: str,
+    version: str,
+    credentials: Credentials,
+    user_email: Optional[str],
+) -> Any:
+    """
+    Return a cached service for this user/API/credential, building it if needed.
+
+    Args:
+        service_name: Google API name (e.g., "gmail", "drive")
+        version: API version (e.g., "v1", "v3")
+        credentials: Credentials the service should be authorized with
+        user_email: Email of the user the credentials belong to
+
+    Returns:
+        A googleapiclient Resource for the requested API
+    """
+    fingerprint = _credential_fingerprint(credentials)
+    if not SERVICE_CACHE_ENABLED or not user_email or not fingerprint:
+        return _build_traced(service_name, version, credentials, cached=False)
+
+    key: ServiceCacheKey = (user_email, service_name, version, fingerprint)
+    service = _service_cache.get(key)
+    if service is not None:
+        logger.debug(f"Service cache hit: {service_name} {version} for {user_email}")
+        return service
+
+    logger.debug(f"Service cache miss: {service_name} {version} for {user_email}")
+    service = _build_traced(service_name, version, credentials, cached=True)
+
+    # Never keep a service around longer than its access token is valid
+    remaining = _seconds_until_expiry(credentials)
+    _service_cache.set(key, service, ttl=remaining)
+    return service
+
+
+def invalidate_user_services(user_email: Optional[str]) -> int:
+    """
+    Drop all cached services for a user.
+
+    Called when a user's token is refreshed, replaced or revoked.
+
+    Returns:
+        Number of cached services removed
+    """
+    if not user_email:
+        return 0
+    removed = _service_cache.invalidate_where(lambda key: key[0] == user_email)
+    if removed:
+        logger.debug(f"Invalidated {removed} cached service(s) for {user_email}")
+    return removed
+
+
+def clear_service_cache() -> None:
+    """Remove all cached services."""
+    _service_cache.clear()
+
+
+def get_service_cache_stats() -> Dict[str, Any]:
+    """Get service cache statistics (size, hits, misses, evictions)."""
+    stats = _service_cache.get_stats()
+    stats["enabled"] = SERVICE_CACHE_ENABLED
+    return stats
@@ -2,20 +2,25 @@ import inspect
 import logging
 
 import re
+import time
 from functools import wraps
 from typing import Dict, List, Optional, Any, Callable, Union, Tuple
 
 from google.auth.exceptions import RefreshError
-from googleapiclient.discovery import build
 from fastmcp.server.dependencies import get_access_token, get_context
 from auth.google_auth import get_authenticated_google_service, GoogleAuthenticationError
+from auth.service_cache import get_or_build_service, invalidate_user_services
+from auth.token_refresh import refresh_credentials_async
+from auth.refresh_scheduler import record_user_activity
 from auth.oauth21_session_store import (
     get_auth_provider,
     get_oauth21_session_store,
-    ensure_session_from_access_token,
+    ensure_session_from_access_token_async,
 )
 from auth.oauth_config import is_oauth21_enabled, get_oauth_config
-from core.context import set_fastmcp_session_id
+from core.context import set_current_user_email, set_fastmcp_session_id
+from core.metrics import record_service_auth
+from core.tracing import start_span
 from auth.scopes import (
     GMAIL_READONLY_SCOPE,
     GMAIL_SEND_SCOPE,
@@ -69,12 +74,15 @@ def _get_auth_context(
             set_fastmcp_session_id(mcp_session_id)
 
         logger.debug(
-            f"[{tool_name}] Auth from middleware: {authenticated_user} via {auth_method}"
+            "[%s] Auth from middleware: %s via %s",
+            tool_name,
+            authenticated_user,
+            auth_method,
         )
         return authenticated_user, auth_method, mcp_session_id
 
     except Exception as e:
-        logger.debug(f"[{tool_name}] Could not get FastMCP context: {e}")
+        logger.debug("[%s] Could not get FastMCP context: %s", tool_name, e)
         return None, None, None
 
 
@@ -93,7 +101,9 @@ def _detect_oauth_version(
     # When OAuth 2.1 is enabled globally, ALWAYS use OAuth 2.1 for authenticated users
     if authenticated_user:
         logger.info(
-            f"[{tool_name}] OAuth 2.1 mode: Using OAuth 2.1 for authenticated user '{authenticated_user}'"
+            "[%s] OAuth 2.1 mode: Using OAuth 2.1 for authenticated user '%s'",
+            tool_name,
+            authenticated_user,
         )
         return True
 
@@ -106,7 +116,10 @@ def _detect_oauth_version(
     oauth_version = config.detect_oauth_version(request_params)
     use_oauth21 = oauth_version == "oauth21"
     logger.info(
-        f"[{tool_name}] OAuth version detected: {oauth_version}, will use OAuth 2.1: {use_oauth21}"
+        "[%s] OAuth version detected: %s, will use OAuth 2.1: %s",
+        tool_name,
+        oauth_version,
+        use_oauth21,
     )
     return use_oauth21
 
@@ -176,29 +189,75 @@ async def _authenticate_service(
     Returns:
         Tuple of (service, actual_user_email)
     """
-    if use_oauth21:
-        logger.debug(f"[{tool_name}] Using OAuth 2.1 flow")
-        return await get_authenticated_google_service_oauth21(
-            service_name=service_name,
-            version=service_version,
-            tool_name=tool_name,
-            user_google_email=user_google_email,
-            required_scopes=resolved_scopes,
-            session_id=mcp_session_id,
-            auth_token_email=authenticated_user,
-            allow_recent_auth=False,
-        )
-    else:
-        logger.debug(f"[{tool_name}] Using legacy OAuth 2.0 flow")
-        return await get_authenticated_google_service(
-            service_name=service_name,
-            version=service_version,
-            tool_name=tool_name,
-            user_google_email=user_google_email,
-            required_scopes=resolved_scopes,
-            session_id=mcp_session_id,
+    started = time.perf_counter()
+    with start_span(
+        f"service.auth {service_name}",
+        {"google.api.service": service_name, "auth.oauth21": use_oauth21},
+    ):
+        if use_oauth21:
+            logger.debug("[%s] Using OAuth 2.1 flow", tool_name)
+            service, user_email = await get_authenticated_google_service_oauth21(
+                service_name=service_name,
+                version=service_version,
+                tool_name=tool_name,
+                user_google_email=user_google_email,
+                required_scopes=resolved_scopes,
+                session_id=mcp_session_id,
+                auth_token_email=authenticated_user,
+                allow_recent_auth=False,
+            )
+        else:
+            logger.debug("[%s] Using legacy OAuth 2.0 flow", tool_name)
+            service, user_email = await get_authenticated_google_service(
+                service_name=service_name,
+                version=service_version,
+                tool_name=tool_name,
+                user_google_email=user_google_email,
+                required_scopes=resolved_scopes,
+                session_id=mcp_session_id,
+            )
+    record_service_auth(service_name, time.perf_counter() - started)
+
+    # API quotas are tracked per user for the rest of this tool call
+    set_current_user_email(user_email)
+    # Keep this user's token fresh in the background (if enabled)
+    record_user_activity(user_email)
+    return service, user_email
+
+
+async def _refresh_oauth21_credentials_if_expired(
+    credentials: Any, user_email: str, service_name: str, tool_name: str
+) -> None:
+    """
+    Refresh expired OAuth 2.1 session credentials before building a service.
+
+    Concurrent calls for the same user share one refresh, and the session
+    store is updated once with the new token.
+    """
+    if credentials.valid or not (credentials.expired and credentials.refresh_token):
+        return
+
+    def _persist(refreshed: Any) -> None:
+        get_oauth21_session_store().update_session_tokens(
+            user_email,
+            access_token=refreshed.token,
+            expiry=refreshed.expiry,
+            refresh_token=refreshed.refresh_token,
         )
 
+    logger.info(
+        "[%s] Refreshing expired OAuth 2.1 token for %s", tool_name, user_email
+    )
+    try:
+        with start_span("credentials.refresh"):
+            await refresh_credentials_async(
+                credentials, persist=_persist, user_email=user_email
+            )
+    except RefreshError as e:
+        raise GoogleAuthenticationError(
+            _handle_token_refresh_error(e, user_email, service_name)
+        ) from e
+
 
 async def get_authenticated_google_service_oauth21(
     service_name: str,
@@ -237,9 +296,10 @@ async def get_authenticated_google_service_oauth21(
                 f"Authenticated account {token_email} does not match requested user {user_google_email}."
             )
 
-        credentials = ensure_session_from_access_token(
-            access_token, resolved_email, session_id
-        )
+        with start_span("credentials.lookup", {"auth.source": "access_token"}):
+            credentials = await ensure_session_from_access_token_async(
+                access_token, resolved_email, session_id
+            )
         if not credentials:
             raise GoogleAuthenticationError(
                 "Unable to build Google credentials from authenticated access token."
@@ -254,19 +314,30 @@ async def get_authenticated_google_service_oauth21(
                 f"OAuth credentials lack required scopes. Need: {required_scopes}, Have: {sorted(scopes_available)}"
             )
 
-        service = build(service_name, version, credentials=credentials)
-        logger.info(f"[{tool_name}] Authenticated {service_name} for {resolved_email}")
+        await _refresh_oauth21_credentials_if_expired(
+            credentials, resolved_email, service_name, tool_name
+        )
+        service = get_or_build_service(
+            service_name, version, credentials, resolved_email
+        )
+        logger.info(
+            "[%s] Authenticated %s for %s", tool_name, service_name, resolved_email
+        )
         return service, resolved_email
 
     store = get_oauth21_session_store()
 
     # Use the validation method to ensure session can only access its own credentials
-    credentials = store.get_credentials_with_validation(
-        requested_user_email=user_google_email,
-        session_id=session_id,
-        auth_token_email=auth_token_email,
-        allow_recent_auth=allow_recent_auth,
-    )
+    with start_span("credentials.lookup", {"auth.source": "session_store"}):
+        await store.refresh_from_backend(
+            user_email=user_google_email, session_id=session_id
+        )
+        credentials = store.get_credentials_with_validation(
+            requested_user_email=user_google_email,
+            session_id=session_id,
+            auth_token_email=auth_token_email,
+            allow_recent_auth=allow_recent_auth,
+        )
 
     if not credentials:
         raise GoogleAuthenticationError(
@@ -284,8 +355,15 @@ async def get_authenticated_google_service_oauth21(
             f"OAuth 2.1 credentials lack required scopes. Need: {required_scopes}, Have: {sorted(scopes_available)}"
         )
 
-    service = build(service_name, version, credentials=credentials)
-    logger.info(f"[{tool_name}] Authenticated {service_name} for {user_google_email}")
+    await _refresh_oauth21_credentials_if_expired(
+        credentials, user_google_email, service_name, tool_name
+    )
+    service = get_or_build_service(
+        service_name, version, credentials, user_google_email
+    )
+    logger.info(
+        "[%s] Authenticated %s for %s", tool_name, service_name, user_google_email
+    )
 
     return service, user_google_email
 
@@ -339,6 +417,22 @@ def _extract_oauth20_user_email(
     return user_google_email
 
 
+# Patterns to match user_google_email parameter documentation
+# Handles various formats like:
+# - user_google_email (str): The user's Google email address. Required.
+# - user_google_email: Description
+# - user_google_email (str) - Description
+_USER_EMAIL_DOC_PATTERNS = [
+    re.compile(pattern, re.MULTILINE)
+    for pattern in (
+        r"^\s*user_google_email\s*\([^)]*\)\s*:\s*[^\n]*\.?\s*(?:Required\.?)?\s*\n",
+        r"^\s*user_google_email\s*:\s*[^\n]*\n",
+        r"^\s*user_google_email\s*\([^)]*\)\s*-\s*[^\n]*\n",
+    )
+]
+_EXTRA_NEWLINES = re.compile(r"\n{3,}")
+
+
 def _remove_user_email_arg_from_docstring(docstring: str) -> str:
     """
     Remove user_google_email parameter documentation from docstring.
@@ -352,23 +446,12 @@ def _remove_user_email_arg_from_docstring(docstring: str) -> str:
     if not docstring:
         return docstring
 
-    # Pattern to match user_google_email parameter documentation
-    # Handles various formats like:
-    # - user_google_email (str): The user's Google email address. Required.
-    # - user_google_email: Description
-    # - user_google_email (str) - Description
-    patterns = [
-        r"^\s*user_google_email\s*\([^)]*\)\s*:\s*[^\n]*\.?\s*(?:Required\.?)?\s*\n",
-        r"^\s*user_google_email\s*:\s*[^\n]*\n",
-        r"^\s*user_google_email\s*\([^)]*\)\s*-\s*[^\n]*\n",
-    ]
-
     modified_docstring = docstring
-    for pattern in patterns:
-        modified_docstring = re.sub(pattern, "", modified_docstring, flags=re.MULTILINE)
+    for pattern in _USER_EMAIL_DOC_PATTERNS:
+        modified_docstring = pattern.sub("", modified_docstring)
 
     # Clean up any sequence of 3 or more newlines that might have been created
-    modified_docstring = re.sub(r"\n{3,}", "\n\n", modified_docstring)
+    modified_docstring = _EXTRA_NEWLINES.sub("\n\n", modified_docstring)
     return modified_docstring
 
 
@@ -459,6 +542,9 @@ def _handle_token_refresh_error(
     """
     error_str = str(error)
 
+    # Cached services hold the failed credentials; force a rebuild on the next call
+    invalidate_user_services(user_email)
+
     if (
         "invalid_grant" in error_str.lower()
         or "expired or revoked" in error_str.lower()
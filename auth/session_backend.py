@@ -0,0 +1,318 @@
+"""
+Shared storage backends for OAuth session state.
+
+By default all auth state (OAuth 2.1 sessions, MCP session bindings and
+pending OAuth states) lives in process memory, so a deployment can only run
+a single replica (or needs sticky sessions) and a restart loses every session.
+A SessionBackend lets OAuth21SessionStore write that state through to shared
+storage that every replica and uvicorn worker can read.
+
+Two implementations are provided:
+    InMemorySessionBackend: Process-local reference implementation
+    RedisSessionBackend: Any server speaking the Redis protocol (Redis,
+        Valkey, KeyDB, ...). Needs the ``redis`` extra
+        (``pip install 'google-workspace-mcp[redis]'``).
+
+Values are JSON documents addressed by (namespace, key).
+
+Security: sessions hold Google access and refresh tokens and the OAuth client
+secret, so RedisSessionBackend encrypts every value with Fernet and refuses
+to start without a key. Anyone holding the key and access to the server can
+still read the tokens: keep the key in a secret store, use a private Redis
+with authentication, and connect over TLS (``rediss://``).
+
+Configuration:
+    WORKSPACE_MCP_SESSION_BACKEND: "memory" (default, no shared backend) or "redis"
+    WORKSPACE_MCP_REDIS_URL: redis://[:password@]host[:port][/db] or rediss://
+        for TLS (default: redis://localhost:6379/0)
+    WORKSPACE_MCP_SESSION_ENCRYPTION_KEY: Fernet key(s) for the redis backend,
+        comma-separated for rotation (first encrypts). Generate one with
+        python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())"
+    WORKSPACE_MCP_REDIS_PREFIX: Key prefix (default: "workspace-mcp")
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import urllib.parse
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+try:
+    import redis
+    from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_LOOPBACK_HOSTS = ("localhost", "127.0.0.1", "::1")
+
+
+class SessionBackendError(Exception):
+    """Raised when the shared session backend cannot be reached or errors."""
+
+
+class SessionBackend(ABC):
+    """Key-value storage for JSON-serializable session state."""
+
+    @abstractmethod
+    def get(self, namespace: str, key: str, ttl: Optional[float] = None) -> Any:
+        """
+        Get a value.
+
+        Args:
+            namespace: Value namespace (e.g., "session")
+            key: Key within the namespace
+            ttl: If given, also reset the entry's lifetime to ttl seconds
+
+        Returns:
+            The stored value, or None if missing or expired
+        """
+        pass
+
+    @abstractmethod
+    def set(
+        self, namespace: str, key: str, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        """Store a value, optionally expiring after ttl seconds."""
+        pass
+
+    @abstractmethod
+    def set_if_absent(
+        self, namespace: str, key: str, value: Any, ttl: Optional[float] = None
+    ) -> Any:
+        """
+        Store a value only if the key does not exist yet.
+
+        Returns:
+            None if the value was stored, otherwise the existing value
+        """
+        pass
+
+    @abstractmethod
+    def pop(self, namespace: str, key: str) -> Any:
+        """Atomically get and delete a value. Returns None if missing."""
+        pass
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> None:
+        """Delete a value if present."""
+        pass
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class InMemorySessionBackend(SessionBackend):
+    """Process-local backend; useful for tests and as a reference implementation."""
+
+    def __init__(self):
+        self._data: Dict[Tuple[str, str], Tuple[Optional[float], str]] = {}
+        self._lock = threading.Lock()
+
+    def _get_locked(self, full_key: Tuple[str, str]) -> Any:
+        entry = self._data.get(full_key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[full_key]
+            return None
+        return json.loads(payload)
+
+    def _set_locked(
+        self, full_key: Tuple[str, str], value: Any, ttl: Optional[float]
+    ) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._data[full_key] = (expires_at, json.dumps(value))
+
+    def get(self, namespace: str, key: str, ttl: Optional[float] = None) -> Any:
+        with self._lock:
+            value = self._get_locked((namespace, key))
+            if value is not None and ttl is not None:
+                self._set_locked((namespace, key), value, ttl)
+            return value
+
+    def set(
+        self, namespace: str, key: str, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        with self._lock:
+            self._set_locked((namespace, key), value, ttl)
+
+    def set_if_absent(
+        self, namespace: str, key: str, value: Any, ttl: Optional[float] = None
+    ) -> Any:
+        with self._lock:
+            existing = self._get_locked((namespace, key))
+            if existing is None:
+                self._set_locked((namespace, key), value, ttl)
+            return existing
+
+    def pop(self, namespace: str, key: str) -> Any:
+        with self._lock:
+            value = self._get_locked((namespace, key))
+            self._data.pop((namespace, key), None)
+            return value
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._data.pop((namespace, key), None)
+
+
+class RedisSessionBackend(SessionBackend):
+    """
+    Backend for any server that speaks the Redis protocol.
+
+    Values are encrypted with Fernet (AES-128-CBC + HMAC-SHA256) before they
+    leave the process. The first key encrypts; every key decrypts, so keys
+    can be rotated by prepending a new one.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        encryption_keys: Sequence[str] = (),
+        prefix: str = "workspace-mcp",
+        timeout: float = 5.0,
+        max_connections: int = 16,
+    ):
+        """
+        Initialize the Redis-protocol backend.
+
+        Args:
+            url: redis:// or rediss:// URL, optionally with password and db number
+            encryption_keys: Fernet keys (see Fernet.generate_key()); at least one
+            prefix: Prefix for every key, so several deployments can share a server
+            timeout: Socket and connection-pool timeout in seconds
+            max_connections: Connections kept in the pool
+
+        Raises:
+            ImportError: If the redis extra is not installed
+            ValueError: If the URL or encryption keys are invalid
+        """
+        if not REDIS_AVAILABLE:
+            raise ImportError(
+                "The redis session backend requires the redis extra: "
+                "pip install 'google-workspace-mcp[redis]'"
+            )
+        parsed = urllib.parse.urlparse(url)
+        if parsed.scheme not in ("redis", "rediss"):
+            raise ValueError(f"Unsupported session backend URL: {url}")
+        if not encryption_keys:
+            raise ValueError(
+                "The redis session backend stores OAuth tokens and needs an "
+                "encryption key (WORKSPACE_MCP_SESSION_ENCRYPTION_KEY)"
+            )
+        self._fernet = MultiFernet([Fernet(key) for key in encryption_keys])
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.use_ssl = parsed.scheme == "rediss"
+        if not self.use_ssl and self.host not in _LOOPBACK_HOSTS:
+            logger.warning(
+                f"Session backend at {self.host} is not using TLS; use a rediss:// URL"
+            )
+        self.prefix = prefix
+        self._pool = redis.BlockingConnectionPool.from_url(
+            url,
+            max_connections=max_connections,
+            timeout=timeout,
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout,
+            # RESP2 works with every Redis-protocol server, including those
+            # without HELLO (Redis < 6)
+            protocol=2,
+        )
+        self._client = redis.Redis(connection_pool=self._pool)
+        logger.info(
+            f"RedisSessionBackend using {self.host}:{self.port} (prefix: {prefix})"
+        )
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}:{namespace}:{key}"
+
+    def _command(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return getattr(self._client, method)(*args, **kwargs)
+        except redis.RedisError as e:
+            raise SessionBackendError(f"Session backend {method} failed: {e}") from e
+
+    def _encode(self, value: Any) -> bytes:
+        return self._fernet.encrypt(json.dumps(value).encode("utf-8"))
+
+    def _decode(self, reply: Optional[bytes]) -> Any:
+        if reply is None:
+            return None
+        try:
+            return json.loads(self._fernet.decrypt(reply))
+        except InvalidToken as e:
+            raise SessionBackendError(
+                "Cannot decrypt session backend value; check the encryption keys"
+            ) from e
+
+    @staticmethod
+    def _px(ttl: Optional[float]) -> Optional[int]:
+        return max(1, int(ttl * 1000)) if ttl is not None else None
+
+    def get(self, namespace: str, key: str, ttl: Optional[float] = None) -> Any:
+        full_key = self._key(namespace, key)
+        if ttl is not None:
+            return self._decode(self._command("getex", full_key, px=self._px(ttl)))
+        return self._decode(self._command("get", full_key))
+
+    def set(
+        self, namespace: str, key: str, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        self._command(
+            "set", self._key(namespace, key), self._encode(value), px=self._px(ttl)
+        )
+
+    def set_if_absent(
+        self, namespace: str, key: str, value: Any, ttl: Optional[float] = None
+    ) -> Any:
+        full_key = self._key(namespace, key)
+        stored = self._command(
+            "set", full_key, self._encode(value), nx=True, px=self._px(ttl)
+        )
+        if stored:
+            return None
+        return self._decode(self._command("get", full_key))
+
+    def pop(self, namespace: str, key: str) -> Any:
+        return self._decode(self._command("getdel", self._key(namespace, key)))
+
+    def delete(self, namespace: str, key: str) -> None:
+        self._command("delete", self._key(namespace, key))
+
+    def ping(self) -> bool:
+        """Check that the backend is reachable."""
+        return bool(self._command("ping"))
+
+    def close(self) -> None:
+        self._pool.disconnect()
+
+
+def create_session_backend_from_env() -> Optional[SessionBackend]:
+    """
+    Create the shared session backend configured by environment variables.
+
+    Returns:
+        The configured backend, or None when session state stays in process memory
+    """
+    backend = os.getenv("WORKSPACE_MCP_SESSION_BACKEND", "memory").lower()
+    if backend == "memory":
+        return None
+    if backend == "redis":
+        keys = os.getenv("WORKSPACE_MCP_SESSION_ENCRYPTION_KEY", "")
+        return RedisSessionBackend(
+            url=os.getenv("WORKSPACE_MCP_REDIS_URL", "redis://localhost:6379/0"),
+            encryption_keys=[key.strip() for key in keys.split(",") if key.strip()],
+            prefix=os.getenv("WORKSPACE_MCP_REDIS_PREFIX", "workspace-mcp"),
+        )
+    raise ValueError(
+        f"Unknown WORKSPACE_MCP_SESSION_BACKEND '{backend}' (expected 'memory' or 'redis')"
+    )
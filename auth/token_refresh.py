@@ -0,0 +1,266 @@
+"""
+Single-flight OAuth token refresh.
+
+When an access token expires under load, every concurrent tool call for that
+user used to hit the token endpoint and then rewrite the credential file and
+session store. The coordinator here makes sure only one refresh per credential
+is in flight: the first caller (the leader) refreshes off the event loop and
+persists the result once; everyone else waits for and adopts the leader's
+token. Callers that arrive shortly after a refresh finished adopt the stored
+result instead of refreshing again.
+
+Refreshes are keyed by the credential's refresh token (one per user grant),
+so the same user reached through the OAuth 2.0 store, the OAuth 2.1 session
+store or a service's own credentials shares a single flight.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+
+from core.cache import TTLCache
+from core.executors import run_io
+
+logger = logging.getLogger(__name__)
+
+PersistCallback = Callable[[Credentials], None]
+
+
+class _Flight:
+    """An in-progress refresh that followers wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.credentials: Optional[Credentials] = None
+        self.error: Optional[BaseException] = None
+
+
+def _refresh_key(credentials: Credentials) -> str:
+    refresh_token = getattr(credentials, "refresh_token", None)
+    if refresh_token:
+        return hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()
+    return f"object:{id(credentials)}"
+
+
+def _adopt(target: Credentials, source: Credentials) -> None:
+    """Copy a refreshed token onto another Credentials object for the same grant."""
+    if target is source:
+        return
+    target.token = source.token
+    target.expiry = source.expiry
+    if source.refresh_token and source.refresh_token != target.refresh_token:
+        # Google may rotate refresh tokens on refresh
+        target._refresh_token = source.refresh_token
+    if getattr(source, "id_token", None) is not None:
+        target._id_token = source.id_token
+
+
+def _seconds_until_expiry(credentials: Credentials) -> Optional[float]:
+    expiry = getattr(credentials, "expiry", None)
+    if not isinstance(expiry, datetime):
+        return None
+    # google-auth stores expiry as naive UTC
+    return (expiry - datetime.now(timezone.utc).replace(tzinfo=None)).total_seconds()
+
+
+class TokenRefreshCoordinator:
+    """Coordinates token refreshes so each credential refreshes at most once at a time."""
+
+    def __init__(self, request_factory: Callable[[], Any] = Request):
+        self._request_factory = request_factory
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        # Recently refreshed credentials, kept until their token expires
+        self._latest = TTLCache(maxsize=1024, ttl=3600, name="refreshed_tokens")
+        self._async_flights: Dict[Any, "asyncio.Future[Credentials]"] = {}
+        self._refreshes = 0
+        self._inline_refreshes = 0
+        self._proactive_refreshes = 0
+        self._coalesced = 0
+        self._adopted = 0
+        self._failures = 0
+
+    def refresh(
+        self,
+        credentials: Credentials,
+        persist: Optional[PersistCallback] = None,
+        user_email: Optional[str] = None,
+        reason: str = "inline",
+    ) -> Credentials:
+        """
+        Refresh credentials, joining any refresh already in flight for them.
+
+        This blocks the calling thread; use refresh_async from coroutines.
+
+        Args:
+            credentials: Credentials to refresh; updated in place
+            persist: Called once with the refreshed credentials by the caller
+                that performed the refresh (e.g., to write the credential store)
+            user_email: Used for logging only
+            reason: "inline" when a caller needs the token now, "proactive"
+                for ahead-of-expiry refreshes (counted separately)
+
+        Returns:
+            The refreshed credentials (the same object that was passed in)
+
+        Raises:
+            google.auth.exceptions.RefreshError: If the refresh failed
+        """
+        key = _refresh_key(credentials)
+
+        with self._lock:
+            latest = self._latest.get(key)
+            if (
+                latest is not None
+                and latest.valid
+                and latest.token != credentials.token
+            ):
+                # Someone else refreshed this grant since these credentials were loaded
+                self._adopted += 1
+                _adopt(credentials, latest)
+                return credentials
+
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            logger.debug(f"Waiting for in-flight token refresh for {user_email}")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            _adopt(credentials, flight.credentials)
+            return credentials
+
+        try:
+            logger.debug(f"Refreshing access token for {user_email}")
+            credentials.refresh(self._request_factory())
+            if persist is not None:
+                try:
+                    persist(credentials)
+                except Exception as e:
+                    logger.error(
+                        f"Failed to persist refreshed credentials for {user_email}: {e}"
+                    )
+            flight.credentials = credentials
+            with self._lock:
+                self._refreshes += 1
+                if reason == "proactive":
+                    self._proactive_refreshes += 1
+                else:
+                    self._inline_refreshes += 1
+                remaining = _seconds_until_expiry(credentials)
+                self._latest.set(key, credentials, ttl=remaining)
+                if credentials.refresh_token:
+                    # Rotated refresh tokens get a new key; keep both pointing here
+                    self._latest.set(
+                        _refresh_key(credentials), credentials, ttl=remaining
+                    )
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self._failures += 1
+                self._latest.pop(key, None)
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+        return credentials
+
+    async def refresh_async(
+        self,
+        credentials: Credentials,
+        persist: Optional[PersistCallback] = None,
+        user_email: Optional[str] = None,
+        reason: str = "inline",
+    ) -> Credentials:
+        """
+        Refresh credentials without blocking the event loop.
+
+        Concurrent coroutines on the same loop share one worker thread for the
+        refresh instead of each parking a thread on the in-flight refresh.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, _refresh_key(credentials))
+
+        with self._lock:
+            future = self._async_flights.get(flight_key)
+            leader = future is None
+            if leader:
+                future = loop.create_future()
+                self._async_flights[flight_key] = future
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            refreshed = await asyncio.shield(future)
+            _adopt(credentials, refreshed)
+            return credentials
+
+        try:
+            refreshed = await run_io(
+                self.refresh, credentials, persist, user_email, reason
+            )
+            future.set_result(refreshed)
+            return refreshed
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure doesn't log a warning
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                self._async_flights.pop(flight_key, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get refresh counters."""
+        with self._lock:
+            return {
+                "refreshes": self._refreshes,
+                "inline_refreshes": self._inline_refreshes,
+                "proactive_refreshes": self._proactive_refreshes,
+                "coalesced": self._coalesced,
+                "adopted": self._adopted,
+                "failures": self._failures,
+                "in_flight": len(self._flights),
+            }
+
+
+_coordinator = TokenRefreshCoordinator()
+
+
+def get_token_refresh_coordinator() -> TokenRefreshCoordinator:
+    """Return the process-wide token refresh coordinator."""
+    return _coordinator
+
+
+def refresh_credentials(
+    credentials: Credentials,
+    persist: Optional[PersistCallback] = None,
+    user_email: Optional[str] = None,
+) -> Credentials:
+    """Refresh credentials through the shared single-flight coordinator."""
+    return _coordinator.refresh(credentials, persist=persist, user_email=user_email)
+
+
+async def refresh_credentials_async(
+    credentials: Credentials,
+    persist: Optional[PersistCallback] = None,
+    user_email: Optional[str] = None,
+) -> Credentials:
+    """Async variant of refresh_credentials that never blocks the event loop."""
+    return await _coordinator.refresh_async(
+        credentials, persist=persist, user_email=user_email
+    )
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Search benchmark for optimizer mode (google_workspace_find_tool)
+
+For 1, 10 and 100 concurrent queries, measures:
+  - sequential: find_similar_tools called once per query
+  - threads: the same calls from one thread per query, as concurrent
+    find_tool calls on the CPU pool would make them
+  - batched: one find_similar_tools_many call
+  - cached: batched again with the same queries, served from the query cache
+  - search_only: similarity and top-k on precomputed query embeddings, for
+    the previous implementation (re-normalize + argsort) and the current one
+
+Tool definitions come from the tool manifest when it exists, otherwise a
+synthetic tool set is used. Requires numpy and sentence-transformers.
+Results are printed as JSON.
+
+Usage:
+    python benchmarks/optimizer_search.py
+    python benchmarks/optimizer_search.py --concurrency 1 10 100 --repeat 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from core.optimizer import (  # noqa: E402
+    ToolOptimizer,
+    _normalize,
+    is_semantic_search_available,
+)
+from core.tool_manifest import load_manifest, optimizer_definitions  # noqa: E402
+
+QUERIES = [
+    "send an email",
+    "create a document",
+    "list calendar events",
+    "search for files in drive",
+    "add a row to a spreadsheet",
+    "reply to a chat message",
+    "create a presentation",
+    "mark a task as done",
+    "insert a table into a doc",
+    "share a file with a colleague",
+]
+
+_SYNTHETIC_VERBS = ["create", "get", "list", "update", "delete", "search", "batch"]
+_SYNTHETIC_NOUNS = [
+    "doc", "sheet", "event", "message", "file", "task", "form", "slide",
+    "comment", "label", "draft", "space", "permission", "table", "range",
+]
+
+
+def _tool_definitions() -> Dict[str, Dict[str, Any]]:
+    manifest = load_manifest()
+    if manifest is not None:
+        return optimizer_definitions(manifest)
+    tools = {}
+    for verb in _SYNTHETIC_VERBS:
+        for noun in _SYNTHETIC_NOUNS:
+            name = f"{verb}_{noun}"
+            tools[name] = {
+                "name": name,
+                "description": f"{verb.capitalize()} a Google Workspace {noun}.",
+                "inputSchema": {"type": "object", "properties": {}},
+                "service": "synthetic",
+            }
+    return tools
+
+
+def _queries(count: int, run: int) -> List[str]:
+    # A distinct suffix per run keeps the query cache cold
+    return [f"{QUERIES[i % len(QUERIES)]} ({run}.{i})" for i in range(count)]
+
+
+def _time(fn: Callable[[int], Any], repeat: int) -> Dict[str, float]:
+    timings = []
+    for run in range(repeat):
+        started = time.perf_counter()
+        fn(run)
+        timings.append(time.perf_counter() - started)
+    return {"median_ms": statistics.median(timings) * 1000, "min_ms": min(timings) * 1000}
+
+
+def _legacy_search(embeddings, query_embedding, top_k: int):
+    import numpy as np
+
+    query_norm = query_embedding / np.linalg.norm(query_embedding)
+    embeddings_norm = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    similarities = np.dot(embeddings_norm, query_norm)
+    return np.argsort(similarities)[::-1][:top_k]
+
+
+def benchmark(
+    optimizer: ToolOptimizer, count: int, top_k: int, repeat: int
+) -> Dict[str, Any]:
+    offset = count * 1000
+
+    def sequential(run: int) -> None:
+        for query in _queries(count, offset + run):
+            optimizer.find_similar_tools(query, top_k)
+
+    def threads(run: int) -> None:
+        with ThreadPoolExecutor(max_workers=count) as pool:
+            list(
+                pool.map(
+                    lambda q: optimizer.find_similar_tools(q, top_k),
+                    _queries(count, offset + 100 + run),
+                )
+            )
+
+    def batched(run: int) -> None:
+        optimizer.find_similar_tools_many(_queries(count, offset + 200 + run), top_k)
+
+    warm = _queries(count, offset + 300)
+    optimizer.find_similar_tools_many(warm, top_k)
+
+    query_vectors = optimizer._get_model().encode(warm, convert_to_numpy=True)
+    embeddings = optimizer.embeddings
+
+    def legacy_search_only(run: int) -> None:
+        for vector in query_vectors:
+            _legacy_search(embeddings, vector, top_k)
+
+    def search_only(run: int) -> None:
+        similarities = _normalize(query_vectors) @ optimizer._normalized.T
+        for row in similarities:
+            optimizer._results(row, top_k)
+
+    return {
+        "queries": count,
+        "sequential": _time(sequential, repeat),
+        "threads": _time(threads, repeat),
+        "batched": _time(batched, repeat),
+        "cached": _time(lambda run: optimizer.find_similar_tools_many(warm, top_k), repeat),
+        "search_only": {
+            "legacy": _time(legacy_search_only, repeat),
+            "current": _time(search_only, repeat),
+        },
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark optimizer tool search")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100],
+        help="Query counts to measure (default: 1 10 100)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Timed runs per measurement (default: 5)"
+    )
+    parser.add_argument("--top-k", type=int, default=10, help="Results per query")
+    parser.add_argument("--output", help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    if not is_semantic_search_available():
+        print("Requires numpy and sentence-transformers", file=sys.stderr)
+        return 1
+
+    tools = _tool_definitions()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        optimizer = ToolOptimizer(cache_dir=cache_dir)
+        optimizer.initialize(tools, {})
+        # Load the model before timing anything
+        optimizer.find_similar_tools(QUERIES[0], args.top_k)
+        results = {
+            "python": sys.version.split()[0],
+            "tools": len(tools),
+            "top_k": args.top_k,
+            "repeat": args.repeat,
+            "runs": [
+                benchmark(optimizer, count, args.top_k, args.repeat)
+                for count in args.concurrency
+            ],
+        }
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for Google Workspace MCP Server
+
+Measures, for the stdio server:
+  - time from process start to the first ``tools/list`` response (median of
+    several runs), which is what an MCP client waits for before it can work
+  - import time per module, from ``python -X importtime``
+
+Results are printed as JSON so they can be stored and compared across
+releases.
+
+Usage:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --lazy-tools --runs 10
+    python benchmarks/startup.py --tools docs sheets --output startup.json
+"""
+
+import argparse
+import json
+import os
+import queue
+import re
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROTOCOL_VERSION = "2025-06-18"
+
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)\s*$")
+
+
+def _server_command(args: argparse.Namespace, importtime: bool) -> List[str]:
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += [os.path.join(REPO_ROOT, "main.py"), "--transport", "stdio"]
+    if args.lazy_tools:
+        command.append("--lazy-tools")
+    if args.tools:
+        command += ["--tools", *args.tools]
+    if args.tool_tier:
+        command += ["--tool-tier", args.tool_tier]
+    return command
+
+
+def _messages() -> List[Dict[str, Any]]:
+    return [
+        {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "startup-benchmark", "version": "1.0"},
+            },
+        },
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+    ]
+
+
+def _read_lines(stream, lines: "queue.Queue[Optional[str]]") -> None:
+    for line in stream:
+        lines.put(line)
+    lines.put(None)
+
+
+def run_once(args: argparse.Namespace, importtime: bool = False) -> Dict[str, Any]:
+    """Start the server, list tools, and stop it."""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        _server_command(args, importtime),
+        cwd=REPO_ROOT,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    stdout: "queue.Queue[Optional[str]]" = queue.Queue()
+    stderr: "queue.Queue[Optional[str]]" = queue.Queue()
+    threading.Thread(target=_read_lines, args=(process.stdout, stdout), daemon=True).start()
+    threading.Thread(target=_read_lines, args=(process.stderr, stderr), daemon=True).start()
+
+    try:
+        for message in _messages():
+            process.stdin.write(json.dumps(message) + "\n")
+        process.stdin.flush()
+
+        deadline = started + args.timeout
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise TimeoutError(f"No tools/list response after {args.timeout}s")
+            line = stdout.get(timeout=remaining)
+            if line is None:
+                raise RuntimeError(
+                    f"Server exited with code {process.wait()} before listing tools"
+                )
+            try:
+                response = json.loads(line)
+            except ValueError:
+                continue
+            if response.get("id") == 2:
+                elapsed = time.perf_counter() - started
+                break
+    finally:
+        process.kill()
+        process.wait()
+
+    if "error" in response:
+        raise RuntimeError(f"tools/list failed: {response['error']}")
+
+    stderr_lines = []
+    while True:
+        try:
+            line = stderr.get(timeout=1.0)
+        except queue.Empty:
+            break
+        if line is None:
+            break
+        stderr_lines.append(line)
+
+    return {
+        "time_to_tools_list_s": elapsed,
+        "tools": len(response["result"]["tools"]),
+        "stderr": stderr_lines,
+    }
+
+
+def parse_importtime(lines: List[str]) -> List[Dict[str, Any]]:
+    """Parse ``-X importtime`` output into per-module timings."""
+    imports = []
+    for line in lines:
+        match = _IMPORT_TIME_LINE.match(line.rstrip("\n"))
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        imports.append(
+            {
+                "module": module,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "depth": len(indent) // 2,
+            }
+        )
+    return imports
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark server startup")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs (default: 5)")
+    parser.add_argument(
+        "--lazy-tools", action="store_true", help="Start the server with --lazy-tools"
+    )
+    parser.add_argument("--tools", nargs="*", help="Services to load (--tools)")
+    parser.add_argument(
+        "--tool-tier", choices=["core", "extended", "complete"], help="Tool tier"
+    )
+    parser.add_argument(
+        "--top", type=int, default=15, help="Slowest imports to report (default: 15)"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=60.0, help="Per-run timeout in seconds"
+    )
+    parser.add_argument("--output", help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    timings = [run_once(args)["time_to_tools_list_s"] for _ in range(args.runs)]
+
+    profiled = run_once(args, importtime=True)
+    imports = parse_importtime(profiled["stderr"])
+    top_level = [entry for entry in imports if entry["depth"] == 0]
+    slowest = sorted(top_level, key=lambda entry: entry["cumulative_ms"], reverse=True)
+
+    results = {
+        "python": sys.version.split()[0],
+        "lazy_tools": args.lazy_tools,
+        "tools_selected": args.tools,
+        "tool_tier": args.tool_tier,
+        "tools_listed": profiled["tools"],
+        "runs": args.runs,
+        "time_to_tools_list_s": {
+            "median": statistics.median(timings),
+            "min": min(timings),
+            "max": max(timings),
+        },
+        "import_time_ms": sum(entry["cumulative_ms"] for entry in top_level),
+        "slowest_imports": [
+            {"module": entry["module"], "cumulative_ms": entry["cumulative_ms"]}
+            for entry in slowest[: args.top]
+        ],
+    }
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,471 @@
+"""
+Async execution of Google API requests.
+
+googleapiclient requests are synchronous: ``request.execute()`` blocks on
+httplib2 for the full network round-trip, so tools used to run every call via
+``asyncio.to_thread``. That ties one executor thread to each in-flight request
+and gives every thread its own single-use connection.
+
+``execute_async`` sends the already-built ``HttpRequest`` through a shared
+``httpx.AsyncClient`` with a keep-alive connection pool instead, so a single
+event loop can keep many Google requests in flight without a thread each. The
+response is handed back to the request's own ``postproc`` and errors are
+raised as ``HttpError`` exactly as ``execute()`` would.
+
+Every request is first paced against the user's per-API quota
+(see core.rate_limit), and quota and server errors are retried according to
+the policy in core.retry. GET responses are cached per user and revalidated
+with ETags or revision probes before reuse (see core.response_cache).
+
+Requests that need googleapiclient's own transport (resumable uploads, batch
+requests, requests without google-auth credentials) and non-HttpRequest
+objects such as test mocks are executed on the I/O thread pool
+(see core.executors).
+
+Each call runs in a "google.api <method>" span (see core.tracing) carrying the
+HTTP status, retry count and cache outcome.
+
+Configuration:
+    WORKSPACE_MCP_ASYNC_HTTP: Set to "false" to always execute in a thread
+    WORKSPACE_MCP_HTTP_MAX_CONNECTIONS: Pool size per event loop (default: 100)
+    WORKSPACE_MCP_HTTP_MAX_KEEPALIVE: Idle connections kept open (default: 20)
+    WORKSPACE_MCP_HTTP_KEEPALIVE_EXPIRY: Idle connection lifetime in seconds (default: 30)
+    WORKSPACE_MCP_HTTP_TIMEOUT: Request timeout in seconds (default: 60)
+"""
+
+import asyncio
+import logging
+import os
+import ssl
+import threading
+import urllib.parse
+import weakref
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, Tuple
+
+import httplib2
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MAX_URI_LENGTH, HttpRequest
+
+from auth.token_refresh import refresh_credentials_async
+from core.context import get_current_user_email, get_fastmcp_session_id
+from core.executors import run_io
+from core.metrics import track_api_request
+from core.rate_limit import acquire_for_request
+from core.response_cache import (
+    DRIVE_VERSION,
+    INLINE_REVISION,
+    RESPONSE_CACHE_ENABLED,
+    CachedResponse,
+    RevisionSource,
+    ResponseCache,
+    cache_key,
+    get_response_cache,
+    revision_source,
+)
+from core.retry import retry_delay, sleep_before_retry
+from core.tracing import SPAN_KIND_CLIENT, current_span, start_span
+
+try:
+    import httpx
+    from google_auth_httplib2 import AuthorizedHttp
+
+    ASYNC_HTTP_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional transport
+    httpx = None
+    ASYNC_HTTP_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+ASYNC_HTTP_ENABLED = os.getenv("WORKSPACE_MCP_ASYNC_HTTP", "true").lower() != "false"
+HTTP_MAX_CONNECTIONS = int(os.getenv("WORKSPACE_MCP_HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("WORKSPACE_MCP_HTTP_MAX_KEEPALIVE", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("WORKSPACE_MCP_HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_TIMEOUT = float(os.getenv("WORKSPACE_MCP_HTTP_TIMEOUT", "60"))
+
+# Status codes that trigger a credential refresh and a single retry,
+# matching google_auth_httplib2.AuthorizedHttp
+_REFRESH_STATUS_CODES = (401,)
+
+# One client per event loop: httpx connections are bound to the loop that
+# opened them, and tests or tools_cli may run several loops in one process.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+_stats_lock = threading.Lock()
+_stats = {
+    "async_requests": 0,
+    "threaded_requests": 0,
+    "credential_refreshes": 0,
+    "retries": 0,
+}
+
+
+def _count(counter: str) -> None:
+    with _stats_lock:
+        _stats[counter] += 1
+
+
+def _get_client() -> Any:
+    """Return the shared AsyncClient for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        with _clients_lock:
+            client = _clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+                    ),
+                    timeout=HTTP_TIMEOUT,
+                    follow_redirects=True,
+                )
+                _clients[loop] = client
+    return client
+
+
+def _can_execute_natively(request: Any) -> bool:
+    return (
+        ASYNC_HTTP_AVAILABLE
+        and ASYNC_HTTP_ENABLED
+        and isinstance(request, HttpRequest)
+        and not request.resumable
+        and isinstance(request.http, AuthorizedHttp)
+    )
+
+
+def _prepare_request(request: HttpRequest) -> None:
+    """Apply the same long-URI rewrite HttpRequest.execute performs."""
+    if len(request.uri) > MAX_URI_LENGTH and request.method == "GET":
+        request.method = "POST"
+        request.headers["x-http-method-override"] = "GET"
+        request.headers["content-type"] = "application/x-www-form-urlencoded"
+        parsed = urllib.parse.urlparse(request.uri)
+        request.uri = urllib.parse.urlunparse(
+            (parsed.scheme, parsed.netloc, parsed.path, parsed.params, None, None)
+        )
+        request.body = parsed.query
+
+
+async def _refresh_credentials(credentials: Any) -> None:
+    """
+    Refresh credentials off the event loop, sharing any in-flight refresh.
+
+    The new token is saved for the user of the current tool call, as
+    get_credentials does, so the next call doesn't refresh again.
+    """
+    # Deferred: auth.google_auth imports this module through core.http_pool
+    from auth.google_auth import save_refreshed_credentials
+
+    _count("credential_refreshes")
+    user_email = get_current_user_email()
+    session_id = get_fastmcp_session_id()
+
+    def _persist(refreshed: Any) -> None:
+        save_refreshed_credentials(refreshed, user_email, session_id)
+
+    await refresh_credentials_async(
+        credentials, persist=_persist, user_email=user_email
+    )
+
+
+def _find_ssl_error(exc: BaseException) -> Optional[ssl.SSLError]:
+    """Return the ssl.SSLError underlying an httpx transport error, if any."""
+    seen = set()
+    current: Optional[BaseException] = exc
+    while current is not None and id(current) not in seen:
+        if isinstance(current, ssl.SSLError):
+            return current
+        seen.add(id(current))
+        current = current.__cause__ or current.__context__
+    return None
+
+
+def _annotate_span(key: str, value: Any) -> None:
+    span = current_span()
+    if span is not None:
+        span.set_attribute(key, value)
+
+
+def _span_attributes(request: Any, method_label: str) -> Dict[str, Any]:
+    attributes: Dict[str, Any] = {"google.api.method": method_label}
+    method = getattr(request, "method", None)
+    if isinstance(method, str):
+        attributes["http.request.method"] = method
+    uri = getattr(request, "uri", None)
+    if isinstance(uri, str):
+        # Query strings can carry user content (search terms), so omit them
+        parsed = urllib.parse.urlsplit(uri)
+        attributes["server.address"] = parsed.hostname
+        attributes["url.path"] = parsed.path
+    return attributes
+
+
+def _method_label(request: Any) -> str:
+    """API method id for metrics (e.g. "docs.documents.get"), else HTTP method."""
+    method_id = getattr(request, "methodId", None)
+    if isinstance(method_id, str) and method_id:
+        return method_id
+    method = getattr(request, "method", None)
+    return method if isinstance(method, str) else "unknown"
+
+
+async def _send(
+    request: HttpRequest, extra_headers: Optional[Dict[str, str]] = None
+) -> Any:
+    credentials = request.http.credentials
+    client = _get_client()
+
+    for attempt in range(2):
+        if not credentials.valid:
+            await _refresh_credentials(credentials)
+
+        headers: Dict[str, str] = {
+            k: v for k, v in request.headers.items() if k.lower() != "content-length"
+        }
+        if extra_headers:
+            headers.update(extra_headers)
+        # Credentials are valid here, so before_request only sets headers
+        credentials.before_request(None, request.method, request.uri, headers)
+
+        try:
+            with track_api_request(request.uri, _method_label(request)) as record:
+                response = await client.request(
+                    request.method,
+                    request.uri,
+                    content=request.body,
+                    headers=headers,
+                )
+                record(response.status_code)
+            _annotate_span("http.response.status_code", response.status_code)
+        except httpx.TransportError as e:
+            # handle_http_errors retries read-only tools on SSL errors
+            ssl_error = _find_ssl_error(e)
+            if ssl_error is not None:
+                raise ssl_error from e
+            raise
+
+        if response.status_code in _REFRESH_STATUS_CODES and attempt == 0:
+            logger.info(
+                f"Refreshing credentials due to a {response.status_code} response"
+            )
+            await _refresh_credentials(credentials)
+            continue
+        return response
+    return response
+
+
+def _to_httplib2(response: Any) -> Tuple[httplib2.Response, bytes]:
+    info = {k.lower(): v for k, v in response.headers.items()}
+    info["status"] = str(response.status_code)
+    return httplib2.Response(info), response.content
+
+
+def _finish(request: HttpRequest, resp: httplib2.Response, content: bytes) -> Any:
+    for callback in request.response_callbacks:
+        callback(resp)
+    if resp.status >= 300:
+        raise HttpError(resp, content, uri=request.uri)
+    return request.postproc(resp, content)
+
+
+async def _cache_io(cache: ResponseCache, method: Any, *args: Any) -> Any:
+    # The disk tier does file I/O, which must not block the event loop
+    if cache.disk_dir:
+        return await run_io(method, *args)
+    return method(*args)
+
+
+async def _probe_revision(
+    request: HttpRequest, source: RevisionSource, cache: ResponseCache, user: str
+) -> Optional[str]:
+    """Fetch just the current revision of a cached resource, or None."""
+    if not cache.probe_allowed(user, source.kind):
+        return None
+    probe = SimpleNamespace(
+        http=request.http,
+        method="GET",
+        methodId=f"{source.kind}_revision_probe",
+        uri=source.probe_uri,
+        headers={},
+        body=None,
+    )
+    await acquire_for_request(probe)
+    try:
+        with start_span(
+            f"google.api {probe.methodId}",
+            _span_attributes(probe, probe.methodId),
+            kind=SPAN_KIND_CLIENT,
+        ):
+            response = await _send(probe)
+    except (httpx.HTTPError, ssl.SSLError) as e:
+        logger.debug(f"Revision probe failed for {source.file_id}: {e}")
+        cache.record("probe_errors")
+        return None
+    if response.status_code != 200:
+        logger.debug(
+            f"Revision probe for {source.file_id} returned {response.status_code}"
+        )
+        cache.record("probe_errors")
+        if response.status_code in (401, 403):
+            cache.deny_probe(user, source.kind)
+        return None
+    try:
+        data = response.json()
+    except ValueError:
+        return None
+    field = "version" if source.kind == DRIVE_VERSION else "revisionId"
+    value = data.get(field) if isinstance(data, dict) else None
+    return str(value) if value is not None else None
+
+
+async def _execute_cached(request: HttpRequest, key: Any, user: str) -> Any:
+    """Execute a GET, reusing a cached response if Google says it is current."""
+    cache = get_response_cache()
+    source = revision_source(request.uri)
+    entry = await _cache_io(cache, cache.get, key)
+    headers = None
+    revision = None
+
+    if source is not None:
+        # Drive probes cost a request, so only pay for them on repeat reads
+        if entry is not None or (
+            source.kind == DRIVE_VERSION and cache.seen_before(key)
+        ):
+            revision = await _probe_revision(request, source, cache, user)
+            if entry is not None and revision and revision == entry.revision:
+                cache.record("revision_hits")
+                _annotate_span("cache.result", "revision_hit")
+                return _finish(request, httplib2.Response(entry.info), entry.content)
+    elif entry is not None and entry.etag:
+        headers = {"if-none-match": entry.etag}
+
+    await acquire_for_request(request)
+    response = await _send(request, headers)
+    if response.status_code == 304 and entry is not None:
+        cache.record("etag_hits")
+        _annotate_span("cache.result", "etag_hit")
+        return _finish(request, httplib2.Response(entry.info), entry.content)
+
+    resp, content = _to_httplib2(response)
+    result = _finish(request, resp, content)
+    cache.record("stale" if entry is not None else "misses")
+    _annotate_span("cache.result", "stale" if entry is not None else "miss")
+
+    if source is not None and source.kind == INLINE_REVISION:
+        # The body carries its own revision, so no probe was needed
+        revision = result.get("revisionId") if isinstance(result, dict) else None
+    etag = resp.get("etag")
+    if revision or etag:
+        fresh = CachedResponse(dict(resp), content, etag=etag, revision=revision)
+        await _cache_io(cache, cache.set, key, fresh)
+    elif entry is not None:
+        await _cache_io(cache, cache.pop, key)
+    return result
+
+
+async def _execute_once(request: Any) -> Any:
+    if not _can_execute_natively(request):
+        await acquire_for_request(request)
+        _count("threaded_requests")
+        uri = getattr(request, "uri", None)
+        with track_api_request(
+            uri if isinstance(uri, str) else "", _method_label(request)
+        ) as record:
+            try:
+                result = await run_io(request.execute)
+            except HttpError as error:
+                record(error.resp.status)
+                _annotate_span("http.response.status_code", error.resp.status)
+                raise
+            record(200)
+            return result
+
+    _count("async_requests")
+    _prepare_request(request)
+    if RESPONSE_CACHE_ENABLED and request.method == "GET" and request.body is None:
+        user = get_current_user_email()
+        key = cache_key(user, request.uri)
+        if key is not None:
+            return await _execute_cached(request, key, user)
+
+    await acquire_for_request(request)
+    response = await _send(request)
+    resp, content = _to_httplib2(response)
+    return _finish(request, resp, content)
+
+
+async def execute_async(request: Any) -> Any:
+    """
+    Execute a Google API request without tying up a thread for the round-trip.
+
+    Drop-in replacement for ``await asyncio.to_thread(request.execute)``.
+    Quota and transient server errors are retried per core.retry.
+
+    Args:
+        request: A googleapiclient HttpRequest (or any object with execute())
+
+    Returns:
+        The deserialized response, as returned by request.execute()
+
+    Raises:
+        HttpError: If the API returned a non-2xx status
+    """
+    method_label = _method_label(request)
+    with start_span(
+        f"google.api {method_label}",
+        _span_attributes(request, method_label),
+        kind=SPAN_KIND_CLIENT,
+    ) as span:
+        return await _execute_with_retries(request, span)
+
+
+async def _execute_with_retries(request: Any, span: Any) -> Any:
+    attempt = 0
+    while True:
+        try:
+            return await _execute_once(request)
+        except HttpError as error:
+            method = getattr(request, "method", None)
+            delay = retry_delay(
+                error.resp.status,
+                error.content,
+                error.resp,
+                method if isinstance(method, str) else "POST",
+                attempt,
+            )
+            if delay is None:
+                raise
+            _count("retries")
+            if span:
+                span.add_event(
+                    "retry",
+                    {"http.response.status_code": error.resp.status, "delay": delay},
+                )
+            await sleep_before_retry(delay, error.resp.status, error.uri)
+            attempt += 1
+            if span:
+                span.set_attribute("google.api.retries", attempt)
+
+
+async def close_async_http_clients() -> None:
+    """Close the pooled client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+def get_async_http_stats() -> Dict[str, Any]:
+    """Get execution counters for the async HTTP layer."""
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["enabled"] = ASYNC_HTTP_AVAILABLE and ASYNC_HTTP_ENABLED
+    stats["max_connections"] = HTTP_MAX_CONNECTIONS
+    return stats
@@ -0,0 +1,300 @@
+"""
+Per-API circuit breakers for Google Workspace tools.
+
+When one Google API degrades, every tool for that service otherwise waits out
+the full request timeout (and its retries), tying up the event loop's
+connections and executor threads while healthy services in the same process
+queue behind it. A breaker per API (the ``service_type`` given to
+handle_http_errors, i.e. a SERVICE_CONFIGS entry) watches the outcomes of
+recent tool calls and, once too many of them fail or are slow, rejects calls
+to that API immediately with a structured error instead.
+
+States:
+
+* closed: calls go through; outcomes are recorded in a sliding time window.
+  The breaker opens when at least ``min_calls`` calls in the window have a
+  failure-or-slow rate of ``failure_rate`` or more.
+* open: calls fail fast with CircuitOpenError until ``open_seconds`` pass.
+* half-open: up to ``half_open_probes`` calls are let through as probes.
+  If they all succeed the breaker closes; any failure re-opens it.
+
+Only errors that say the API itself is unhealthy count as failures: 5xx
+responses, timeouts and transport/SSL errors. Client errors (400/404, auth
+problems) and per-user quota rejections mean the API is answering, so they
+count as successful calls.
+
+Configuration:
+    WORKSPACE_MCP_CIRCUIT_BREAKER: Set to "false" to disable circuit breakers
+    WORKSPACE_MCP_CIRCUIT_FAILURE_RATE: Failure-or-slow rate that opens a breaker (default: 0.5)
+    WORKSPACE_MCP_CIRCUIT_MIN_CALLS: Calls needed in the window before a breaker can open (default: 10)
+    WORKSPACE_MCP_CIRCUIT_WINDOW: Sliding window length in seconds (default: 60)
+    WORKSPACE_MCP_CIRCUIT_SLOW_CALL: Seconds after which a call counts as slow (default: 30)
+    WORKSPACE_MCP_CIRCUIT_OPEN_SECONDS: How long a breaker stays open before probing (default: 30)
+    WORKSPACE_MCP_CIRCUIT_HALF_OPEN_PROBES: Probe calls allowed while half-open (default: 3)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import ssl
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import httpx
+from googleapiclient.errors import HttpError
+
+from core.retry import SERVER_ERROR_STATUS_CODES
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_BREAKER_ENABLED = (
+    os.getenv("WORKSPACE_MCP_CIRCUIT_BREAKER", "true").lower() != "false"
+)
+CIRCUIT_FAILURE_RATE = float(os.getenv("WORKSPACE_MCP_CIRCUIT_FAILURE_RATE", "0.5"))
+CIRCUIT_MIN_CALLS = int(os.getenv("WORKSPACE_MCP_CIRCUIT_MIN_CALLS", "10"))
+CIRCUIT_WINDOW = float(os.getenv("WORKSPACE_MCP_CIRCUIT_WINDOW", "60"))
+CIRCUIT_SLOW_CALL = float(os.getenv("WORKSPACE_MCP_CIRCUIT_SLOW_CALL", "30"))
+CIRCUIT_OPEN_SECONDS = float(os.getenv("WORKSPACE_MCP_CIRCUIT_OPEN_SECONDS", "30"))
+CIRCUIT_HALF_OPEN_PROBES = int(os.getenv("WORKSPACE_MCP_CIRCUIT_HALF_OPEN_PROBES", "3"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_TIMEOUT_ERRORS = (asyncio.TimeoutError, TimeoutError, httpx.TimeoutException)
+_TRANSPORT_ERRORS = (ssl.SSLError, ConnectionError, httpx.TransportError)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a tool while its API's circuit is open."""
+
+    def __init__(self, service: str, tool_name: str, retry_after: float):
+        self.service = service
+        self.tool_name = tool_name
+        self.retry_after = retry_after
+        super().__init__(self.to_json())
+
+    def to_json(self) -> str:
+        """Structured error body returned to the client."""
+        seconds = max(1, int(round(self.retry_after)))
+        return json.dumps(
+            {
+                "error": True,
+                "code": "SERVICE_UNAVAILABLE",
+                "message": (
+                    f"The Google {self.service} API is currently failing; "
+                    f"'{self.tool_name}' was not attempted"
+                ),
+                "reason": (
+                    f"Recent {self.service} requests failed or timed out, so calls "
+                    "are paused to avoid waiting on an unhealthy service."
+                ),
+                "suggestion": f"Retry in about {seconds} seconds.",
+                "context": {
+                    "service": self.service,
+                    "tool": self.tool_name,
+                    "retry_after_seconds": seconds,
+                },
+            },
+            indent=2,
+        )
+
+
+def classify_error(error: BaseException) -> Optional[bool]:
+    """
+    Decide what an exception from a tool call says about its API.
+
+    Follows ``raise ... from`` chains, since handle_http_errors wraps errors.
+
+    Returns:
+        True if the API looks unhealthy, False if it answered (e.g. a 404),
+        None if the error came from elsewhere (bad arguments, auth flow)
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, HttpError):
+            return error.resp.status in SERVER_ERROR_STATUS_CODES
+        if isinstance(error, _TIMEOUT_ERRORS + _TRANSPORT_ERRORS):
+            return True
+        error = error.__cause__
+    return None
+
+
+class CircuitBreaker:
+    """Circuit breaker for a single API. Thread-safe."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = CIRCUIT_FAILURE_RATE,
+        min_calls: int = CIRCUIT_MIN_CALLS,
+        window: float = CIRCUIT_WINDOW,
+        slow_call: float = CIRCUIT_SLOW_CALL,
+        open_seconds: float = CIRCUIT_OPEN_SECONDS,
+        half_open_probes: int = CIRCUIT_HALF_OPEN_PROBES,
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = max(1, min_calls)
+        self.window = window
+        self.slow_call = slow_call
+        self.open_seconds = open_seconds
+        self.half_open_probes = max(1, half_open_probes)
+
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        # (finished_at, failed, slow) for calls finished while closed
+        self._outcomes: Deque[Tuple[float, bool, bool]] = deque()
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "failures": 0, "slow": 0, "rejected": 0, "opened": 0}
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._advance_locked(time.monotonic())
+            return self._state
+
+    def _advance_locked(self, now: float) -> None:
+        if self._state == OPEN and now - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+            logger.info(f"Circuit for {self.name} is half-open; probing")
+
+    def _open_locked(self, now: float, reason: str) -> None:
+        self._state = OPEN
+        self._opened_at = now
+        self._outcomes.clear()
+        self._stats["opened"] += 1
+        logger.warning(
+            f"Circuit for {self.name} opened ({reason}); failing fast for "
+            f"{self.open_seconds:.0f}s"
+        )
+
+    def _prune_locked(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window:
+            self._outcomes.popleft()
+
+    def before_call(self, tool_name: str = "") -> bool:
+        """
+        Admit a call or reject it.
+
+        Returns:
+            True if the call is a half-open probe, False for a normal call
+
+        Raises:
+            CircuitOpenError: If the circuit is open or all probe slots are taken
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._advance_locked(now)
+            if self._state == CLOSED:
+                return False
+            if (
+                self._state == HALF_OPEN
+                and self._probes_in_flight + self._probe_successes
+                < self.half_open_probes
+            ):
+                self._probes_in_flight += 1
+                return True
+            self._stats["rejected"] += 1
+            retry_after = max(0.0, self._opened_at + self.open_seconds - now)
+        raise CircuitOpenError(self.name, tool_name, retry_after)
+
+    def record(self, failed: Optional[bool], duration: float, probe: bool) -> None:
+        """
+        Record the outcome of an admitted call.
+
+        Args:
+            failed: True if the API looked unhealthy, False if it answered,
+                None if the outcome says nothing about the API
+            duration: Call duration in seconds
+            probe: The value before_call returned for this call
+        """
+        now = time.monotonic()
+        slow = duration >= self.slow_call
+        bad = bool(failed) or slow
+        with self._lock:
+            if failed is not None:
+                self._stats["calls"] += 1
+                self._stats["failures"] += int(bool(failed))
+                self._stats["slow"] += int(slow)
+
+            if probe:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if self._state != HALF_OPEN or failed is None:
+                    return
+                if bad:
+                    self._open_locked(now, "probe failed")
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_probes:
+                    self._state = CLOSED
+                    logger.info(f"Circuit for {self.name} closed; probes succeeded")
+                return
+
+            if self._state != CLOSED or failed is None:
+                return
+            self._outcomes.append((now, bool(failed), slow))
+            self._prune_locked(now)
+            calls = len(self._outcomes)
+            if calls < self.min_calls:
+                return
+            bad_calls = sum(1 for _, f, s in self._outcomes if f or s)
+            if bad_calls / calls >= self.failure_rate:
+                self._open_locked(
+                    now, f"{bad_calls}/{calls} recent calls failed or slow"
+                )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the breaker's state and counters."""
+        now = time.monotonic()
+        with self._lock:
+            self._advance_locked(now)
+            self._prune_locked(now)
+            calls = len(self._outcomes)
+            failed = sum(1 for _, f, _ in self._outcomes if f)
+            slow = sum(1 for _, _, s in self._outcomes if s)
+            stats = {
+                "state": self._state,
+                "window_calls": calls,
+                "window_failure_rate": round(failed / calls, 3) if calls else 0.0,
+                "window_slow_rate": round(slow / calls, 3) if calls else 0.0,
+                **self._stats,
+            }
+            if self._state == OPEN:
+                stats["retry_after_seconds"] = round(
+                    max(0.0, self._opened_at + self.open_seconds - now), 1
+                )
+            return stats
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(service: str) -> CircuitBreaker:
+    """Return the process-wide breaker for an API, creating it on first use."""
+    breaker = _breakers.get(service)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(service, CircuitBreaker(service))
+    return breaker
+
+
+def get_circuit_breaker_stats() -> Dict[str, Any]:
+    """Get the state of every API's circuit breaker."""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    services = {name: b.get_stats() for name, b in sorted(breakers.items())}
+    return {
+        "enabled": CIRCUIT_BREAKER_ENABLED,
+        "degraded": sorted(n for n, s in services.items() if s["state"] != CLOSED),
+        "services": services,
+    }
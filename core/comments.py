@@ -14,12 +14,12 @@ Important distinction for Google Sheets:
 """
 
 import logging
-import asyncio
 
 
 from auth.service_decorator import require_google_service
 from core.server import server
 from core.utils import handle_http_errors
+from core.async_http import execute_async
 
 logger = logging.getLogger(__name__)
 
@@ -223,13 +223,11 @@ async def _read_comments_impl(service, app_name: str, file_id: str) -> str:
     """Implementation for reading comments from any Google Workspace file."""
     logger.info(f"[read_{app_name}_comments] Reading comments for {app_name} {file_id}")
 
-    response = await asyncio.to_thread(
-        service.comments()
-        .list(
+    response = await execute_async(
+        service.comments().list(
             fileId=file_id,
             fields="comments(id,content,author,createdTime,modifiedTime,resolved,anchor,quotedFileContent,replies(content,author,id,createdTime,modifiedTime))",
         )
-        .execute
     )
 
     comments = response.get("comments", [])
@@ -298,14 +296,12 @@ async def _create_comment_impl(
         body["anchor"] = anchor
         logger.info(f"[create_{app_name}_comment] Using anchor: {anchor}")
 
-    comment = await asyncio.to_thread(
-        service.comments()
-        .create(
+    comment = await execute_async(
+        service.comments().create(
             fileId=file_id,
             body=body,
             fields="id,content,author,createdTime,modifiedTime,anchor",
         )
-        .execute
     )
 
     comment_id = comment.get("id", "")
@@ -331,15 +327,13 @@ async def _reply_to_comment_impl(
 
     body = {"content": reply_content}
 
-    reply = await asyncio.to_thread(
-        service.replies()
-        .create(
+    reply = await execute_async(
+        service.replies().create(
             fileId=file_id,
             commentId=comment_id,
             body=body,
             fields="id,content,author,createdTime,modifiedTime",
         )
-        .execute
     )
 
     reply_id = reply.get("id", "")
@@ -359,15 +353,13 @@ async def _resolve_comment_impl(
 
     body = {"content": "This comment has been resolved.", "action": "resolve"}
 
-    reply = await asyncio.to_thread(
-        service.replies()
-        .create(
+    reply = await execute_async(
+        service.replies().create(
             fileId=file_id,
             commentId=comment_id,
             body=body,
             fields="id,content,author,createdTime,modifiedTime",
         )
-        .execute
     )
 
     reply_id = reply.get("id", "")
@@ -41,3 +41,24 @@ def set_fastmcp_session_id(session_id: Optional[str]):
     This is called when a FastMCP request starts.
     """
     _fastmcp_session_id.set(session_id)
+
+
+# Context variable to hold the Google user a tool call runs as, for the life
+# of a single request (used to key per-user API quotas).
+_current_user_email = contextvars.ContextVar("current_user_email", default=None)
+
+
+def get_current_user_email() -> Optional[str]:
+    """
+    Retrieve the authenticated Google user for the current request context.
+    This is called by the API execution layer to apply per-user quotas.
+    """
+    return _current_user_email.get()
+
+
+def set_current_user_email(user_email: Optional[str]):
+    """
+    Set or clear the authenticated Google user for the current request context.
+    This is called by the service decorator once the service is authenticated.
+    """
+    _current_user_email.set(user_email)
@@ -0,0 +1,181 @@
+"""
+Dedicated, instrumented thread pools for blocking work.
+
+``asyncio.to_thread`` and ``run_in_executor(None, ...)`` share the event
+loop's default executor, sized ``min(32, cpu_count + 4)``. Every blocking
+Google call, credential file read and document parse in the process competes
+for those few threads, so concurrent tool calls queue behind each other no
+matter how much load the pod could take, and nothing shows that they are
+queueing.
+
+Blocking work is split across two pools instead:
+
+* I/O (``run_io``): googleapiclient calls that cannot use core.async_http,
+  media downloads, credential storage and token refreshes. These threads
+  mostly wait on the network, so the pool is large.
+* CPU (``run_cpu``): parsing such as Office XML text extraction. Sized to the
+  CPU count so a burst of large files cannot crowd out I/O threads.
+
+Both pools copy the caller's context variables into the worker (as
+``asyncio.to_thread`` does) and report queue depth, queue wait and active
+threads via get_executor_stats.
+
+Configuration:
+    WORKSPACE_MCP_IO_THREADS: I/O pool size (default: 64)
+    WORKSPACE_MCP_CPU_THREADS: CPU pool size (default: number of CPUs)
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+IO_THREADS = int(os.getenv("WORKSPACE_MCP_IO_THREADS", "64"))
+CPU_THREADS = int(os.getenv("WORKSPACE_MCP_CPU_THREADS", str(os.cpu_count() or 4)))
+
+T = TypeVar("T")
+
+
+class InstrumentedExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor that tracks queue depth, queue wait and busy threads."""
+
+    def __init__(self, name: str, max_workers: int):
+        super().__init__(max_workers=max(1, max_workers), thread_name_prefix=name)
+        self.name = name
+        self._stats_lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._run_seconds = 0.0
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future:
+        submitted_at = time.monotonic()
+        with self._stats_lock:
+            self._queued += 1
+            self._submitted += 1
+
+        def run() -> T:
+            started_at = time.monotonic()
+            waited = started_at - submitted_at
+            with self._stats_lock:
+                self._queued -= 1
+                self._active += 1
+                self._wait_seconds += waited
+                self._max_wait_seconds = max(self._max_wait_seconds, waited)
+            failed = True
+            try:
+                result = fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                with self._stats_lock:
+                    self._active -= 1
+                    self._completed += 1
+                    self._failed += int(failed)
+                    self._run_seconds += time.monotonic() - started_at
+
+        try:
+            return super().submit(run)
+        except BaseException:
+            with self._stats_lock:
+                self._queued -= 1
+                self._submitted -= 1
+            raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get gauges (queue depth, active threads) and cumulative counters."""
+        with self._stats_lock:
+            started = self._completed + self._active
+            return {
+                "max_workers": self._max_workers,
+                "threads": len(self._threads),
+                "active": self._active,
+                "queue_depth": self._queued,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "wait_seconds_total": round(self._wait_seconds, 3),
+                "wait_seconds_max": round(self._max_wait_seconds, 3),
+                "wait_seconds_avg": (
+                    round(self._wait_seconds / started, 4) if started else 0.0
+                ),
+                "run_seconds_total": round(self._run_seconds, 3),
+            }
+
+
+_executors: Dict[str, InstrumentedExecutor] = {}
+_executors_lock = threading.Lock()
+_POOL_SIZES = {"io": lambda: IO_THREADS, "cpu": lambda: CPU_THREADS}
+
+
+def _get_executor(kind: str) -> InstrumentedExecutor:
+    executor = _executors.get(kind)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(kind)
+            if executor is None:
+                size = _POOL_SIZES[kind]()
+                executor = InstrumentedExecutor(f"workspace-mcp-{kind}", size)
+                _executors[kind] = executor
+                logger.debug(f"Started {kind} executor with {size} threads")
+    return executor
+
+
+def get_io_executor() -> InstrumentedExecutor:
+    """Return the process-wide pool for blocking I/O, creating it on first use."""
+    return _get_executor("io")
+
+
+def get_cpu_executor() -> InstrumentedExecutor:
+    """Return the process-wide pool for CPU-bound work, creating it on first use."""
+    return _get_executor("cpu")
+
+
+async def _run(
+    executor: InstrumentedExecutor, fn: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, fn, *args, **kwargs)
+    return await loop.run_in_executor(executor, call)
+
+
+async def run_io(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking I/O call on the I/O pool.
+
+    Drop-in replacement for ``await asyncio.to_thread(fn, *args, **kwargs)``.
+    """
+    return await _run(get_io_executor(), fn, *args, **kwargs)
+
+
+async def run_cpu(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run CPU-bound work (parsing, extraction) on the CPU pool."""
+    return await _run(get_cpu_executor(), fn, *args, **kwargs)
+
+
+def shutdown_executors(wait: bool = False) -> None:
+    """Shut down both pools; they are recreated on next use."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+def get_executor_stats(kind: Optional[str] = None) -> Dict[str, Any]:
+    """Get statistics for one pool ("io" or "cpu"), or for both."""
+    if kind is not None:
+        return _get_executor(kind).get_stats()
+    return {name: _get_executor(name).get_stats() for name in _POOL_SIZES}
@@ -0,0 +1,194 @@
+"""
+Thread-safe pooled httplib2 connections for googleapiclient.
+
+A googleapiclient service holds a single ``httplib2.Http`` and httplib2 objects
+are not thread-safe. Once service objects are cached and shared, requests that
+still run in worker threads (batch requests, media uploads and downloads) can
+use the same connection from several threads at once, which corrupts TLS
+state and shows up as SSL errors.
+
+``PooledAuthorizedHttp`` is a drop-in ``AuthorizedHttp`` whose underlying HTTP
+object checks out a dedicated ``httplib2.Http`` from a shared, bounded pool
+for each request. Connections are kept alive between requests and reused
+across users (authorization is per request), so concurrent calls no longer
+repeat the TLS handshake or share a connection.
+
+Configuration:
+    WORKSPACE_MCP_HTTP_POOL_SIZE: Maximum pooled httplib2 connections (default: 32)
+    WORKSPACE_MCP_HTTP_POOL_KEEPALIVE: Seconds an idle connection is kept
+        open before it is reset (default: 30)
+"""
+
+import contextlib
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.http import build_http
+
+from core.async_http import HTTP_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+HTTP_POOL_SIZE = int(os.getenv("WORKSPACE_MCP_HTTP_POOL_SIZE", "32"))
+HTTP_POOL_KEEPALIVE = float(os.getenv("WORKSPACE_MCP_HTTP_POOL_KEEPALIVE", "30"))
+
+
+class HttpConnectionPool:
+    """
+    Bounded pool of httplib2.Http objects.
+
+    Each checked-out object is used by exactly one thread at a time. When all
+    objects are in use, callers wait for one to be released.
+    """
+
+    def __init__(
+        self,
+        size: int = HTTP_POOL_SIZE,
+        keepalive: float = HTTP_POOL_KEEPALIVE,
+        timeout: Optional[float] = HTTP_TIMEOUT,
+    ):
+        if size <= 0:
+            raise ValueError("size must be positive")
+        self.size = size
+        self.keepalive = keepalive
+        self.timeout = timeout
+        self._idle: List[Tuple[float, httplib2.Http]] = []
+        self._created = 0
+        self._condition = threading.Condition()
+        self._acquisitions = 0
+        self._waits = 0
+        self._reuses = 0
+        self._expired = 0
+
+    def _new_http(self) -> httplib2.Http:
+        # build_http drops 308 from the redirect codes so resumable uploads
+        # see "308 Resume Incomplete" instead of a redirect error.
+        http = build_http()
+        http.timeout = self.timeout
+        return http
+
+    def acquire(self) -> httplib2.Http:
+        """Check out an Http object, waiting if the pool is exhausted."""
+        with self._condition:
+            self._acquisitions += 1
+            while not self._idle and self._created >= self.size:
+                self._waits += 1
+                self._condition.wait()
+
+            if self._idle:
+                # Most recently released first, so warm connections are reused
+                released_at, http = self._idle.pop()
+                if time.monotonic() - released_at > self.keepalive:
+                    http.close()
+                    self._expired += 1
+                else:
+                    self._reuses += 1
+                return http
+
+            self._created += 1
+
+        return self._new_http()
+
+    def release(self, http: httplib2.Http) -> None:
+        """Return an Http object to the pool."""
+        with self._condition:
+            self._idle.append((time.monotonic(), http))
+            self._condition.notify()
+
+    def discard(self, http: httplib2.Http) -> None:
+        """Drop an Http object whose connections may be in a broken state."""
+        try:
+            http.close()
+        except Exception:
+            pass
+        with self._condition:
+            self._created -= 1
+            self._condition.notify()
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[httplib2.Http]:
+        """Context manager that checks an Http object out for one request."""
+        http = self.acquire()
+        try:
+            yield http
+        except Exception:
+            self.discard(http)
+            raise
+        else:
+            self.release(http)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+            self._condition.notify_all()
+        for _, http in idle:
+            http.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        with self._condition:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "idle": len(self._idle),
+                "in_use": self._created - len(self._idle),
+                "acquisitions": self._acquisitions,
+                "waits": self._waits,
+                "reuses": self._reuses,
+                "keepalive_expired": self._expired,
+            }
+
+
+class PooledHttp:
+    """httplib2.Http-compatible object that runs each request on a pooled connection."""
+
+    def __init__(self, pool: HttpConnectionPool):
+        self._pool = pool
+        self.timeout = pool.timeout
+        self.follow_redirects = True
+        self.redirect_codes = httplib2.REDIRECT_CODES - {308}
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        with self._pool.connection() as http:
+            return http.request(uri, method, body=body, headers=headers, **kwargs)
+
+    def close(self) -> None:
+        """Connections belong to the shared pool; nothing to close per service."""
+
+
+class PooledAuthorizedHttp(AuthorizedHttp):
+    """AuthorizedHttp whose requests are spread over a shared connection pool."""
+
+    def __init__(self, credentials: Any, pool: Optional[HttpConnectionPool] = None):
+        super().__init__(credentials, http=PooledHttp(pool or get_http_pool()))
+
+
+_http_pool: Optional[HttpConnectionPool] = None
+_http_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> HttpConnectionPool:
+    """Return the process-wide connection pool, creating it on first use."""
+    global _http_pool
+    if _http_pool is None:
+        with _http_pool_lock:
+            if _http_pool is None:
+                _http_pool = HttpConnectionPool()
+    return _http_pool
+
+
+def build_authorized_http(credentials: Any) -> PooledAuthorizedHttp:
+    """Create a thread-safe authorized HTTP object for a googleapiclient service."""
+    return PooledAuthorizedHttp(credentials)
+
+
+def get_http_pool_stats() -> Dict[str, Any]:
+    """Get statistics for the shared connection pool."""
+    return get_http_pool().get_stats()
@@ -0,0 +1,120 @@
+"""
+Lazy tool registration from the tool schema manifest.
+
+Importing every tool module at startup is the slowest part of launching the
+server: gdocs/docs_tools.py alone is over 10k lines, and every
+``@require_google_service`` / ``@server.tool()`` decorator rebuilds signatures,
+rewrites docstrings and generates a JSON schema. None of that is needed to
+answer ``tools/list``.
+
+In lazy mode the server registers a ``LazyTool`` per entry in the tool
+manifest (see core.tool_manifest) instead of importing the modules. The
+first call to any tool imports its module on the CPU pool (see
+core.executors); the module's decorators then replace every LazyTool from
+that module with the real tool, and the call is forwarded to it.
+
+Lazy mode falls back to importing modules eagerly when the manifest is
+missing, and is not used in optimizer mode, which needs the tool functions.
+
+Configuration:
+    WORKSPACE_MCP_LAZY_TOOLS: Set to "true" to register tools from the
+        manifest (same as --lazy-tools)
+"""
+
+import asyncio
+import logging
+import os
+from importlib import import_module
+from typing import Any, Dict, Iterable, List
+
+from fastmcp.tools import Tool
+from mcp.types import ToolAnnotations
+
+from core.executors import run_cpu
+from core.tool_manifest import TOOL_MODULES
+from core.tool_registry import filter_server_tools, is_tool_enabled
+
+logger = logging.getLogger(__name__)
+
+LAZY_TOOLS_ENABLED = os.getenv("WORKSPACE_MCP_LAZY_TOOLS", "false").lower() == "true"
+
+# Set by register_lazy_tools; LazyTool.run resolves real tools through it
+_server: Any = None
+_module_locks: Dict[str, asyncio.Lock] = {}
+_loaded_modules: set = set()
+
+
+def _import_tool_module(module: str) -> None:
+    manager = _server._tool_manager
+    # The module's decorators re-register names the LazyTools hold; replace
+    # them quietly rather than warning once per tool.
+    previous = getattr(manager, "duplicate_behavior", None)
+    manager.duplicate_behavior = "replace"
+    try:
+        import_module(module)
+    finally:
+        manager.duplicate_behavior = previous
+
+
+async def load_tool_module(module: str) -> None:
+    """Import a tool module once, off the event loop."""
+    if module in _loaded_modules:
+        return
+    lock = _module_locks.setdefault(module, asyncio.Lock())
+    async with lock:
+        if module in _loaded_modules:
+            return
+        logger.info(f"Loading tool module {module} on first use")
+        await run_cpu(_import_tool_module, module)
+        # Importing registers every tool in the module, including tier-disabled
+        # ones. Filter on the loop, where tools/list iterates the registry.
+        filter_server_tools(_server)
+        _loaded_modules.add(module)
+
+
+class LazyTool(Tool):
+    """Manifest-backed placeholder that imports its module on first call."""
+
+    module: str
+
+    async def run(self, arguments: Dict[str, Any]) -> Any:
+        await load_tool_module(self.module)
+        tool = _server._tool_manager._tools.get(self.name)
+        if tool is None or isinstance(tool, LazyTool):
+            raise RuntimeError(
+                f"Tool module {self.module} did not register {self.name}; "
+                "the tool manifest is out of date"
+            )
+        return await tool.run(arguments)
+
+
+def register_lazy_tools(
+    server: Any, manifest: Dict[str, Any], services: Iterable[str]
+) -> List[str]:
+    """
+    Register a LazyTool for every manifest tool of the given services.
+
+    Returns:
+        Names of the registered tools
+    """
+    global _server
+    _server = server
+    modules = {TOOL_MODULES[service] for service in services if service in TOOL_MODULES}
+    registered = []
+    for entry in manifest["tools"]:
+        if entry["module"] not in modules or not is_tool_enabled(entry["name"]):
+            continue
+        annotations = entry.get("annotations")
+        server.add_tool(
+            LazyTool(
+                name=entry["name"],
+                description=entry["description"],
+                parameters=entry["parameters"],
+                output_schema=entry.get("output_schema"),
+                annotations=ToolAnnotations(**annotations) if annotations else None,
+                tags=set(entry.get("tags") or ()),
+                module=entry["module"],
+            )
+        )
+        registered.append(entry["name"])
+    return registered
@@ -24,6 +24,36 @@ class EnhancedLogFormatter(logging.Formatter):
         "RESET": "\033[0m",  # Reset
     }
 
+    # ASCII-safe prefixes for different services
+    ASCII_PREFIXES = {
+        "core.tool_tier_loader": "[TOOLS]",
+        "core.tool_registry": "[REGISTRY]",
+        "auth.scopes": "[AUTH]",
+        "core.utils": "[UTILS]",
+        "auth.google_auth": "[OAUTH]",
+        "auth.credential_store": "[CREDS]",
+        "gcalendar.calendar_tools": "[CALENDAR]",
+        "gdrive.drive_tools": "[DRIVE]",
+        "gmail.gmail_tools": "[GMAIL]",
+        "gdocs.docs_tools": "[DOCS]",
+        "gsheets.sheets_tools": "[SHEETS]",
+        "gchat.chat_tools": "[CHAT]",
+        "gforms.forms_tools": "[FORMS]",
+        "gslides.slides_tools": "[SLIDES]",
+        "gtasks.tasks_tools": "[TASKS]",
+        "gsearch.search_tools": "[SEARCH]",
+    }
+
+    # Loggers whose messages _enhance_message rewrites
+    ENHANCED_LOGGERS = frozenset(
+        {"core.tool_tier_loader", "core.tool_registry", "auth.scopes", "core.utils"}
+    )
+
+    _TIER_PATTERN = re.compile(
+        r"Tier '(\w+)' resolved to (\d+) tools across (\d+) services: (.+)"
+    )
+    _FILTERING_PATTERN = re.compile(r"removed (\d+) tools, (\d+) enabled")
+
     def __init__(self, use_colors: bool = True, *args, **kwargs):
         """
         Initialize the emoji log formatter.
@@ -39,8 +69,11 @@ class EnhancedLogFormatter(logging.Formatter):
         # Get the appropriate ASCII prefix for the service
         service_prefix = self._get_ascii_prefix(record.name, record.levelname)
 
-        # Format the message with enhanced styling
-        formatted_msg = self._enhance_message(record.getMessage())
+        # Format the message with enhanced styling. Only startup messages from
+        # a few loggers are rewritten, so skip the pattern checks for the rest.
+        formatted_msg = record.getMessage()
+        if record.name in self.ENHANCED_LOGGERS:
+            formatted_msg = self._enhance_message(formatted_msg)
 
         # Build the formatted log entry
         if self.use_colors:
@@ -52,27 +85,7 @@ class EnhancedLogFormatter(logging.Formatter):
 
     def _get_ascii_prefix(self, logger_name: str, level_name: str) -> str:
         """Get ASCII-safe prefix for Windows compatibility."""
-        # ASCII-safe prefixes for different services
-        ascii_prefixes = {
-            "core.tool_tier_loader": "[TOOLS]",
-            "core.tool_registry": "[REGISTRY]",
-            "auth.scopes": "[AUTH]",
-            "core.utils": "[UTILS]",
-            "auth.google_auth": "[OAUTH]",
-            "auth.credential_store": "[CREDS]",
-            "gcalendar.calendar_tools": "[CALENDAR]",
-            "gdrive.drive_tools": "[DRIVE]",
-            "gmail.gmail_tools": "[GMAIL]",
-            "gdocs.docs_tools": "[DOCS]",
-            "gsheets.sheets_tools": "[SHEETS]",
-            "gchat.chat_tools": "[CHAT]",
-            "gforms.forms_tools": "[FORMS]",
-            "gslides.slides_tools": "[SLIDES]",
-            "gtasks.tasks_tools": "[TASKS]",
-            "gsearch.search_tools": "[SEARCH]",
-        }
-
-        return ascii_prefixes.get(logger_name, f"[{level_name}]")
+        return self.ASCII_PREFIXES.get(logger_name, f"[{level_name}]")
 
     def _enhance_message(self, message: str) -> str:
         """Enhance the log message with better formatting."""
@@ -81,10 +94,7 @@ class EnhancedLogFormatter(logging.Formatter):
         # Tool tier loading messages
         if "resolved to" in message and "tools across" in message:
             # Extract numbers and service names for better formatting
-            pattern = (
-                r"Tier '(\w+)' resolved to (\d+) tools across (\d+) services: (.+)"
-            )
-            match = re.search(pattern, message)
+            match = self._TIER_PATTERN.search(message)
             if match:
                 tier, tool_count, service_count, services = match.groups()
                 return f"Tool tier '{tier}' loaded: {tool_count} tools across {service_count} services [{services}]"
@@ -96,8 +106,7 @@ class EnhancedLogFormatter(logging.Formatter):
 
         # Tool filtering messages
         if "Tool tier filtering" in message:
-            pattern = r"removed (\d+) tools, (\d+) enabled"
-            match = re.search(pattern, message)
+            match = self._FILTERING_PATTERN.search(message)
             if match:
                 removed, enabled = match.groups()
                 return f"Tool filtering complete: {enabled} tools enabled ({removed} filtered out)"
@@ -0,0 +1,303 @@
+"""
+Off-loop, structured logging for Google Workspace MCP.
+
+By default every handler (console and mcp_server_debug.log) runs on whatever
+thread logs the record, which for tool calls is the event loop: messages are
+formatted, run through EnhancedLogFormatter and written to disk before the
+coroutine continues. With the pipeline enabled, the root logger gets a single
+QueueHandler and the real handlers run on a QueueListener thread::
+
+    logger.info(...)  ->  LogSampler  ->  QueueHandler  ->  queue
+                                                             |
+                                 QueueListener thread  <-----+
+                                   ├── console handler (text or JSON)
+                                   └── file handler     (text or JSON)
+
+On the logging thread a record costs a sampling check, a contextvar read and
+a queue put. ``%``-style arguments are interpolated on the listener thread
+when they are immutable (str, numbers, None, tuples of these); anything else
+is formatted before queueing, since the caller may mutate it afterwards.
+
+JSON mode writes one object per line with the timestamp, level, logger,
+message, source location, thread, the active trace and span ids (see
+core.tracing) and the user the tool call runs as.
+
+Sampling keeps a fraction of INFO and DEBUG records per logger (and its
+children); WARNING and above are always kept. For example, to keep 10% of
+credential lookups and 1% of Docs history records::
+
+    WORKSPACE_MCP_LOG_SAMPLING="auth.google_auth=0.1,gdocs.managers.history_manager=0.01"
+
+Configuration:
+    WORKSPACE_MCP_LOG_FORMAT: "text" (default) or "json"; "json" also
+        enables the queue
+    WORKSPACE_MCP_LOG_QUEUE: Set to "true" to use the queue with text
+        output (default: true in JSON mode, false otherwise)
+    WORKSPACE_MCP_LOG_SAMPLING: Comma-separated logger=ratio pairs
+"""
+
+import atexit
+import datetime
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import threading
+from typing import Any, Dict, List, Optional
+
+from core.context import get_current_user_email
+from core.tracing import current_span
+
+LOG_FORMAT = os.getenv("WORKSPACE_MCP_LOG_FORMAT", "text").lower()
+LOG_QUEUE_ENABLED = (
+    os.getenv(
+        "WORKSPACE_MCP_LOG_QUEUE", "true" if LOG_FORMAT == "json" else "false"
+    ).lower()
+    == "true"
+)
+LOG_SAMPLING = os.getenv("WORKSPACE_MCP_LOG_SAMPLING", "")
+
+_IMMUTABLE = (str, int, float, bool, type(None), bytes)
+
+# LogRecord attributes that are not caller-supplied ``extra`` fields
+_RECORD_FIELDS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", (), None)).keys()
+) | {"message", "asctime", "trace_id", "span_id", "user_email"}
+
+
+def _is_immutable(value: Any) -> bool:
+    if isinstance(value, tuple):
+        return all(_is_immutable(v) for v in value)
+    return isinstance(value, _IMMUTABLE)
+
+
+def parse_sampling(spec: str) -> Dict[str, float]:
+    """Parse "logger=ratio,..." into a dict, skipping malformed entries."""
+    rates: Dict[str, float] = {}
+    for item in spec.split(","):
+        name, sep, value = item.partition("=")
+        if not sep or not name.strip():
+            continue
+        try:
+            rates[name.strip()] = min(1.0, max(0.0, float(value)))
+        except ValueError:
+            logging.getLogger(__name__).warning(
+                "Ignoring invalid log sampling entry %r", item
+            )
+    return rates
+
+
+def _capture_context(record: logging.LogRecord) -> None:
+    span = current_span()
+    record.trace_id = span.trace_id if span is not None else None
+    record.span_id = span.span_id if span is not None else None
+    record.user_email = get_current_user_email()
+
+
+class LogSampler(logging.Filter):
+    """
+    Keep a fraction of INFO/DEBUG records from selected loggers.
+
+    Rates apply to a logger and its children; the most specific configured
+    name wins. WARNING and above always pass.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = dict(rates)
+        self._resolved: Dict[str, Optional[float]] = {}
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def _rate_for(self, name: str) -> Optional[float]:
+        try:
+            return self._resolved[name]
+        except KeyError:
+            pass
+        rate = None
+        candidate = name
+        while candidate:
+            if candidate in self.rates:
+                rate = self.rates[candidate]
+                break
+            candidate = candidate.rpartition(".")[0]
+        self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate_for(record.name)
+        if rate is None or rate >= 1.0 or random.random() < rate:
+            return True
+        with self._lock:
+            self.dropped += 1
+        return False
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that defers message formatting to the listener thread.
+
+    The stock QueueHandler formats every record before queueing it, which is
+    the work this pipeline exists to move off the event loop. Request context
+    (trace ids, user) lives in contextvars, so it is captured here.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args and not _is_immutable(record.args):
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info and not record.exc_text:
+            # Tracebacks pin frames (and their locals) until formatted
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        _capture_context(record)
+        return record
+
+
+class JsonLogFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "timestamp": datetime.datetime.fromtimestamp(
+                record.created, tz=datetime.timezone.utc
+            ).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "thread": record.threadName,
+        }
+        if not hasattr(record, "trace_id"):
+            # Formatted synchronously, so the caller's context is still current
+            _capture_context(record)
+        for key in ("trace_id", "span_id", "user_email"):
+            value = getattr(record, key, None)
+            if value:
+                entry[key] = value
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_FIELDS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_target: Optional[logging.Logger] = None
+_queue_handler: Optional[ContextQueueHandler] = None
+_moved_handlers: List[logging.Handler] = []
+_sampler: Optional[LogSampler] = None
+_sampled_handlers: List[logging.Handler] = []
+_pipeline_lock = threading.Lock()
+
+
+def configure_log_pipeline(
+    json_format: Optional[bool] = None,
+    use_queue: Optional[bool] = None,
+    sampling: Optional[Dict[str, float]] = None,
+    logger: Optional[logging.Logger] = None,
+) -> bool:
+    """
+    Move the handlers of ``logger`` (default: root) behind a queue.
+
+    Call this after all handlers are installed (console, file); handlers added
+    later stay synchronous. Calling it again first undoes the previous setup.
+
+    Args:
+        json_format: Use JsonLogFormatter on every handler
+            (default: WORKSPACE_MCP_LOG_FORMAT == "json")
+        use_queue: Hand records to a QueueListener thread
+            (default: WORKSPACE_MCP_LOG_QUEUE)
+        sampling: Logger name to kept fraction of INFO/DEBUG records
+            (default: WORKSPACE_MCP_LOG_SAMPLING)
+        logger: Logger to configure (default: root)
+
+    Returns:
+        bool: True if the queue listener was started
+    """
+    global _listener, _queue_handler, _sampler, _target
+    if json_format is None:
+        json_format = LOG_FORMAT == "json"
+    if use_queue is None:
+        use_queue = LOG_QUEUE_ENABLED
+    if sampling is None:
+        sampling = parse_sampling(LOG_SAMPLING)
+    target = logger or logging.getLogger()
+
+    stop_log_pipeline()
+    with _pipeline_lock:
+        handlers = list(target.handlers)
+        if json_format:
+            formatter = JsonLogFormatter()
+            for handler in handlers:
+                handler.setFormatter(formatter)
+
+        _sampler = LogSampler(sampling) if sampling else None
+
+        if not use_queue:
+            if _sampler is not None:
+                for handler in handlers:
+                    handler.addFilter(_sampler)
+                    _sampled_handlers.append(handler)
+            return False
+
+        for handler in handlers:
+            target.removeHandler(handler)
+        _moved_handlers[:] = handlers
+
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        _queue_handler = ContextQueueHandler(log_queue)
+        if _sampler is not None:
+            _queue_handler.addFilter(_sampler)
+        _listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _listener.start()
+        target.addHandler(_queue_handler)
+        _target = target
+        return True
+
+
+def stop_log_pipeline() -> None:
+    """Drain the queue and put the original handlers back on their logger."""
+    global _listener, _queue_handler, _sampler, _target
+    with _pipeline_lock:
+        listener, queue_handler, target = _listener, _queue_handler, _target
+        _listener, _queue_handler, _target = None, None, None
+        if queue_handler is not None and target is not None:
+            target.removeHandler(queue_handler)
+            if listener is not None:
+                listener.stop()
+            for handler in _moved_handlers:
+                target.addHandler(handler)
+            _moved_handlers.clear()
+        if _sampler is not None:
+            for handler in _sampled_handlers:
+                handler.removeFilter(_sampler)
+        _sampled_handlers.clear()
+        _sampler = None
+
+
+atexit.register(stop_log_pipeline)
+
+
+def get_log_pipeline_stats() -> Dict[str, Any]:
+    """Get pipeline mode and the number of records dropped by sampling."""
+    sampler = _sampler
+    return {
+        "queued": _listener is not None,
+        "format": LOG_FORMAT,
+        "sampling": dict(sampler.rates) if sampler else {},
+        "sampled_out": sampler.dropped if sampler else 0,
+    }
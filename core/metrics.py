@@ -0,0 +1,534 @@
+"""
+Prometheus metrics for Google Workspace MCP.
+
+A small, dependency-free registry rendered in the Prometheus text exposition
+format by the ``/metrics`` route. Measurements are taken centrally:
+
+* handle_http_errors wraps every tool call in track_tool_call: latency
+  histogram and call count by tool and outcome, in-flight gauge, and how many
+  Google API requests the call made.
+* core.async_http records every Google API request: count by (service,
+  method, status), latency histogram and in-flight gauge.
+* require_google_service records how long credential lookup and service
+  construction take per service.
+
+Everything else (cache hit ratios, token refreshes, retries, quota pacing,
+circuit breakers, executors) is already counted by the component that does
+the work and is read from its get_*_stats() function at scrape time, so it
+costs nothing between scrapes.
+
+Recording is a dictionary lookup and an addition under a lock per metric.
+
+Configuration:
+    WORKSPACE_MCP_METRICS: Set to "false" to disable collection and /metrics
+"""
+
+import bisect
+import contextlib
+import contextvars
+import logging
+import math
+import os
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from core.circuit_breaker import CircuitOpenError
+from core.rate_limit import api_for_uri
+
+logger = logging.getLogger(__name__)
+
+METRICS_ENABLED = os.getenv("WORKSPACE_MCP_METRICS", "true").lower() != "false"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# (labels, value) pairs for one metric family
+Samples = List[Tuple[Dict[str, str], float]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Tuple[str, ...]) -> Tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {labels}"
+            )
+        return tuple(str(v) for v in labels)
+
+    def _lines(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._lines())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, *labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _lines(self) -> Iterator[str]:
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            labels = _format_labels(list(zip(self.labelnames, key)))
+            yield f"{self.name}{labels} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """Value that can go up and down per label set."""
+
+    kind = "gauge"
+
+    def set(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    """Bucketed observations per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = (0.1, 0.5, 1, 5, 10),
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label key -> [per-bucket counts..., +Inf count, sum]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            state[index] += 1
+            state[-1] += value
+
+    def get_count(self, *labels: str) -> float:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return sum(state[:-1]) if state else 0.0
+
+    def _lines(self) -> Iterator[str]:
+        with self._lock:
+            values = [(key, list(state)) for key, state in self._values.items()]
+        for key, state in values:
+            base = list(zip(self.labelnames, key))
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (math.inf,), state[:-1]):
+                cumulative += count
+                labels = _format_labels(base + [("le", _format_value(bound))])
+                yield f"{self.name}_bucket{labels} {_format_value(cumulative)}"
+            labels = _format_labels(base)
+            yield f"{self.name}_sum{labels} {_format_value(state[-1])}"
+            yield f"{self.name}_count{labels} {_format_value(cumulative)}"
+
+
+class MetricsRegistry:
+    """Holds metrics and scrape-time collectors, and renders them."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[
+            Callable[[], Iterable[Tuple[str, str, str, Samples]]]
+        ] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames=(), buckets=(0.1, 0.5, 1, 5)
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(
+        self, collector: Callable[[], Iterable[Tuple[str, str, str, Samples]]]
+    ) -> None:
+        """
+        Register a function called at scrape time.
+
+        It returns (name, type, help, samples) tuples, where samples is a list
+        of (labels, value) pairs.
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        blocks = [metric.render() for metric in metrics]
+        for collector in collectors:
+            try:
+                families = list(collector())
+            except Exception as e:
+                logger.warning(f"Metrics collector {collector.__name__} failed: {e}")
+                continue
+            for name, kind, documentation, samples in families:
+                lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+                for labels, value in samples:
+                    lines.append(
+                        f"{name}{_format_labels(sorted(labels.items()))} "
+                        f"{_format_value(float(value))}"
+                    )
+                blocks.append("\n".join(lines))
+        return "\n".join(blocks) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+TOOL_DURATION = REGISTRY.histogram(
+    "workspace_mcp_tool_duration_seconds",
+    "Tool call latency by tool, service and outcome.",
+    ("tool", "service", "outcome"),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+TOOL_IN_FLIGHT = REGISTRY.gauge(
+    "workspace_mcp_tool_in_flight",
+    "Tool calls currently executing.",
+    ("tool",),
+)
+TOOL_API_REQUESTS = REGISTRY.histogram(
+    "workspace_mcp_tool_api_requests",
+    "Google API requests made per tool call.",
+    ("tool",),
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200),
+)
+API_REQUESTS = REGISTRY.counter(
+    "workspace_mcp_google_api_requests_total",
+    "Google API requests by service, API method and HTTP status.",
+    ("service", "method", "status"),
+)
+API_DURATION = REGISTRY.histogram(
+    "workspace_mcp_google_api_request_duration_seconds",
+    "Google API request latency by service and API method.",
+    ("service", "method"),
+    buckets=(0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+API_IN_FLIGHT = REGISTRY.gauge(
+    "workspace_mcp_google_api_in_flight",
+    "Google API requests currently in flight.",
+    ("service",),
+)
+SERVICE_AUTH_DURATION = REGISTRY.histogram(
+    "workspace_mcp_service_auth_duration_seconds",
+    "Time to load credentials and build a Google service client.",
+    ("service",),
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+
+class _ToolCall:
+    __slots__ = ("api_requests",)
+
+    def __init__(self):
+        self.api_requests = 0
+
+
+_current_call: contextvars.ContextVar[Optional[_ToolCall]] = contextvars.ContextVar(
+    "metrics_tool_call", default=None
+)
+
+
+@contextlib.contextmanager
+def track_tool_call(tool_name: str, service: Optional[str] = None) -> Iterator[None]:
+    """Measure one tool call: latency, outcome and Google requests made."""
+    if not METRICS_ENABLED:
+        yield
+        return
+    call = _ToolCall()
+    token = _current_call.set(call)
+    TOOL_IN_FLIGHT.inc(tool_name)
+    started = time.perf_counter()
+    outcome = "success"
+    try:
+        yield
+    except CircuitOpenError:
+        outcome = "circuit_open"
+        raise
+    except BaseException:
+        outcome = "error"
+        raise
+    finally:
+        _current_call.reset(token)
+        TOOL_IN_FLIGHT.dec(tool_name)
+        TOOL_DURATION.observe(
+            time.perf_counter() - started, tool_name, service or "none", outcome
+        )
+        TOOL_API_REQUESTS.observe(call.api_requests, tool_name)
+
+
+@contextlib.contextmanager
+def track_api_request(uri: str, method: str) -> Iterator[Callable[[Any], None]]:
+    """
+    Measure one Google API request.
+
+    Yields a function to call with the response status; if it is not called
+    before an exception, the request is counted with status "error".
+    """
+    if not METRICS_ENABLED:
+        yield lambda status: None
+        return
+    service = api_for_uri(uri) or "other"
+    status = ["error"]
+    call = _current_call.get()
+    if call is not None:
+        call.api_requests += 1
+    API_IN_FLIGHT.inc(service)
+    started = time.perf_counter()
+    try:
+        yield lambda value: status.__setitem__(0, str(value))
+    finally:
+        API_IN_FLIGHT.dec(service)
+        API_DURATION.observe(time.perf_counter() - started, service, method)
+        API_REQUESTS.inc(service, method, status[0])
+
+
+def record_service_auth(service: str, seconds: float) -> None:
+    """Record how long authenticating a service for a tool call took."""
+    if METRICS_ENABLED:
+        SERVICE_AUTH_DURATION.observe(seconds, service)
+
+
+def _component_metrics() -> Iterable[Tuple[str, str, str, Samples]]:
+    """Read counters kept by other components (imported lazily)."""
+    from auth.auth_info_middleware import get_token_verification_stats
+    from auth.credential_store import get_credential_cache_stats
+    from auth.refresh_scheduler import get_refresh_scheduler_stats
+    from auth.service_cache import get_service_cache_stats
+    from auth.token_refresh import get_token_refresh_coordinator
+    from core.async_http import get_async_http_stats
+    from core.circuit_breaker import get_circuit_breaker_stats
+    from core.executors import get_executor_stats
+    from core.rate_limit import get_rate_limit_stats
+    from core.response_cache import get_response_cache_stats
+    from core.retry import get_retry_stats
+    from core.singleflight import get_coalescing_stats
+
+    caches = {
+        "service": get_service_cache_stats(),
+        "token_verification": get_token_verification_stats(),
+    }
+    credentials = get_credential_cache_stats()
+    if credentials is not None:
+        caches["credentials"] = credentials
+    response = get_response_cache_stats()
+    yield (
+        "workspace_mcp_cache_hits_total",
+        "counter",
+        "Cache hits by cache.",
+        [({"cache": name}, s["hits"]) for name, s in caches.items()]
+        + [
+            ({"cache": "response_etag"}, response["etag_hits"]),
+            ({"cache": "response_revision"}, response["revision_hits"]),
+        ],
+    )
+    yield (
+        "workspace_mcp_cache_misses_total",
+        "counter",
+        "Cache misses by cache (stale response cache entries included).",
+        [({"cache": name}, s["misses"]) for name, s in caches.items()]
+        + [({"cache": "response"}, response["misses"] + response["stale"])],
+    )
+    yield (
+        "workspace_mcp_cache_hit_ratio",
+        "gauge",
+        "Hit ratio since start by cache.",
+        [({"cache": name}, s["hit_ratio"]) for name, s in caches.items()]
+        + [({"cache": "response"}, response["hit_rate"])],
+    )
+    yield (
+        "workspace_mcp_response_cache_bytes",
+        "gauge",
+        "Bytes held by the response cache by tier.",
+        [
+            ({"tier": "memory"}, response["memory_bytes"]),
+            ({"tier": "disk"}, response["disk_bytes"]),
+        ],
+    )
+
+    refresh = get_token_refresh_coordinator().get_stats()
+    yield (
+        "workspace_mcp_token_refreshes_total",
+        "counter",
+        "OAuth token refreshes by trigger.",
+        [
+            ({"reason": "inline"}, refresh["inline_refreshes"]),
+            ({"reason": "proactive"}, refresh["proactive_refreshes"]),
+        ],
+    )
+    yield (
+        "workspace_mcp_token_refresh_failures_total",
+        "counter",
+        "Failed OAuth token refreshes.",
+        [({}, refresh["failures"])],
+    )
+    yield (
+        "workspace_mcp_proactive_refresh_users",
+        "gauge",
+        "Users whose tokens are kept fresh in the background.",
+        [({}, get_refresh_scheduler_stats()["active_users"])],
+    )
+
+    retries = get_retry_stats()
+    yield (
+        "workspace_mcp_google_api_retries_total",
+        "counter",
+        "Google API request retries by response status.",
+        [({"status": str(s)}, n) for s, n in retries["by_status"].items()],
+    )
+    yield (
+        "workspace_mcp_retry_budget_exhausted_total",
+        "counter",
+        "Tool calls that ran out of retry budget.",
+        [({}, retries["budget_exhausted"])],
+    )
+
+    pacing = get_rate_limit_stats()
+    yield (
+        "workspace_mcp_rate_limit_wait_seconds_total",
+        "counter",
+        "Seconds requests were delayed to stay within per-user quotas, by API.",
+        [({"api": api}, s["wait_seconds"]) for api, s in pacing["apis"].items()],
+    )
+    yield (
+        "workspace_mcp_rate_limit_throttled_total",
+        "counter",
+        "Requests delayed to stay within per-user quotas, by API.",
+        [({"api": api}, s["throttled"]) for api, s in pacing["apis"].items()],
+    )
+
+    coalescing = get_coalescing_stats()
+    yield (
+        "workspace_mcp_coalesced_tool_calls_total",
+        "counter",
+        "Read-only tool calls served by joining an identical in-flight call.",
+        [({}, coalescing["coalesced"])],
+    )
+
+    state_values = {"closed": 0, "half_open": 1, "open": 2}
+    breakers = get_circuit_breaker_stats()["services"]
+    yield (
+        "workspace_mcp_circuit_state",
+        "gauge",
+        "Circuit breaker state by service (0 closed, 1 half-open, 2 open).",
+        [({"service": n}, state_values[s["state"]]) for n, s in breakers.items()],
+    )
+    yield (
+        "workspace_mcp_circuit_rejected_total",
+        "counter",
+        "Tool calls rejected by an open circuit, by service.",
+        [({"service": n}, s["rejected"]) for n, s in breakers.items()],
+    )
+
+    pools = get_executor_stats()
+    for field, name, kind, documentation in (
+        ("queue_depth", "queue_depth", "gauge", "Tasks waiting for a thread."),
+        ("active", "active_threads", "gauge", "Threads running a task."),
+        ("max_workers", "max_threads", "gauge", "Configured pool size."),
+        ("wait_seconds_total", "wait_seconds_total", "counter", "Seconds queued."),
+        ("completed", "tasks_completed_total", "counter", "Tasks completed."),
+    ):
+        yield (
+            f"workspace_mcp_executor_{name}",
+            kind,
+            f"{documentation[:-1]}, by pool.",
+            [({"pool": pool}, s[field]) for pool, s in pools.items()],
+        )
+
+    http = get_async_http_stats()
+    yield (
+        "workspace_mcp_google_api_executions_total",
+        "counter",
+        "Google API requests by execution path.",
+        [
+            ({"path": "async"}, http["async_requests"]),
+            ({"path": "threaded"}, http["threaded_requests"]),
+        ],
+    )
+
+
+REGISTRY.add_collector(_component_metrics)
+
+
+def render_metrics() -> str:
+    """Render all metrics for a Prometheus scrape."""
+    return REGISTRY.render()
@@ -5,42 +5,219 @@ This module provides optional tool optimization through semantic search,
 allowing LLMs to discover and use tools on-demand rather than loading
 all tool schemas at once.
 
-Requires: numpy, sentence-transformers
+Tool embeddings are persisted between starts in a memory-mapped .npy file,
+keyed by model name and a hash of each tool's embedded text. Only new or
+changed tools are re-encoded, and when every tool is cached the embedding
+model is not loaded until the first search.
+
+Searches compare against a pre-normalized float32 copy of the embeddings,
+reuse the embeddings of recently seen queries, and can be batched with
+find_similar_tools_many.
+
+Every search mode also has a BM25 index (core.tool_index) that needs no
+extra dependencies. Search modes:
+
+- hybrid (default): blend embedding and BM25 scores; BM25 only when numpy
+  or sentence-transformers is missing
+- lexical: BM25 only; the embedding model is never loaded, which suits
+  low-memory pods
+- semantic: embeddings only
+
+Semantic search requires: numpy, sentence-transformers
+
+Configuration:
+    WORKSPACE_MCP_OPTIMIZER_SEARCH: "hybrid", "lexical" or "semantic"
+        (default: hybrid)
+    WORKSPACE_MCP_OPTIMIZER_SEMANTIC_WEIGHT: Weight of the embedding score in
+        hybrid ranking, from 0 to 1 (default: 0.7)
+    WORKSPACE_MCP_EMBEDDING_CACHE: Set to "false" to re-encode every tool on
+        each start
+    WORKSPACE_MCP_EMBEDDING_CACHE_DIR: Cache directory
+        (default: ~/.google_workspace_mcp/embeddings)
+    WORKSPACE_MCP_OPTIMIZER_QUERY_CACHE_SIZE: Search queries whose
+        embeddings are kept (default: 512)
 """
 
+import hashlib
+import json
 import logging
-from typing import Optional, Any
+import os
+import re
+import tempfile
+import threading
+from typing import Any, Callable, Optional
+
+from core.cache import TTLCache
+from core.tool_index import LexicalToolIndex
 
 try:
     import numpy as np
     from sentence_transformers import SentenceTransformer
 
-    OPTIMIZER_AVAILABLE = True
+    SEMANTIC_SEARCH_AVAILABLE = True
 except ImportError:
-    OPTIMIZER_AVAILABLE = False
+    SEMANTIC_SEARCH_AVAILABLE = False
     np = None
     SentenceTransformer = None
 
 logger = logging.getLogger(__name__)
 
+SEARCH_MODES = ("hybrid", "lexical", "semantic")
+SEARCH_MODE = os.getenv("WORKSPACE_MCP_OPTIMIZER_SEARCH", "hybrid").lower()
+SEMANTIC_WEIGHT = float(os.getenv("WORKSPACE_MCP_OPTIMIZER_SEMANTIC_WEIGHT", "0.7"))
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_CACHE_ENABLED = (
+    os.getenv("WORKSPACE_MCP_EMBEDDING_CACHE", "true").lower() != "false"
+)
+QUERY_CACHE_SIZE = int(os.getenv("WORKSPACE_MCP_OPTIMIZER_QUERY_CACHE_SIZE", "512"))
+# Query embeddings only change with the model; the TTL just bounds staleness
+# of rarely repeated queries.
+QUERY_CACHE_TTL = 24 * 3600
+
+
+def _default_embedding_cache_dir() -> str:
+    if os.getenv("WORKSPACE_MCP_EMBEDDING_CACHE_DIR"):
+        return os.getenv("WORKSPACE_MCP_EMBEDDING_CACHE_DIR")
+    home_dir = os.path.expanduser("~")
+    if home_dir and home_dir != "~":
+        return os.path.join(home_dir, ".google_workspace_mcp", "embeddings")
+    return os.path.join(os.getcwd(), ".embeddings")
+
+
+def _normalize(vectors: "np.ndarray") -> "np.ndarray":
+    """Scale rows to unit length as a contiguous float32 array."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.ascontiguousarray(vectors / norms)
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    On-disk embedding matrix for one model.
+
+    ``<model>.json`` lists the text hash of each row of the matrix file it
+    names. Matrix files are named after the hashes of their rows and written
+    before the index is replaced, so readers never pair an index with the
+    wrong matrix.
+    """
+
+    def __init__(self, directory: str, model_name: str):
+        self.directory = directory
+        self.model_name = model_name
+        stem = re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+        self.index_path = os.path.join(directory, f"{stem}.json")
+        self._stem = stem
+
+    def load(self) -> tuple[dict[str, int], Optional["np.ndarray"]]:
+        """Return (text hash -> row, memory-mapped matrix), or ({}, None)."""
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("model") != self.model_name:
+                return {}, None
+            matrix = np.load(
+                os.path.join(self.directory, index["matrix"]), mmap_mode="r"
+            )
+            hashes = index["hashes"]
+            if matrix.ndim != 2 or matrix.shape[0] != len(hashes):
+                raise ValueError(f"matrix shape {matrix.shape} does not match index")
+        except FileNotFoundError:
+            return {}, None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring embedding cache {self.index_path}: {e}")
+            return {}, None
+        return {text_hash: row for row, text_hash in enumerate(hashes)}, matrix
+
+    def save(self, hashes: list[str], matrix: "np.ndarray") -> None:
+        matrix_name = (
+            f"{self._stem}-{_text_hash(''.join(hashes))[:16]}-{matrix.shape[1]}.npy"
+        )
+        matrix_path = os.path.join(self.directory, matrix_name)
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            previous = self._matrix_name()
+            self._write(matrix_path, lambda f: np.save(f, matrix))
+            index = {"model": self.model_name, "matrix": matrix_name, "hashes": hashes}
+            self._write(
+                self.index_path, lambda f: f.write(json.dumps(index).encode("utf-8"))
+            )
+            if previous and previous != matrix_name:
+                os.remove(os.path.join(self.directory, previous))
+        except OSError as e:
+            logger.warning(f"Could not write embedding cache to {self.directory}: {e}")
+
+    def _matrix_name(self) -> Optional[str]:
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                return json.load(f).get("matrix")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _write(self, path: str, write: Callable[[Any], Any]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
 
 class ToolOptimizer:
     """
-    Optimizer that wraps a collection of tools for semantic search and on-demand retrieval.
+    Optimizer that wraps a collection of tools for search and on-demand retrieval.
     """
 
-    def __init__(self):
-        if not OPTIMIZER_AVAILABLE:
-            raise RuntimeError(
-                "Optimizer mode requires numpy and sentence-transformers. "
-                "Install with: pip install numpy sentence-transformers"
+    def __init__(
+        self,
+        model_name: str = EMBEDDING_MODEL,
+        cache_dir: Optional[str] = None,
+        search_mode: Optional[str] = None,
+    ):
+        search_mode = (search_mode or SEARCH_MODE).lower()
+        if search_mode not in SEARCH_MODES:
+            raise ValueError(
+                f"Unknown optimizer search mode {search_mode!r}; "
+                f"expected one of {', '.join(SEARCH_MODES)}"
             )
+        if search_mode != "lexical" and not SEMANTIC_SEARCH_AVAILABLE:
+            if search_mode == "semantic":
+                raise RuntimeError(
+                    "Semantic search requires numpy and sentence-transformers. "
+                    "Install with: pip install numpy sentence-transformers"
+                )
+            logger.info(
+                "numpy or sentence-transformers not installed; "
+                "optimizer will use lexical search only"
+            )
+            search_mode = "lexical"
+        self.search_mode = search_mode
 
         self.tools: dict[str, Any] = {}  # name -> tool definition
         self.tool_functions: dict[str, Any] = {}  # name -> actual tool function
-        self.embeddings: Optional[np.ndarray] = None
+        self.embeddings: Optional["np.ndarray"] = None
         self.tool_names: list[str] = []
-        self.embedding_model: Optional[SentenceTransformer] = None
+        self.lexical_index: Optional[LexicalToolIndex] = None
+        self.embedding_model: Optional["SentenceTransformer"] = None
+        self.model_name = model_name
+        if cache_dir is None and EMBEDDING_CACHE_ENABLED:
+            cache_dir = _default_embedding_cache_dir()
+        self.embedding_cache = (
+            EmbeddingCache(cache_dir, model_name) if cache_dir else None
+        )
+        self._model_lock = threading.Lock()
+        # Unit-length float32 copy of embeddings, searched by every query
+        self._normalized: Optional["np.ndarray"] = None
+        self._query_cache = TTLCache(
+            maxsize=QUERY_CACHE_SIZE, ttl=QUERY_CACHE_TTL, name="optimizer_queries"
+        )
         self._initialized = False
 
     def initialize(self, tools: dict[str, Any], tool_functions: dict[str, Any]) -> None:
@@ -60,14 +237,16 @@ class ToolOptimizer:
         self.tool_functions = tool_functions
         self.tool_names = list(tools.keys())
 
-        logger.info(f"Initializing optimizer with {len(self.tool_names)} tools")
+        logger.info(
+            f"Initializing optimizer with {len(self.tool_names)} tools "
+            f"({self.search_mode} search)"
+        )
 
-        # Initialize embedding model (using a small, fast model)
-        logger.info("Loading embedding model (all-MiniLM-L6-v2)...")
-        self.embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
+        if self.search_mode != "semantic":
+            self.lexical_index = LexicalToolIndex(tools)
 
         # Compute embeddings for all tools
-        if self.tool_names:
+        if self.tool_names and self.search_mode != "lexical":
             texts = []
             for name in self.tool_names:
                 tool = self.tools[name]
@@ -75,13 +254,109 @@ class ToolOptimizer:
                 text = f"{name}: {tool.get('description', '')}"
                 texts.append(text)
 
-            logger.info("Computing embeddings for all tools...")
-            self.embeddings = self.embedding_model.encode(texts, convert_to_numpy=True)
-            logger.info(f"Embeddings computed with shape {self.embeddings.shape}")
+            self.embeddings = self._load_embeddings(texts)
+            self._normalized = _normalize(self.embeddings)
+            logger.info(f"Embeddings ready with shape {self.embeddings.shape}")
 
         self._initialized = True
         logger.info("Optimizer initialization complete")
 
+    def _get_model(self) -> "SentenceTransformer":
+        """Load the embedding model on first use."""
+        with self._model_lock:
+            if self.embedding_model is None:
+                logger.info(f"Loading embedding model ({self.model_name})...")
+                self.embedding_model = SentenceTransformer(self.model_name)
+            return self.embedding_model
+
+    def _load_embeddings(self, texts: list[str]) -> "np.ndarray":
+        """
+        Embed ``texts``, reusing rows from the embedding cache.
+
+        When every text is cached in the same order, the memory-mapped matrix
+        is returned as is and the model is not loaded.
+        """
+        hashes = [_text_hash(text) for text in texts]
+        rows, cached = (
+            self.embedding_cache.load() if self.embedding_cache else ({}, None)
+        )
+        missing = [i for i, text_hash in enumerate(hashes) if text_hash not in rows]
+        logger.info(
+            f"Embedding cache: {len(texts) - len(missing)} cached, "
+            f"{len(missing)} to compute"
+        )
+        if not missing and [rows[text_hash] for text_hash in hashes] == list(
+            range(cached.shape[0])
+        ):
+            return cached
+
+        computed = None
+        if missing:
+            logger.info("Computing embeddings for new or changed tools...")
+            computed = self._get_model().encode(
+                [texts[i] for i in missing], convert_to_numpy=True
+            )
+        template = computed if computed is not None else cached
+        embeddings = np.empty((len(texts), template.shape[1]), dtype=template.dtype)
+        for i, text_hash in enumerate(hashes):
+            if text_hash in rows:
+                embeddings[i] = cached[rows[text_hash]]
+        if computed is not None:
+            embeddings[missing] = computed
+
+        if self.embedding_cache:
+            self.embedding_cache.save(hashes, embeddings)
+        return embeddings
+
+    def _embed_queries(self, queries: list[str]) -> "np.ndarray":
+        """Normalized query embeddings, encoding cache misses in one model call."""
+        vectors = [self._query_cache.get(query) for query in queries]
+        missing = list(
+            dict.fromkeys(query for query, vector in zip(queries, vectors) if vector is None)
+        )
+        if missing:
+            encoded = _normalize(
+                self._get_model().encode(missing, convert_to_numpy=True)
+            )
+            computed = dict(zip(missing, encoded))
+            for query, vector in computed.items():
+                self._query_cache.set(query, vector)
+            vectors = [
+                computed[query] if vector is None else vector
+                for query, vector in zip(queries, vectors)
+            ]
+        return np.stack(vectors)
+
+    def _results(self, similarities: "np.ndarray", top_k: int) -> list[dict]:
+        top_k = min(top_k, similarities.shape[0])
+        if top_k <= 0:
+            return []
+        # Select the top k in linear time, then sort only those
+        top_indices = np.argpartition(similarities, -top_k)[-top_k:]
+        top_indices = top_indices[np.argsort(similarities[top_indices])[::-1]]
+
+        return [
+            self._result(self.tool_names[idx], similarities[idx]) for idx in top_indices
+        ]
+
+    def _result(self, name: str, score: float) -> dict:
+        desc = self.tools[name].get("description", "")
+        # Truncate description for excerpt
+        excerpt = desc[:150] + "..." if len(desc) > 150 else desc
+        return {"name": name, "excerpt": excerpt, "score": float(score)}
+
+    def _blend(self, queries: list[str], similarities: "np.ndarray") -> "np.ndarray":
+        """Mix cosine similarities with BM25 scores scaled to [0, 1] per query."""
+        blended = SEMANTIC_WEIGHT * similarities
+        for row, query in zip(blended, queries):
+            lexical = self.lexical_index.scores(query)
+            if not lexical:
+                continue
+            scale = (1 - SEMANTIC_WEIGHT) / max(lexical.values())
+            for position, score in lexical.items():
+                row[position] += scale * score
+        return blended
+
     def find_similar_tools(self, query: str, top_k: int = 10) -> list[dict]:
         """
         Find tools similar to the query using semantic search.
@@ -93,40 +368,41 @@ class ToolOptimizer:
         Returns:
             List of dictionaries with 'name', 'excerpt', and 'score' keys
         """
-        if not self._initialized:
-            raise RuntimeError("Optimizer not initialized")
-
-        if self.embedding_model is None or self.embeddings is None:
-            return []
+        return self.find_similar_tools_many([query], top_k)[0]
 
-        # Embed the query
-        query_embedding = self.embedding_model.encode([query], convert_to_numpy=True)[0]
+    def find_similar_tools_many(
+        self, queries: list[str], top_k: int = 10
+    ) -> list[list[dict]]:
+        """
+        Run several searches with one model call and one matrix product.
 
-        # Compute cosine similarity
-        # Normalize vectors
-        query_norm = query_embedding / np.linalg.norm(query_embedding)
-        embeddings_norm = self.embeddings / np.linalg.norm(
-            self.embeddings, axis=1, keepdims=True
-        )
+        Args:
+            queries: Natural language descriptions, as for find_similar_tools
+            top_k: Number of top matches to return per query
 
-        # Dot product gives cosine similarity for normalized vectors
-        similarities = np.dot(embeddings_norm, query_norm)
+        Returns:
+            One find_similar_tools result list per query, in order
+        """
+        if not self._initialized:
+            raise RuntimeError("Optimizer not initialized")
 
-        # Get top-k indices
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        if not self.tool_names or not queries:
+            return [[] for _ in queries]
 
-        results = []
-        for idx in top_indices:
-            name = self.tool_names[idx]
-            tool = self.tools[name]
-            desc = tool.get("description", "")
-            # Truncate description for excerpt
-            excerpt = desc[:150] + "..." if len(desc) > 150 else desc
-            results.append(
-                {"name": name, "excerpt": excerpt, "score": float(similarities[idx])}
-            )
+        if self.search_mode == "lexical":
+            return [
+                [
+                    self._result(name, score)
+                    for name, score in self.lexical_index.search(query, top_k)
+                ]
+                for query in queries
+            ]
 
-        return results
+        # Rows are unit vectors, so the dot product is the cosine similarity
+        similarities = self._embed_queries(queries) @ self._normalized.T
+        if self.search_mode == "hybrid":
+            similarities = self._blend(queries, similarities)
+        return [self._results(row, top_k) for row in similarities]
 
     def get_tool_definition(self, name: str) -> dict:
         """
@@ -236,18 +512,12 @@ def initialize_optimizer(tools: dict[str, Any], tool_functions: dict[str, Any])
     """
     global _optimizer_instance
 
-    if not OPTIMIZER_AVAILABLE:
-        raise RuntimeError(
-            "Optimizer mode requires numpy and sentence-transformers. "
-            "Install with: pip install numpy sentence-transformers"
-        )
-
     _optimizer_instance = ToolOptimizer()
     _optimizer_instance.initialize(tools, tool_functions)
     return _optimizer_instance
 
 
-def is_optimizer_available() -> bool:
-    """Check if optimizer dependencies are installed."""
-    return OPTIMIZER_AVAILABLE
+def is_semantic_search_available() -> bool:
+    """Check if the embedding search dependencies are installed."""
+    return SEMANTIC_SEARCH_AVAILABLE
 
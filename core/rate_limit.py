@@ -0,0 +1,287 @@
+"""
+Client-side pacing of Google API requests against per-user quotas.
+
+Google enforces per-user, per-API quotas (e.g. Sheets allows 60 requests per
+minute per user). Bulk tools can send requests far faster than that; the
+excess comes back as 429s, and retrying those costs more than pacing would
+have. Every request executed through core.async_http first takes a token from
+a bucket keyed by (user, API), so a user's requests are spread to stay just
+under the quota instead of bursting into it.
+
+Buckets refill continuously at the per-minute rate and hold a tenth of a
+minute's requests (at least one), so short bursts are not delayed. A full
+bucket plus a minute of refill is all a user can send in any 60 seconds, so
+that stays within 10% of the quota; a bucket holding a whole minute would
+allow twice the quota in the first minute. Limits for write requests
+(anything but GET) can be set separately with an ``<api>.write`` entry.
+
+Configuration:
+    WORKSPACE_MCP_RATE_LIMIT: Set to "false" to disable pacing
+    WORKSPACE_MCP_RATE_LIMIT_BURST: Fraction of the per-minute limit a bucket
+        holds (default: 0.1)
+    WORKSPACE_MCP_RATE_LIMITS: Per-minute overrides, e.g. "sheets=120,gmail=6000".
+        A limit of 0 disables pacing for that API.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+import urllib.parse
+from typing import Any, Dict, Optional, Tuple
+
+from core.cache import TTLCache
+from core.context import get_current_user_email
+from core.retry import get_retry_budget
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_ENABLED = os.getenv("WORKSPACE_MCP_RATE_LIMIT", "true").lower() != "false"
+RATE_LIMIT_BURST = float(os.getenv("WORKSPACE_MCP_RATE_LIMIT_BURST", "0.1"))
+
+# Default per-user requests per minute, from Google's published per-user quotas
+DEFAULT_RATE_LIMITS: Dict[str, float] = {
+    # 250 quota units/second; most calls cost 5 units
+    "gmail": 3000,
+    "drive": 12000,
+    "calendar": 600,
+    "sheets": 60,
+    "sheets.write": 60,
+    "docs": 300,
+    "docs.write": 60,
+    "slides": 600,
+    "slides.write": 60,
+    "forms": 975,
+    "forms.write": 375,
+}
+
+_WWW_HOST = "www.googleapis.com"
+_PATH_PREFIXES = ("upload", "batch")
+
+
+def _parse_limits(spec: str) -> Dict[str, float]:
+    limits = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        name, _, value = item.partition("=")
+        try:
+            limits[name.strip().lower()] = float(value)
+        except ValueError:
+            logger.warning(f"Ignoring invalid rate limit '{item}'")
+    return limits
+
+
+def configured_rate_limits() -> Dict[str, float]:
+    """Return the effective per-minute limits (defaults plus env overrides)."""
+    limits = dict(DEFAULT_RATE_LIMITS)
+    limits.update(_parse_limits(os.getenv("WORKSPACE_MCP_RATE_LIMITS", "")))
+    return limits
+
+
+def api_for_uri(uri: str) -> Optional[str]:
+    """
+    Return the Google API a request URI belongs to.
+
+    ``https://sheets.googleapis.com/v4/...`` is "sheets";
+    ``https://www.googleapis.com/drive/v3/...`` is "drive".
+    """
+    parsed = urllib.parse.urlparse(uri)
+    host = parsed.hostname or ""
+    if not host.endswith(".googleapis.com"):
+        return None
+    if host != _WWW_HOST:
+        return host.split(".", 1)[0]
+    for segment in parsed.path.split("/"):
+        if segment and segment not in _PATH_PREFIXES:
+            return segment
+    return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Callers reserve tokens up front and are told how long to wait, so waiting
+    callers are served in arrival order without holding a lock while asleep.
+    The bucket starts full; capacity defaults to RATE_LIMIT_BURST of a
+    minute's requests, and at least one.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.rate = rate_per_minute / 60.0
+        if capacity is None:
+            capacity = max(1.0, rate_per_minute * RATE_LIMIT_BURST)
+        self.capacity = capacity
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill_locked(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens, going into debt if necessary.
+
+        Returns:
+            Seconds the caller must wait before using the tokens
+        """
+        with self._lock:
+            self._refill_locked()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def refund(self, tokens: float = 1.0) -> None:
+        """Return tokens that were reserved but not used."""
+        with self._lock:
+            self._refill_locked()
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+
+class RateLimiter:
+    """Token buckets keyed by (user, API), created on first use."""
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, float]] = None,
+        enabled: bool = RATE_LIMIT_ENABLED,
+        max_buckets: int = 10000,
+    ):
+        self.limits = configured_rate_limits() if limits is None else dict(limits)
+        self.enabled = enabled
+        # Idle buckets are dropped after an hour; a new bucket starts full
+        self._buckets = TTLCache(maxsize=max_buckets, ttl=3600, name="rate_limits")
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def _limit_key(self, api: str, method: str) -> Optional[str]:
+        if method.upper() != "GET" and self.limits.get(f"{api}.write"):
+            return f"{api}.write"
+        if self.limits.get(api):
+            return api
+        return None
+
+    def _bucket(self, user: str, limit_key: str) -> TokenBucket:
+        key = (user, limit_key)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = TokenBucket(self.limits[limit_key])
+        # TTLCache expires entries a fixed time after set, so set on every use
+        # to make the TTL measure idle time; otherwise a busy user's bucket
+        # would be replaced by a full one every hour
+        self._buckets.set(key, bucket)
+        return bucket
+
+    def _record(self, limit_key: str, waited: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(
+                limit_key, {"requests": 0, "throttled": 0, "wait_seconds": 0.0}
+            )
+            stats["requests"] += 1
+            if waited > 0:
+                stats["throttled"] += 1
+                stats["wait_seconds"] += waited
+
+    async def acquire(
+        self, api: Optional[str], method: str = "GET", user: Optional[str] = None
+    ) -> float:
+        """
+        Wait until a request to api may be sent for user.
+
+        Args:
+            api: API name (see api_for_uri); unlimited if None or not configured
+            method: HTTP method, to pick a separate write limit if configured
+            user: Google user; defaults to the user of the current tool call
+
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.enabled or not api:
+            return 0.0
+        limit_key = self._limit_key(api, method)
+        if limit_key is None:
+            return 0.0
+
+        user = user or get_current_user_email() or "anonymous"
+        bucket = self._bucket(user, limit_key)
+        wait = bucket.reserve()
+        if wait > 0:
+            logger.debug(
+                f"Pacing {limit_key} request for {user} by {wait:.2f}s to stay within quota"
+            )
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                bucket.refund()
+                raise
+        self._record(limit_key, wait)
+        return wait
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pacing statistics per API."""
+        with self._lock:
+            per_api = {name: dict(stats) for name, stats in self._stats.items()}
+        return {
+            "enabled": self.enabled,
+            "buckets": len(self._buckets),
+            "requests": sum(s["requests"] for s in per_api.values()),
+            "throttled": sum(s["throttled"] for s in per_api.values()),
+            "wait_seconds": sum(s["wait_seconds"] for s in per_api.values()),
+            "apis": per_api,
+        }
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide rate limiter, creating it on first use."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimiter()
+    return _rate_limiter
+
+
+async def acquire_for_request(request: Any) -> Tuple[Optional[str], float]:
+    """
+    Pace a googleapiclient request according to its API's quota.
+
+    The wait is added to the current tool call's retry budget so the circuit
+    breaker can leave it out of the call's latency.
+
+    Returns:
+        The API the request was attributed to and the seconds spent waiting
+    """
+    uri = getattr(request, "uri", None)
+    if not isinstance(uri, str):
+        return None, 0.0
+    api = api_for_uri(uri)
+    method = getattr(request, "method", "GET")
+    if not isinstance(method, str):
+        method = "GET"
+    waited = await get_rate_limiter().acquire(api, method)
+    budget = get_retry_budget()
+    if budget is not None:
+        budget.paced_seconds += waited
+    return api, waited
+
+
+def get_rate_limit_stats() -> Dict[str, Any]:
+    """Get statistics for the process-wide rate limiter."""
+    return get_rate_limiter().get_stats()
@@ -0,0 +1,419 @@
+"""
+Validated response cache for Google API GET requests.
+
+Read tools such as get_doc_content, get_spreadsheet_info or list_calendars
+refetch the full resource on every call even when nothing has changed. The
+response cache keeps recent GET response bodies per (user, URI) and, on the
+next identical request, asks Google whether the resource changed before
+reusing them. Entries are never served without that check, so a cached
+response is always as current as a fresh fetch would have been.
+
+Entries are validated in one of two ways:
+
+* ETag: responses that carry an ETag (e.g. Calendar) are revalidated with
+  ``If-None-Match``; a 304 means the cached body is still current.
+* Revision probe: Docs, Slides and Forms resources are revalidated by
+  fetching only their ``revisionId``; Sheets, which has no revision field,
+  by fetching the file's Drive ``version``. A matching revision means the
+  cached body is still current. Drive probes cost an extra request on a
+  miss, so Sheets responses are only cached once a URI is read twice.
+
+Bodies are kept in memory with least-recently-used eviction bounded by total
+bytes, and optionally written to a disk tier that survives restarts. Cached
+files contain user data: the directory is created 0700 and files 0600.
+
+Configuration:
+    WORKSPACE_MCP_RESPONSE_CACHE: Set to "false" to disable the response cache
+    WORKSPACE_MCP_RESPONSE_CACHE_MB: Memory tier size in MB (default: 64)
+    WORKSPACE_MCP_RESPONSE_CACHE_MAX_ENTRY_MB: Largest response cached, in MB (default: 8)
+    WORKSPACE_MCP_RESPONSE_CACHE_DIR: Directory for the disk tier (default: disabled)
+    WORKSPACE_MCP_RESPONSE_CACHE_DISK_MB: Disk tier size in MB (default: 512)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import tempfile
+import threading
+import urllib.parse
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from core.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_ENABLED = (
+    os.getenv("WORKSPACE_MCP_RESPONSE_CACHE", "true").lower() != "false"
+)
+RESPONSE_CACHE_MB = float(os.getenv("WORKSPACE_MCP_RESPONSE_CACHE_MB", "64"))
+RESPONSE_CACHE_MAX_ENTRY_MB = float(
+    os.getenv("WORKSPACE_MCP_RESPONSE_CACHE_MAX_ENTRY_MB", "8")
+)
+RESPONSE_CACHE_DIR = os.getenv("WORKSPACE_MCP_RESPONSE_CACHE_DIR") or None
+RESPONSE_CACHE_DISK_MB = float(os.getenv("WORKSPACE_MCP_RESPONSE_CACHE_DISK_MB", "512"))
+
+_MB = 1024 * 1024
+# Rough per-entry overhead (headers, key, bookkeeping) counted against the budget
+_ENTRY_OVERHEAD = 512
+_HEADER_LENGTH = struct.Struct(">I")
+
+# Ways of finding a resource's current revision without fetching it
+INLINE_REVISION = "inline"
+DRIVE_VERSION = "drive"
+
+_DRIVE_VERSION_URI = (
+    "https://www.googleapis.com/drive/v3/files/{file_id}"
+    "?fields=version&supportsAllDrives=true"
+)
+# host -> (resource path prefix, where its revision comes from)
+_REVISIONED_APIS = {
+    "docs.googleapis.com": ("/v1/documents/", INLINE_REVISION),
+    "slides.googleapis.com": ("/v1/presentations/", INLINE_REVISION),
+    "forms.googleapis.com": ("/v1/forms/", INLINE_REVISION),
+    "sheets.googleapis.com": ("/v4/spreadsheets/", DRIVE_VERSION),
+}
+
+
+@dataclass(frozen=True)
+class RevisionSource:
+    """How to look up the current revision of a cached resource."""
+
+    kind: str
+    probe_uri: str
+    file_id: str
+
+
+def revision_source(uri: str) -> Optional[RevisionSource]:
+    """
+    Work out how a GET URI's resource can be revalidated by revision.
+
+    Docs, Slides and Forms GETs of a whole resource carry a ``revisionId``
+    that can be fetched on its own. Any Sheets GET under a spreadsheet
+    (metadata or values) changes with the file's Drive ``version``.
+    """
+    parsed = urllib.parse.urlparse(uri)
+    api = _REVISIONED_APIS.get(parsed.hostname or "")
+    if api is None:
+        return None
+    prefix, kind = api
+    if not parsed.path.startswith(prefix):
+        return None
+    rest = parsed.path[len(prefix) :]
+
+    if kind == INLINE_REVISION:
+        # Sub-resources (e.g. form responses) change without a new revision
+        if not rest or "/" in rest or ":" in rest:
+            return None
+        probe = parsed._replace(query="fields=revisionId", fragment="")
+        return RevisionSource(kind, urllib.parse.urlunparse(probe), rest)
+
+    file_id = rest.split("/", 1)[0].split(":", 1)[0]
+    if not file_id:
+        return None
+    return RevisionSource(
+        kind,
+        _DRIVE_VERSION_URI.format(file_id=urllib.parse.quote(file_id, safe="")),
+        file_id,
+    )
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body and the validator it is checked with."""
+
+    info: Dict[str, str]
+    content: bytes
+    etag: Optional[str] = None
+    revision: Optional[str] = None
+    size: int = field(init=False)
+
+    def __post_init__(self):
+        self.size = len(self.content) + _ENTRY_OVERHEAD
+
+
+class ResponseCache:
+    """
+    Byte-bounded LRU of validated responses, with an optional disk tier.
+
+    The memory tier holds the most recently used entries; when a disk
+    directory is configured every stored entry is also written there, and
+    memory misses fall back to it.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = int(RESPONSE_CACHE_MB * _MB),
+        max_entry_bytes: int = int(RESPONSE_CACHE_MAX_ENTRY_MB * _MB),
+        disk_dir: Optional[str] = RESPONSE_CACHE_DIR,
+        disk_max_bytes: int = int(RESPONSE_CACHE_DISK_MB * _MB),
+    ):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+
+        self._memory: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        # URIs read once, so a second read is worth the cost of caching
+        self._seen = TTLCache(maxsize=10000, ttl=3600, name="response_cache_seen")
+        # (user, probe kind) pairs whose probes were refused (e.g. missing scope)
+        self._probe_denied = TTLCache(maxsize=1000, ttl=600, name="probe_denied")
+        self._stats = {
+            "etag_hits": 0,
+            "revision_hits": 0,
+            "misses": 0,
+            "stale": 0,
+            "stores": 0,
+            "evictions": 0,
+            "disk_hits": 0,
+            "disk_errors": 0,
+            "probe_errors": 0,
+        }
+
+        if self.disk_dir:
+            self._load_disk_index()
+
+    # Memory tier
+
+    def _evict_memory_locked(self) -> None:
+        while self._memory_bytes > self.max_bytes and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.size
+            self._stats["evictions"] += 1
+
+    def _put_memory_locked(self, key: Hashable, entry: CachedResponse) -> None:
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= old.size
+        self._memory[key] = entry
+        self._memory_bytes += entry.size
+        self._evict_memory_locked()
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        """Return the stored entry for key (not yet validated), if any."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+        if not self.disk_dir:
+            return None
+
+        entry = self._read_disk(key)
+        if entry is not None:
+            with self._lock:
+                self._stats["disk_hits"] += 1
+                self._put_memory_locked(key, entry)
+        return entry
+
+    def set(self, key: Hashable, entry: CachedResponse) -> bool:
+        """Store an entry. Returns False if it is too large to cache."""
+        if entry.size > self.max_entry_bytes:
+            self.pop(key)
+            return False
+        with self._lock:
+            self._stats["stores"] += 1
+            self._put_memory_locked(key, entry)
+        if self.disk_dir:
+            self._write_disk(key, entry)
+        return True
+
+    def pop(self, key: Hashable) -> None:
+        """Drop an entry from both tiers."""
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_bytes -= old.size
+        if self.disk_dir:
+            self._remove_disk(self._disk_name(key))
+
+    def seen_before(self, key: Hashable) -> bool:
+        """Record a read of key; True if it was already read recently."""
+        if self._seen.get(key):
+            return True
+        self._seen.set(key, True)
+        return False
+
+    def probe_allowed(self, user: str, kind: str) -> bool:
+        """Whether revision probes of this kind recently worked for user."""
+        return not self._probe_denied.get((user, kind))
+
+    def deny_probe(self, user: str, kind: str) -> None:
+        """Stop probing for user for a while after a refused probe."""
+        self._probe_denied.set((user, kind), True)
+
+    def record(self, outcome: str) -> None:
+        """Count a lookup outcome (see get_stats for the names)."""
+        with self._lock:
+            self._stats[outcome] += 1
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            names = list(self._disk)
+        for name in names:
+            self._remove_disk(name)
+        self._seen.clear()
+
+    # Disk tier
+
+    @staticmethod
+    def _disk_name(key: Hashable) -> str:
+        return hashlib.sha256(repr(key).encode("utf-8")).hexdigest() + ".bin"
+
+    def _load_disk_index(self) -> None:
+        try:
+            os.makedirs(self.disk_dir, mode=0o700, exist_ok=True)
+            entries = []
+            with os.scandir(self.disk_dir) as it:
+                for item in it:
+                    if item.name.endswith(".bin") and item.is_file():
+                        stat = item.stat()
+                        entries.append((stat.st_mtime, item.name, stat.st_size))
+        except OSError as e:
+            logger.warning(f"Disabling response cache disk tier {self.disk_dir}: {e}")
+            self.disk_dir = None
+            return
+        for _, name, size in sorted(entries):
+            self._disk[name] = size
+            self._disk_bytes += size
+        logger.info(
+            f"Response cache disk tier at {self.disk_dir}: {len(self._disk)} entries"
+        )
+
+    def _read_disk(self, key: Hashable) -> Optional[CachedResponse]:
+        name = self._disk_name(key)
+        with self._lock:
+            if name not in self._disk:
+                return None
+        path = os.path.join(self.disk_dir, name)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            (header_length,) = _HEADER_LENGTH.unpack_from(data)
+            header_end = _HEADER_LENGTH.size + header_length
+            header = json.loads(data[_HEADER_LENGTH.size : header_end])
+            if header["key"] != repr(key):
+                return None
+            os.utime(path)
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            logger.debug(f"Dropping unreadable response cache file {path}: {e}")
+            self.record("disk_errors")
+            self._remove_disk(name)
+            return None
+        with self._lock:
+            if name in self._disk:
+                self._disk.move_to_end(name)
+        return CachedResponse(
+            info=header["info"],
+            content=data[header_end:],
+            etag=header.get("etag"),
+            revision=header.get("revision"),
+        )
+
+    def _write_disk(self, key: Hashable, entry: CachedResponse) -> None:
+        name = self._disk_name(key)
+        header = json.dumps(
+            {
+                "key": repr(key),
+                "info": entry.info,
+                "etag": entry.etag,
+                "revision": entry.revision,
+            }
+        ).encode("utf-8")
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER_LENGTH.pack(len(header)))
+                f.write(header)
+                f.write(entry.content)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, os.path.join(self.disk_dir, name))
+            tmp_path = None
+        except OSError as e:
+            logger.warning(f"Could not write response cache file: {e}")
+            self.record("disk_errors")
+            return
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+        size = _HEADER_LENGTH.size + len(header) + len(entry.content)
+        evicted = []
+        with self._lock:
+            self._disk_bytes += size - self._disk.pop(name, 0)
+            self._disk[name] = size
+            while self._disk_bytes > self.disk_max_bytes and len(self._disk) > 1:
+                old_name, old_size = self._disk.popitem(last=False)
+                self._disk_bytes -= old_size
+                evicted.append(old_name)
+        for old_name in evicted:
+            self._remove_disk(old_name, tracked=False)
+
+    def _remove_disk(self, name: str, tracked: bool = True) -> None:
+        if tracked:
+            with self._lock:
+                size = self._disk.pop(name, None)
+                if size is None:
+                    return
+                self._disk_bytes -= size
+        try:
+            os.remove(os.path.join(self.disk_dir, name))
+        except OSError:
+            pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit, miss and size statistics for both tiers."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats.update(
+                memory_entries=len(self._memory),
+                memory_bytes=self._memory_bytes,
+                memory_max_bytes=self.max_bytes,
+                disk_enabled=bool(self.disk_dir),
+                disk_entries=len(self._disk),
+                disk_bytes=self._disk_bytes,
+            )
+        hits = stats["etag_hits"] + stats["revision_hits"]
+        lookups = hits + stats["stale"] + stats["misses"]
+        stats["hit_rate"] = round(hits / lookups, 3) if lookups else 0.0
+        return stats
+
+
+def cache_key(user: Optional[str], uri: str) -> Optional[Tuple[str, str]]:
+    """Key a GET by user and URI; None if the user is unknown."""
+    if not user:
+        return None
+    return (user, uri)
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache, creating it on first use."""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = ResponseCache()
+    return _response_cache
+
+
+def get_response_cache_stats() -> Dict[str, Any]:
+    """Get statistics for the process-wide response cache."""
+    return {"enabled": RESPONSE_CACHE_ENABLED, **get_response_cache().get_stats()}
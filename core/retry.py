@@ -0,0 +1,260 @@
+"""
+Retry policy for Google API requests.
+
+Google returns 429 (and 403 ``rateLimitExceeded``) when a quota is exceeded,
+and occasional 500/502/503/504s. Retrying the single failed request after a
+short backoff is far cheaper than failing the tool call and having the
+client re-run the whole tool from scratch.
+
+Retries happen per request in core.async_http.execute_async:
+
+* Quota errors (429, rate-limit 403s) are always retried: the request was
+  rejected before it did anything, so even writes are safe to resend.
+* Server errors (5xx) are retried only when resending cannot apply a change
+  twice: idempotent HTTP methods, or any request made by a read-only tool.
+* Delays use exponential backoff with full jitter, or the server's
+  Retry-After when it sends one.
+* Each tool call has a retry budget (set by handle_http_errors), so a tool
+  that makes many requests cannot retry indefinitely while Google is
+  struggling. Retries used are logged per call and counted per tool.
+
+Configuration:
+    WORKSPACE_MCP_RETRY_ENABLED: Set to "false" to disable request retries
+    WORKSPACE_MCP_RETRY_MAX_ATTEMPTS: Attempts per request, including the first (default: 4)
+    WORKSPACE_MCP_RETRY_BASE_DELAY: Backoff base in seconds (default: 1)
+    WORKSPACE_MCP_RETRY_MAX_DELAY: Longest single wait in seconds; a longer
+        Retry-After is not waited for (default: 32)
+    WORKSPACE_MCP_RETRY_BUDGET: Retries allowed per tool call (default: 6)
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import email.utils
+import logging
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+RETRY_ENABLED = os.getenv("WORKSPACE_MCP_RETRY_ENABLED", "true").lower() != "false"
+RETRY_MAX_ATTEMPTS = int(os.getenv("WORKSPACE_MCP_RETRY_MAX_ATTEMPTS", "4"))
+RETRY_BASE_DELAY = float(os.getenv("WORKSPACE_MCP_RETRY_BASE_DELAY", "1"))
+RETRY_MAX_DELAY = float(os.getenv("WORKSPACE_MCP_RETRY_MAX_DELAY", "32"))
+RETRY_BUDGET = int(os.getenv("WORKSPACE_MCP_RETRY_BUDGET", "6"))
+
+QUOTA_STATUS_CODES = (429,)
+SERVER_ERROR_STATUS_CODES = (500, 502, 503, 504)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+_RATE_LIMIT_REASONS = (b"rateLimitExceeded", b"userRateLimitExceeded")
+
+
+@dataclass
+class RetryBudget:
+    """Retries available to one tool call."""
+
+    tool_name: str = ""
+    read_only: bool = False
+    remaining: int = RETRY_BUDGET
+    used: int = 0
+    wait_seconds: float = 0.0
+    # Seconds the call's requests spent queued by core.rate_limit
+    paced_seconds: float = 0.0
+
+    def consume(self, delay: float) -> bool:
+        """Take one retry from the budget. Returns False if it is exhausted."""
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        self.used += 1
+        self.wait_seconds += delay
+        return True
+
+
+@dataclass
+class _ToolRetryStats:
+    calls_with_retries: int = 0
+    retries: int = 0
+    wait_seconds: float = 0.0
+
+
+_current_budget: contextvars.ContextVar[Optional[RetryBudget]] = contextvars.ContextVar(
+    "retry_budget", default=None
+)
+
+_stats_lock = threading.Lock()
+_tool_stats: Dict[str, _ToolRetryStats] = {}
+_status_counts: Dict[int, int] = {}
+_exhausted = 0
+
+
+@contextlib.contextmanager
+def retry_budget(tool_name: str, read_only: bool = False) -> Iterator[RetryBudget]:
+    """
+    Give the enclosed tool call its own retry budget and record what it used.
+
+    Args:
+        tool_name: Tool name, for logging and per-tool counters
+        read_only: Whether the tool only reads (its requests are safe to resend)
+    """
+    budget = RetryBudget(tool_name=tool_name, read_only=read_only)
+    token = _current_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_budget.reset(token)
+        if budget.used:
+            logger.info(
+                f"{tool_name} used {budget.used} request retries "
+                f"({budget.wait_seconds:.1f}s backing off)"
+            )
+            with _stats_lock:
+                stats = _tool_stats.setdefault(tool_name, _ToolRetryStats())
+                stats.calls_with_retries += 1
+                stats.retries += budget.used
+                stats.wait_seconds += budget.wait_seconds
+
+
+def get_retry_budget() -> Optional[RetryBudget]:
+    """Return the current tool call's retry budget, if any."""
+    return _current_budget.get()
+
+
+def is_rate_limit_error(status: int, content: Optional[bytes]) -> bool:
+    """Whether a response means a quota was exceeded (and nothing was applied)."""
+    if status in QUOTA_STATUS_CODES:
+        return True
+    if status == 403 and content:
+        if isinstance(content, str):
+            content = content.encode("utf-8", "replace")
+        return any(reason in content for reason in _RATE_LIMIT_REASONS)
+    return False
+
+
+def is_retryable(
+    status: int, content: Optional[bytes], method: str, read_only: bool = False
+) -> bool:
+    """
+    Decide whether a failed request may be resent.
+
+    Args:
+        status: HTTP status of the failed response
+        content: Response body
+        method: HTTP method of the request
+        read_only: Whether the request belongs to a read-only tool
+    """
+    if is_rate_limit_error(status, content):
+        return True
+    if status in SERVER_ERROR_STATUS_CODES:
+        return read_only or method.upper() in IDEMPOTENT_METHODS
+    return False
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def backoff_delay(
+    attempt: int,
+    base_delay: float = RETRY_BASE_DELAY,
+    max_delay: float = RETRY_MAX_DELAY,
+) -> float:
+    """Exponential backoff with full jitter for the given retry (0-based)."""
+    return random.uniform(0, min(max_delay, base_delay * (2**attempt)))
+
+
+def retry_delay(
+    status: int,
+    content: Optional[bytes],
+    headers: Any,
+    method: str,
+    attempt: int,
+) -> Optional[float]:
+    """
+    Work out whether and how long to wait before resending a failed request.
+
+    Takes a retry from the current tool call's budget when it returns a delay.
+
+    Args:
+        status: HTTP status of the failed response
+        content: Response body
+        headers: Response headers (any mapping with lower-case keys)
+        method: HTTP method of the request
+        attempt: Number of retries already made for this request
+
+    Returns:
+        Seconds to wait before retrying, or None to give up
+    """
+    global _exhausted
+
+    if not RETRY_ENABLED or attempt + 1 >= RETRY_MAX_ATTEMPTS:
+        return None
+    budget = _current_budget.get()
+    read_only = budget.read_only if budget else False
+    if not is_retryable(status, content, method, read_only):
+        return None
+
+    retry_after = parse_retry_after(headers.get("retry-after") if headers else None)
+    if retry_after is not None:
+        if retry_after > RETRY_MAX_DELAY:
+            logger.warning(
+                f"Not retrying {status} response: Retry-After of {retry_after:.0f}s "
+                f"exceeds {RETRY_MAX_DELAY:.0f}s"
+            )
+            return None
+        delay = retry_after
+    else:
+        delay = backoff_delay(attempt)
+
+    if budget is not None and not budget.consume(delay):
+        with _stats_lock:
+            _exhausted += 1
+        logger.warning(
+            f"Retry budget for {budget.tool_name} exhausted; not retrying {status} response"
+        )
+        return None
+
+    with _stats_lock:
+        _status_counts[status] = _status_counts.get(status, 0) + 1
+    return delay
+
+
+async def sleep_before_retry(delay: float, status: int, uri: str) -> None:
+    """Wait out a retry delay, logging why."""
+    logger.warning(f"Retrying request after {status} in {delay:.2f}s: {uri}")
+    await asyncio.sleep(delay)
+
+
+def get_retry_stats() -> Dict[str, Any]:
+    """Get retry counters per response status and per tool."""
+    with _stats_lock:
+        return {
+            "enabled": RETRY_ENABLED,
+            "retries": sum(_status_counts.values()),
+            "by_status": dict(_status_counts),
+            "budget_exhausted": _exhausted,
+            "tools": {
+                name: {
+                    "calls_with_retries": s.calls_with_retries,
+                    "retries": s.retries,
+                    "wait_seconds": round(s.wait_seconds, 3),
+                }
+                for name, s in _tool_stats.items()
+            },
+        }
@@ -1,9 +1,10 @@
 import logging
 import json
-from typing import List, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
 from importlib import metadata
 
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
+from fastapi.responses import HTMLResponse, JSONResponse, FileResponse, Response
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.middleware import Middleware
@@ -20,7 +21,13 @@ from auth.oauth_responses import (
     create_server_error_response,
 )
 from auth.auth_info_middleware import AuthInfoMiddleware
+from auth.refresh_scheduler import start_proactive_refresh, stop_proactive_refresh
 from auth.scopes import SCOPES, get_current_scopes  # noqa
+from core.circuit_breaker import get_circuit_breaker_stats
+from core.executors import get_executor_stats, run_cpu, run_io
+from core.log_pipeline import get_log_pipeline_stats
+from core.metrics import CONTENT_TYPE, METRICS_ENABLED, render_metrics
+from core.tracing import get_tracing_stats
 from core.config import (
     USER_GOOGLE_EMAIL,
     get_transport_mode,
@@ -53,9 +60,20 @@ class SecureFastMCP(FastMCP):
         return app
 
 
+@asynccontextmanager
+async def server_lifespan(app: FastMCP) -> AsyncIterator[dict]:
+    """Run background services for as long as the server is serving."""
+    await start_proactive_refresh()
+    try:
+        yield {}
+    finally:
+        await stop_proactive_refresh()
+
+
 server = SecureFastMCP(
     name="google_workspace",
     auth=None,
+    lifespan=server_lifespan,
 )
 
 # Add the AuthInfo middleware to inject authentication into FastMCP context
@@ -167,16 +185,31 @@ async def health_check(request: Request):
         version = metadata.version("workspace-mcp")
     except metadata.PackageNotFoundError:
         version = "dev"
+    # Open circuits mean a Google API is failing, not this process: report
+    # "degraded" but keep 200 so liveness probes don't restart the pod.
+    circuits = get_circuit_breaker_stats()
     return JSONResponse(
         {
-            "status": "healthy",
+            "status": "degraded" if circuits["degraded"] else "healthy",
             "service": "workspace-mcp",
             "version": version,
             "transport": get_transport_mode(),
+            "circuit_breakers": circuits,
+            "executors": get_executor_stats(),
+            "tracing": get_tracing_stats(),
+            "logging": get_log_pipeline_stats(),
         }
     )
 
 
+@server.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request):
+    """Prometheus metrics for tools, Google API calls, caches and pools."""
+    if not METRICS_ENABLED:
+        return Response(status_code=404)
+    return Response(render_metrics(), media_type=CONTENT_TYPE)
+
+
 @server.custom_route("/attachments/{file_id}", methods=["GET"])
 async def serve_attachment(file_id: str, request: Request):
     """Serve a stored attachment file."""
@@ -229,7 +262,9 @@ async def legacy_oauth2_callback(request: Request) -> HTMLResponse:
         if hasattr(request, "state") and hasattr(request.state, "session_id"):
             mcp_session_id = request.state.session_id
 
-        verified_user_id, credentials = handle_auth_callback(
+        # Exchanges the code with Google and writes the credential stores
+        verified_user_id, credentials = await run_io(
+            handle_auth_callback,
             scopes=get_current_scopes(),
             authorization_response=str(request.url),
             redirect_uri=get_oauth_redirect_uri_for_current_mode(),
@@ -243,7 +278,7 @@ async def legacy_oauth2_callback(request: Request) -> HTMLResponse:
         try:
             store = get_oauth21_session_store()
 
-            store.store_session(
+            await store.store_session_async(
                 user_email=verified_user_id,
                 access_token=credentials.token,
                 refresh_token=credentials.refresh_token,
@@ -347,7 +382,8 @@ def register_optimizer_tools():
             )
 
         try:
-            results = optimizer.find_similar_tools(query, top_k)
+            # The first search may load the embedding model; keep it off the loop
+            results = await run_cpu(optimizer.find_similar_tools, query, top_k)
             return json.dumps(results, indent=2)
         except Exception as e:
             logger.error(f"Error in google_workspace_find_tool: {e}", exc_info=True)
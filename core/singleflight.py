@@ -0,0 +1,162 @@
+"""
+Coalescing of identical concurrent read-only tool calls.
+
+Agents often issue the same read at the same moment, e.g. several sub-agents
+calling get_doc_content with the same document ID. handle_http_errors runs
+read-only tools through a SingleFlight group: while a call for a given
+(caller, tool, arguments) key is in flight, identical calls wait for it and
+receive its result (or its exception) instead of sending their own requests.
+
+Only calls that overlap in time are shared; nothing is cached once the call
+finishes. The shared call runs in its own task, so one caller cancelling does
+not cancel it for the others; it is cancelled only when every caller has
+gone.
+
+Configuration:
+    WORKSPACE_MCP_COALESCE_READS: Set to "false" to disable coalescing
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from core.context import get_injected_oauth_credentials
+
+logger = logging.getLogger(__name__)
+
+COALESCE_READS_ENABLED = (
+    os.getenv("WORKSPACE_MCP_COALESCE_READS", "true").lower() != "false"
+)
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Shares one in-flight execution among concurrent callers with the same key."""
+
+    def __init__(self, name: str = "singleflight"):
+        self.name = name
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "executions": 0, "coalesced": 0}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn, or join an identical call that is already running.
+
+        Args:
+            key: Identity of the call; callers with equal keys share a result
+            fn: Zero-argument coroutine function performing the call
+
+        Returns:
+            fn's result, shared with every caller that joined
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        with self._lock:
+            self._stats["calls"] += 1
+            flight = self._flights.get(flight_key)
+            if flight is None:
+                self._stats["executions"] += 1
+                flight = _Flight(loop.create_task(fn()))
+                self._flights[flight_key] = flight
+                flight.task.add_done_callback(
+                    lambda _task: self._finish(flight_key, flight)
+                )
+            else:
+                self._stats["coalesced"] += 1
+                logger.debug(f"[{self.name}] Joining in-flight call {key!r:.120}")
+            flight.waiters += 1
+
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done():
+                with self._lock:
+                    flight.waiters -= 1
+                    abandoned = flight.waiters == 0
+                if abandoned:
+                    flight.task.cancel()
+            raise
+
+    def _finish(self, flight_key: Hashable, flight: _Flight) -> None:
+        with self._lock:
+            if self._flights.get(flight_key) is flight:
+                del self._flights[flight_key]
+        if not flight.task.cancelled():
+            # Mark the exception retrieved even if every waiter was cancelled
+            flight.task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get call, execution and coalescing counters."""
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._flights)}
+
+
+def _caller_identity() -> Optional[Hashable]:
+    """
+    Identify whose credentials the current tool call will use.
+
+    Returns None when that cannot be shared safely (credentials injected for
+    this request only).
+    """
+    if get_injected_oauth_credentials():
+        return None
+    try:
+        from fastmcp.server.dependencies import get_context
+
+        ctx = get_context()
+    except Exception:
+        return ("", "")
+    authenticated_user = ctx.get_state("authenticated_user_email")
+    if authenticated_user:
+        return ("user", authenticated_user)
+    # Without an authenticated user, credentials may be bound to the session
+    return ("session", getattr(ctx, "session_id", None) or "")
+
+
+def call_key(
+    tool_name: str, signature: inspect.Signature, args: tuple, kwargs: dict
+) -> Optional[Hashable]:
+    """
+    Build the coalescing key for a tool call.
+
+    Arguments are bound to the tool's signature with defaults applied, so
+    calls that differ only in how arguments were passed share a key.
+
+    Returns:
+        The key, or None if the call must not be coalesced
+    """
+    identity = _caller_identity()
+    if identity is None:
+        return None
+    try:
+        bound = signature.bind_partial(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = json.dumps(bound.arguments, sort_keys=True, default=repr)
+    except (TypeError, ValueError):
+        return None
+    return (identity, tool_name, arguments)
+
+
+_read_coalescer = SingleFlight("read_tools")
+
+
+def get_read_coalescer() -> SingleFlight:
+    """Return the process-wide group used for read-only tools."""
+    return _read_coalescer
+
+
+def get_coalescing_stats() -> Dict[str, Any]:
+    """Get statistics for coalesced read-only tool calls."""
+    return {"enabled": COALESCE_READS_ENABLED, **_read_coalescer.get_stats()}
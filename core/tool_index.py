@@ -0,0 +1,108 @@
+"""
+Lexical tool index for optimizer mode.
+
+A pure-Python BM25 inverted index over each tool's name, description and
+parameter names. It needs no extra dependencies and no model, answers a
+query in microseconds, and adds almost nothing to worker memory, so
+``google_workspace_find_tool`` works on pods that cannot afford
+sentence-transformers. When embeddings are available, core.optimizer blends
+the two rankings.
+
+Tokens are lowercased words split on punctuation, underscores and camelCase,
+with a plural "s" dropped so "events" matches list_calendar_events. Name
+tokens are counted several times, since a query word that appears in a tool
+name is the strongest signal for that tool.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+# BM25 parameters (the usual defaults)
+K1 = 1.2
+B = 0.75
+
+# How many times each token from a tool name counts toward term frequency
+NAME_WEIGHT = 3
+
+_WORD = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from how i in into is it its me my of on or "
+    "that the this to with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase search terms."""
+    tokens = []
+    for word in _WORD.findall(text):
+        word = word.lower()
+        if word in _STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+
+def _parameter_names(schema: Any) -> List[str]:
+    if not isinstance(schema, dict):
+        return []
+    properties = schema.get("properties")
+    return list(properties) if isinstance(properties, dict) else []
+
+
+class LexicalToolIndex:
+    """BM25 inverted index over tool definitions."""
+
+    def __init__(self, tools: Dict[str, Dict[str, Any]]):
+        """
+        Args:
+            tools: Tool name -> definition with 'description' and 'inputSchema'
+        """
+        self.tool_names: List[str] = list(tools)
+        # term -> [(tool position, term frequency)]
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        self._lengths: List[int] = []
+
+        for position, name in enumerate(self.tool_names):
+            tool = tools[name]
+            terms = Counter(tokenize(name) * NAME_WEIGHT)
+            terms.update(tokenize(tool.get("description") or ""))
+            for parameter in _parameter_names(tool.get("inputSchema")):
+                terms.update(tokenize(parameter))
+            for term, frequency in terms.items():
+                self._postings.setdefault(term, []).append((position, frequency))
+            self._lengths.append(sum(terms.values()))
+
+        count = len(self.tool_names)
+        self._average_length = sum(self._lengths) / count if count else 0.0
+        self._idf = {
+            term: math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+
+    def scores(self, query: str) -> Dict[int, float]:
+        """BM25 score of every tool matching at least one query term, by position."""
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf[term]
+            for position, frequency in postings:
+                norm = K1 * (1 - B + B * self._lengths[position] / self._average_length)
+                scores[position] = scores.get(position, 0.0) + idf * frequency * (
+                    K1 + 1
+                ) / (frequency + norm)
+        return scores
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        """Return up to top_k (tool name, score) pairs, best first."""
+        if top_k <= 0:
+            return []
+        best = heapq.nlargest(top_k, self.scores(query).items(), key=lambda item: item[1])
+        return [(self.tool_names[position], score) for position, score in best]
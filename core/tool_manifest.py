@@ -0,0 +1,274 @@
+"""
+Precomputed tool schema manifest.
+
+Every ``@server.tool()`` registration introspects the tool's signature and
+docstring and builds its JSON schema at import time. The manifest stores the
+result (name, description, input and output schema, annotations) for every
+tool, along with the module and service that define it and its tier from
+core/tool_tiers.yaml. Readers get all tool metadata from one JSON file in a
+few milliseconds, without importing any tool module:
+
+- lazy startup (core.lazy_tools) registers tools from it
+- optimizer mode takes its tool definitions and services from it
+- tools_cli.py lists and describes tools from it
+
+The manifest is generated from the code as a build step (see the Dockerfile):
+
+    python -m core.tool_manifest generate
+    python -m core.tool_manifest check    # exit 1 if it no longer matches
+
+``format_version`` changes when the manifest layout changes; readers ignore
+manifests with another format version and fall back to importing the tool
+modules. tests/core/test_tool_manifest.py fails when the manifest drifts
+from the code.
+
+This module must stay cheap to import: it does not import fastmcp or any
+tool module unless a manifest is being generated.
+
+Configuration:
+    WORKSPACE_MCP_TOOL_MANIFEST: Manifest path
+        (default: core/tool_manifest.json)
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from importlib import import_module, metadata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FORMAT_VERSION = 1
+MANIFEST_PATH = Path(
+    os.getenv(
+        "WORKSPACE_MCP_TOOL_MANIFEST", str(Path(__file__).parent / "tool_manifest.json")
+    )
+)
+
+# Service name (as used by --tools) -> module that registers its tools
+TOOL_MODULES = {
+    "gmail": "gmail.gmail_tools",
+    "drive": "gdrive.drive_tools",
+    "calendar": "gcalendar.calendar_tools",
+    "docs": "gdocs.docs_tools",
+    "sheets": "gsheets.sheets_tools",
+    "chat": "gchat.chat_tools",
+    "forms": "gforms.forms_tools",
+    "slides": "gslides.slides_tools",
+    "tasks": "gtasks.tasks_tools",
+    "search": "gsearch.search_tools",
+}
+
+_MODULE_SERVICES = {module: service for service, module in TOOL_MODULES.items()}
+
+TIER_ORDER = ("core", "extended", "complete")
+
+
+def _server_version() -> str:
+    try:
+        return metadata.version("workspace-mcp")
+    except metadata.PackageNotFoundError:
+        return "dev"
+
+
+def _tool_tiers() -> Dict[str, str]:
+    """Map each tool in core/tool_tiers.yaml to the lowest tier listing it."""
+    from core.tool_tier_loader import ToolTierLoader
+
+    loader = ToolTierLoader()
+    tiers: Dict[str, str] = {}
+    for tier in TIER_ORDER:
+        for tool_name in loader.get_tools_for_tier(tier):
+            tiers.setdefault(tool_name, tier)
+    return tiers
+
+
+def import_tool_modules(
+    server: Any, modules: Optional[Iterable[str]] = None
+) -> Dict[str, str]:
+    """
+    Import tool modules, recording which one registered each tool.
+
+    Tools are attributed to the module being imported when they appeared in
+    the registry, not to ``fn.__module__``: factories such as
+    core.comments.create_comment_tools define tools in one module on behalf
+    of another. Modules must not have been imported yet.
+
+    Returns:
+        Tool name -> service module that registered it
+    """
+    registry = server._tool_manager._tools
+    tool_modules: Dict[str, str] = {}
+    for module in TOOL_MODULES.values() if modules is None else modules:
+        if module in sys.modules:
+            raise RuntimeError(
+                f"{module} is already imported; generate the manifest in a fresh process"
+            )
+        before = set(registry)
+        import_module(module)
+        for name in registry.keys() - before:
+            tool_modules[name] = module
+    return tool_modules
+
+
+def _tool_entry(tool: Any, module: str, tiers: Dict[str, str]) -> Dict[str, Any]:
+    annotations = getattr(tool, "annotations", None)
+    if annotations is not None and hasattr(annotations, "model_dump"):
+        annotations = annotations.model_dump(exclude_none=True)
+    return {
+        "name": tool.name,
+        "service": _MODULE_SERVICES.get(module),
+        "module": module,
+        "tier": tiers.get(tool.name),
+        "description": tool.description or "",
+        "parameters": tool.parameters,
+        "output_schema": getattr(tool, "output_schema", None),
+        "annotations": annotations or None,
+        "tags": sorted(getattr(tool, "tags", None) or ()),
+    }
+
+
+def build_manifest(server: Any, tool_modules: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Snapshot the tools registered on ``server`` by the service modules.
+
+    ``tool_modules`` comes from import_tool_modules. Tools registered outside
+    the service modules (start_google_auth in core.server) are left out: they
+    are registered whenever the server module is imported.
+    """
+    tiers = _tool_tiers()
+    tools = [
+        _tool_entry(tool, tool_modules[name], tiers)
+        for name, tool in server._tool_manager._tools.items()
+        if name in tool_modules
+    ]
+    tools.sort(key=lambda entry: entry["name"])
+    return {
+        "format_version": MANIFEST_FORMAT_VERSION,
+        "server_version": _server_version(),
+        "tools": tools,
+    }
+
+
+def generate_manifest() -> Dict[str, Any]:
+    """Import every tool module and build the manifest from the live server."""
+    from core.server import server
+
+    return build_manifest(server, import_tool_modules(server))
+
+
+def write_manifest(manifest: Dict[str, Any], path: Path = MANIFEST_PATH) -> None:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> Optional[Dict[str, Any]]:
+    """Read the manifest, or return None if it is missing, unreadable or outdated."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read tool manifest {path}: {e}")
+        return None
+    if manifest.get("format_version") != MANIFEST_FORMAT_VERSION:
+        logger.warning(
+            f"Ignoring tool manifest {path}: format version "
+            f"{manifest.get('format_version')}, expected {MANIFEST_FORMAT_VERSION}"
+        )
+        return None
+    if not isinstance(manifest.get("tools"), list):
+        logger.warning(f"Tool manifest {path} has no tool list")
+        return None
+    return manifest
+
+
+def manifest_drift(expected: Dict[str, Any], actual: Dict[str, Any]) -> List[str]:
+    """
+    Describe how the tools in two manifests differ (empty when they match).
+
+    The server version is ignored, so a release alone does not invalidate an
+    otherwise identical manifest.
+    """
+    expected_tools = {tool["name"]: tool for tool in expected["tools"]}
+    actual_tools = {tool["name"]: tool for tool in actual["tools"]}
+    drift = [
+        f"missing tool: {name}"
+        for name in sorted(expected_tools.keys() - actual_tools.keys())
+    ]
+    drift += [
+        f"unexpected tool: {name}"
+        for name in sorted(actual_tools.keys() - expected_tools.keys())
+    ]
+    for name in sorted(expected_tools.keys() & actual_tools.keys()):
+        expected_tool, actual_tool = expected_tools[name], actual_tools[name]
+        changed = sorted(
+            key
+            for key in expected_tool.keys() | actual_tool.keys()
+            if expected_tool.get(key) != actual_tool.get(key)
+        )
+        if changed:
+            drift.append(f"changed tool: {name} ({', '.join(changed)})")
+    return drift
+
+
+def optimizer_definitions(
+    manifest: Dict[str, Any], names: Optional[Set[str]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Tool definitions in the shape core.optimizer expects."""
+    return {
+        entry["name"]: {
+            "name": entry["name"],
+            "description": entry["description"],
+            "inputSchema": entry["parameters"],
+            "service": entry["service"] or "unknown",
+        }
+        for entry in manifest["tools"]
+        if names is None or entry["name"] in names
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Manage the tool schema manifest")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command, help_text in (
+        ("generate", "Import all tool modules and write the manifest"),
+        ("check", "Exit with status 1 if the manifest does not match the code"),
+    ):
+        subparser = subparsers.add_parser(command, help=help_text)
+        subparser.add_argument(
+            "--path", default=str(MANIFEST_PATH), help="Manifest path"
+        )
+    args = parser.parse_args(argv)
+    path = Path(args.path)
+
+    manifest = generate_manifest()
+    if args.command == "generate":
+        write_manifest(manifest, path)
+        print(f"Wrote {len(manifest['tools'])} tools to {path}")
+        return 0
+
+    current = load_manifest(path)
+    if current is None:
+        print(f"{path} is missing or unreadable")
+        print("Run: python -m core.tool_manifest generate")
+        return 1
+    drift = manifest_drift(manifest, current)
+    for line in drift:
+        print(line)
+    if drift:
+        print("Tool manifest is out of date; run: python -m core.tool_manifest generate")
+        return 1
+    print(f"{path} is up to date ({len(manifest['tools'])} tools)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,692 @@
+"""
+Distributed tracing from MCP tool calls down to individual Google API requests.
+
+Metrics (core.metrics) show that a tool is slow; a trace shows why. Each
+``tools/call`` gets a root span (opened in AuthInfoMiddleware.on_call_tool)
+with children for the credential lookup, the googleapiclient service build,
+every ``execute_async`` request (including revision probes and retries) and
+heavy local steps such as range resolution and text search in gdocs::
+
+    tools/call batch_edit_doc
+    ├── credentials.lookup
+    ├── service.build docs v1
+    ├── google.api docs.documents.get
+    ├── gdocs.find_text_in_document
+    └── google.api docs.documents.batchUpdate
+
+Spans follow the OpenTelemetry data model and are exported as OTLP/JSON, so
+any OTLP/HTTP endpoint (Collector, Jaeger, Tempo) can receive them without
+adding the OpenTelemetry SDK as a dependency. An incoming W3C ``traceparent``
+header is honoured, so tool calls join the caller's trace.
+
+Sampling is parent-based: root spans are kept with probability
+WORKSPACE_MCP_TRACING_SAMPLE_RATIO (decided from the trace id, as
+OpenTelemetry's TraceIdRatioBased sampler does) and children follow their
+parent. When tracing is off, ``start_span`` and ``traced`` cost a single
+attribute check.
+
+Tests can capture spans with::
+
+    exporter = InMemorySpanExporter()
+    configure_tracing(exporter, processor="simple")
+    ...
+    exporter.get_finished_spans()
+
+Configuration:
+    WORKSPACE_MCP_TRACING: Exporter, "none" (default), "file" or "otlp"
+    WORKSPACE_MCP_TRACING_FILE: JSON lines output for the file exporter
+        (default: workspace-mcp-traces.jsonl)
+    WORKSPACE_MCP_TRACING_SAMPLE_RATIO: Fraction of traces kept (default: 1.0)
+    OTEL_EXPORTER_OTLP_TRACES_ENDPOINT: OTLP/HTTP traces URL
+        (default: $OTEL_EXPORTER_OTLP_ENDPOINT/v1/traces, else
+        http://localhost:4318/v1/traces)
+    OTEL_EXPORTER_OTLP_HEADERS: Extra headers, e.g. "authorization=Bearer x"
+    OTEL_SERVICE_NAME: service.name resource attribute (default: workspace-mcp)
+"""
+
+import atexit
+import contextlib
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import random
+import threading
+import time
+import urllib.parse
+import urllib.request
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+TRACING_EXPORTER = os.getenv("WORKSPACE_MCP_TRACING", "none").lower()
+TRACING_FILE = os.getenv("WORKSPACE_MCP_TRACING_FILE", "workspace-mcp-traces.jsonl")
+TRACING_SAMPLE_RATIO = float(os.getenv("WORKSPACE_MCP_TRACING_SAMPLE_RATIO", "1.0"))
+SERVICE_NAME = os.getenv("OTEL_SERVICE_NAME", "workspace-mcp")
+
+# OTLP span kinds and status codes
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_SCOPE = {"name": "workspace-mcp"}
+_MAX_EVENTS = 32
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "kind",
+        "sampled",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "events",
+        "status_code",
+        "status_message",
+        "_processor",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        span_id: str,
+        parent_span_id: Optional[str] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+        sampled: bool = True,
+        attributes: Optional[Dict[str, Any]] = None,
+        processor: Optional["SpanProcessor"] = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.sampled = sampled
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = dict(attributes) if attributes else {}
+        self.events: List[Dict[str, Any]] = []
+        self.status_code = STATUS_UNSET
+        self.status_message = ""
+        self._processor = processor
+
+    @property
+    def is_recording(self) -> bool:
+        return self.sampled and self.end_ns is None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.is_recording and value is not None:
+            self.attributes[key] = value
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        if self.is_recording and len(self.events) < _MAX_EVENTS:
+            self.events.append(
+                {
+                    "name": name,
+                    "time_ns": time.time_ns(),
+                    "attributes": attributes or {},
+                }
+            )
+
+    def set_status(self, code: int, message: str = "") -> None:
+        if self.is_recording:
+            self.status_code = code
+            self.status_message = message
+
+    def record_exception(self, exc: BaseException) -> None:
+        """Add an OpenTelemetry "exception" event and mark the span as failed."""
+        self.add_event(
+            "exception",
+            {
+                "exception.type": type(exc).__name__,
+                "exception.message": str(exc)[:1024],
+            },
+        )
+        self.set_status(STATUS_ERROR, type(exc).__name__)
+
+    def end(self) -> None:
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if self.sampled and self._processor is not None:
+            self._processor.on_end(self)
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Encode as an OTLP/JSON span."""
+        span: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": self.status_code},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        if self.events:
+            span["events"] = [
+                {
+                    "name": event["name"],
+                    "timeUnixNano": str(event["time_ns"]),
+                    "attributes": _otlp_attributes(event["attributes"]),
+                }
+                for event in self.events
+            ]
+        return span
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, trace_id={self.trace_id}, span_id={self.span_id})"
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(v) for v in value]}}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items()]
+
+
+def encode_spans(spans: Sequence[Span]) -> Dict[str, Any]:
+    """Wrap spans in an OTLP ExportTraceServiceRequest (JSON encoding)."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _otlp_attributes({"service.name": SERVICE_NAME})
+                },
+                "scopeSpans": [
+                    {"scope": _SCOPE, "spans": [span.to_otlp() for span in spans]}
+                ],
+            }
+        ]
+    }
+
+
+class SpanExporter:
+    """Sends finished spans somewhere. Returns False from export on failure."""
+
+    def export(self, spans: Sequence[Span]) -> bool:
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps finished spans in memory, for tests."""
+
+    def __init__(self):
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> bool:
+        with self._lock:
+            self._spans.extend(spans)
+        return True
+
+    def get_finished_spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+class FileSpanExporter(SpanExporter):
+    """Appends one OTLP/JSON export request per line, like the Collector's file exporter."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> bool:
+        line = json.dumps(encode_spans(spans), separators=(",", ":"))
+        try:
+            with self._lock, open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            logger.warning(f"Could not write traces to {self.path}: {e}")
+            return False
+        return True
+
+
+def _parse_otlp_headers(value: str) -> Dict[str, str]:
+    headers = {}
+    for item in value.split(","):
+        key, sep, val = item.partition("=")
+        if sep and key.strip():
+            headers[key.strip()] = urllib.parse.unquote(val.strip())
+    return headers
+
+
+def _default_otlp_endpoint() -> str:
+    endpoint = os.getenv("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT")
+    if endpoint:
+        return endpoint
+    base = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318")
+    return base.rstrip("/") + "/v1/traces"
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    """POSTs spans to an OTLP/HTTP endpoint using the JSON encoding."""
+
+    def __init__(
+        self,
+        endpoint: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10.0,
+    ):
+        self.endpoint = endpoint or _default_otlp_endpoint()
+        if headers is None:
+            headers = _parse_otlp_headers(os.getenv("OTEL_EXPORTER_OTLP_HEADERS", ""))
+        self.headers = {"Content-Type": "application/json", **headers}
+        self.timeout = timeout
+
+    def export(self, spans: Sequence[Span]) -> bool:
+        body = json.dumps(encode_spans(spans), separators=(",", ":")).encode()
+        request = urllib.request.Request(
+            self.endpoint, data=body, headers=self.headers, method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return 200 <= response.status < 300
+        except OSError as e:
+            logger.debug(f"OTLP trace export to {self.endpoint} failed: {e}")
+            return False
+
+
+class SpanProcessor:
+    """Receives spans as they end and hands them to an exporter."""
+
+    def __init__(self, exporter: SpanExporter):
+        self.exporter = exporter
+
+    def on_end(self, span: Span) -> None:
+        raise NotImplementedError
+
+    def force_flush(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        self.exporter.shutdown()
+
+
+class SimpleSpanProcessor(SpanProcessor):
+    """Exports each span synchronously as it ends."""
+
+    def on_end(self, span: Span) -> None:
+        _export(self.exporter, [span])
+
+
+class BatchSpanProcessor(SpanProcessor):
+    """
+    Queues spans and exports them in batches from a background thread.
+
+    Spans end on the event loop, so exporting (file writes, HTTP POSTs) must
+    not happen there. The queue is bounded; spans are dropped when it is full.
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        max_queue_size: int = 2048,
+        max_batch_size: int = 512,
+        schedule_delay: float = 5.0,
+    ):
+        super().__init__(exporter)
+        self.max_queue_size = max_queue_size
+        self.max_batch_size = max_batch_size
+        self.schedule_delay = schedule_delay
+        self._queue: deque = deque()
+        self._condition = threading.Condition()
+        self._shutdown = False
+        self._flush_requested = 0
+        self._flushed = 0
+        self._thread = threading.Thread(
+            target=self._worker, name="workspace-mcp-tracing", daemon=True
+        )
+        self._thread.start()
+
+    def on_end(self, span: Span) -> None:
+        with self._condition:
+            if self._shutdown or len(self._queue) >= self.max_queue_size:
+                _record("spans_dropped")
+                return
+            self._queue.append(span)
+            if len(self._queue) >= self.max_batch_size:
+                self._condition.notify()
+
+    def _worker(self) -> None:
+        while True:
+            with self._condition:
+                if not self._queue and not self._shutdown:
+                    self._condition.wait(self.schedule_delay)
+                flush_target = self._flush_requested
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(len(self._queue), self.max_batch_size))
+                ]
+                done = self._shutdown and not self._queue
+            if batch:
+                _export(self.exporter, batch)
+            with self._condition:
+                if not self._queue:
+                    self._flushed = max(self._flushed, flush_target)
+                    self._condition.notify_all()
+            if done:
+                return
+
+    def force_flush(self, timeout: float = 10.0) -> None:
+        """Export everything queued so far, waiting up to timeout seconds."""
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            self._flush_requested += 1
+            target = self._flush_requested
+            self._condition.notify_all()
+            while self._flushed < target and self._thread.is_alive():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        self._thread.join(10.0)
+        super().shutdown()
+
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, int] = {
+    "spans_started": 0,
+    "spans_sampled": 0,
+    "spans_exported": 0,
+    "spans_dropped": 0,
+    "export_failures": 0,
+}
+
+
+def _record(counter: str, amount: int = 1) -> None:
+    with _stats_lock:
+        _stats[counter] += amount
+
+
+def _export(exporter: SpanExporter, spans: List[Span]) -> None:
+    try:
+        ok = exporter.export(spans)
+    except Exception as e:
+        logger.debug(f"Span exporter {type(exporter).__name__} raised: {e}")
+        ok = False
+    if ok:
+        _record("spans_exported", len(spans))
+    else:
+        _record("export_failures")
+        _record("spans_dropped", len(spans))
+
+
+class _Tracer:
+    def __init__(self, processor: SpanProcessor, sample_ratio: float):
+        self.processor = processor
+        self.sample_ratio = min(1.0, max(0.0, sample_ratio))
+        self._bound = int(self.sample_ratio * (1 << 64))
+
+    def should_sample(self, trace_id: str) -> bool:
+        # Same rule as TraceIdRatioBased: compare the low 64 bits of the id
+        return int(trace_id[16:], 16) < self._bound
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "workspace_mcp_current_span", default=None
+)
+_tracer: Optional[_Tracer] = None
+_configured = False
+_config_lock = threading.Lock()
+
+
+def configure_tracing(
+    exporter: Optional[SpanExporter],
+    sample_ratio: float = 1.0,
+    processor: str = "batch",
+) -> None:
+    """
+    Install an exporter for all spans in the process, replacing any previous one.
+
+    Args:
+        exporter: Where finished spans go, or None to turn tracing off
+        sample_ratio: Fraction of new traces to record (0.0 - 1.0)
+        processor: "batch" to export from a background thread, or "simple"
+            to export synchronously as each span ends (tests)
+    """
+    global _tracer, _configured
+    with _config_lock:
+        previous = _tracer
+        if exporter is None:
+            _tracer = None
+        else:
+            span_processor = (
+                SimpleSpanProcessor(exporter)
+                if processor == "simple"
+                else BatchSpanProcessor(exporter)
+            )
+            _tracer = _Tracer(span_processor, sample_ratio)
+        _configured = True
+    if previous is not None:
+        previous.processor.shutdown()
+
+
+def configure_tracing_from_env() -> None:
+    """Configure the exporter from WORKSPACE_MCP_TRACING and OTEL_* variables."""
+    if TRACING_EXPORTER == "file":
+        exporter: Optional[SpanExporter] = FileSpanExporter(TRACING_FILE)
+    elif TRACING_EXPORTER == "otlp":
+        exporter = OtlpHttpSpanExporter()
+    else:
+        if TRACING_EXPORTER not in ("none", "", "false"):
+            logger.warning(
+                f"Unknown WORKSPACE_MCP_TRACING exporter {TRACING_EXPORTER!r}"
+            )
+        exporter = None
+    configure_tracing(exporter, TRACING_SAMPLE_RATIO)
+    if exporter is not None:
+        logger.info(
+            f"Tracing enabled: {type(exporter).__name__}, "
+            f"sample ratio {TRACING_SAMPLE_RATIO}"
+        )
+
+
+def _get_tracer() -> Optional[_Tracer]:
+    if not _configured:
+        configure_tracing_from_env()
+    return _tracer
+
+
+def force_flush() -> None:
+    """Export queued spans now."""
+    tracer = _tracer
+    if tracer is not None:
+        tracer.processor.force_flush()
+
+
+def shutdown_tracing() -> None:
+    """Flush and stop the exporter; tracing is off until reconfigured."""
+    global _tracer
+    with _config_lock:
+        tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.processor.shutdown()
+
+
+atexit.register(shutdown_tracing)
+
+
+def current_span() -> Optional[Span]:
+    """The span active in this context, if any."""
+    return _current_span.get()
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Span]:
+    """
+    Parse a W3C ``traceparent`` header into a remote parent span, or None.
+
+    The returned span is never recorded; it only carries the trace id, the
+    caller's span id and its sampling decision.
+    """
+    if not header:
+        return None
+    parts = header.strip().lower().split("-")
+    if len(parts) < 4 or len(parts[0]) != 2 or parts[0] == "ff":
+        return None
+    trace_id, span_id, flags = parts[1], parts[2], parts[3]
+    try:
+        if len(trace_id) != 32 or len(span_id) != 16 or len(flags) != 2:
+            return None
+        int(trace_id, 16), int(span_id, 16)
+        sampled = bool(int(flags, 16) & 1)
+    except ValueError:
+        return None
+    if trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    remote = Span("remote", trace_id, span_id, sampled=sampled)
+    remote.end_ns = remote.start_ns
+    return remote
+
+
+@contextlib.contextmanager
+def start_span(
+    name: str,
+    attributes: Optional[Dict[str, Any]] = None,
+    kind: int = SPAN_KIND_INTERNAL,
+    traceparent: Optional[str] = None,
+) -> Iterator[Optional[Span]]:
+    """
+    Open a span as a child of the current one and make it current.
+
+    Yields None when tracing is off, so callers guard attribute updates with
+    ``if span:``. Exceptions raised inside the block are recorded on the span
+    and re-raised.
+
+    Args:
+        name: Span name
+        attributes: Initial attributes
+        kind: SPAN_KIND_INTERNAL, SPAN_KIND_SERVER or SPAN_KIND_CLIENT
+        traceparent: W3C header to continue when there is no current span
+    """
+    tracer = _tracer if _configured else _get_tracer()
+    if tracer is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    if parent is None:
+        parent = parse_traceparent(traceparent)
+    if parent is not None:
+        trace_id = parent.trace_id
+        sampled = parent.sampled
+    else:
+        trace_id = f"{random.getrandbits(128):032x}"
+        sampled = tracer.should_sample(trace_id)
+
+    _record("spans_started")
+    if sampled:
+        _record("spans_sampled")
+    span = Span(
+        name,
+        trace_id,
+        f"{random.getrandbits(64):016x}",
+        parent_span_id=parent.span_id if parent is not None else None,
+        kind=kind,
+        sampled=sampled,
+        attributes=attributes if sampled else None,
+        processor=tracer.processor,
+    )
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.record_exception(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end()
+
+
+def traced(name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decorate a function (sync or async) so each call runs in its own span.
+
+    Args:
+        name: Span name (default: the function's qualified name)
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if _configured and _tracer is None:
+                    return await func(*args, **kwargs)
+                with start_span(span_name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _configured and _tracer is None:
+                return func(*args, **kwargs)
+            with start_span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def get_tracing_stats() -> Dict[str, Any]:
+    """Get span counters and the active exporter."""
+    tracer = _tracer
+    with _stats_lock:
+        stats: Dict[str, Any] = dict(_stats)
+    stats["enabled"] = tracer is not None
+    stats["exporter"] = (
+        type(tracer.processor.exporter).__name__ if tracer is not None else None
+    )
+    stats["sample_ratio"] = tracer.sample_ratio if tracer is not None else 0.0
+    return stats
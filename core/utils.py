@@ -6,11 +6,21 @@ import xml.etree.ElementTree as ET
 import ssl
 import asyncio
 import functools
+import inspect
+import time
 
 from typing import List, Optional
 
 from googleapiclient.errors import HttpError
 from .api_enablement import get_api_enablement_message
+from .metrics import track_tool_call
+from .circuit_breaker import (
+    CIRCUIT_BREAKER_ENABLED,
+    classify_error,
+    get_circuit_breaker,
+)
+from .retry import retry_budget
+from .singleflight import COALESCE_READS_ENABLED, call_key, get_read_coalescer
 from auth.google_auth import GoogleAuthenticationError
 
 logger = logging.getLogger(__name__)
@@ -357,6 +367,20 @@ def handle_http_errors(
     If is_read_only is True, it will also catch ssl.SSLError and retry with
     exponential backoff. After exhausting retries, it raises a TransientNetworkError.
 
+    Each call also gets a retry budget for the Google API requests it makes:
+    429s, rate-limit 403s and (when safe to resend) 5xx responses are retried
+    per request with jittered backoff (see core.retry) before surfacing here.
+
+    When service_type is given, calls go through that API's circuit breaker
+    (see core.circuit_breaker): while the API is failing, calls are rejected
+    immediately with a structured CircuitOpenError instead of being attempted.
+
+    Read-only calls are coalesced (see core.singleflight): concurrent calls by
+    the same caller with the same arguments share one execution and result.
+
+    Every call's latency, outcome and Google request count are recorded for
+    the /metrics endpoint (see core.metrics).
+
     Args:
         tool_name (str): The name of the tool being decorated (e.g., 'list_calendars').
         is_read_only (bool): If True, the operation is considered safe to retry on
@@ -365,8 +389,49 @@ def handle_http_errors(
     """
 
     def decorator(func):
+        signature = inspect.signature(func)
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
+            with track_tool_call(tool_name, service_type):
+                if is_read_only and COALESCE_READS_ENABLED:
+                    key = call_key(tool_name, signature, args, kwargs)
+                    if key is not None:
+                        return await get_read_coalescer().do(
+                            key, lambda: _guarded_call(*args, **kwargs)
+                        )
+                return await _guarded_call(*args, **kwargs)
+
+        async def _guarded_call(*args, **kwargs):
+            if service_type and CIRCUIT_BREAKER_ENABLED:
+                return await _call_through_breaker(*args, **kwargs)
+            # Request-level retries for quota/server errors share one budget
+            with retry_budget(tool_name, read_only=is_read_only):
+                return await _call_with_error_handling(*args, **kwargs)
+
+        async def _call_through_breaker(*args, **kwargs):
+            breaker = get_circuit_breaker(service_type)
+            probe = breaker.before_call(tool_name)
+            failed = None
+            budget = None
+            started = time.monotonic()
+            try:
+                with retry_budget(tool_name, read_only=is_read_only) as budget:
+                    result = await _call_with_error_handling(*args, **kwargs)
+                failed = False
+                return result
+            except Exception as e:
+                failed = classify_error(e)
+                raise
+            finally:
+                # Quota pacing and retry backoff are our own waits, not Google
+                # being slow, so they don't count toward the slow-call threshold
+                duration = time.monotonic() - started
+                if budget is not None:
+                    duration -= budget.wait_seconds + budget.paced_seconds
+                breaker.record(failed, max(duration, 0.0), probe)
+
+        async def _call_with_error_handling(*args, **kwargs):
             max_retries = 3
             base_delay = 1
 
@@ -6,7 +6,6 @@ This module provides MCP tools for interacting with Google Calendar API.
 
 import datetime
 import logging
-import asyncio
 import re
 import uuid
 import json
@@ -19,6 +18,7 @@ from auth.service_decorator import require_google_service
 from core.utils import handle_http_errors
 
 from core.server import server
+from core.async_http import execute_async
 
 
 # Configure module logger
@@ -290,9 +290,7 @@ async def list_calendars(service, user_google_email: str) -> str:
     """
     logger.info(f"[list_calendars] Invoked. Email: '{user_google_email}'")
 
-    calendar_list_response = await asyncio.to_thread(
-        lambda: service.calendarList().list().execute()
-    )
+    calendar_list_response = await execute_async(service.calendarList().list())
     items = calendar_list_response.get("items", [])
     if not items:
         return f"No calendars found for {user_google_email}."
@@ -349,10 +347,8 @@ async def get_events(
     # Handle single event retrieval
     if event_id:
         logger.info(f"[get_events] Retrieving single event with ID: {event_id}")
-        event = await asyncio.to_thread(
-            lambda: service.events()
-            .get(calendarId=calendar_id, eventId=event_id)
-            .execute()
+        event = await execute_async(
+            service.events().get(calendarId=calendar_id, eventId=event_id)
         )
         items = [event]
     else:
@@ -396,9 +392,7 @@ async def get_events(
         if query:
             request_params["q"] = query
 
-        events_result = await asyncio.to_thread(
-            lambda: service.events().list(**request_params).execute()
-        )
+        events_result = await execute_async(service.events().list(**request_params))
         items = events_result.get("items", [])
     if not items:
         if event_id:
@@ -657,14 +651,12 @@ async def create_event(
                 # Try to get the actual MIME type and filename from Drive
                 if drive_service:
                     try:
-                        file_metadata = await asyncio.to_thread(
-                            lambda: drive_service.files()
-                            .get(
+                        file_metadata = await execute_async(
+                            drive_service.files().get(
                                 fileId=file_id,
                                 fields="mimeType,name",
                                 supportsAllDrives=True,
                             )
-                            .execute()
                         )
                         mime_type = file_metadata.get("mimeType", mime_type)
                         filename = file_metadata.get("name")
@@ -688,25 +680,21 @@ async def create_event(
                         "mimeType": mime_type,
                     }
                 )
-        created_event = await asyncio.to_thread(
-            lambda: service.events()
-            .insert(
+        created_event = await execute_async(
+            service.events().insert(
                 calendarId=calendar_id,
                 body=event_body,
                 supportsAttachments=True,
                 conferenceDataVersion=1 if add_google_meet else 0,
             )
-            .execute()
         )
     else:
-        created_event = await asyncio.to_thread(
-            lambda: service.events()
-            .insert(
+        created_event = await execute_async(
+            service.events().insert(
                 calendarId=calendar_id,
                 body=event_body,
                 conferenceDataVersion=1 if add_google_meet else 0,
             )
-            .execute()
         )
     link = created_event.get("htmlLink", "No link available")
     confirmation_message = f"Successfully created event '{created_event.get('summary', summary)}' for {user_google_email}. Link: {link}"
@@ -805,10 +793,8 @@ async def modify_event(
         else:
             # Preserve existing event's useDefault value if not explicitly specified
             try:
-                existing_event = (
-                    service.events()
-                    .get(calendarId=calendar_id, eventId=event_id)
-                    .execute()
+                existing_event = await execute_async(
+                    service.events().get(calendarId=calendar_id, eventId=event_id)
                 )
                 reminder_data["useDefault"] = existing_event.get("reminders", {}).get(
                     "useDefault", True
@@ -866,10 +852,8 @@ async def modify_event(
 
     # Get the existing event to preserve fields that aren't being updated
     try:
-        existing_event = await asyncio.to_thread(
-            lambda: service.events()
-            .get(calendarId=calendar_id, eventId=event_id)
-            .execute()
+        existing_event = await execute_async(
+            service.events().get(calendarId=calendar_id, eventId=event_id)
         )
         logger.info(
             "[modify_event] Successfully retrieved existing event before update"
@@ -931,15 +915,13 @@ async def modify_event(
             )
 
     # Proceed with the update
-    updated_event = await asyncio.to_thread(
-        lambda: service.events()
-        .update(
+    updated_event = await execute_async(
+        service.events().update(
             calendarId=calendar_id,
             eventId=event_id,
             body=event_body,
             conferenceDataVersion=1,
         )
-        .execute()
     )
 
     link = updated_event.get("htmlLink", "No link available")
@@ -992,10 +974,8 @@ async def delete_event(
 
     # Try to get the event first to verify it exists
     try:
-        await asyncio.to_thread(
-            lambda: service.events()
-            .get(calendarId=calendar_id, eventId=event_id)
-            .execute()
+        await execute_async(
+            service.events().get(calendarId=calendar_id, eventId=event_id)
         )
         logger.info("[delete_event] Successfully verified event exists before deletion")
     except HttpError as get_error:
@@ -1011,10 +991,8 @@ async def delete_event(
             )
 
     # Proceed with the deletion
-    await asyncio.to_thread(
-        lambda: service.events()
-        .delete(calendarId=calendar_id, eventId=event_id)
-        .execute()
+    await execute_async(
+        service.events().delete(calendarId=calendar_id, eventId=event_id)
     )
 
     confirmation_message = f"Successfully deleted event (ID: {event_id}) from calendar '{calendar_id}' for {user_google_email}."
@@ -1077,9 +1055,8 @@ async def get_events_times_only(
         f"[get_events_times_only] Final API parameters - calendarId: '{calendar_id}', timeMin: '{effective_time_min}', timeMax: '{effective_time_max}', maxResults: {max_results}"
     )
 
-    events_result = await asyncio.to_thread(
-        lambda: service.events()
-        .list(
+    events_result = await execute_async(
+        service.events().list(
             calendarId=calendar_id,
             timeMin=effective_time_min,
             timeMax=effective_time_max,
@@ -1087,7 +1064,6 @@ async def get_events_times_only(
             singleEvents=True,
             orderBy="startTime",
         )
-        .execute()
     )
     items = events_result.get("items", [])
     if not items:
@@ -5,7 +5,6 @@ This module provides MCP tools for interacting with Google Chat API.
 """
 
 import logging
-import asyncio
 from typing import Optional
 
 from googleapiclient.errors import HttpError
@@ -14,6 +13,7 @@ from googleapiclient.errors import HttpError
 from auth.service_decorator import require_google_service
 from core.server import server
 from core.utils import handle_http_errors
+from core.async_http import execute_async
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +46,7 @@ async def list_spaces(
     if filter_param:
         request_params["filter"] = filter_param
 
-    response = await asyncio.to_thread(service.spaces().list(**request_params).execute)
+    response = await execute_async(service.spaces().list(**request_params))
 
     spaces = response.get("spaces", [])
     if not spaces:
@@ -81,15 +81,14 @@ async def get_messages(
     logger.info(f"[get_messages] Space ID: '{space_id}' for user '{user_google_email}'")
 
     # Get space info first
-    space_info = await asyncio.to_thread(service.spaces().get(name=space_id).execute)
+    space_info = await execute_async(service.spaces().get(name=space_id))
     space_name = space_info.get("displayName", "Unknown Space")
 
     # Get messages
-    response = await asyncio.to_thread(
+    response = await execute_async(
         service.spaces()
         .messages()
         .list(parent=space_id, pageSize=page_size, orderBy=order_by)
-        .execute
     )
 
     messages = response.get("messages", [])
@@ -135,9 +134,7 @@ async def send_message(
     if thread_key:
         request_params["threadKey"] = thread_key
 
-    message = await asyncio.to_thread(
-        service.spaces().messages().create(**request_params).execute
-    )
+    message = await execute_async(service.spaces().messages().create(**request_params))
 
     message_name = message.get("name", "")
     create_time = message.get("createTime", "")
@@ -169,32 +166,28 @@ async def search_messages(
 
     # If specific space provided, search within that space
     if space_id:
-        response = await asyncio.to_thread(
+        response = await execute_async(
             service.spaces()
             .messages()
             .list(parent=space_id, pageSize=page_size, filter=f'text:"{query}"')
-            .execute
         )
         messages = response.get("messages", [])
         context = f"space '{space_id}'"
     else:
         # Search across all accessible spaces (this may require iterating through spaces)
         # For simplicity, we'll search the user's spaces first
-        spaces_response = await asyncio.to_thread(
-            service.spaces().list(pageSize=100).execute
-        )
+        spaces_response = await execute_async(service.spaces().list(pageSize=100))
         spaces = spaces_response.get("spaces", [])
 
         messages = []
         for space in spaces[:10]:  # Limit to first 10 spaces to avoid timeout
             try:
-                space_messages = await asyncio.to_thread(
+                space_messages = await execute_async(
                     service.spaces()
                     .messages()
                     .list(
                         parent=space.get("name"), pageSize=5, filter=f'text:"{query}"'
                     )
-                    .execute
                 )
                 space_msgs = space_messages.get("messages", [])
                 for msg in space_msgs:
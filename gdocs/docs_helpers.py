@@ -10,6 +10,8 @@ from typing import Dict, Any, Optional, Tuple, List
 from enum import Enum
 from dataclasses import dataclass, asdict
 
+from core.tracing import traced
+
 logger = logging.getLogger(__name__)
 
 
@@ -321,6 +323,7 @@ def extract_document_text_with_indices(
     return text_segments
 
 
+@traced("gdocs.extract_text_at_range")
 def extract_text_at_range(
     doc_data: Dict[str, Any], start_index: int, end_index: int, context_chars: int = 50
 ) -> Dict[str, Any]:
@@ -427,6 +430,7 @@ def get_character_at_index(doc_data: Dict[str, Any], index: int) -> Optional[str
     return None
 
 
+@traced("gdocs.find_text_in_document")
 def find_text_in_document(
     doc_data: Dict[str, Any],
     search_text: str,
@@ -548,6 +552,7 @@ def find_all_occurrences_in_document(
     return results
 
 
+@traced("gdocs.calculate_search_based_indices")
 def calculate_search_based_indices(
     doc_data: Dict[str, Any],
     search_text: str,
@@ -2040,6 +2045,7 @@ def resolve_range_by_section(
     )
 
 
+@traced("gdocs.resolve_range")
 def resolve_range(doc_data: Dict[str, Any], range_spec: Dict[str, Any]) -> RangeResult:
     """
     Resolve a range specification to start/end indices.
@@ -5,7 +5,6 @@ This module provides MCP tools for interacting with Google Docs API and managing
 """
 
 import logging
-import asyncio
 import io
 from typing import List, Dict, Any, Literal
 
@@ -76,6 +75,8 @@ from gdocs.managers import (
 )
 from gdocs.managers.history_manager import get_history_manager, UndoCapability
 from gdocs.errors import DocsErrorBuilder, format_error
+from core.async_http import execute_async
+from core.executors import run_cpu, run_io
 
 logger = logging.getLogger(__name__)
 
@@ -99,16 +100,14 @@ async def search_docs(
 
     escaped_query = query.replace("'", "\\'")
 
-    response = await asyncio.to_thread(
-        service.files()
-        .list(
+    response = await execute_async(
+        service.files().list(
             q=f"name contains '{escaped_query}' and mimeType='application/vnd.google-apps.document' and trashed=false",
             pageSize=page_size,
             fields="files(id, name, createdTime, modifiedTime, webViewLink)",
             supportsAllDrives=True,
             includeItemsFromAllDrives=True,
         )
-        .execute
     )
     files = response.get("files", [])
     if not files:
@@ -224,8 +223,8 @@ async def get_doc_content(
     if scope != "full" or format == "formatted":
         # Must be a native Google Doc for these operations
         try:
-            doc_data = await asyncio.to_thread(
-                docs_service.documents().get(documentId=document_id).execute
+            doc_data = await execute_async(
+                docs_service.documents().get(documentId=document_id)
             )
         except HttpError as e:
             if e.resp.status == 400:
@@ -340,10 +339,10 @@ async def get_doc_content(
     # This ensures users with Docs API access but not Drive API access can still get content
     try:
         logger.info("[get_doc_content] Trying Docs API first for consistency.")
-        doc_data = await asyncio.to_thread(
-            docs_service.documents()
-            .get(documentId=document_id, includeTabsContent=True)
-            .execute
+        doc_data = await execute_async(
+            docs_service.documents().get(
+                documentId=document_id, includeTabsContent=True
+            )
         )
 
         # Successfully got document via Docs API - it's a native Google Doc
@@ -397,14 +396,12 @@ async def get_doc_content(
     # Fall back to Drive API for non-Google Docs files (.docx, etc.)
     logger.info("[get_doc_content] Falling back to Drive API for non-Google Doc file.")
 
-    file_metadata = await asyncio.to_thread(
-        drive_service.files()
-        .get(
+    file_metadata = await execute_async(
+        drive_service.files().get(
             fileId=document_id,
             fields="id, name, mimeType, webViewLink",
             supportsAllDrives=True,
         )
-        .execute
     )
     mime_type = file_metadata.get("mimeType", "")
     file_name = file_metadata.get("name", "Unknown File")
@@ -431,14 +428,13 @@ async def get_doc_content(
 
     fh = io.BytesIO()
     downloader = MediaIoBaseDownload(fh, request_obj)
-    loop = asyncio.get_event_loop()
     done = False
     while not done:
-        status, done = await loop.run_in_executor(None, downloader.next_chunk)
+        status, done = await run_io(downloader.next_chunk)
 
     file_content_bytes = fh.getvalue()
 
-    office_text = extract_office_xml_text(file_content_bytes, mime_type)
+    office_text = await run_cpu(extract_office_xml_text, file_content_bytes, mime_type)
     if office_text:
         body_text = office_text
     else:
@@ -585,16 +581,14 @@ async def list_docs_in_folder(
         f"[list_docs_in_folder] Invoked. Email: '{user_google_email}', Folder ID: '{folder_id}'"
     )
 
-    rsp = await asyncio.to_thread(
-        service.files()
-        .list(
+    rsp = await execute_async(
+        service.files().list(
             q=f"'{folder_id}' in parents and mimeType='application/vnd.google-apps.document' and trashed=false",
             pageSize=page_size,
             fields="files(id, name, modifiedTime, webViewLink)",
             supportsAllDrives=True,
             includeItemsFromAllDrives=True,
         )
-        .execute
     )
     items = rsp.get("files", [])
     if not items:
@@ -635,8 +629,8 @@ async def list_doc_tabs(
     )
 
     # Fetch document with tab content
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id, includeTabsContent=True).execute
+    doc_data = await execute_async(
+        service.documents().get(documentId=document_id, includeTabsContent=True)
     )
 
     doc_title = doc_data.get("title", "Untitled Document")
@@ -730,18 +724,16 @@ async def create_doc(
     """
     logger.info(f"[create_doc] Invoked. Email: '{user_google_email}', Title='{title}'")
 
-    doc = await asyncio.to_thread(
-        service.documents().create(body={"title": title}).execute
-    )
+    doc = await execute_async(service.documents().create(body={"title": title}))
     doc_id = doc.get("documentId")
     if content:
         # Interpret escape sequences in content (e.g., \n -> actual newline)
         content = interpret_escape_sequences(content)
         requests = [{"insertText": {"location": {"index": 1}, "text": content}}]
-        await asyncio.to_thread(
-            service.documents()
-            .batchUpdate(documentId=doc_id, body={"requests": requests})
-            .execute
+        await execute_async(
+            service.documents().batchUpdate(
+                documentId=doc_id, body={"requests": requests}
+            )
         )
     link = f"https://docs.google.com/document/d/{doc_id}/edit"
     msg = f"Created Google Doc '{title}' (ID: {doc_id}) for {user_google_email}. Link: {link}"
@@ -1559,10 +1551,8 @@ async def modify_doc_text(
     # If using location mode, resolve to indices by fetching document
     if use_location_mode:
         # Get document to determine total length (with tab support)
-        doc_data = await asyncio.to_thread(
-            service.documents()
-            .get(documentId=document_id, includeTabsContent=True)
-            .execute
+        doc_data = await execute_async(
+            service.documents().get(documentId=document_id, includeTabsContent=True)
         )
 
         structure = parse_document_structure(doc_data, tab_id)
@@ -1590,9 +1580,7 @@ async def modify_doc_text(
     # If using range mode, resolve the range to indices
     elif use_range_mode:
         # Get document
-        doc_data = await asyncio.to_thread(
-            service.documents().get(documentId=document_id).execute
-        )
+        doc_data = await execute_async(service.documents().get(documentId=document_id))
 
         # Resolve the range specification
         range_result = resolve_range(doc_data, range)
@@ -1630,9 +1618,7 @@ async def modify_doc_text(
     # If using heading mode, find the section and calculate insertion point
     elif use_heading_mode:
         # Get document
-        doc_data = await asyncio.to_thread(
-            service.documents().get(documentId=document_id).execute
-        )
+        doc_data = await execute_async(service.documents().get(documentId=document_id))
 
         # Find the insertion point using section navigation
         insertion_index = find_section_insertion_point(
@@ -1659,9 +1645,7 @@ async def modify_doc_text(
     # If using search mode, find the text and calculate indices
     elif use_search_mode:
         # Get document to search
-        doc_data = await asyncio.to_thread(
-            service.documents().get(documentId=document_id).execute
-        )
+        doc_data = await execute_async(service.documents().get(documentId=document_id))
 
         success, calc_start, calc_end, message = calculate_search_based_indices(
             doc_data, search, position, occurrence, match_case
@@ -1833,8 +1817,8 @@ async def modify_doc_text(
         doc_data_for_style_check = locals().get("doc_data")
 
         if doc_data_for_style_check is None:
-            doc_data_for_style_check = await asyncio.to_thread(
-                service.documents().get(documentId=document_id).execute
+            doc_data_for_style_check = await execute_async(
+                service.documents().get(documentId=document_id)
             )
             # Store for later use (e.g., preview mode)
             doc_data = doc_data_for_style_check
@@ -1870,8 +1854,8 @@ async def modify_doc_text(
         and end_index > start_index
     ):
         if doc_data is None:
-            doc_data = await asyncio.to_thread(
-                service.documents().get(documentId=document_id).execute
+            doc_data = await execute_async(
+                service.documents().get(documentId=document_id)
             )
 
     # Clean text for list conversion if needed
@@ -2351,8 +2335,8 @@ async def modify_doc_text(
             [use_location_mode, use_range_mode, use_heading_mode, use_search_mode]
         ):
             # Index-based mode - need to fetch document for preview
-            doc_data = await asyncio.to_thread(
-                service.documents().get(documentId=document_id).execute
+            doc_data = await execute_async(
+                service.documents().get(documentId=document_id)
             )
 
         # Calculate what would change
@@ -2543,8 +2527,8 @@ async def modify_doc_text(
         # Ensure we have doc_data for text capture
         try:
             if "doc_data" not in dir() or doc_data is None:
-                doc_data = await asyncio.to_thread(
-                    service.documents().get(documentId=document_id).execute
+                doc_data = await execute_async(
+                    service.documents().get(documentId=document_id)
                 )
             extracted = extract_text_at_range(
                 doc_data, actual_start_index, actual_end_index
@@ -2557,10 +2541,10 @@ async def modify_doc_text(
         except Exception as e:
             logger.warning(f"Failed to capture text for undo: {e}")
 
-    await asyncio.to_thread(
-        service.documents()
-        .batchUpdate(documentId=document_id, body={"requests": requests})
-        .execute
+    await execute_async(
+        service.documents().batchUpdate(
+            documentId=document_id, body={"requests": requests}
+        )
     )
 
     # Record operation for undo history (automatic tracking)
@@ -2857,9 +2841,7 @@ async def find_and_replace_doc(
 
     # Handle preview mode - find all occurrences without modifying
     if preview:
-        doc_data = await asyncio.to_thread(
-            service.documents().get(documentId=document_id).execute
-        )
+        doc_data = await execute_async(service.documents().get(documentId=document_id))
 
         all_occurrences = find_all_occurrences_in_document(
             doc_data, find_text, match_case
@@ -2920,9 +2902,7 @@ async def find_and_replace_doc(
 
     # For non-preview mode, first get document to find all occurrence positions
     # This allows us to report affected ranges in the structured response
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc_data = await execute_async(service.documents().get(documentId=document_id))
     all_occurrences = find_all_occurrences_in_document(doc_data, find_text, match_case)
 
     # Build matches list with original positions (before replacement)
@@ -2946,10 +2926,10 @@ async def find_and_replace_doc(
         )
     ]
 
-    result = await asyncio.to_thread(
-        service.documents()
-        .batchUpdate(documentId=document_id, body={"requests": requests})
-        .execute
+    result = await execute_async(
+        service.documents().batchUpdate(
+            documentId=document_id, body={"requests": requests}
+        )
     )
 
     # Extract number of replacements from response
@@ -2963,8 +2943,8 @@ async def find_and_replace_doc(
     occurrences_formatted = 0
     if has_formatting and replacements > 0 and replace_text:
         # Fetch the updated document to find positions of replaced text
-        updated_doc_data = await asyncio.to_thread(
-            service.documents().get(documentId=document_id).execute
+        updated_doc_data = await execute_async(
+            service.documents().get(documentId=document_id)
         )
 
         # Find all occurrences of the replacement text
@@ -3006,10 +2986,10 @@ async def find_and_replace_doc(
 
         # Apply formatting in a batch update
         if format_requests:
-            await asyncio.to_thread(
-                service.documents()
-                .batchUpdate(documentId=document_id, body={"requests": format_requests})
-                .execute
+            await execute_async(
+                service.documents().batchUpdate(
+                    documentId=document_id, body={"requests": format_requests}
+                )
             )
             occurrences_formatted = len(replaced_occurrences)
 
@@ -3276,9 +3256,7 @@ async def format_all_occurrences(
         formatting_applied.append("background_color")
 
     # Get document and find all occurrences
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc_data = await execute_async(service.documents().get(documentId=document_id))
     all_occurrences = find_all_occurrences_in_document(doc_data, search, match_case)
 
     doc_link = f"https://docs.google.com/document/d/{document_id}/edit"
@@ -3367,10 +3345,10 @@ async def format_all_occurrences(
 
     # Apply formatting in a single batch update
     if format_requests:
-        await asyncio.to_thread(
-            service.documents()
-            .batchUpdate(documentId=document_id, body={"requests": format_requests})
-            .execute
+        await execute_async(
+            service.documents().batchUpdate(
+                documentId=document_id, body={"requests": format_requests}
+            )
         )
 
     operation_result = {
@@ -3508,9 +3486,7 @@ async def auto_linkify_doc(
         pattern = re.compile(DEFAULT_URL_PATTERN, re.IGNORECASE)
 
     # Get document data
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc_data = await execute_async(service.documents().get(documentId=document_id))
 
     # Extract text with indices
     text_segments = extract_document_text_with_indices(doc_data)
@@ -3674,10 +3650,10 @@ async def auto_linkify_doc(
 
     # Apply links in a single batch update
     if format_requests:
-        await asyncio.to_thread(
-            service.documents()
-            .batchUpdate(documentId=document_id, body={"requests": format_requests})
-            .execute
+        await execute_async(
+            service.documents().batchUpdate(
+                documentId=document_id, body={"requests": format_requests}
+            )
         )
 
     operation_result = {
@@ -3794,8 +3770,8 @@ async def insert_doc_elements(
     else:
         # Location-based positioning - fetch document first
         try:
-            doc_data = await asyncio.to_thread(
-                service.documents().get(documentId=document_id).execute
+            doc_data = await execute_async(
+                service.documents().get(documentId=document_id)
             )
         except Exception as e:
             return f"ERROR: Failed to fetch document for index calculation: {str(e)}"
@@ -3973,10 +3949,10 @@ async def insert_doc_elements(
             ],
         )
 
-    await asyncio.to_thread(
-        service.documents()
-        .batchUpdate(documentId=document_id, body={"requests": requests})
-        .execute
+    await execute_async(
+        service.documents().batchUpdate(
+            documentId=document_id, body={"requests": requests}
+        )
     )
 
     link = f"https://docs.google.com/document/d/{document_id}/edit"
@@ -4088,8 +4064,8 @@ async def insert_doc_image(
     else:
         # Auto-detect insertion point - fetch document first
         try:
-            doc_data = await asyncio.to_thread(
-                docs_service.documents().get(documentId=document_id).execute
+            doc_data = await execute_async(
+                docs_service.documents().get(documentId=document_id)
             )
         except Exception as e:
             return f"ERROR: Failed to fetch document for index calculation: {str(e)}"
@@ -4142,14 +4118,12 @@ async def insert_doc_image(
     if is_drive_file:
         # Verify Drive file exists and get metadata
         try:
-            file_metadata = await asyncio.to_thread(
-                drive_service.files()
-                .get(
+            file_metadata = await execute_async(
+                drive_service.files().get(
                     fileId=image_source,
                     fields="id, name, mimeType",
                     supportsAllDrives=True,
                 )
-                .execute
             )
             mime_type = file_metadata.get("mimeType", "")
             if not mime_type.startswith("image/"):
@@ -4170,10 +4144,10 @@ async def insert_doc_image(
     # Use helper to create image request
     requests = [create_insert_image_request(resolved_index, image_uri, width, height)]
 
-    await asyncio.to_thread(
-        docs_service.documents()
-        .batchUpdate(documentId=document_id, body={"requests": requests})
-        .execute
+    await execute_async(
+        docs_service.documents().batchUpdate(
+            documentId=document_id, body={"requests": requests}
+        )
     )
 
     size_info = ""
@@ -4291,9 +4265,7 @@ async def insert_doc_footnote(
 
     # Fetch document to resolve positioning
     try:
-        doc_data = await asyncio.to_thread(
-            service.documents().get(documentId=document_id).execute
-        )
+        doc_data = await execute_async(service.documents().get(documentId=document_id))
     except Exception as e:
         return f"ERROR: Failed to fetch document: {str(e)}"
 
@@ -4333,12 +4305,10 @@ async def insert_doc_footnote(
     create_footnote_request = create_insert_footnote_request(resolved_index)
 
     try:
-        result = await asyncio.to_thread(
-            service.documents()
-            .batchUpdate(
+        result = await execute_async(
+            service.documents().batchUpdate(
                 documentId=document_id, body={"requests": [create_footnote_request]}
             )
-            .execute
         )
     except Exception as e:
         error_msg = str(e)
@@ -4372,12 +4342,10 @@ async def insert_doc_footnote(
     )
 
     try:
-        await asyncio.to_thread(
-            service.documents()
-            .batchUpdate(
+        await execute_async(
+            service.documents().batchUpdate(
                 documentId=document_id, body={"requests": [insert_text_request]}
             )
-            .execute
         )
     except Exception as e:
         return (
@@ -4689,9 +4657,7 @@ async def get_doc_headers_footers(
         )
 
     # Extract full text content for each header/footer
-    doc = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc = await execute_async(service.documents().get(documentId=document_id))
 
     result = {
         "has_headers": info.get("has_headers", False),
@@ -5025,9 +4991,7 @@ async def get_doc_info(
         return structured_error
 
     # Get the document once
-    doc = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc = await execute_async(service.documents().get(documentId=document_id))
 
     result = {
         "title": doc.get("title", "Untitled"),
@@ -5193,9 +5157,7 @@ async def delete_doc_section(
         )
 
     # Get the document
-    doc = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc = await execute_async(service.documents().get(documentId=document_id))
 
     # Find the section
     section = find_section_by_heading(doc, heading, match_case)
@@ -5277,10 +5239,10 @@ async def delete_doc_section(
     # Perform the deletion
     if characters_to_delete > 0:
         requests = [create_delete_range_request(delete_start, delete_end)]
-        await asyncio.to_thread(
-            service.documents()
-            .batchUpdate(documentId=document_id, body={"requests": requests})
-            .execute
+        await execute_async(
+            service.documents().batchUpdate(
+                documentId=document_id, body={"requests": requests}
+            )
         )
 
     result["deleted"] = True
@@ -5394,8 +5356,8 @@ async def create_table_with_data(
     else:
         # Auto-detect insertion point - fetch document first
         try:
-            doc_data = await asyncio.to_thread(
-                service.documents().get(documentId=document_id).execute
+            doc_data = await execute_async(
+                service.documents().get(documentId=document_id)
             )
         except Exception as e:
             return f"ERROR: Failed to fetch document for index calculation: {str(e)}"
@@ -5525,9 +5487,7 @@ async def debug_table_structure(
     )
 
     # Get the document
-    doc = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc = await execute_async(service.documents().get(documentId=document_id))
 
     # Find tables
     tables = find_tables(doc)
@@ -5961,9 +5921,7 @@ async def modify_table(
 
         try:
             # Refresh table structure before each operation
-            doc = await asyncio.to_thread(
-                service.documents().get(documentId=document_id).execute
-            )
+            doc = await execute_async(service.documents().get(documentId=document_id))
             tables = find_tables(doc)
 
             # Handle negative indices (Python-style: -1 = last, -2 = second-to-last)
@@ -5998,10 +5956,10 @@ async def modify_table(
                     insert_below=insert_below,
                 )
 
-                await asyncio.to_thread(
-                    service.documents()
-                    .batchUpdate(documentId=document_id, body={"requests": [request]})
-                    .execute
+                await execute_async(
+                    service.documents().batchUpdate(
+                        documentId=document_id, body={"requests": [request]}
+                    )
                 )
 
                 position = "below" if insert_below else "above"
@@ -6028,10 +5986,10 @@ async def modify_table(
                     table_start_index=table_start, row_index=row_idx
                 )
 
-                await asyncio.to_thread(
-                    service.documents()
-                    .batchUpdate(documentId=document_id, body={"requests": [request]})
-                    .execute
+                await execute_async(
+                    service.documents().batchUpdate(
+                        documentId=document_id, body={"requests": [request]}
+                    )
                 )
 
                 results.append(f"Op {i} (delete_row): SUCCESS - deleted row {row_idx}")
@@ -6053,10 +6011,10 @@ async def modify_table(
                     insert_right=insert_right,
                 )
 
-                await asyncio.to_thread(
-                    service.documents()
-                    .batchUpdate(documentId=document_id, body={"requests": [request]})
-                    .execute
+                await execute_async(
+                    service.documents().batchUpdate(
+                        documentId=document_id, body={"requests": [request]}
+                    )
                 )
 
                 position = "right of" if insert_right else "left of"
@@ -6083,10 +6041,10 @@ async def modify_table(
                     table_start_index=table_start, row_index=0, column_index=col_idx
                 )
 
-                await asyncio.to_thread(
-                    service.documents()
-                    .batchUpdate(documentId=document_id, body={"requests": [request]})
-                    .execute
+                await execute_async(
+                    service.documents().batchUpdate(
+                        documentId=document_id, body={"requests": [request]}
+                    )
                 )
 
                 results.append(
@@ -6147,12 +6105,10 @@ async def modify_table(
                 if requests:
                     # Execute delete first (if any), then insert
                     for req in requests:
-                        await asyncio.to_thread(
-                            service.documents()
-                            .batchUpdate(
+                        await execute_async(
+                            service.documents().batchUpdate(
                                 documentId=document_id, body={"requests": [req]}
                             )
-                            .execute
                         )
 
                 results.append(
@@ -6166,10 +6122,10 @@ async def modify_table(
                 # Delete the entire table using deleteContentRange
                 request = create_delete_range_request(table_start, table_end)
 
-                await asyncio.to_thread(
-                    service.documents()
-                    .batchUpdate(documentId=document_id, body={"requests": [request]})
-                    .execute
+                await execute_async(
+                    service.documents().batchUpdate(
+                        documentId=document_id, body={"requests": [request]}
+                    )
                 )
 
                 results.append(
@@ -6217,10 +6173,10 @@ async def modify_table(
                     column_span=column_span,
                 )
 
-                await asyncio.to_thread(
-                    service.documents()
-                    .batchUpdate(documentId=document_id, body={"requests": [request]})
-                    .execute
+                await execute_async(
+                    service.documents().batchUpdate(
+                        documentId=document_id, body={"requests": [request]}
+                    )
                 )
 
                 results.append(
@@ -6267,10 +6223,10 @@ async def modify_table(
                     column_span=column_span,
                 )
 
-                await asyncio.to_thread(
-                    service.documents()
-                    .batchUpdate(documentId=document_id, body={"requests": [request]})
-                    .execute
+                await execute_async(
+                    service.documents().batchUpdate(
+                        documentId=document_id, body={"requests": [request]}
+                    )
                 )
 
                 results.append(
@@ -6331,10 +6287,10 @@ async def modify_table(
                     content_alignment=op.get("content_alignment"),
                 )
 
-                await asyncio.to_thread(
-                    service.documents()
-                    .batchUpdate(documentId=document_id, body={"requests": [request]})
-                    .execute
+                await execute_async(
+                    service.documents().batchUpdate(
+                        documentId=document_id, body={"requests": [request]}
+                    )
                 )
 
                 # Build a description of what was formatted
@@ -6393,10 +6349,10 @@ async def modify_table(
                     width_type=width_type,
                 )
 
-                await asyncio.to_thread(
-                    service.documents()
-                    .batchUpdate(documentId=document_id, body={"requests": [request]})
-                    .execute
+                await execute_async(
+                    service.documents().batchUpdate(
+                        documentId=document_id, body={"requests": [request]}
+                    )
                 )
 
                 col_desc = (
@@ -6455,14 +6411,12 @@ async def export_doc_to_pdf(
 
     # Get file metadata first to validate it's a Google Doc
     try:
-        file_metadata = await asyncio.to_thread(
-            service.files()
-            .get(
+        file_metadata = await execute_async(
+            service.files().get(
                 fileId=document_id,
                 fields="id, name, mimeType, webViewLink",
                 supportsAllDrives=True,
             )
-            .execute
         )
     except Exception as e:
         return validator.create_pdf_export_error(
@@ -6492,7 +6446,7 @@ async def export_doc_to_pdf(
 
         done = False
         while not done:
-            _, done = await asyncio.to_thread(downloader.next_chunk)
+            _, done = await run_io(downloader.next_chunk)
 
         pdf_content = fh.getvalue()
         pdf_size = len(pdf_content)
@@ -6523,15 +6477,13 @@ async def export_doc_to_pdf(
             file_metadata["parents"] = [folder_id]
 
         # Upload the file
-        uploaded_file = await asyncio.to_thread(
-            service.files()
-            .create(
+        uploaded_file = await execute_async(
+            service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields="id, name, webViewLink, parents",
                 supportsAllDrives=True,
             )
-            .execute
         )
 
         pdf_file_id = uploaded_file.get("id")
@@ -6593,14 +6545,12 @@ async def export_doc_as_markdown(
 
     # Get file metadata first to validate it's a Google Doc
     try:
-        file_metadata = await asyncio.to_thread(
-            service.files()
-            .get(
+        file_metadata = await execute_async(
+            service.files().get(
                 fileId=document_id,
                 fields="id, name, mimeType, webViewLink",
                 supportsAllDrives=True,
             )
-            .execute
         )
     except Exception as e:
         error = DocsErrorBuilder.invalid_param_value(
@@ -6634,7 +6584,7 @@ async def export_doc_as_markdown(
 
         done = False
         while not done:
-            _, done = await asyncio.to_thread(downloader.next_chunk)
+            _, done = await run_io(downloader.next_chunk)
 
         markdown_content = fh.getvalue().decode("utf-8")
         content_size = len(markdown_content)
@@ -6749,9 +6699,7 @@ async def find_doc_elements(
         return format_error(error)
 
     # Get the document
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc_data = await execute_async(service.documents().get(documentId=document_id))
 
     # Find elements
     elements = find_elements_by_type(doc_data, element_type)
@@ -6867,9 +6815,7 @@ async def get_element_context(
         return format_error(error)
 
     # Get the document
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc_data = await execute_async(service.documents().get(documentId=document_id))
 
     # Get ancestors
     ancestors = get_element_ancestors(doc_data, index)
@@ -7202,9 +7148,7 @@ async def navigate_heading_siblings(
         return format_error(error)
 
     # Get the document
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc_data = await execute_async(service.documents().get(documentId=document_id))
 
     # Get siblings
     result = get_heading_siblings(doc_data, heading, match_case)
@@ -7302,9 +7246,7 @@ async def extract_links(
         return structured_error
 
     # Get the document
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc_data = await execute_async(service.documents().get(documentId=document_id))
 
     # Get headings for section context
     headings = []
@@ -7447,9 +7389,7 @@ async def extract_images(
         return structured_error
 
     # Get the document
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc_data = await execute_async(service.documents().get(documentId=document_id))
 
     # Get inline objects registry
     inline_objects = doc_data.get("inlineObjects", {})
@@ -7621,9 +7561,7 @@ async def extract_code_blocks(
         return structured_error
 
     # Get the document
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc_data = await execute_async(service.documents().get(documentId=document_id))
 
     # Common monospace fonts used for code
     MONOSPACE_FONTS = {
@@ -7848,9 +7786,7 @@ async def extract_document_summary(
         return structured_error
 
     # Get the document
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc_data = await execute_async(service.documents().get(documentId=document_id))
 
     # Get structural elements
     elements = extract_structural_elements(doc_data)
@@ -8020,9 +7956,7 @@ async def get_doc_statistics(
         return structured_error
 
     # Get the document
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc_data = await execute_async(service.documents().get(documentId=document_id))
 
     # Extract all text from the document body
     body = doc_data.get("body", {})
@@ -8426,10 +8360,10 @@ async def undo_doc_operation(
             )
 
         # Execute the batch update
-        await asyncio.to_thread(
-            service.documents()
-            .batchUpdate(documentId=document_id, body={"requests": requests})
-            .execute
+        await execute_async(
+            service.documents().batchUpdate(
+                documentId=document_id, body={"requests": requests}
+            )
         )
 
         # Mark the operation as undone
@@ -8566,10 +8500,10 @@ async def _execute_batch_undo(
             )
 
         # Execute all reverse operations in a single batch
-        await asyncio.to_thread(
-            service.documents()
-            .batchUpdate(documentId=document_id, body={"requests": requests})
-            .execute
+        await execute_async(
+            service.documents().batchUpdate(
+                documentId=document_id, body={"requests": requests}
+            )
         )
 
         # Mark all operations in the batch as undone
@@ -8784,9 +8718,7 @@ async def record_doc_operation(
             )
 
         # Fetch document to capture the text
-        doc_data = await asyncio.to_thread(
-            service.documents().get(documentId=document_id).execute
-        )
+        doc_data = await execute_async(service.documents().get(documentId=document_id))
 
         # Extract the text at the range
         extracted = extract_text_at_range(doc_data, start_index, end_index)
@@ -9042,9 +8974,7 @@ async def clear_doc_formatting(
             return index_error
 
     # Fetch document to resolve positions
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc_data = await execute_async(service.documents().get(documentId=document_id))
     doc_link = f"https://docs.google.com/document/d/{document_id}/edit"
 
     # Resolve indices based on positioning mode
@@ -9186,10 +9116,10 @@ async def clear_doc_formatting(
         start_index, end_index, preserve_links
     )
 
-    await asyncio.to_thread(
-        service.documents()
-        .batchUpdate(documentId=document_id, body={"requests": [clear_request]})
-        .execute
+    await execute_async(
+        service.documents().batchUpdate(
+            documentId=document_id, body={"requests": [clear_request]}
+        )
     )
 
     # Build success response
@@ -9338,9 +9268,7 @@ async def create_doc_named_range(
         )
 
     # Fetch document to resolve positions
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc_data = await execute_async(service.documents().get(documentId=document_id))
     doc_link = f"https://docs.google.com/document/d/{document_id}/edit"
 
     # Resolve indices based on positioning mode
@@ -9426,10 +9354,10 @@ async def create_doc_named_range(
     request = create_named_range_request(name, resolved_start, resolved_end)
 
     # Execute the request
-    result = await asyncio.to_thread(
-        service.documents()
-        .batchUpdate(documentId=document_id, body={"requests": [request]})
-        .execute
+    result = await execute_async(
+        service.documents().batchUpdate(
+            documentId=document_id, body={"requests": [request]}
+        )
     )
 
     # Extract the named range ID from the response
@@ -9503,8 +9431,8 @@ async def list_doc_named_ranges(
         return structured_error
 
     # Fetch document with tabs content to get named ranges from all tabs
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id, includeTabsContent=True).execute
+    doc_data = await execute_async(
+        service.documents().get(documentId=document_id, includeTabsContent=True)
     )
     doc_link = f"https://docs.google.com/document/d/{document_id}/edit"
 
@@ -9657,8 +9585,8 @@ async def delete_doc_named_range(
     doc_link = f"https://docs.google.com/document/d/{document_id}/edit"
 
     # Fetch document to verify named range exists (using tabs content for multi-tab support)
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id, includeTabsContent=True).execute
+    doc_data = await execute_async(
+        service.documents().get(documentId=document_id, includeTabsContent=True)
     )
 
     # Find all named ranges in the document (from all tabs)
@@ -9756,10 +9684,10 @@ async def delete_doc_named_range(
         return json.dumps({"success": False, "error": str(e)}, indent=2)
 
     # Execute the request
-    await asyncio.to_thread(
-        service.documents()
-        .batchUpdate(documentId=document_id, body={"requests": [request]})
-        .execute
+    await execute_async(
+        service.documents().batchUpdate(
+            documentId=document_id, body={"requests": [request]}
+        )
     )
 
     response = {
@@ -9870,9 +9798,7 @@ async def convert_list_type(
     doc_link = f"https://docs.google.com/document/d/{document_id}/edit"
 
     # Get document content
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc_data = await execute_async(service.documents().get(documentId=document_id))
 
     # Find all lists in the document
     all_lists = find_elements_by_type(doc_data, "list")
@@ -10020,10 +9946,10 @@ async def convert_list_type(
     )
 
     # Execute the request
-    await asyncio.to_thread(
-        service.documents()
-        .batchUpdate(documentId=document_id, body={"requests": [request]})
-        .execute
+    await execute_async(
+        service.documents().batchUpdate(
+            documentId=document_id, body={"requests": [request]}
+        )
     )
 
     return json.dumps(
@@ -10191,9 +10117,7 @@ async def append_to_list(
     doc_link = f"https://docs.google.com/document/d/{document_id}/edit"
 
     # Get document content
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc_data = await execute_async(service.documents().get(documentId=document_id))
 
     # Find all lists in the document
     all_lists = find_elements_by_type(doc_data, "list")
@@ -10326,10 +10250,10 @@ async def append_to_list(
     ]
 
     # Execute the requests
-    await asyncio.to_thread(
-        service.documents()
-        .batchUpdate(documentId=document_id, body={"requests": requests})
-        .execute
+    await execute_async(
+        service.documents().batchUpdate(
+            documentId=document_id, body={"requests": requests}
+        )
     )
 
     return json.dumps(
@@ -10482,9 +10406,7 @@ async def insert_list_item(
     doc_link = f"https://docs.google.com/document/d/{document_id}/edit"
 
     # Get document content
-    doc_data = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc_data = await execute_async(service.documents().get(documentId=document_id))
 
     # Find all lists in the document
     all_lists = find_elements_by_type(doc_data, "list")
@@ -10742,10 +10664,10 @@ async def insert_list_item(
     ]
 
     # Execute the requests
-    await asyncio.to_thread(
-        service.documents()
-        .batchUpdate(documentId=document_id, body={"requests": requests})
-        .execute
+    await execute_async(
+        service.documents().batchUpdate(
+            documentId=document_id, body={"requests": requests}
+        )
     )
 
     return json.dumps(
@@ -10927,9 +10849,7 @@ async def copy_doc_section(
         )
 
     # Get the document
-    doc = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc = await execute_async(service.documents().get(documentId=document_id))
 
     # Determine source range
     copy_start = None
@@ -11202,10 +11122,10 @@ async def copy_doc_section(
                 requests.append(format_req)
 
     # Execute the batch update
-    await asyncio.to_thread(
-        service.documents()
-        .batchUpdate(documentId=document_id, body={"requests": requests})
-        .execute
+    await execute_async(
+        service.documents().batchUpdate(
+            documentId=document_id, body={"requests": requests}
+        )
     )
 
     result["success"] = True
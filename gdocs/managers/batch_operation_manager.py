@@ -12,7 +12,6 @@ Features:
 """
 
 import logging
-import asyncio
 from typing import Any, Union, Dict, List, Tuple, Optional
 from dataclasses import dataclass, asdict
 
@@ -40,6 +39,8 @@ from gdocs.docs_helpers import (
 )
 from gdocs.docs_structure import parse_document_structure
 from gdocs.managers.history_manager import get_history_manager, UndoCapability
+from core.async_http import execute_async
+from core.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -1086,10 +1087,10 @@ class BatchOperationManager:
         Returns:
             API response
         """
-        return await asyncio.to_thread(
-            self.service.documents()
-            .batchUpdate(documentId=document_id, body={"requests": requests})
-            .execute
+        return await execute_async(
+            self.service.documents().batchUpdate(
+                documentId=document_id, body={"requests": requests}
+            )
         )
 
     def _build_operation_summary(self, operation_descriptions: list[str]) -> str:
@@ -1189,6 +1190,7 @@ class BatchOperationManager:
             ],
         }
 
+    @traced("gdocs.batch.execute_with_search")
     async def execute_batch_with_search(
         self,
         document_id: str,
@@ -1276,8 +1278,8 @@ class BatchOperationManager:
 
         # First, fetch document to resolve search-based positions
         try:
-            doc_data = await asyncio.to_thread(
-                self.service.documents().get(documentId=document_id).execute
+            doc_data = await execute_async(
+                self.service.documents().get(documentId=document_id)
             )
         except Exception as e:
             return BatchExecutionResult(
@@ -1494,6 +1496,7 @@ class BatchOperationManager:
 
         return expanded
 
+    @traced("gdocs.batch.resolve_operations")
     async def _resolve_operations_with_search(
         self,
         operations: List[Dict[str, Any]],
@@ -6,9 +6,10 @@ in Google Docs, extracting complex logic from the main tools module.
 """
 
 import logging
-import asyncio
 from typing import Any, Optional
 
+from core.async_http import execute_async
+
 logger = logging.getLogger(__name__)
 
 
@@ -118,9 +119,7 @@ class HeaderFooterManager:
 
     async def _get_document(self, document_id: str) -> dict[str, Any]:
         """Get the full document data."""
-        return await asyncio.to_thread(
-            self.service.documents().get(documentId=document_id).execute
-        )
+        return await execute_async(self.service.documents().get(documentId=document_id))
 
     async def _find_target_section(
         self, doc: dict[str, Any], section_type: str, header_footer_type: str
@@ -235,10 +234,10 @@ class HeaderFooterManager:
         )
 
         try:
-            await asyncio.to_thread(
-                self.service.documents()
-                .batchUpdate(documentId=document_id, body={"requests": requests})
-                .execute
+            await execute_async(
+                self.service.documents().batchUpdate(
+                    documentId=document_id, body={"requests": requests}
+                )
             )
             return True
 
@@ -348,10 +347,10 @@ class HeaderFooterManager:
                 batch_request = {"createFooter": request}
 
             # Execute the request
-            await asyncio.to_thread(
-                self.service.documents()
-                .batchUpdate(documentId=document_id, body={"requests": [batch_request]})
-                .execute
+            await execute_async(
+                self.service.documents().batchUpdate(
+                    documentId=document_id, body={"requests": [batch_request]}
+                )
             )
 
             return True, f"Successfully created {section_type} with type {api_type}"
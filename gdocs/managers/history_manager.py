@@ -251,9 +251,12 @@ class HistoryManager:
         )
 
         history.add_operation(snapshot)
-        batch_info = f" (batch={batch_id}, idx={batch_index})" if batch_id else ""
         logger.info(
-            f"Recorded operation {snapshot.id}: {operation_type} on {document_id}{batch_info}"
+            "Recorded operation %s: %s on %s%s",
+            snapshot.id,
+            operation_type,
+            document_id,
+            f" (batch={batch_id}, idx={batch_index})" if batch_id else "",
         )
 
         return snapshot
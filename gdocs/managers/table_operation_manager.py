@@ -6,12 +6,12 @@ multiple Google Docs API calls for complex table manipulations.
 """
 
 import logging
-import asyncio
 from typing import List, Dict, Any, Tuple
 
 from gdocs.docs_helpers import create_insert_table_request
 from gdocs.docs_structure import find_tables
 from gdocs.docs_tables import validate_table_data
+from core.async_http import execute_async
 
 logger = logging.getLogger(__name__)
 
@@ -115,20 +115,16 @@ class TableOperationManager:
         """Create an empty table at the specified index."""
         logger.debug(f"Creating {rows}x{cols} table at index {index}")
 
-        await asyncio.to_thread(
-            self.service.documents()
-            .batchUpdate(
+        await execute_async(
+            self.service.documents().batchUpdate(
                 documentId=document_id,
                 body={"requests": [create_insert_table_request(index, rows, cols)]},
             )
-            .execute
         )
 
     async def _get_document_tables(self, document_id: str) -> List[Dict[str, Any]]:
         """Get fresh document structure and extract table information."""
-        doc = await asyncio.to_thread(
-            self.service.documents().get(documentId=document_id).execute
-        )
+        doc = await execute_async(self.service.documents().get(documentId=document_id))
         return find_tables(doc)
 
     def _find_table_at_index(
@@ -283,9 +279,8 @@ class TableOperationManager:
                 return False
 
             # Insert text
-            await asyncio.to_thread(
-                self.service.documents()
-                .batchUpdate(
+            await execute_async(
+                self.service.documents().batchUpdate(
                     documentId=document_id,
                     body={
                         "requests": [
@@ -298,7 +293,6 @@ class TableOperationManager:
                         ]
                     },
                 )
-                .execute
             )
 
             # Apply bold formatting if requested
@@ -317,9 +311,8 @@ class TableOperationManager:
         self, document_id: str, start_index: int, end_index: int
     ) -> None:
         """Apply bold formatting to a text range."""
-        await asyncio.to_thread(
-            self.service.documents()
-            .batchUpdate(
+        await execute_async(
+            self.service.documents().batchUpdate(
                 documentId=document_id,
                 body={
                     "requests": [
@@ -336,7 +329,6 @@ class TableOperationManager:
                     ]
                 },
             )
-            .execute
         )
 
     async def populate_existing_table(
@@ -431,9 +423,8 @@ class TableOperationManager:
                 cell_end = cell["end_index"] - 1  # Don't include cell end marker
 
                 try:
-                    await asyncio.to_thread(
-                        self.service.documents()
-                        .batchUpdate(
+                    await execute_async(
+                        self.service.documents().batchUpdate(
                             documentId=document_id,
                             body={
                                 "requests": [
@@ -446,7 +437,6 @@ class TableOperationManager:
                                 ]
                             },
                         )
-                        .execute
                     )
                     population_count += 1
 
@@ -4,10 +4,11 @@ Google Drive Helper Functions
 Shared utilities for Google Drive operations including permission checking.
 """
 
-import asyncio
 import re
 from typing import List, Dict, Any, Optional, Tuple
 
+from core.async_http import execute_async
+
 
 def check_public_link_permission(permissions: List[Dict[str, Any]]) -> bool:
     """
@@ -141,10 +142,10 @@ async def resolve_drive_item(
         fields = f"{fields}, {extra_fields}"
 
     while True:
-        metadata = await asyncio.to_thread(
-            service.files()
-            .get(fileId=current_id, fields=fields, supportsAllDrives=True)
-            .execute
+        metadata = await execute_async(
+            service.files().get(
+                fileId=current_id, fields=fields, supportsAllDrives=True
+            )
         )
         mime_type = metadata.get("mimeType")
         if mime_type != SHORTCUT_MIME_TYPE:
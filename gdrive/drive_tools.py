@@ -5,7 +5,6 @@ This module provides MCP tools for interacting with Google Drive API.
 """
 
 import logging
-import asyncio
 from typing import Optional
 from tempfile import NamedTemporaryFile
 from urllib.parse import urlparse
@@ -27,6 +26,8 @@ from gdrive.drive_helpers import (
     resolve_drive_item,
     resolve_folder_id,
 )
+from core.async_http import execute_async
+from core.executors import run_cpu, run_io
 
 logger = logging.getLogger(__name__)
 
@@ -91,7 +92,7 @@ async def search_drive_files(
         corpora=corpora,
     )
 
-    results = await asyncio.to_thread(service.files().list(**list_params).execute)
+    results = await execute_async(service.files().list(**list_params))
     files = results.get("files", [])
     if not files:
         return f"No files found for '{query}'."
@@ -154,10 +155,9 @@ async def get_drive_file_content(
     )
     fh = io.BytesIO()
     downloader = MediaIoBaseDownload(fh, request_obj)
-    loop = asyncio.get_event_loop()
     done = False
     while not done:
-        status, done = await loop.run_in_executor(None, downloader.next_chunk)
+        status, done = await run_io(downloader.next_chunk)
 
     file_content_bytes = fh.getvalue()
 
@@ -169,7 +169,9 @@ async def get_drive_file_content(
     }
 
     if mime_type in office_mime_types:
-        office_text = extract_office_xml_text(file_content_bytes, mime_type)
+        office_text = await run_cpu(
+            extract_office_xml_text, file_content_bytes, mime_type
+        )
         if office_text:
             body_text = office_text
         else:
@@ -242,7 +244,7 @@ async def list_drive_items(
         corpora=corpora,
     )
 
-    results = await asyncio.to_thread(service.files().list(**list_params).execute)
+    results = await execute_async(service.files().list(**list_params))
     files = results.get("files", [])
     if not files:
         return f"No items found in folder '{folder_id}'."
@@ -347,7 +349,7 @@ async def create_drive_file(
             logger.info(f"[create_drive_file] Reading local file: {file_path}")
 
             # Read file and upload
-            file_data = await asyncio.to_thread(path_obj.read_bytes)
+            file_data = await run_io(path_obj.read_bytes)
             total_bytes = len(file_data)
             logger.info(f"[create_drive_file] Read {total_bytes} bytes from local file")
 
@@ -359,15 +361,13 @@ async def create_drive_file(
             )
 
             logger.info("[create_drive_file] Starting upload to Google Drive...")
-            created_file = await asyncio.to_thread(
-                service.files()
-                .create(
+            created_file = await execute_async(
+                service.files().create(
                     body=file_metadata,
                     media_body=media,
                     fields="id, name, webViewLink",
                     supportsAllDrives=True,
                 )
-                .execute
             )
         # Handle HTTP/HTTPS URLs
         elif parsed_url.scheme in ("http", "https"):
@@ -396,15 +396,13 @@ async def create_drive_file(
                     chunksize=UPLOAD_CHUNK_SIZE_BYTES,
                 )
 
-                created_file = await asyncio.to_thread(
-                    service.files()
-                    .create(
+                created_file = await execute_async(
+                    service.files().create(
                         body=file_metadata,
                         media_body=media,
                         fields="id, name, webViewLink",
                         supportsAllDrives=True,
                     )
-                    .execute
                 )
             else:
                 # Use NamedTemporaryFile to stream download and upload
@@ -422,7 +420,7 @@ async def create_drive_file(
                             async for chunk in resp.aiter_bytes(
                                 chunk_size=DOWNLOAD_CHUNK_SIZE_BYTES
                             ):
-                                await asyncio.to_thread(temp_file.write, chunk)
+                                await run_io(temp_file.write, chunk)
                                 total_bytes += len(chunk)
 
                             logger.info(
@@ -455,15 +453,13 @@ async def create_drive_file(
                     logger.info(
                         "[create_drive_file] Starting upload to Google Drive..."
                     )
-                    created_file = await asyncio.to_thread(
-                        service.files()
-                        .create(
+                    created_file = await execute_async(
+                        service.files().create(
                             body=file_metadata,
                             media_body=media,
                             fields="id, name, webViewLink",
                             supportsAllDrives=True,
                         )
-                        .execute
                     )
         else:
             if not parsed_url.scheme:
@@ -477,15 +473,13 @@ async def create_drive_file(
         file_data = content.encode("utf-8")
         media = io.BytesIO(file_data)
 
-        created_file = await asyncio.to_thread(
-            service.files()
-            .create(
+        created_file = await execute_async(
+            service.files().create(
                 body=file_metadata,
                 media_body=MediaIoBaseUpload(media, mimetype=mime_type, resumable=True),
                 fields="id, name, webViewLink",
                 supportsAllDrives=True,
             )
-            .execute
         )
 
     link = created_file.get("webViewLink", "No link available")
@@ -523,15 +517,13 @@ async def get_drive_file_permissions(
 
     try:
         # Get comprehensive file metadata including permissions
-        file_metadata = await asyncio.to_thread(
-            service.files()
-            .get(
+        file_metadata = await execute_async(
+            service.files().get(
                 fileId=file_id,
                 fields="id, name, mimeType, size, modifiedTime, owners, permissions, "
                 "webViewLink, webContentLink, shared, sharingUser, viewersCanCopyContent",
                 supportsAllDrives=True,
             )
-            .execute
         )
 
         # Format the response
@@ -654,7 +646,7 @@ async def check_drive_file_public_access(
         "includeItemsFromAllDrives": True,
     }
 
-    results = await asyncio.to_thread(service.files().list(**list_params).execute)
+    results = await execute_async(service.files().list(**list_params))
 
     files = results.get("files", [])
     if not files:
@@ -675,14 +667,12 @@ async def check_drive_file_public_access(
     file_id = resolved_file_id
 
     # Get detailed permissions
-    file_metadata = await asyncio.to_thread(
-        service.files()
-        .get(
+    file_metadata = await execute_async(
+        service.files().get(
             fileId=file_id,
             fields="id, name, mimeType, permissions, webViewLink, webContentLink, shared",
             supportsAllDrives=True,
         )
-        .execute
     )
 
     permissions = file_metadata.get("permissions", [])
@@ -755,16 +745,16 @@ async def delete_drive_file(
 
     if permanent:
         # Permanently delete the file
-        await asyncio.to_thread(
-            service.files().delete(fileId=file_id, supportsAllDrives=True).execute
+        await execute_async(
+            service.files().delete(fileId=file_id, supportsAllDrives=True)
         )
         return f"Permanently deleted file '{file_name}' (ID: {file_id}) for {user_google_email}. This action cannot be undone."
     else:
         # Move to trash (recoverable)
-        await asyncio.to_thread(
-            service.files()
-            .update(fileId=file_id, body={"trashed": True}, supportsAllDrives=True)
-            .execute
+        await execute_async(
+            service.files().update(
+                fileId=file_id, body={"trashed": True}, supportsAllDrives=True
+            )
         )
         return f"Moved file '{file_name}' (ID: {file_id}) to trash for {user_google_email}. The file can be recovered from the trash."
 
@@ -877,9 +867,7 @@ async def update_drive_file(
         query_params["body"] = update_body
 
     # Perform the update
-    updated_file = await asyncio.to_thread(
-        service.files().update(**query_params).execute
-    )
+    updated_file = await execute_async(service.files().update(**query_params))
 
     # Build response message
     output_parts = [
@@ -5,13 +5,13 @@ This module provides MCP tools for interacting with Google Forms API.
 """
 
 import logging
-import asyncio
 from typing import Optional, Dict, Any
 
 
 from auth.service_decorator import require_google_service
 from core.server import server
 from core.utils import handle_http_errors
+from core.async_http import execute_async
 
 logger = logging.getLogger(__name__)
 
@@ -48,9 +48,7 @@ async def create_form(
     if document_title:
         form_body["info"]["document_title"] = document_title
 
-    created_form = await asyncio.to_thread(
-        service.forms().create(body=form_body).execute
-    )
+    created_form = await execute_async(service.forms().create(body=form_body))
 
     form_id = created_form.get("formId")
     edit_url = f"https://docs.google.com/forms/d/{form_id}/edit"
@@ -79,7 +77,7 @@ async def get_form(service, user_google_email: str, form_id: str) -> str:
     """
     logger.info(f"[get_form] Invoked. Email: '{user_google_email}', Form ID: {form_id}")
 
-    form = await asyncio.to_thread(service.forms().get(formId=form_id).execute)
+    form = await execute_async(service.forms().get(formId=form_id))
 
     form_info = form.get("info", {})
     title = form_info.get("title", "No Title")
@@ -150,8 +148,8 @@ async def set_publish_settings(
         "requireAuthentication": require_authentication,
     }
 
-    await asyncio.to_thread(
-        service.forms().setPublishSettings(formId=form_id, body=settings_body).execute
+    await execute_async(
+        service.forms().setPublishSettings(formId=form_id, body=settings_body)
     )
 
     confirmation_message = f"Successfully updated publish settings for form {form_id} for {user_google_email}. Publish as template: {publish_as_template}, Require authentication: {require_authentication}"
@@ -182,8 +180,8 @@ async def get_form_response(
         f"[get_form_response] Invoked. Email: '{user_google_email}', Form ID: {form_id}, Response ID: {response_id}"
     )
 
-    response = await asyncio.to_thread(
-        service.forms().responses().get(formId=form_id, responseId=response_id).execute
+    response = await execute_async(
+        service.forms().responses().get(formId=form_id, responseId=response_id)
     )
 
     response_id = response.get("responseId", "Unknown")
@@ -246,9 +244,7 @@ async def list_form_responses(
     if page_token:
         params["pageToken"] = page_token
 
-    responses_result = await asyncio.to_thread(
-        service.forms().responses().list(**params).execute
-    )
+    responses_result = await execute_async(service.forms().responses().list(**params))
 
     responses = responses_result.get("responses", [])
     next_page_token = responses_result.get("nextPageToken")
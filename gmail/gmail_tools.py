@@ -24,11 +24,12 @@ from auth.scopes import (
     GMAIL_MODIFY_SCOPE,
     GMAIL_LABELS_SCOPE,
 )
+from core.async_http import execute_async
 
 logger = logging.getLogger(__name__)
 
 GMAIL_BATCH_SIZE = 25
-GMAIL_REQUEST_DELAY = 0.1
+GMAIL_FALLBACK_CONCURRENCY = 10
 HTML_BODY_TRUNCATE_LIMIT = 20000
 
 
@@ -371,9 +372,7 @@ async def search_gmail_messages(
         request_params["pageToken"] = page_token
         logger.info("[search_gmail_messages] Using page_token for pagination")
 
-    response = await asyncio.to_thread(
-        service.users().messages().list(**request_params).execute
-    )
+    response = await execute_async(service.users().messages().list(**request_params))
 
     # Handle potential null response (but empty dict {} is valid)
     if response is None:
@@ -423,7 +422,7 @@ async def get_gmail_message_content(
     logger.info(f"[get_gmail_message_content] Using service for: {user_google_email}")
 
     # Fetch message metadata first to get headers
-    message_metadata = await asyncio.to_thread(
+    message_metadata = await execute_async(
         service.users()
         .messages()
         .get(
@@ -432,7 +431,6 @@ async def get_gmail_message_content(
             format="metadata",
             metadataHeaders=["Subject", "From", "To", "Cc"],
         )
-        .execute
     )
 
     headers = {
@@ -445,7 +443,7 @@ async def get_gmail_message_content(
     cc = headers.get("Cc", "")
 
     # Now fetch the full message to get the body parts
-    message_full = await asyncio.to_thread(
+    message_full = await execute_async(
         service.users()
         .messages()
         .get(
@@ -453,7 +451,6 @@ async def get_gmail_message_content(
             id=message_id,
             format="full",  # Request full payload for body
         )
-        .execute
     )
 
     # Extract both text and HTML bodies using enhanced helper function
@@ -560,20 +557,22 @@ async def get_gmail_messages_content_batch(
                 batch.add(req, request_id=mid)
 
             # Execute batch request
-            await asyncio.to_thread(batch.execute)
+            await execute_async(batch)
 
         except Exception as batch_error:
-            # Fallback to sequential processing instead of parallel to prevent SSL exhaustion
+            # Fall back to individual requests; connections are pooled, so a
+            # bounded number can run concurrently
             logger.warning(
-                f"[get_gmail_messages_content_batch] Batch API failed, falling back to sequential processing: {batch_error}"
+                f"[get_gmail_messages_content_batch] Batch API failed, falling back to individual requests: {batch_error}"
             )
+            fallback_semaphore = asyncio.Semaphore(GMAIL_FALLBACK_CONCURRENCY)
 
             async def fetch_message_with_retry(mid: str, max_retries: int = 3):
                 """Fetch a single message with exponential backoff retry for SSL errors"""
                 for attempt in range(max_retries):
                     try:
                         if format == "metadata":
-                            msg = await asyncio.to_thread(
+                            msg = await execute_async(
                                 service.users()
                                 .messages()
                                 .get(
@@ -582,14 +581,12 @@ async def get_gmail_messages_content_batch(
                                     format="metadata",
                                     metadataHeaders=["Subject", "From", "To", "Cc"],
                                 )
-                                .execute
                             )
                         else:
-                            msg = await asyncio.to_thread(
+                            msg = await execute_async(
                                 service.users()
                                 .messages()
                                 .get(userId="me", id=mid, format="full")
-                                .execute
                             )
                         return mid, msg, None
                     except ssl.SSLError as ssl_error:
@@ -608,12 +605,14 @@ async def get_gmail_messages_content_batch(
                     except Exception as e:
                         return mid, None, e
 
-            # Process messages sequentially with small delays to prevent connection exhaustion
-            for mid in chunk_ids:
-                mid_result, msg_data, error = await fetch_message_with_retry(mid)
+            async def fetch_message_bounded(mid: str):
+                async with fallback_semaphore:
+                    return await fetch_message_with_retry(mid)
+
+            for mid_result, msg_data, error in await asyncio.gather(
+                *(fetch_message_bounded(mid) for mid in chunk_ids)
+            ):
                 results[mid_result] = {"data": msg_data, "error": error}
-                # Brief delay between requests to allow connection cleanup
-                await asyncio.sleep(GMAIL_REQUEST_DELAY)
 
         # Process results for this chunk
         for mid in chunk_ids:
@@ -717,12 +716,11 @@ async def get_gmail_attachment_content(
     # to fail. The attachment download endpoint returns size information, and filename/mime
     # type should be obtained from the original message content call that provided this ID.
     try:
-        attachment = await asyncio.to_thread(
+        attachment = await execute_async(
             service.users()
             .messages()
             .attachments()
             .get(userId="me", messageId=message_id, id=attachment_id)
-            .execute
         )
     except Exception as e:
         logger.error(
@@ -769,11 +767,10 @@ async def get_gmail_attachment_content(
         try:
             # Quick metadata fetch to try to get attachment info
             # Note: This might fail if attachment IDs changed, but worth trying
-            message_metadata = await asyncio.to_thread(
+            message_metadata = await execute_async(
                 service.users()
                 .messages()
                 .get(userId="me", id=message_id, format="metadata")
-                .execute
             )
             payload = message_metadata.get("payload", {})
             attachments = _extract_attachments(payload)
@@ -929,8 +926,8 @@ async def send_gmail_message(
         send_body["threadId"] = thread_id_final
 
     # Send the message
-    sent_message = await asyncio.to_thread(
-        service.users().messages().send(userId="me", body=send_body).execute
+    sent_message = await execute_async(
+        service.users().messages().send(userId="me", body=send_body)
     )
     message_id = sent_message.get("id")
     return f"Email sent! Message ID: {message_id}"
@@ -1049,8 +1046,8 @@ async def draft_gmail_message(
         draft_body["message"]["threadId"] = thread_id_final
 
     # Create the draft
-    created_draft = await asyncio.to_thread(
-        service.users().drafts().create(userId="me", body=draft_body).execute
+    created_draft = await execute_async(
+        service.users().drafts().create(userId="me", body=draft_body)
     )
     draft_id = created_draft.get("id")
     return f"Draft created! Draft ID: {draft_id}"
@@ -1152,8 +1149,8 @@ async def get_gmail_thread_content(
     )
 
     # Fetch the complete thread with all messages
-    thread_response = await asyncio.to_thread(
-        service.users().threads().get(userId="me", id=thread_id, format="full").execute
+    thread_response = await execute_async(
+        service.users().threads().get(userId="me", id=thread_id, format="full")
     )
 
     return _format_thread_content(thread_response, thread_id)
@@ -1207,23 +1204,24 @@ async def get_gmail_threads_content_batch(
                 batch.add(req, request_id=tid)
 
             # Execute batch request
-            await asyncio.to_thread(batch.execute)
+            await execute_async(batch)
 
         except Exception as batch_error:
-            # Fallback to sequential processing instead of parallel to prevent SSL exhaustion
+            # Fall back to individual requests; connections are pooled, so a
+            # bounded number can run concurrently
             logger.warning(
-                f"[get_gmail_threads_content_batch] Batch API failed, falling back to sequential processing: {batch_error}"
+                f"[get_gmail_threads_content_batch] Batch API failed, falling back to individual requests: {batch_error}"
             )
+            fallback_semaphore = asyncio.Semaphore(GMAIL_FALLBACK_CONCURRENCY)
 
             async def fetch_thread_with_retry(tid: str, max_retries: int = 3):
                 """Fetch a single thread with exponential backoff retry for SSL errors"""
                 for attempt in range(max_retries):
                     try:
-                        thread = await asyncio.to_thread(
+                        thread = await execute_async(
                             service.users()
                             .threads()
                             .get(userId="me", id=tid, format="full")
-                            .execute
                         )
                         return tid, thread, None
                     except ssl.SSLError as ssl_error:
@@ -1242,12 +1240,14 @@ async def get_gmail_threads_content_batch(
                     except Exception as e:
                         return tid, None, e
 
-            # Process threads sequentially with small delays to prevent connection exhaustion
-            for tid in chunk_ids:
-                tid_result, thread_data, error = await fetch_thread_with_retry(tid)
+            async def fetch_thread_bounded(tid: str):
+                async with fallback_semaphore:
+                    return await fetch_thread_with_retry(tid)
+
+            for tid_result, thread_data, error in await asyncio.gather(
+                *(fetch_thread_bounded(tid) for tid in chunk_ids)
+            ):
                 results[tid_result] = {"data": thread_data, "error": error}
-                # Brief delay between requests to allow connection cleanup
-                await asyncio.sleep(GMAIL_REQUEST_DELAY)
 
         # Process results for this chunk
         for tid in chunk_ids:
@@ -1283,9 +1283,7 @@ async def list_gmail_labels(service, user_google_email: str) -> str:
     """
     logger.info(f"[list_gmail_labels] Invoked. Email: '{user_google_email}'")
 
-    response = await asyncio.to_thread(
-        service.users().labels().list(userId="me").execute
-    )
+    response = await execute_async(service.users().labels().list(userId="me"))
     labels = response.get("labels", [])
 
     if not labels:
@@ -1358,14 +1356,14 @@ async def manage_gmail_label(
             "labelListVisibility": label_list_visibility,
             "messageListVisibility": message_list_visibility,
         }
-        created_label = await asyncio.to_thread(
-            service.users().labels().create(userId="me", body=label_object).execute
+        created_label = await execute_async(
+            service.users().labels().create(userId="me", body=label_object)
         )
         return f"Label created successfully!\nName: {created_label['name']}\nID: {created_label['id']}"
 
     elif action == "update":
-        current_label = await asyncio.to_thread(
-            service.users().labels().get(userId="me", id=label_id).execute
+        current_label = await execute_async(
+            service.users().labels().get(userId="me", id=label_id)
         )
 
         label_object = {
@@ -1375,23 +1373,18 @@ async def manage_gmail_label(
             "messageListVisibility": message_list_visibility,
         }
 
-        updated_label = await asyncio.to_thread(
-            service.users()
-            .labels()
-            .update(userId="me", id=label_id, body=label_object)
-            .execute
+        updated_label = await execute_async(
+            service.users().labels().update(userId="me", id=label_id, body=label_object)
         )
         return f"Label updated successfully!\nName: {updated_label['name']}\nID: {updated_label['id']}"
 
     elif action == "delete":
-        label = await asyncio.to_thread(
-            service.users().labels().get(userId="me", id=label_id).execute
+        label = await execute_async(
+            service.users().labels().get(userId="me", id=label_id)
         )
         label_name = label["name"]
 
-        await asyncio.to_thread(
-            service.users().labels().delete(userId="me", id=label_id).execute
-        )
+        await execute_async(service.users().labels().delete(userId="me", id=label_id))
         return f"Label '{label_name}' (ID: {label_id}) deleted successfully!"
 
 
@@ -1438,8 +1431,8 @@ async def modify_gmail_message_labels(
     if remove_label_ids:
         body["removeLabelIds"] = remove_label_ids
 
-    await asyncio.to_thread(
-        service.users().messages().modify(userId="me", id=message_id, body=body).execute
+    await execute_async(
+        service.users().messages().modify(userId="me", id=message_id, body=body)
     )
 
     actions = []
@@ -1492,9 +1485,7 @@ async def batch_modify_gmail_message_labels(
     if remove_label_ids:
         body["removeLabelIds"] = remove_label_ids
 
-    await asyncio.to_thread(
-        service.users().messages().batchModify(userId="me", body=body).execute
-    )
+    await execute_async(service.users().messages().batchModify(userId="me", body=body))
 
     actions = []
     if add_label_ids:
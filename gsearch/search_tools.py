@@ -5,13 +5,13 @@ This module provides MCP tools for interacting with Google Programmable Search E
 """
 
 import logging
-import asyncio
 import os
 from typing import Optional, List, Literal
 
 from auth.service_decorator import require_google_service
 from core.server import server
 from core.utils import handle_http_errors
+from core.async_http import execute_async
 
 logger = logging.getLogger(__name__)
 
@@ -98,7 +98,7 @@ async def search_custom(
         params["cr"] = country
 
     # Execute the search request
-    result = await asyncio.to_thread(service.cse().list(**params).execute)
+    result = await execute_async(service.cse().list(**params))
 
     # Extract search information
     search_info = result.get("searchInformation", {})
@@ -195,7 +195,7 @@ async def get_search_engine_info(service, user_google_email: str) -> str:
         "num": 1,
     }
 
-    result = await asyncio.to_thread(service.cse().list(**params).execute)
+    result = await execute_async(service.cse().list(**params))
 
     # Extract context information
     context = result.get("context", {})
@@ -5,7 +5,6 @@ This module provides MCP tools for interacting with Google Sheets API.
 """
 
 import logging
-import asyncio
 import json
 import re
 from typing import Any, Dict, List, Literal, Optional, Union
@@ -15,6 +14,7 @@ from auth.service_decorator import require_google_service
 from core.server import server
 from core.utils import handle_http_errors
 from core.comments import create_comment_tools
+from core.async_http import execute_async
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -40,9 +40,8 @@ async def list_spreadsheets(
     """
     logger.info(f"[list_spreadsheets] Invoked. Email: '{user_google_email}'")
 
-    files_response = await asyncio.to_thread(
-        service.files()
-        .list(
+    files_response = await execute_async(
+        service.files().list(
             q="mimeType='application/vnd.google-apps.spreadsheet'",
             pageSize=max_results,
             fields="files(id,name,modifiedTime,webViewLink)",
@@ -50,7 +49,6 @@ async def list_spreadsheets(
             supportsAllDrives=True,
             includeItemsFromAllDrives=True,
         )
-        .execute
     )
 
     files = files_response.get("files", [])
@@ -95,8 +93,8 @@ async def get_spreadsheet_info(
         f"[get_spreadsheet_info] Invoked. Email: '{user_google_email}', Spreadsheet ID: {spreadsheet_id}"
     )
 
-    spreadsheet = await asyncio.to_thread(
-        service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute
+    spreadsheet = await execute_async(
+        service.spreadsheets().get(spreadsheetId=spreadsheet_id)
     )
 
     title = spreadsheet.get("properties", {}).get("title", "Unknown")
@@ -141,8 +139,8 @@ async def _get_sheet_name_by_id(service, spreadsheet_id: str, sheet_id: int) ->
     Raises:
         ValueError if sheet not found
     """
-    spreadsheet = await asyncio.to_thread(
-        service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute
+    spreadsheet = await execute_async(
+        service.spreadsheets().get(spreadsheetId=spreadsheet_id)
     )
 
     for sheet in spreadsheet.get("sheets", []):
@@ -254,7 +252,7 @@ async def read_sheet_values(
         service, spreadsheet_id, range_name, sheet_name, sheet_id
     )
 
-    result = await asyncio.to_thread(
+    result = await execute_async(
         service.spreadsheets()
         .values()
         .get(
@@ -262,7 +260,6 @@ async def read_sheet_values(
             range=full_range,
             valueRenderOption=value_render_option,
         )
-        .execute
     )
 
     values = result.get("values", [])
@@ -366,11 +363,10 @@ async def modify_sheet_values(
     )
 
     if clear_values:
-        result = await asyncio.to_thread(
+        result = await execute_async(
             service.spreadsheets()
             .values()
             .clear(spreadsheetId=spreadsheet_id, range=full_range)
-            .execute
         )
 
         cleared_range = result.get("clearedRange", range_name)
@@ -381,7 +377,7 @@ async def modify_sheet_values(
     else:
         body = {"values": values}
 
-        result = await asyncio.to_thread(
+        result = await execute_async(
             service.spreadsheets()
             .values()
             .update(
@@ -390,7 +386,6 @@ async def modify_sheet_values(
                 valueInputOption=value_input_option,
                 body=body,
             )
-            .execute
         )
 
         updated_cells = result.get("updatedCells", 0)
@@ -499,7 +494,7 @@ async def append_sheet_values(
 
     body = {"values": values}
 
-    result = await asyncio.to_thread(
+    result = await execute_async(
         service.spreadsheets()
         .values()
         .append(
@@ -509,7 +504,6 @@ async def append_sheet_values(
             insertDataOption=insert_data_option,
             body=body,
         )
-        .execute
     )
 
     # Extract update information from the response
@@ -563,8 +557,8 @@ async def create_spreadsheet(
             {"properties": {"title": sheet_name}} for sheet_name in sheet_names
         ]
 
-    spreadsheet = await asyncio.to_thread(
-        service.spreadsheets().create(body=spreadsheet_body).execute
+    spreadsheet = await execute_async(
+        service.spreadsheets().create(body=spreadsheet_body)
     )
 
     spreadsheet_id = spreadsheet.get("spreadsheetId")
@@ -607,10 +601,10 @@ async def create_sheet(
 
     request_body = {"requests": [{"addSheet": {"properties": {"title": sheet_name}}}]}
 
-    response = await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    response = await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     sheet_id = response["replies"][0]["addSheet"]["properties"]["sheetId"]
@@ -693,8 +687,8 @@ async def _get_sheet_id_by_name(service, spreadsheet_id: str, sheet_name: str) -
     Raises:
         ValueError if sheet not found
     """
-    spreadsheet = await asyncio.to_thread(
-        service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute
+    spreadsheet = await execute_async(
+        service.spreadsheets().get(spreadsheetId=spreadsheet_id)
     )
 
     for sheet in spreadsheet.get("sheets", []):
@@ -753,14 +747,12 @@ async def read_cell_notes(
     )
 
     # Get spreadsheet data including notes
-    result = await asyncio.to_thread(
-        service.spreadsheets()
-        .get(
+    result = await execute_async(
+        service.spreadsheets().get(
             spreadsheetId=spreadsheet_id,
             ranges=[full_range],
             fields="sheets.data.rowData.values.note,sheets.properties.title",
         )
-        .execute
     )
 
     sheets = result.get("sheets", [])
@@ -867,8 +859,8 @@ async def update_cell_note(
         resolved_sheet_name = sheet_name
     else:
         # Get first sheet ID and name
-        spreadsheet = await asyncio.to_thread(
-            service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute
+        spreadsheet = await execute_async(
+            service.spreadsheets().get(spreadsheetId=spreadsheet_id)
         )
         sheets = spreadsheet.get("sheets", [])
         if not sheets:
@@ -893,10 +885,10 @@ async def update_cell_note(
         ]
     }
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     text_output = (
@@ -965,8 +957,8 @@ async def clear_cell_note(
         resolved_sheet_name = sheet_name
     else:
         # Get first sheet ID and name
-        spreadsheet = await asyncio.to_thread(
-            service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute
+        spreadsheet = await execute_async(
+            service.spreadsheets().get(spreadsheetId=spreadsheet_id)
         )
         sheets = spreadsheet.get("sheets", [])
         if not sheets:
@@ -991,10 +983,10 @@ async def clear_cell_note(
         ]
     }
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     text_output = (
@@ -1170,8 +1162,8 @@ async def _resolve_sheet_id(
         return await _get_sheet_id_by_name(service, spreadsheet_id, sheet_name)
 
     # Get first sheet
-    spreadsheet = await asyncio.to_thread(
-        service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute
+    spreadsheet = await execute_async(
+        service.spreadsheets().get(spreadsheetId=spreadsheet_id)
     )
     sheets = spreadsheet.get("sheets", [])
     if not sheets:
@@ -1357,10 +1349,10 @@ async def format_cells(
         ]
     }
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     # Build summary of applied formatting
@@ -1461,10 +1453,10 @@ async def merge_cells(
         ]
     }
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     text_output = (
@@ -1522,10 +1514,10 @@ async def unmerge_cells(
     # Build request
     request_body = {"requests": [{"unmergeCells": {"range": grid_range}}]}
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     text_output = (
@@ -1609,10 +1601,10 @@ async def set_frozen_rows_columns(
         ]
     }
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     # Build summary
@@ -1705,10 +1697,10 @@ async def set_column_width(
         ]
     }
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     col_range = f"{start_column}-{end_column}" if end_column else start_column
@@ -1787,10 +1779,10 @@ async def set_row_height(
         ]
     }
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     row_range = f"{start_row}-{end_row}" if end_row else str(start_row)
@@ -1967,10 +1959,10 @@ async def add_conditional_formatting(
         "requests": [{"addConditionalFormatRule": {"rule": rule, "index": 0}}]
     }
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     text_output = (
@@ -2027,10 +2019,10 @@ async def delete_sheet(
     # Build the delete request
     request_body = {"requests": [{"deleteSheet": {"sheetId": resolved_sheet_id}}]}
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     text_output = (
@@ -2101,10 +2093,10 @@ async def rename_sheet(
         ]
     }
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     text_output = (
@@ -2231,10 +2223,10 @@ async def set_borders(
     # Build request
     request_body = {"requests": [{"updateBorders": update_borders_request}]}
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     # Build summary of applied borders
@@ -2345,10 +2337,10 @@ async def sort_range(
         ]
     }
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     sort_order = "ascending" if ascending else "descending"
@@ -2435,10 +2427,10 @@ async def find_and_replace(
 
     request_body = {"requests": [{"findReplace": find_replace_request}]}
 
-    response = await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    response = await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     # Get the result
@@ -2539,10 +2531,10 @@ async def insert_rows(
         ]
     }
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     text_output = (
@@ -2613,10 +2605,10 @@ async def delete_rows(
         ]
     }
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     end_row = start_row + num_rows - 1
@@ -2693,10 +2685,10 @@ async def insert_columns(
         ]
     }
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     text_output = (
@@ -2766,10 +2758,10 @@ async def delete_columns(
         ]
     }
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     if num_columns > 1:
@@ -2859,8 +2851,8 @@ async def auto_resize_dimension(
             resolved_end = end_index
         else:
             # Auto-resize all columns - need to get sheet dimensions
-            spreadsheet = await asyncio.to_thread(
-                service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute
+            spreadsheet = await execute_async(
+                service.spreadsheets().get(spreadsheetId=spreadsheet_id)
             )
             for sheet in spreadsheet.get("sheets", []):
                 if sheet.get("properties", {}).get("sheetId") == resolved_sheet_id:
@@ -2891,8 +2883,8 @@ async def auto_resize_dimension(
             )
         else:
             # Auto-resize all rows - need to get sheet dimensions
-            spreadsheet = await asyncio.to_thread(
-                service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute
+            spreadsheet = await execute_async(
+                service.spreadsheets().get(spreadsheetId=spreadsheet_id)
             )
             for sheet in spreadsheet.get("sheets", []):
                 if sheet.get("properties", {}).get("sheetId") == resolved_sheet_id:
@@ -2921,10 +2913,10 @@ async def auto_resize_dimension(
         ]
     }
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     # Build summary
@@ -2996,13 +2988,11 @@ async def clear_conditional_formatting(
     grid_range["sheetId"] = resolved_sheet_id
 
     # Get existing conditional format rules to find overlapping ones
-    spreadsheet = await asyncio.to_thread(
-        service.spreadsheets()
-        .get(
+    spreadsheet = await execute_async(
+        service.spreadsheets().get(
             spreadsheetId=spreadsheet_id,
             fields="sheets.conditionalFormats,sheets.properties.sheetId",
         )
-        .execute
     )
 
     # Find rules that overlap with our range
@@ -3039,10 +3029,10 @@ async def clear_conditional_formatting(
 
     request_body = {"requests": requests}
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     text_output = (
@@ -3171,10 +3161,10 @@ async def copy_range(
         ]
     }
 
-    await asyncio.to_thread(
-        service.spreadsheets()
-        .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-        .execute
+    await execute_async(
+        service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=request_body
+        )
     )
 
     # Build descriptive output message
@@ -3248,7 +3238,7 @@ async def copy_sheet(
     # Copy the sheet using the copyTo API
     copy_request_body = {"destinationSpreadsheetId": dest_spreadsheet_id}
 
-    copy_response = await asyncio.to_thread(
+    copy_response = await execute_async(
         service.spreadsheets()
         .sheets()
         .copyTo(
@@ -3256,7 +3246,6 @@ async def copy_sheet(
             sheetId=resolved_source_sheet_id,
             body=copy_request_body,
         )
-        .execute
     )
 
     new_sheet_id = copy_response.get("sheetId")
@@ -3279,10 +3268,10 @@ async def copy_sheet(
             ]
         }
 
-        await asyncio.to_thread(
-            service.spreadsheets()
-            .batchUpdate(spreadsheetId=dest_spreadsheet_id, body=rename_request_body)
-            .execute
+        await execute_async(
+            service.spreadsheets().batchUpdate(
+                spreadsheetId=dest_spreadsheet_id, body=rename_request_body
+            )
         )
         final_sheet_name = new_sheet_name
 
@@ -5,7 +5,6 @@ This module provides MCP tools for interacting with Google Slides API.
 """
 
 import logging
-import asyncio
 from typing import List, Dict, Any
 
 
@@ -13,6 +12,7 @@ from auth.service_decorator import require_google_service
 from core.server import server
 from core.utils import handle_http_errors
 from core.comments import create_comment_tools
+from core.async_http import execute_async
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +39,7 @@ async def create_presentation(
 
     body = {"title": title}
 
-    result = await asyncio.to_thread(service.presentations().create(body=body).execute)
+    result = await execute_async(service.presentations().create(body=body))
 
     presentation_id = result.get("presentationId")
     presentation_url = f"https://docs.google.com/presentation/d/{presentation_id}/edit"
@@ -74,8 +74,8 @@ async def get_presentation(
         f"[get_presentation] Invoked. Email: '{user_google_email}', ID: '{presentation_id}'"
     )
 
-    result = await asyncio.to_thread(
-        service.presentations().get(presentationId=presentation_id).execute
+    result = await execute_async(
+        service.presentations().get(presentationId=presentation_id)
     )
 
     title = result.get("title", "Untitled")
@@ -130,10 +130,8 @@ async def batch_update_presentation(
 
     body = {"requests": requests}
 
-    result = await asyncio.to_thread(
-        service.presentations()
-        .batchUpdate(presentationId=presentation_id, body=body)
-        .execute
+    result = await execute_async(
+        service.presentations().batchUpdate(presentationId=presentation_id, body=body)
     )
 
     replies = result.get("replies", [])
@@ -185,11 +183,10 @@ async def get_page(
         f"[get_page] Invoked. Email: '{user_google_email}', Presentation: '{presentation_id}', Page: '{page_object_id}'"
     )
 
-    result = await asyncio.to_thread(
+    result = await execute_async(
         service.presentations()
         .pages()
         .get(presentationId=presentation_id, pageObjectId=page_object_id)
-        .execute
     )
 
     page_type = result.get("pageType", "Unknown")
@@ -251,7 +248,7 @@ async def get_page_thumbnail(
         f"[get_page_thumbnail] Invoked. Email: '{user_google_email}', Presentation: '{presentation_id}', Page: '{page_object_id}', Size: '{thumbnail_size}'"
     )
 
-    result = await asyncio.to_thread(
+    result = await execute_async(
         service.presentations()
         .pages()
         .getThumbnail(
@@ -260,7 +257,6 @@ async def get_page_thumbnail(
             thumbnailProperties_thumbnailSize=thumbnail_size,
             thumbnailProperties_mimeType="PNG",
         )
-        .execute
     )
 
     thumbnail_url = result.get("contentUrl", "")
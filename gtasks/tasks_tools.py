@@ -4,7 +4,6 @@ Google Tasks MCP Tools
 This module provides MCP tools for interacting with Google Tasks API.
 """
 
-import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
@@ -15,6 +14,7 @@ from mcp import Resource
 from auth.service_decorator import require_google_service
 from core.server import server
 from core.utils import handle_http_errors
+from core.async_http import execute_async
 
 logger = logging.getLogger(__name__)
 
@@ -96,7 +96,7 @@ async def list_task_lists(
         if page_token:
             params["pageToken"] = page_token
 
-        result = await asyncio.to_thread(service.tasklists().list(**params).execute)
+        result = await execute_async(service.tasklists().list(**params))
 
         task_lists = result.get("items", [])
         next_page_token = result.get("nextPageToken")
@@ -146,9 +146,7 @@ async def get_task_list(
     )
 
     try:
-        task_list = await asyncio.to_thread(
-            service.tasklists().get(tasklist=task_list_id).execute
-        )
+        task_list = await execute_async(service.tasklists().get(tasklist=task_list_id))
 
         response = f"""Task List Details for {user_google_email}:
 - Title: {task_list["title"]}
@@ -194,7 +192,7 @@ async def create_task_list(
     try:
         body = {"title": title}
 
-        result = await asyncio.to_thread(service.tasklists().insert(body=body).execute)
+        result = await execute_async(service.tasklists().insert(body=body))
 
         response = f"""Task List Created for {user_google_email}:
 - Title: {result["title"]}
@@ -241,8 +239,8 @@ async def update_task_list(
     try:
         body = {"id": task_list_id, "title": title}
 
-        result = await asyncio.to_thread(
-            service.tasklists().update(tasklist=task_list_id, body=body).execute
+        result = await execute_async(
+            service.tasklists().update(tasklist=task_list_id, body=body)
         )
 
         response = f"""Task List Updated for {user_google_email}:
@@ -286,9 +284,7 @@ async def delete_task_list(
     )
 
     try:
-        await asyncio.to_thread(
-            service.tasklists().delete(tasklist=task_list_id).execute
-        )
+        await execute_async(service.tasklists().delete(tasklist=task_list_id))
 
         response = f"Task list {task_list_id} has been deleted for {user_google_email}. All tasks in this list have also been deleted."
 
@@ -381,7 +377,7 @@ async def list_tasks(
         if updated_min:
             params["updatedMin"] = updated_min
 
-        result = await asyncio.to_thread(service.tasks().list(**params).execute)
+        result = await execute_async(service.tasks().list(**params))
 
         tasks = result.get("items", [])
         next_page_token = result.get("nextPageToken")
@@ -397,7 +393,7 @@ async def list_tasks(
         while results_remaining > 0 and next_page_token:
             params["pageToken"] = next_page_token
             params["maxResults"] = str(results_remaining)
-            result = await asyncio.to_thread(service.tasks().list(**params).execute)
+            result = await execute_async(service.tasks().list(**params))
             more_tasks = result.get("items", [])
             next_page_token = result.get("nextPageToken")
             if len(more_tasks) == 0:
@@ -571,8 +567,8 @@ async def get_task(
     )
 
     try:
-        task = await asyncio.to_thread(
-            service.tasks().get(tasklist=task_list_id, task=task_id).execute
+        task = await execute_async(
+            service.tasks().get(tasklist=task_list_id, task=task_id)
         )
 
         response = f"""Task Details for {user_google_email}:
@@ -656,7 +652,7 @@ async def create_task(
         if previous:
             params["previous"] = previous
 
-        result = await asyncio.to_thread(service.tasks().insert(**params).execute)
+        result = await execute_async(service.tasks().insert(**params))
 
         response = f"""Task Created for {user_google_email}:
 - Title: {result["title"]}
@@ -720,8 +716,8 @@ async def update_task(
 
     try:
         # First get the current task to build the update body
-        current_task = await asyncio.to_thread(
-            service.tasks().get(tasklist=task_list_id, task=task_id).execute
+        current_task = await execute_async(
+            service.tasks().get(tasklist=task_list_id, task=task_id)
         )
 
         body = {
@@ -742,10 +738,8 @@ async def update_task(
         elif current_task.get("due"):
             body["due"] = current_task["due"]
 
-        result = await asyncio.to_thread(
-            service.tasks()
-            .update(tasklist=task_list_id, task=task_id, body=body)
-            .execute
+        result = await execute_async(
+            service.tasks().update(tasklist=task_list_id, task=task_id, body=body)
         )
 
         response = f"""Task Updated for {user_google_email}:
@@ -796,9 +790,7 @@ async def delete_task(
     )
 
     try:
-        await asyncio.to_thread(
-            service.tasks().delete(tasklist=task_list_id, task=task_id).execute
-        )
+        await execute_async(service.tasks().delete(tasklist=task_list_id, task=task_id))
 
         response = f"Task {task_id} has been deleted from task list {task_list_id} for {user_google_email}."
 
@@ -854,7 +846,7 @@ async def move_task(
         if destination_task_list:
             params["destinationTasklist"] = destination_task_list
 
-        result = await asyncio.to_thread(service.tasks().move(**params).execute)
+        result = await execute_async(service.tasks().move(**params))
 
         response = f"""Task Moved for {user_google_email}:
 - Title: {result["title"]}
@@ -912,7 +904,7 @@ async def clear_completed_tasks(
     )
 
     try:
-        await asyncio.to_thread(service.tasks().clear(tasklist=task_list_id).execute)
+        await execute_async(service.tasks().clear(tasklist=task_list_id))
 
         response = f"All completed tasks have been cleared from task list {task_list_id} for {user_google_email}. The tasks are now hidden and won't appear in default task list views."
 
@@ -8,8 +8,11 @@ from dotenv import load_dotenv
 
 from auth.oauth_config import reload_oauth_config, is_stateless_mode
 from core.log_formatter import EnhancedLogFormatter, configure_file_logging
+from core.log_pipeline import configure_log_pipeline
 from core.utils import check_credentials_directory_permissions
 from core.server import server, set_transport_mode, configure_server_for_http
+from core.lazy_tools import LAZY_TOOLS_ENABLED, register_lazy_tools
+from core.tool_manifest import TOOL_MODULES, load_manifest, optimizer_definitions
 from core.tool_tier_loader import resolve_tools_from_tier
 from core.tool_registry import (
     set_enabled_tools as set_enabled_tool_names,
@@ -83,6 +86,9 @@ def main():
     # Configure safe logging for Windows Unicode handling
     configure_safe_logging()
 
+    # Optionally move log formatting and I/O off the event loop (JSON, sampling)
+    configure_log_pipeline()
+
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Google Workspace MCP Server")
     parser.add_argument(
@@ -121,7 +127,13 @@ def main():
     parser.add_argument(
         "--optimizer",
         action="store_true",
-        help="Enable optimizer mode - expose only 3 meta-tools for semantic tool discovery (requires numpy and sentence-transformers)",
+        help="Enable optimizer mode - expose only 3 meta-tools for tool discovery (embedding search needs numpy and sentence-transformers; BM25 search works without them)",
+    )
+    parser.add_argument(
+        "--lazy-tools",
+        action="store_true",
+        default=LAZY_TOOLS_ENABLED,
+        help="Register tools from the precomputed manifest and import each tool module on its first call (faster startup)",
     )
     args = parser.parse_args()
 
@@ -179,16 +191,8 @@ def main():
 
     # Import tool modules to register them with the MCP server via decorators
     tool_imports = {
-        "gmail": lambda: import_module("gmail.gmail_tools"),
-        "drive": lambda: import_module("gdrive.drive_tools"),
-        "calendar": lambda: import_module("gcalendar.calendar_tools"),
-        "docs": lambda: import_module("gdocs.docs_tools"),
-        "sheets": lambda: import_module("gsheets.sheets_tools"),
-        "chat": lambda: import_module("gchat.chat_tools"),
-        "forms": lambda: import_module("gforms.forms_tools"),
-        "slides": lambda: import_module("gslides.slides_tools"),
-        "tasks": lambda: import_module("gtasks.tasks_tools"),
-        "search": lambda: import_module("gsearch.search_tools"),
+        service: (lambda module=module: import_module(module))
+        for service, module in TOOL_MODULES.items()
     }
 
     tool_icons = {
@@ -240,10 +244,26 @@ def main():
 
     set_enabled_tools(list(tools_to_import))
 
-    safe_print(
-        f"🛠️  Loading {len(tools_to_import)} tool module{'s' if len(tools_to_import) != 1 else ''}:"
-    )
-    for tool in tools_to_import:
+    # Lazy mode registers schemas from the manifest and defers module imports
+    # to the first tool call; optimizer mode needs the real tool functions.
+    manifest = load_manifest() if args.lazy_tools or args.optimizer else None
+    if args.lazy_tools and not args.optimizer and manifest is None:
+        safe_print("⚠️  Tool manifest not found, importing tool modules eagerly")
+        safe_print("   Generate it with: python -m core.tool_manifest generate")
+
+    lazy_mode = args.lazy_tools and not args.optimizer and manifest is not None
+    if lazy_mode:
+        lazy_tools = register_lazy_tools(server, manifest, tools_to_import)
+        safe_print(
+            f"🛠️  Registered {len(lazy_tools)} tools from the manifest; modules load on first use"
+        )
+        modules_to_import = []
+    else:
+        safe_print(
+            f"🛠️  Loading {len(tools_to_import)} tool module{'s' if len(tools_to_import) != 1 else ''}:"
+        )
+        modules_to_import = tools_to_import
+    for tool in modules_to_import:
         try:
             tool_imports[tool]()
             safe_print(
@@ -257,22 +277,20 @@ def main():
     # Filter tools based on tier configuration (if tier-based loading is enabled)
     filter_server_tools(server)
 
+    # Load API discovery documents once so building services never hits the network
+    from auth.discovery_documents import preload_discovery_documents
+    from auth.service_decorator import SERVICE_CONFIGS
+
+    preload_discovery_documents(
+        (config["service"], config["version"]) for config in SERVICE_CONFIGS.values()
+    )
+
     # Initialize optimizer mode if requested
     if args.optimizer:
         safe_print("")
         safe_print("🔍 Initializing Optimizer Mode...")
 
-        # Check if optimizer dependencies are available
-        from core.optimizer import is_optimizer_available, initialize_optimizer
-
-        if not is_optimizer_available():
-            safe_print(
-                "❌ Optimizer mode requires numpy and sentence-transformers"
-            )
-            safe_print(
-                "   Install with: uv pip install numpy sentence-transformers"
-            )
-            sys.exit(1)
+        from core.optimizer import initialize_optimizer
 
         # Collect all registered tools from the server
         tool_definitions = {}
@@ -314,7 +332,8 @@ def main():
                 tool_def = {
                     "name": tool_name,
                     "description": getattr(tool_impl.fn, "__doc__", "") or "",
-                    "inputSchema": getattr(tool_impl, "parameters_json_schema", {}),
+                    "inputSchema": getattr(tool_impl, "parameters_json_schema", None)
+                    or getattr(tool_impl, "parameters", {}),
                     "service": service or "unknown",
                 }
                 tool_definitions[tool_name] = tool_def
@@ -322,12 +341,18 @@ def main():
                 # Store the actual tool function for execution
                 tool_functions[tool_name] = tool_impl.fn
 
+        # Prefer the manifest's schemas and services over the guesses above
+        if manifest is not None:
+            tool_definitions.update(
+                optimizer_definitions(manifest, set(tool_functions))
+            )
+
         safe_print(f"   📋 Found {len(tool_definitions)} tools to optimize")
 
         # Initialize the optimizer with both definitions and functions
         try:
-            initialize_optimizer(tool_definitions, tool_functions)
-            safe_print("   ✅ Optimizer initialized with semantic embeddings")
+            optimizer = initialize_optimizer(tool_definitions, tool_functions)
+            safe_print(f"   ✅ Optimizer initialized ({optimizer.search_mode} search)")
         except Exception as e:
             safe_print(f"   ❌ Failed to initialize optimizer: {e}")
             logger.error(f"Optimizer initialization failed: {e}", exc_info=True)
@@ -351,6 +376,8 @@ def main():
     safe_print(f"   🔧 Services Loaded: {len(tools_to_import)}/{len(tool_imports)}")
     if args.optimizer:
         safe_print("   🔍 Optimizer Mode: ENABLED (4 meta-tools active)")
+    if lazy_mode:
+        safe_print("   💤 Lazy Tools: ENABLED (modules load on first call)")
     if args.tool_tier is not None:
         if args.tools is not None:
             safe_print(
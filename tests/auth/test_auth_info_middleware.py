@@ -0,0 +1,101 @@
+"""Tests for the bearer-token verification cache in AuthInfoMiddleware."""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from auth import auth_info_middleware
+from auth.auth_info_middleware import (
+    clear_token_verification_cache,
+    get_token_verification_stats,
+    verify_token_cached,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_token_verification_cache()
+    yield
+    clear_token_verification_cache()
+
+
+def _provider(result):
+    return SimpleNamespace(verify_token=AsyncMock(return_value=result))
+
+
+def _verified(expires_in: float = 3600):
+    return SimpleNamespace(
+        claims={"email": "user@example.com"},
+        expires_at=int(time.time() + expires_in),
+        scopes=[],
+    )
+
+
+class TestVerifyTokenCached:
+    """Tests for verify_token_cached."""
+
+    async def test_verification_is_cached_per_token(self):
+        """Repeated calls with the same token verify once."""
+        verified = _verified()
+        provider = _provider(verified)
+
+        for _ in range(5):
+            assert await verify_token_cached(provider, "ya29.token") is verified
+
+        provider.verify_token.assert_awaited_once_with("ya29.token")
+        stats = get_token_verification_stats()
+        assert stats["hits"] >= 4
+
+    async def test_different_tokens_verified_separately(self):
+        provider = _provider(_verified())
+
+        await verify_token_cached(provider, "ya29.one")
+        await verify_token_cached(provider, "ya29.two")
+
+        assert provider.verify_token.await_count == 2
+
+    async def test_rejected_token_is_cached_briefly(self):
+        """A rejected token is not re-verified within the negative TTL."""
+        provider = _provider(None)
+
+        assert await verify_token_cached(provider, "ya29.bad") is None
+        assert await verify_token_cached(provider, "ya29.bad") is None
+
+        provider.verify_token.assert_awaited_once()
+
+    async def test_expired_token_is_not_cached(self):
+        """Entries never outlive the token's expires_at."""
+        provider = _provider(_verified(expires_in=-10))
+
+        await verify_token_cached(provider, "ya29.old")
+        await verify_token_cached(provider, "ya29.old")
+
+        assert provider.verify_token.await_count == 2
+
+    async def test_provider_errors_are_not_cached(self):
+        """Transient verification errors are retried on the next call."""
+        verified = _verified()
+        provider = SimpleNamespace(
+            verify_token=AsyncMock(side_effect=[RuntimeError("tokeninfo"), verified])
+        )
+
+        with pytest.raises(RuntimeError):
+            await verify_token_cached(provider, "ya29.token")
+        assert await verify_token_cached(provider, "ya29.token") is verified
+
+    async def test_raw_token_not_used_as_key(self):
+        await verify_token_cached(_provider(_verified()), "ya29.secret")
+
+        keys = list(auth_info_middleware._verification_cache._data)
+        assert keys and all("ya29.secret" not in str(k) for k in keys)
+
+    async def test_disabled_cache_always_verifies(self, monkeypatch):
+        monkeypatch.setattr(auth_info_middleware, "TOKEN_CACHE_ENABLED", False)
+        provider = _provider(_verified())
+
+        await verify_token_cached(provider, "ya29.token")
+        await verify_token_cached(provider, "ya29.token")
+
+        assert provider.verify_token.await_count == 2
@@ -0,0 +1,240 @@
+"""Tests for the credential store backends."""
+
+import json
+import os
+import stat
+import threading
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from auth import credential_store
+from auth.credential_store import (
+    LocalDirectoryCredentialStore,
+    SQLiteCredentialStore,
+    main,
+)
+
+
+def _credentials(token: str = "ya29.token") -> Credentials:
+    return Credentials(
+        token=token,
+        refresh_token="1//refresh",
+        token_uri="https://oauth2.googleapis.com/token",
+        client_id="client",
+        client_secret="secret",
+        scopes=["https://www.googleapis.com/auth/drive"],
+        expiry=datetime(2030, 1, 1, 12, 0, 0),
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalDirectoryCredentialStore(base_dir=str(tmp_path / "creds"))
+
+
+class TestLocalDirectoryCredentialStore:
+    """Tests for LocalDirectoryCredentialStore."""
+
+    def test_round_trip(self, store):
+        assert store.store_credential("user@example.com", _credentials())
+
+        loaded = store.get_credential("user@example.com")
+
+        assert loaded.token == "ya29.token"
+        assert loaded.refresh_token == "1//refresh"
+        assert loaded.expiry == datetime(2030, 1, 1, 12, 0, 0)
+        assert store.list_users() == ["user@example.com"]
+
+    def test_missing_user_returns_none(self, store):
+        assert store.get_credential("nobody@example.com") is None
+
+    def test_unchanged_file_is_not_reread(self, store):
+        """Lookups of an unchanged file are served from memory."""
+        store.store_credential("user@example.com", _credentials())
+
+        with patch("builtins.open", side_effect=AssertionError("file reopened")):
+            for _ in range(3):
+                assert store.get_credential("user@example.com").token == "ya29.token"
+
+        assert store.get_cache_stats()["hits"] == 3
+
+    def test_returns_independent_objects(self, store):
+        """Callers may refresh credentials in place without affecting the cache."""
+        store.store_credential("user@example.com", _credentials())
+
+        first = store.get_credential("user@example.com")
+        first.token = "mutated"
+
+        assert store.get_credential("user@example.com").token == "ya29.token"
+
+    def test_external_changes_are_picked_up(self, store):
+        """A file rewritten by another process invalidates the cached entry."""
+        store.store_credential("user@example.com", _credentials())
+        store.get_credential("user@example.com")
+
+        path = os.path.join(store.base_dir, "user@example.com.json")
+        with open(path) as f:
+            data = json.load(f)
+        data["token"] = "ya29.external-edit"
+        with open(path, "w") as f:
+            json.dump(data, f)
+        # Make sure the signature changes even on coarse-mtime filesystems
+        os.utime(path, ns=(0, 123456789))
+
+        assert store.get_credential("user@example.com").token == "ya29.external-edit"
+
+    def test_write_is_atomic_and_private(self, store):
+        """Writes leave no temp files behind and are readable by the owner only."""
+        store.store_credential("user@example.com", _credentials())
+        store.store_credential("user@example.com", _credentials("ya29.second"))
+
+        assert sorted(os.listdir(store.base_dir)) == ["user@example.com.json"]
+        path = os.path.join(store.base_dir, "user@example.com.json")
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert store.get_credential("user@example.com").token == "ya29.second"
+
+    def test_failed_write_keeps_previous_file(self, store):
+        store.store_credential("user@example.com", _credentials())
+
+        with patch("auth.credential_store.os.replace", side_effect=OSError("disk")):
+            assert not store.store_credential(
+                "user@example.com", _credentials("ya29.lost")
+            )
+
+        assert sorted(os.listdir(store.base_dir)) == ["user@example.com.json"]
+        assert store.get_credential("user@example.com").token == "ya29.token"
+
+    def test_delete_clears_cache(self, store):
+        store.store_credential("user@example.com", _credentials())
+        store.get_credential("user@example.com")
+
+        assert store.delete_credential("user@example.com")
+
+        assert store.get_credential("user@example.com") is None
+        assert store.get_cache_stats()["cached_users"] == 0
+
+
+@pytest.fixture
+def sqlite_store(tmp_path):
+    store = SQLiteCredentialStore(db_path=str(tmp_path / "credentials.db"))
+    yield store
+    store.close()
+
+
+class TestSQLiteCredentialStore:
+    """Tests for SQLiteCredentialStore."""
+
+    def test_round_trip(self, sqlite_store):
+        assert sqlite_store.store_credential("user@example.com", _credentials())
+
+        loaded = sqlite_store.get_credential("user@example.com")
+
+        assert loaded.token == "ya29.token"
+        assert loaded.scopes == ["https://www.googleapis.com/auth/drive"]
+        assert loaded.expiry == datetime(2030, 1, 1, 12, 0, 0)
+
+    def test_store_overwrites(self, sqlite_store):
+        sqlite_store.store_credential("user@example.com", _credentials())
+        sqlite_store.store_credential("user@example.com", _credentials("ya29.new"))
+
+        assert sqlite_store.get_credential("user@example.com").token == "ya29.new"
+        assert sqlite_store.list_users() == ["user@example.com"]
+
+    def test_missing_and_delete(self, sqlite_store):
+        assert sqlite_store.get_credential("nobody@example.com") is None
+        sqlite_store.store_credential("user@example.com", _credentials())
+
+        assert sqlite_store.delete_credential("user@example.com")
+
+        assert sqlite_store.get_credential("user@example.com") is None
+        assert sqlite_store.list_users() == []
+
+    def test_uses_wal_mode(self, sqlite_store):
+        mode = sqlite_store._connect().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_database_wal_and_shm_are_private(self, tmp_path):
+        db_path = tmp_path / "creds.db"
+        old_umask = os.umask(0o022)
+        try:
+            sqlite_store = SQLiteCredentialStore(db_path=str(db_path))
+            sqlite_store.store_credential("user@example.com", _credentials())
+        finally:
+            os.umask(old_umask)
+
+        for path in (db_path, tmp_path / "creds.db-wal", tmp_path / "creds.db-shm"):
+            assert stat.S_IMODE(os.stat(path).st_mode) == 0o600, path
+
+    def test_batch_lookup(self, sqlite_store):
+        """Batched lookups return every stored user across query chunks."""
+        emails = [f"user{i}@example.com" for i in range(1200)]
+        for email in emails[::2]:
+            sqlite_store.store_credential(email, _credentials(f"ya29.{email}"))
+
+        found = sqlite_store.get_credentials_batch(emails)
+
+        assert set(found) == set(emails[::2])
+        assert found["user0@example.com"].token == "ya29.user0@example.com"
+
+    def test_concurrent_readers_and_writer(self, sqlite_store):
+        """Separate connections read while another writes."""
+        sqlite_store.store_credential("user@example.com", _credentials())
+        other = SQLiteCredentialStore(db_path=sqlite_store.db_path)
+        errors = []
+
+        def read():
+            try:
+                for _ in range(50):
+                    assert other.get_credential("user@example.com") is not None
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        for i in range(50):
+            sqlite_store.store_credential(f"w{i}@example.com", _credentials())
+        for thread in readers:
+            thread.join()
+
+        assert errors == []
+        assert len(other.list_users()) == 51
+
+    def test_migrate_from_directory(self, tmp_path, sqlite_store):
+        local = LocalDirectoryCredentialStore(base_dir=str(tmp_path / "json"))
+        local.store_credential("a@example.com", _credentials("ya29.a"))
+        local.store_credential("b@example.com", _credentials("ya29.b"))
+        sqlite_store.store_credential("a@example.com", _credentials("ya29.kept"))
+
+        imported = sqlite_store.migrate_from_directory(local.base_dir)
+
+        assert imported == 1
+        assert sqlite_store.get_credential("a@example.com").token == "ya29.kept"
+        assert sqlite_store.get_credential("b@example.com").token == "ya29.b"
+
+    def test_migrate_command(self, tmp_path, capsys):
+        local = LocalDirectoryCredentialStore(base_dir=str(tmp_path / "json"))
+        local.store_credential("a@example.com", _credentials())
+        db_path = str(tmp_path / "migrated.db")
+
+        assert main(["migrate", "--from", local.base_dir, "--to", db_path]) == 0
+
+        assert "Imported 1 users" in capsys.readouterr().out
+        assert SQLiteCredentialStore(db_path).list_users() == ["a@example.com"]
+
+
+class TestGetCredentialStore:
+    """Tests for backend selection."""
+
+    def test_sqlite_selected_by_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GOOGLE_MCP_CREDENTIAL_STORE", "sqlite")
+        monkeypatch.setenv("GOOGLE_MCP_CREDENTIALS_DB", str(tmp_path / "env.db"))
+        monkeypatch.setattr(credential_store, "_credential_store", None)
+
+        store = credential_store.get_credential_store()
+
+        assert isinstance(store, SQLiteCredentialStore)
+        assert store.db_path == str(tmp_path / "env.db")
@@ -0,0 +1,109 @@
+"""Tests for offline discovery document loading."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from auth import discovery_documents
+from auth.discovery_documents import (
+    build_service,
+    export_discovery_documents,
+    get_discovery_document,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_documents():
+    discovery_documents._documents.clear()
+    yield
+    discovery_documents._documents.clear()
+
+
+class TestGetDiscoveryDocument:
+    """Tests for get_discovery_document."""
+
+    def test_loads_bundled_document_once(self):
+        """The bundled document is read and parsed only on first use."""
+        with patch.object(
+            discovery_documents,
+            "_read_document",
+            wraps=discovery_documents._read_document,
+        ) as mock_read:
+            first = get_discovery_document("drive", "v3")
+            second = get_discovery_document("drive", "v3")
+
+        assert first is second
+        assert first["name"] == "drive"
+        assert mock_read.call_count == 1
+
+    def test_unknown_api_returns_none(self):
+        """APIs without an offline document return None."""
+        assert get_discovery_document("notanapi", "v0") is None
+
+    def test_reads_from_configured_directory(self, tmp_path):
+        """WORKSPACE_MCP_DISCOVERY_DIR documents take precedence."""
+        document = json.loads(
+            discovery_documents.discovery_cache.get_static_doc("tasks", "v1")
+        )
+        document["title"] = "Vendored Tasks API"
+        (tmp_path / "tasks.v1.json").write_text(json.dumps(document))
+
+        with patch.object(discovery_documents, "DISCOVERY_DIR", str(tmp_path)):
+            loaded = get_discovery_document("tasks", "v1")
+
+        assert loaded["title"] == "Vendored Tasks API"
+
+    def test_building_does_not_mutate_document(self):
+        """Services built from a preloaded document leave it unchanged."""
+        document = get_discovery_document("drive", "v3")
+        snapshot = json.dumps(document, sort_keys=True)
+
+        service = build_service("drive", "v3", Credentials(token="token"))
+        service.files().list(pageSize=1)
+        service.permissions().create(fileId="abc", body={})
+
+        assert json.dumps(document, sort_keys=True) == snapshot
+
+
+class TestBuildService:
+    """Tests for build_service."""
+
+    def test_builds_from_document(self):
+        """Services are built from the in-memory document."""
+        service = build_service("drive", "v3", Credentials(token="token"))
+        request = service.files().get(fileId="abc")
+
+        assert request.uri.startswith("https://www.googleapis.com/drive/v3/files/abc")
+
+    def test_falls_back_to_build_without_document(self):
+        """build() is used when no offline document is available."""
+        credentials = Credentials(token="token")
+        with patch.object(discovery_documents, "build") as mock_build:
+            build_service("notanapi", "v0", credentials)
+
+        mock_build.assert_called_once()
+        assert mock_build.call_args.kwargs["http"].credentials is credentials
+
+
+class TestExportDiscoveryDocuments:
+    """Tests for export_discovery_documents."""
+
+    def test_export_writes_loadable_documents(self, tmp_path):
+        """Exported documents can be loaded back from the directory."""
+        paths = export_discovery_documents(
+            str(tmp_path), [("gmail", "v1"), ("sheets", "v4")]
+        )
+
+        assert sorted(p.rsplit("/", 1)[-1] for p in paths) == [
+            "gmail.v1.json",
+            "sheets.v4.json",
+        ]
+        with patch.object(discovery_documents, "DISCOVERY_DIR", str(tmp_path)):
+            assert get_discovery_document("gmail", "v1")["name"] == "gmail"
+
+    def test_export_unknown_api_raises(self, tmp_path):
+        """Exporting an API without a bundled document raises ValueError."""
+        with pytest.raises(ValueError):
+            export_discovery_documents(str(tmp_path), [("notanapi", "v0")])
@@ -0,0 +1,117 @@
+"""Tests for OAuth21SessionStore eviction and locking behaviour."""
+
+import threading
+
+from auth.oauth21_session_store import OAuth21SessionStore
+
+
+def _store_session(store, user_email, mcp_session_id=None, session_id=None):
+    store.store_session(
+        user_email=user_email,
+        access_token=f"ya29.{user_email}",
+        refresh_token="1//refresh",
+        mcp_session_id=mcp_session_id,
+        session_id=session_id,
+    )
+
+
+class TestSessionEviction:
+    """Tests for idle-TTL and max-size eviction of session mappings."""
+
+    def test_idle_mappings_are_evicted(self):
+        store = OAuth21SessionStore(idle_ttl=0)
+        _store_session(store, "a@example.com", mcp_session_id="mcp-1")
+
+        assert store.evict_idle_sessions() == 1
+
+        assert store.get_user_by_mcp_session("mcp-1") is None
+        assert store.get_stats()["session_bindings"] == 0
+        assert store.get_stats()["evictions"] == 1
+        # The user's tokens are kept; only the session mapping goes
+        assert store.has_session("a@example.com")
+
+    def test_recently_used_mappings_are_kept(self):
+        store = OAuth21SessionStore(idle_ttl=3600)
+        _store_session(store, "a@example.com", mcp_session_id="mcp-1")
+
+        assert store.evict_idle_sessions() == 0
+        assert store.get_user_by_mcp_session("mcp-1") == "a@example.com"
+
+    def test_max_mappings_evicts_least_recently_used(self):
+        store = OAuth21SessionStore(max_mappings=2)
+        _store_session(store, "a@example.com", mcp_session_id="mcp-1")
+        _store_session(store, "b@example.com", mcp_session_id="mcp-2")
+        # Touch mcp-1 so mcp-2 becomes the least recently used
+        store._session_last_seen["mcp-2"] -= 10
+        store.get_user_by_mcp_session("mcp-1")
+
+        _store_session(store, "c@example.com", mcp_session_id="mcp-3")
+
+        assert store.has_mcp_session("mcp-1")
+        assert not store.has_mcp_session("mcp-2")
+        assert store.has_mcp_session("mcp-3")
+        assert store.get_stats()["evictions"] == 1
+
+    def test_remove_session_clears_tracking(self):
+        store = OAuth21SessionStore()
+        _store_session(
+            store, "a@example.com", mcp_session_id="mcp-1", session_id="oauth-1"
+        )
+
+        store.remove_session("a@example.com")
+
+        assert store._session_last_seen == {}
+        assert store.get_stats()["session_bindings"] == 0
+
+
+class TestSessionStoreConcurrency:
+    """Tests for lock-free reads and contention counters."""
+
+    def test_reads_do_not_take_the_lock(self):
+        store = OAuth21SessionStore()
+        _store_session(store, "a@example.com", mcp_session_id="mcp-1")
+        acquisitions = store.get_stats()["lock_acquisitions"]
+
+        for _ in range(10):
+            assert store.get_credentials("a@example.com") is not None
+            assert store.get_credentials_with_validation(
+                "a@example.com", session_id="mcp-1"
+            )
+            assert store.get_session_info("a@example.com") is not None
+
+        # Only the get_stats call itself acquires the lock
+        assert store.get_stats()["lock_acquisitions"] == acquisitions + 1
+
+    def test_reads_proceed_while_lock_is_held(self):
+        store = OAuth21SessionStore()
+        _store_session(store, "a@example.com", mcp_session_id="mcp-1")
+        result = []
+
+        with store._locked():
+            reader = threading.Thread(
+                target=lambda: result.append(store.get_credentials("a@example.com"))
+            )
+            reader.start()
+            reader.join(timeout=5)
+
+        assert result and result[0].token == "ya29.a@example.com"
+
+    def test_contention_is_counted(self):
+        store = OAuth21SessionStore()
+        started = threading.Event()
+
+        def writer():
+            started.set()
+            _store_session(store, "b@example.com")
+
+        with store._locked():
+            thread = threading.Thread(target=writer)
+            thread.start()
+            started.wait()
+            # Give the writer a moment to block on the lock
+            thread.join(timeout=0.05)
+        thread.join()
+
+        stats = store.get_stats()
+        assert stats["lock_contentions"] == 1
+        assert stats["lock_wait_seconds"] > 0
@@ -0,0 +1,211 @@
+"""Tests for the proactive background token refresher."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from auth import refresh_scheduler
+from auth.refresh_scheduler import ProactiveTokenRefresher
+from auth.token_refresh import TokenRefreshCoordinator
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _credentials(token: str, expires_in: timedelta) -> Credentials:
+    return Credentials(
+        token=token,
+        refresh_token=f"1//refresh-{token}",
+        token_uri="https://oauth2.googleapis.com/token",
+        client_id="client",
+        client_secret="secret",
+        expiry=_now() + expires_in,
+    )
+
+
+def _fake_refresh(self, request):
+    self.token = f"{self.token}-fresh"
+    self.expiry = _now() + timedelta(hours=1)
+
+
+@pytest.fixture
+def coordinator():
+    coordinator = TokenRefreshCoordinator(request_factory=lambda: None)
+    with patch.object(
+        refresh_scheduler, "get_token_refresh_coordinator", return_value=coordinator
+    ):
+        yield coordinator
+
+
+class TestRefreshDueAt:
+    """Tests for scheduling refreshes within a token's lifetime."""
+
+    def test_due_at_fraction_of_lifetime(self):
+        """Without jitter, a refresh is due at exactly the configured fraction."""
+        refresher = ProactiveTokenRefresher(refresh_fraction=0.8, jitter=0)
+        issued = _now()
+        expiry = issued + timedelta(minutes=60)
+
+        due = refresher.refresh_due_at("a@example.com", "tok", expiry, issued)
+
+        assert due == issued + timedelta(minutes=48)
+
+    def test_unknown_issue_time_assumes_one_hour(self):
+        """Tokens without an issue time are treated as one-hour tokens."""
+        refresher = ProactiveTokenRefresher(refresh_fraction=0.5, jitter=0)
+        expiry = _now() + timedelta(minutes=10)
+
+        due = refresher.refresh_due_at("a@example.com", "tok", expiry)
+
+        assert due == expiry - timedelta(minutes=30)
+
+    def test_jitter_is_rolled_once_per_token(self):
+        """Repeated scans of the same token keep the same due time."""
+        refresher = ProactiveTokenRefresher(refresh_fraction=0.8, jitter=0.1)
+        issued = _now()
+        expiry = issued + timedelta(hours=1)
+
+        first = refresher.refresh_due_at("a@example.com", "tok", expiry, issued)
+        for _ in range(5):
+            assert (
+                refresher.refresh_due_at("a@example.com", "tok", expiry, issued)
+                == first
+            )
+        assert issued + timedelta(minutes=42) <= first <= issued + timedelta(minutes=54)
+
+    def test_invalid_fraction_rejected(self):
+        with pytest.raises(ValueError):
+            ProactiveTokenRefresher(refresh_fraction=1.5)
+
+
+class TestScanOnce:
+    """Tests for ProactiveTokenRefresher.scan_once."""
+
+    async def test_refreshes_due_token_and_persists(self, coordinator):
+        """A token past its refresh point is refreshed once and persisted."""
+        refresher = ProactiveTokenRefresher(refresh_fraction=0.8, jitter=0)
+        refresher.record_activity("a@example.com")
+        credentials = _credentials("ya29.old", timedelta(minutes=5))
+        persist = MagicMock()
+
+        with (
+            patch.object(
+                refresher, "_load", return_value=(credentials, None, "session")
+            ),
+            patch.object(refresher, "_persist", persist),
+            patch.object(
+                Credentials, "refresh", autospec=True, side_effect=_fake_refresh
+            ),
+        ):
+            started = await refresher.scan_once()
+
+        assert started == 1
+        assert credentials.token == "ya29.old-fresh"
+        persist.assert_called_once_with("a@example.com", "session", credentials)
+        assert refresher.get_stats()["users_refreshed"] == 1
+        stats = coordinator.get_stats()
+        assert stats["proactive_refreshes"] == 1
+        assert stats["inline_refreshes"] == 0
+
+    async def test_token_not_yet_due_is_left_alone(self, coordinator):
+        """Fresh tokens are not refreshed ahead of their refresh point."""
+        refresher = ProactiveTokenRefresher(refresh_fraction=0.8, jitter=0)
+        refresher.record_activity("a@example.com")
+        credentials = _credentials("ya29.new", timedelta(minutes=55))
+
+        with (
+            patch.object(
+                refresher, "_load", return_value=(credentials, None, "session")
+            ),
+            patch.object(Credentials, "refresh", autospec=True) as refresh,
+        ):
+            await refresher.scan_once()
+
+        refresh.assert_not_called()
+        assert credentials.token == "ya29.new"
+
+    async def test_idle_users_are_dropped(self, coordinator):
+        """Users without recent activity are no longer scanned."""
+        refresher = ProactiveTokenRefresher(idle_timeout=0)
+        refresher.record_activity("a@example.com")
+        refresher._active_users["a@example.com"] -= 1
+
+        with patch.object(refresher, "_load") as load:
+            assert await refresher.scan_once() == 0
+
+        load.assert_not_called()
+        assert refresher.get_stats()["active_users"] == 0
+
+    async def test_concurrency_is_capped(self, coordinator):
+        """No more than max_concurrency refreshes run at once."""
+        refresher = ProactiveTokenRefresher(jitter=0, max_concurrency=2)
+        users = [f"user{i}@example.com" for i in range(6)]
+        for user in users:
+            refresher.record_activity(user)
+        credentials = {u: _credentials(u, timedelta(minutes=1)) for u in users}
+
+        running = 0
+        peak = 0
+
+        async def refresh_async(creds, persist=None, user_email=None, reason="inline"):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return creds
+
+        with (
+            patch.object(
+                refresher,
+                "_load",
+                side_effect=lambda u: (credentials[u], None, "session"),
+            ),
+            patch.object(coordinator, "refresh_async", side_effect=refresh_async),
+        ):
+            await refresher.scan_once()
+
+        assert peak == 2
+        assert refresher.get_stats()["users_refreshed"] == 6
+
+    async def test_failure_is_counted_not_raised(self, coordinator):
+        """A failed refresh is logged and counted without stopping the scan."""
+        refresher = ProactiveTokenRefresher(jitter=0)
+        refresher.record_activity("a@example.com")
+        credentials = _credentials("ya29.old", timedelta(minutes=1))
+
+        with (
+            patch.object(
+                refresher, "_load", return_value=(credentials, None, "session")
+            ),
+            patch.object(
+                Credentials, "refresh", autospec=True, side_effect=RuntimeError("boom")
+            ),
+        ):
+            await refresher.scan_once()
+
+        assert refresher.get_stats()["failures"] == 1
+
+
+class TestLifecycle:
+    """Tests for starting and stopping the background task."""
+
+    async def test_start_and_stop(self):
+        refresher = ProactiveTokenRefresher(interval=60)
+        refresher.start()
+        assert refresher.running
+
+        await refresher.stop()
+        assert not refresher.running
+
+    async def test_disabled_by_default(self):
+        """Nothing is tracked or started unless explicitly enabled."""
+        with patch.object(refresh_scheduler, "PROACTIVE_REFRESH_ENABLED", False):
+            refresh_scheduler.record_user_activity("a@example.com")
+            await refresh_scheduler.start_proactive_refresh()
+            assert not refresh_scheduler.get_proactive_refresher().running
+            assert refresh_scheduler.get_refresh_scheduler_stats()["enabled"] is False
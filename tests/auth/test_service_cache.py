@@ -0,0 +1,160 @@
+"""Tests for the Google API service object cache."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from auth import service_cache
+from auth.service_cache import (
+    clear_service_cache,
+    get_or_build_service,
+    get_service_cache_stats,
+    invalidate_user_services,
+)
+
+
+def _make_credentials(token: str = "ya29.token", expires_in: int = 3600):
+    expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(
+        seconds=expires_in
+    )
+    return Credentials(token=token, expiry=expiry)
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache():
+    clear_service_cache()
+    yield
+    clear_service_cache()
+
+
+class TestGetOrBuildService:
+    """Tests for get_or_build_service."""
+
+    def test_reuses_service_for_same_user_and_token(self):
+        """A second call with the same identity returns the cached service."""
+        with patch.object(
+            service_cache, "build_service", side_effect=lambda *a, **k: MagicMock()
+        ) as mock_build:
+            creds = _make_credentials()
+            first = get_or_build_service("gmail", "v1", creds, "user@example.com")
+            second = get_or_build_service("gmail", "v1", creds, "user@example.com")
+
+        assert first is second
+        assert mock_build.call_count == 1
+
+    def test_cache_key_includes_service_version_and_token(self):
+        """Different APIs, versions or tokens get distinct services."""
+        with patch.object(
+            service_cache, "build_service", side_effect=lambda *a, **k: MagicMock()
+        ) as mock_build:
+            get_or_build_service("gmail", "v1", _make_credentials(), "user@example.com")
+            get_or_build_service("drive", "v3", _make_credentials(), "user@example.com")
+            get_or_build_service("drive", "v2", _make_credentials(), "user@example.com")
+            get_or_build_service(
+                "gmail", "v1", _make_credentials("ya29.other"), "user@example.com"
+            )
+
+        assert mock_build.call_count == 4
+
+    def test_users_do_not_share_services(self):
+        """The same token for different users never shares a cached service."""
+        with patch.object(
+            service_cache, "build_service", side_effect=lambda *a, **k: MagicMock()
+        ):
+            creds = _make_credentials()
+            alice = get_or_build_service("gmail", "v1", creds, "alice@example.com")
+            bob = get_or_build_service("gmail", "v1", creds, "bob@example.com")
+
+        assert alice is not bob
+
+    def test_expired_token_is_not_cached(self):
+        """Services for already-expired tokens are built but not cached."""
+        with patch.object(
+            service_cache, "build_service", side_effect=lambda *a, **k: MagicMock()
+        ) as mock_build:
+            creds = _make_credentials(expires_in=-60)
+            get_or_build_service("gmail", "v1", creds, "user@example.com")
+            get_or_build_service("gmail", "v1", creds, "user@example.com")
+
+        assert mock_build.call_count == 2
+
+    def test_no_user_bypasses_cache(self):
+        """Without a user identity the cache is bypassed."""
+        with patch.object(
+            service_cache, "build_service", side_effect=lambda *a, **k: MagicMock()
+        ) as mock_build:
+            creds = _make_credentials()
+            get_or_build_service("gmail", "v1", creds, None)
+            get_or_build_service("gmail", "v1", creds, None)
+
+        assert mock_build.call_count == 2
+
+    def test_hit_and_miss_counters(self):
+        """Stats report hits and misses."""
+        before = get_service_cache_stats()
+        with patch.object(
+            service_cache, "build_service", side_effect=lambda *a, **k: MagicMock()
+        ):
+            creds = _make_credentials()
+            get_or_build_service("gmail", "v1", creds, "user@example.com")
+            get_or_build_service("gmail", "v1", creds, "user@example.com")
+
+        stats = get_service_cache_stats()
+        assert stats["misses"] - before["misses"] == 1
+        assert stats["hits"] - before["hits"] == 1
+        assert stats["size"] == 1
+
+
+class TestInvalidation:
+    """Tests for invalidate_user_services and store integration."""
+
+    def test_invalidate_user_services_only_affects_that_user(self):
+        """Invalidating one user keeps other users' services."""
+        with patch.object(
+            service_cache, "build_service", side_effect=lambda *a, **k: MagicMock()
+        ):
+            creds = _make_credentials()
+            get_or_build_service("gmail", "v1", creds, "alice@example.com")
+            get_or_build_service("drive", "v3", creds, "alice@example.com")
+            get_or_build_service("gmail", "v1", creds, "bob@example.com")
+
+        assert invalidate_user_services("alice@example.com") == 2
+        assert get_service_cache_stats()["size"] == 1
+
+    def test_session_token_replacement_invalidates(self):
+        """Storing a new access token for a user drops their cached services."""
+        from auth.oauth21_session_store import OAuth21SessionStore
+
+        store = OAuth21SessionStore()
+        store.store_session(user_email="user@example.com", access_token="ya29.old")
+
+        with patch.object(
+            service_cache, "build_service", side_effect=lambda *a, **k: MagicMock()
+        ):
+            get_or_build_service(
+                "gmail", "v1", _make_credentials("ya29.old"), "user@example.com"
+            )
+
+        store.store_session(user_email="user@example.com", access_token="ya29.new")
+
+        assert get_service_cache_stats()["size"] == 0
+
+    def test_session_removal_invalidates(self):
+        """Removing a session (revocation/logout) drops cached services."""
+        from auth.oauth21_session_store import OAuth21SessionStore
+
+        store = OAuth21SessionStore()
+        store.store_session(user_email="user@example.com", access_token="ya29.token")
+
+        with patch.object(
+            service_cache, "build_service", side_effect=lambda *a, **k: MagicMock()
+        ):
+            get_or_build_service(
+                "gmail", "v1", _make_credentials("ya29.token"), "user@example.com"
+            )
+
+        store.remove_session("user@example.com")
+
+        assert get_service_cache_stats()["size"] == 0
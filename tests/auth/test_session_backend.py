@@ -0,0 +1,474 @@
+"""Tests for shared session backends and their use by OAuth21SessionStore."""
+
+import socketserver
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from cryptography.fernet import Fernet
+
+from auth import oauth21_session_store
+from auth.oauth21_session_store import (
+    OAuth21SessionStore,
+    ensure_session_from_access_token_async,
+)
+from auth.session_backend import (
+    REDIS_AVAILABLE,
+    InMemorySessionBackend,
+    RedisSessionBackend,
+    SessionBackendError,
+    create_session_backend_from_env,
+)
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    """Serves the subset of Redis commands the backend uses."""
+
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        assert line.startswith(b"*")
+        args = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def _bulk(self, value):
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def _get(self, key):
+        entry = self.server.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.server.data[key]
+            return None
+        return value
+
+    @staticmethod
+    def _expiry(options):
+        if b"PX" in options:
+            ms = int(options[options.index(b"PX") + 1])
+            return time.monotonic() + ms / 1000
+        return None
+
+    def handle(self):
+        while True:
+            args = self._read_command()
+            if args is None:
+                return
+            command, rest = args[0].upper(), args[1:]
+            self.server.commands.append(command.decode())
+            with self.server.lock:
+                reply = self._dispatch(command, rest)
+            self.wfile.write(reply)
+
+    def _dispatch(self, command, rest):
+        data = self.server.data
+        if command == b"PING":
+            return b"+PONG\r\n"
+        if command == b"AUTH":
+            if rest[-1] != self.server.password:
+                return b"-WRONGPASS invalid password\r\n"
+            return b"+OK\r\n"
+        if command == b"SELECT":
+            return b"+OK\r\n"
+        if command == b"GET":
+            return self._bulk(self._get(rest[0]))
+        if command == b"GETEX":
+            value = self._get(rest[0])
+            if value is not None:
+                data[rest[0]] = (value, self._expiry(rest[1:]))
+            return self._bulk(value)
+        if command == b"GETDEL":
+            value = self._get(rest[0])
+            data.pop(rest[0], None)
+            return self._bulk(value)
+        if command == b"SET":
+            key, value, options = rest[0], rest[1], [o.upper() for o in rest[2:]]
+            if b"NX" in options and self._get(key) is not None:
+                return b"$-1\r\n"
+            data[key] = (value, self._expiry(options))
+            return b"+OK\r\n"
+        if command == b"DEL":
+            return b":%d\r\n" % sum(data.pop(k, None) is not None for k in rest)
+        return b"-ERR unknown command\r\n"
+
+
+class _RespServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, password=None):
+        super().__init__(("127.0.0.1", 0), _RespHandler)
+        self.data = {}
+        self.commands = []
+        self.lock = threading.Lock()
+        self.password = password
+
+
+requires_redis = pytest.mark.skipif(
+    not REDIS_AVAILABLE, reason="redis extra not installed"
+)
+
+
+@pytest.fixture
+def resp_server():
+    if not REDIS_AVAILABLE:
+        pytest.skip("redis extra not installed")
+    server = _RespServer(password=b"s3cret")
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+KEY = Fernet.generate_key().decode()
+
+
+@pytest.fixture
+def redis_backend(resp_server):
+    host, port = resp_server.server_address
+    backend = RedisSessionBackend(
+        url=f"redis://:s3cret@{host}:{port}/0", encryption_keys=[KEY], prefix="t"
+    )
+    yield backend
+    backend.close()
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    if request.param == "memory":
+        return InMemorySessionBackend()
+    return request.getfixturevalue("redis_backend")
+
+
+class TestSessionBackends:
+    """Behaviour shared by every SessionBackend implementation."""
+
+    def test_set_get_delete(self, backend):
+        backend.set("session", "a@example.com", {"token": "ya29.a"})
+
+        assert backend.get("session", "a@example.com") == {"token": "ya29.a"}
+        assert backend.get("session", "b@example.com") is None
+
+        backend.delete("session", "a@example.com")
+        assert backend.get("session", "a@example.com") is None
+
+    def test_ttl_expires_entries(self, backend):
+        backend.set("oauth_state", "s1", {"x": 1}, ttl=0.05)
+        time.sleep(0.1)
+
+        assert backend.get("oauth_state", "s1") is None
+
+    def test_set_if_absent_keeps_first_value(self, backend):
+        assert backend.set_if_absent("binding", "mcp-1", "a@example.com") is None
+        assert backend.set_if_absent("binding", "mcp-1", "b@example.com") == (
+            "a@example.com"
+        )
+        assert backend.get("binding", "mcp-1") == "a@example.com"
+
+    def test_pop_consumes(self, backend):
+        backend.set("oauth_state", "s1", {"x": 1})
+
+        assert backend.pop("oauth_state", "s1") == {"x": 1}
+        assert backend.pop("oauth_state", "s1") is None
+
+
+@requires_redis
+class TestRedisSessionBackend:
+    """Tests specific to the Redis-protocol client."""
+
+    def test_keys_are_prefixed(self, redis_backend, resp_server):
+        redis_backend.set("session", "a@example.com", {"token": "t"})
+
+        assert b"t:session:a@example.com" in resp_server.data
+
+    def test_connections_are_reused(self, redis_backend, resp_server):
+        for _ in range(5):
+            redis_backend.get("session", "a@example.com")
+
+        # One AUTH for the single pooled connection
+        assert resp_server.commands.count("AUTH") == 1
+
+    def test_wrong_password_raises(self, resp_server):
+        host, port = resp_server.server_address
+        backend = RedisSessionBackend(
+            url=f"redis://:nope@{host}:{port}/0", encryption_keys=[KEY]
+        )
+
+        with pytest.raises(SessionBackendError):
+            backend.ping()
+
+    def test_unreachable_server_raises(self):
+        backend = RedisSessionBackend(
+            url="redis://127.0.0.1:1/0", encryption_keys=[KEY], timeout=0.5
+        )
+
+        with pytest.raises(SessionBackendError):
+            backend.get("session", "a@example.com")
+
+    def test_rejects_other_schemes(self):
+        with pytest.raises(ValueError):
+            RedisSessionBackend(url="http://localhost:6379", encryption_keys=[KEY])
+
+    def test_requires_encryption_key(self):
+        with pytest.raises(ValueError, match="encryption key"):
+            RedisSessionBackend(url="redis://localhost:6379/0")
+
+    def test_values_are_encrypted(self, redis_backend, resp_server):
+        redis_backend.set("session", "a@example.com", {"refresh_token": "1//secret"})
+
+        (stored, _), = resp_server.data.values()
+        assert b"1//secret" not in stored
+        assert redis_backend.get("session", "a@example.com") == {
+            "refresh_token": "1//secret"
+        }
+
+    def test_wrong_key_raises(self, redis_backend, resp_server):
+        redis_backend.set("session", "a@example.com", {"token": "t"})
+        host, port = resp_server.server_address
+        other = RedisSessionBackend(
+            url=f"redis://:s3cret@{host}:{port}/0",
+            encryption_keys=[Fernet.generate_key().decode()],
+            prefix="t",
+        )
+
+        with pytest.raises(SessionBackendError):
+            other.get("session", "a@example.com")
+        other.close()
+
+    def test_old_keys_still_decrypt(self, redis_backend, resp_server):
+        redis_backend.set("session", "a@example.com", {"token": "t"})
+        host, port = resp_server.server_address
+        rotated = RedisSessionBackend(
+            url=f"redis://:s3cret@{host}:{port}/0",
+            encryption_keys=[Fernet.generate_key().decode(), KEY],
+            prefix="t",
+        )
+
+        assert rotated.get("session", "a@example.com") == {"token": "t"}
+        rotated.close()
+
+    def test_created_from_env(self, monkeypatch, resp_server):
+        host, port = resp_server.server_address
+        monkeypatch.setenv("WORKSPACE_MCP_SESSION_BACKEND", "redis")
+        monkeypatch.setenv("WORKSPACE_MCP_REDIS_URL", f"redis://{host}:{port}/0")
+        monkeypatch.setenv("WORKSPACE_MCP_SESSION_ENCRYPTION_KEY", f"{KEY}, ")
+
+        backend = create_session_backend_from_env()
+
+        assert isinstance(backend, RedisSessionBackend)
+        assert backend.port == port
+
+    def test_memory_is_default(self, monkeypatch):
+        monkeypatch.delenv("WORKSPACE_MCP_SESSION_BACKEND", raising=False)
+        assert create_session_backend_from_env() is None
+
+
+class TestSharedSessionStore:
+    """Two store instances sharing a backend behave like two replicas."""
+
+    @pytest.fixture
+    def replicas(self, redis_backend):
+        return (
+            OAuth21SessionStore(backend=redis_backend, backend_cache_ttl=0),
+            OAuth21SessionStore(backend=redis_backend, backend_cache_ttl=0),
+        )
+
+    def test_session_visible_on_other_replica(self, replicas):
+        first, second = replicas
+        first.store_session(
+            "a@example.com",
+            access_token="ya29.a",
+            refresh_token="1//r",
+            mcp_session_id="mcp-1",
+        )
+
+        credentials = second.get_credentials_with_validation(
+            "a@example.com", session_id="mcp-1"
+        )
+
+        assert credentials.token == "ya29.a"
+        assert credentials.expiry is None
+        assert second.get_user_by_mcp_session("mcp-1") == "a@example.com"
+
+    def test_binding_is_enforced_across_replicas(self, replicas):
+        first, second = replicas
+        first.store_session("a@example.com", "ya29.a", mcp_session_id="mcp-1")
+
+        with pytest.raises(ValueError):
+            second.store_session("b@example.com", "ya29.b", mcp_session_id="mcp-1")
+        assert (
+            second.get_credentials_with_validation("b@example.com", session_id="mcp-1")
+            is None
+        )
+
+    def test_token_update_and_removal_propagate(self, replicas):
+        first, second = replicas
+        first.store_session("a@example.com", "ya29.a", mcp_session_id="mcp-1")
+        second.get_credentials("a@example.com")
+
+        first.update_session_tokens("a@example.com", "ya29.refreshed")
+        assert second.get_credentials("a@example.com").token == "ya29.refreshed"
+
+        first.remove_session("a@example.com")
+        assert second.get_credentials("a@example.com") is None
+        assert second.get_user_by_mcp_session("mcp-1") is None
+
+    def test_oauth_state_consumed_on_any_replica(self, replicas):
+        first, second = replicas
+        first.store_oauth_state("state-1", session_id="mcp-1")
+
+        info = second.validate_and_consume_oauth_state("state-1", session_id="mcp-1")
+
+        assert info["session_id"] == "mcp-1"
+        with pytest.raises(ValueError):
+            first.validate_and_consume_oauth_state("state-1", session_id="mcp-1")
+
+    def test_local_state_used_when_backend_down(self, resp_server):
+        host, port = resp_server.server_address
+        backend = RedisSessionBackend(
+            url=f"redis://:s3cret@{host}:{port}/0", encryption_keys=[KEY]
+        )
+        store = OAuth21SessionStore(backend=backend, backend_cache_ttl=0)
+        store.store_session("a@example.com", "ya29.a")
+        resp_server.shutdown()
+        resp_server.server_close()
+        backend.close()
+
+        assert store.get_credentials("a@example.com").token == "ya29.a"
+        assert store.get_stats()["backend_errors"] >= 1
+
+    async def test_event_loop_lookups_stay_local(self, replicas, resp_server):
+        first, second = replicas
+        first.store_session("a@example.com", "ya29.a", mcp_session_id="mcp-1")
+        commands = len(resp_server.commands)
+
+        assert second.get_user_by_mcp_session("mcp-1") is None
+        assert len(resp_server.commands) == commands
+
+        await second.refresh_from_backend(
+            user_email="a@example.com", session_id="mcp-1"
+        )
+
+        assert second.get_user_by_mcp_session("mcp-1") == "a@example.com"
+        assert (
+            second.get_credentials_with_validation("a@example.com", session_id="mcp-1")
+            is not None
+        )
+
+
+class TestBackendFailures:
+    """Session bindings fail closed when the shared backend is unavailable."""
+
+    @pytest.fixture
+    def store_and_stop(self, resp_server):
+        host, port = resp_server.server_address
+        backend = RedisSessionBackend(
+            url=f"redis://:s3cret@{host}:{port}/0", encryption_keys=[KEY], timeout=0.5
+        )
+        store = OAuth21SessionStore(backend=backend, backend_cache_ttl=0)
+
+        def stop():
+            resp_server.shutdown()
+            resp_server.server_close()
+            backend.close()
+
+        return store, stop
+
+    def test_binding_refused_when_backend_down(self, store_and_stop):
+        store, stop = store_and_stop
+        stop()
+
+        with pytest.raises(SessionBackendError):
+            store.store_session("a@example.com", "ya29.a", mcp_session_id="mcp-1")
+        assert store._session_auth_binding == {}
+
+    def test_bindings_denied_when_backend_down(self, store_and_stop):
+        store, stop = store_and_stop
+        store.store_session("a@example.com", "ya29.a", mcp_session_id="mcp-1")
+        stop()
+
+        assert (
+            store.get_credentials_with_validation("a@example.com", session_id="mcp-1")
+            is None
+        )
+        assert store.get_user_by_mcp_session("mcp-1") is None
+
+
+class _RecordingBackend(InMemorySessionBackend):
+    """Records each backend call and the thread it ran on."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def _record(self, method):
+        self.calls.append((method, threading.get_ident()))
+
+    def get(self, namespace, key, ttl=None):
+        self._record("get")
+        return super().get(namespace, key, ttl=ttl)
+
+    def set(self, namespace, key, value, ttl=None):
+        self._record("set")
+        super().set(namespace, key, value, ttl=ttl)
+
+    def set_if_absent(self, namespace, key, value, ttl=None):
+        self._record("set_if_absent")
+        return super().set_if_absent(namespace, key, value, ttl=ttl)
+
+    def pop(self, namespace, key):
+        self._record("pop")
+        return super().pop(namespace, key)
+
+    def delete(self, namespace, key):
+        self._record("delete")
+        super().delete(namespace, key)
+
+
+class TestEventLoopWrites:
+    """Writes made from the event loop run their backend I/O on the I/O pool."""
+
+    @pytest.fixture
+    def store(self, monkeypatch):
+        store = OAuth21SessionStore(backend=_RecordingBackend())
+        monkeypatch.setattr(oauth21_session_store, "_global_store", store)
+        return store
+
+    async def test_no_backend_call_on_loop_thread(self, store):
+        access_token = SimpleNamespace(
+            token="ya29.a",
+            expires_at=None,
+            scopes=["openid"],
+            claims={"email": "a@example.com"},
+        )
+
+        await store.refresh_from_backend(user_email="a@example.com", session_id="mcp-1")
+        credentials = await ensure_session_from_access_token_async(
+            access_token, None, "mcp-1"
+        )
+        await store.store_oauth_state_async("state-1", session_id="mcp-1")
+
+        assert credentials.token == "ya29.a"
+        assert store.get_user_by_mcp_session("mcp-1") == "a@example.com"
+        calls = store._backend.calls
+        assert {method for method, _ in calls} >= {"set", "set_if_absent"}
+        assert all(thread != threading.get_ident() for _, thread in calls)
+
+    def test_unchanged_session_is_not_rewritten(self, store):
+        store.store_session("a@example.com", "ya29.a", mcp_session_id="mcp-1")
+        writes = [m for m, _ in store._backend.calls if m != "get"]
+
+        store.store_session("a@example.com", "ya29.a", mcp_session_id="mcp-1")
+
+        assert [m for m, _ in store._backend.calls if m != "get"] == writes
+
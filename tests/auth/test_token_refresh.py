@@ -0,0 +1,213 @@
+"""Tests for single-flight OAuth token refresh."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.auth.exceptions import RefreshError
+from google.oauth2.credentials import Credentials
+
+from auth.token_refresh import TokenRefreshCoordinator
+
+
+def _expired_credentials(refresh_token: str = "1//refresh") -> Credentials:
+    expiry = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=5)
+    return Credentials(
+        token="ya29.expired",
+        refresh_token=refresh_token,
+        token_uri="https://oauth2.googleapis.com/token",
+        client_id="client",
+        client_secret="secret",
+        expiry=expiry,
+    )
+
+
+def _fake_refresh(calls, delay: float = 0.05):
+    def refresh(self, request):
+        calls.append(self)
+        time.sleep(delay)
+        self.token = f"ya29.fresh-{len(calls)}"
+        self.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(
+            hours=1
+        )
+
+    return refresh
+
+
+@pytest.fixture
+def coordinator():
+    return TokenRefreshCoordinator(request_factory=lambda: None)
+
+
+class TestTokenRefreshCoordinator:
+    """Tests for TokenRefreshCoordinator.refresh."""
+
+    def test_concurrent_threads_share_one_refresh(self, coordinator):
+        """Concurrent refreshes of one grant hit the token endpoint once."""
+        calls = []
+        persist = MagicMock()
+        credentials = [_expired_credentials() for _ in range(8)]
+
+        with patch.object(
+            Credentials, "refresh", autospec=True, side_effect=_fake_refresh(calls)
+        ):
+            threads = [
+                threading.Thread(target=coordinator.refresh, args=(c, persist))
+                for c in credentials
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(timeout=5)
+
+        assert len(calls) == 1
+        persist.assert_called_once()
+        assert {c.token for c in credentials} == {"ya29.fresh-1"}
+        assert all(c.valid for c in credentials)
+
+    def test_recent_refresh_is_adopted(self, coordinator):
+        """Stale credentials loaded after a refresh adopt the new token."""
+        calls = []
+        with patch.object(
+            Credentials, "refresh", autospec=True, side_effect=_fake_refresh(calls)
+        ):
+            coordinator.refresh(_expired_credentials())
+            late = coordinator.refresh(_expired_credentials())
+
+        assert len(calls) == 1
+        assert late.token == "ya29.fresh-1"
+        assert coordinator.get_stats()["adopted"] == 1
+
+    def test_different_grants_refresh_independently(self, coordinator):
+        """Credentials with different refresh tokens are not coalesced."""
+        calls = []
+        with patch.object(
+            Credentials, "refresh", autospec=True, side_effect=_fake_refresh(calls)
+        ):
+            coordinator.refresh(_expired_credentials("1//alice"))
+            coordinator.refresh(_expired_credentials("1//bob"))
+
+        assert len(calls) == 2
+
+    def test_failure_propagates_to_followers_and_is_not_cached(self, coordinator):
+        """A failed refresh raises for every waiter and is retried next time."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing_refresh(self, request):
+            started.set()
+            release.wait(timeout=5)
+            raise RefreshError("invalid_grant")
+
+        errors = []
+
+        def run(creds):
+            try:
+                coordinator.refresh(creds)
+            except RefreshError as e:
+                errors.append(e)
+
+        with patch.object(
+            Credentials, "refresh", autospec=True, side_effect=failing_refresh
+        ):
+            leader = threading.Thread(target=run, args=(_expired_credentials(),))
+            leader.start()
+            started.wait(timeout=5)
+            follower = threading.Thread(target=run, args=(_expired_credentials(),))
+            follower.start()
+            time.sleep(0.05)
+            release.set()
+            leader.join(timeout=5)
+            follower.join(timeout=5)
+
+        assert len(errors) == 2
+        stats = coordinator.get_stats()
+        assert stats["failures"] == 1
+        assert stats["in_flight"] == 0
+
+    def test_persist_failure_does_not_fail_refresh(self, coordinator):
+        """Errors writing the refreshed token are logged, not raised."""
+        calls = []
+        persist = MagicMock(side_effect=OSError("disk full"))
+        with patch.object(
+            Credentials, "refresh", autospec=True, side_effect=_fake_refresh(calls)
+        ):
+            credentials = coordinator.refresh(_expired_credentials(), persist)
+
+        assert credentials.valid
+
+
+class TestRefreshAsync:
+    """Tests for TokenRefreshCoordinator.refresh_async."""
+
+    async def test_concurrent_coroutines_share_one_refresh(self, coordinator):
+        """Concurrent coroutines refresh once without blocking the loop."""
+        calls = []
+        persist = MagicMock()
+        credentials = [_expired_credentials() for _ in range(20)]
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        with patch.object(
+            Credentials,
+            "refresh",
+            autospec=True,
+            side_effect=_fake_refresh(calls, delay=0.1),
+        ):
+            tick_task = asyncio.create_task(ticker())
+            await asyncio.gather(
+                *(coordinator.refresh_async(c, persist) for c in credentials)
+            )
+            tick_task.cancel()
+
+        assert len(calls) == 1
+        persist.assert_called_once()
+        assert {c.token for c in credentials} == {"ya29.fresh-1"}
+        # The loop kept running while the refresh was in progress
+        assert ticks > 5
+
+
+class TestUpdateSessionTokens:
+    """Tests for OAuth21SessionStore.update_session_tokens."""
+
+    def test_updates_tokens_and_keeps_bindings(self):
+        """Refreshed tokens replace the old ones without dropping session metadata."""
+        from auth.oauth21_session_store import OAuth21SessionStore
+
+        store = OAuth21SessionStore()
+        store.store_session(
+            user_email="user@example.com",
+            access_token="ya29.old",
+            refresh_token="1//refresh",
+            mcp_session_id="mcp-1",
+            issuer="https://accounts.google.com",
+        )
+        new_expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+
+        assert store.update_session_tokens(
+            "user@example.com", access_token="ya29.new", expiry=new_expiry
+        )
+
+        info = store.get_session_info("user@example.com")
+        assert info["access_token"] == "ya29.new"
+        assert info["refresh_token"] == "1//refresh"
+        assert info["issuer"] == "https://accounts.google.com"
+        assert info["expiry"].tzinfo is None
+        assert store.get_user_by_mcp_session("mcp-1") == "user@example.com"
+
+    def test_unknown_user_is_not_created(self):
+        """Updating tokens for a user without a session is a no-op."""
+        from auth.oauth21_session_store import OAuth21SessionStore
+
+        store = OAuth21SessionStore()
+
+        assert not store.update_session_tokens("nobody@example.com", "ya29.x")
+        assert store.get_session_info("nobody@example.com") is None
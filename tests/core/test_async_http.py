@@ -0,0 +1,179 @@
+"""Tests for the async Google API execution layer."""
+
+import json
+import ssl
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from google.oauth2.credentials import Credentials
+from googleapiclient.errors import HttpError
+
+from auth.discovery_documents import build_service
+from core import async_http
+from core.context import set_current_user_email, set_fastmcp_session_id
+from core.async_http import execute_async
+
+
+def _mock_client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def drive_service():
+    return build_service("drive", "v3", Credentials(token="ya29.valid"))
+
+
+class TestExecuteAsync:
+    """Tests for execute_async."""
+
+    async def test_executes_request_over_async_client(self, drive_service):
+        """Requests are sent with credentials and the JSON body is returned."""
+        seen = {}
+
+        def handler(request):
+            seen["auth"] = request.headers["authorization"]
+            seen["url"] = str(request.url)
+            return httpx.Response(200, json={"id": "abc", "name": "Doc"})
+
+        with patch.object(
+            async_http, "_get_client", return_value=_mock_client(handler)
+        ):
+            result = await execute_async(drive_service.files().get(fileId="abc"))
+
+        assert result == {"id": "abc", "name": "Doc"}
+        assert seen["auth"] == "Bearer ya29.valid"
+        assert seen["url"].startswith("https://www.googleapis.com/drive/v3/files/abc")
+
+    async def test_sends_request_body(self, drive_service):
+        """Request bodies built by googleapiclient are sent unchanged."""
+        seen = {}
+
+        def handler(request):
+            seen["method"] = request.method
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(200, json={"id": "new"})
+
+        with patch.object(
+            async_http, "_get_client", return_value=_mock_client(handler)
+        ):
+            await execute_async(drive_service.files().create(body={"name": "x"}))
+
+        assert seen["method"] == "POST"
+        assert seen["body"] == {"name": "x"}
+
+    async def test_error_status_raises_http_error(self, drive_service):
+        """Non-2xx responses raise HttpError with the response status."""
+
+        def handler(request):
+            return httpx.Response(404, json={"error": {"message": "File not found"}})
+
+        with patch.object(
+            async_http, "_get_client", return_value=_mock_client(handler)
+        ):
+            with pytest.raises(HttpError) as exc_info:
+                await execute_async(drive_service.files().get(fileId="missing"))
+
+        assert exc_info.value.resp.status == 404
+        assert "File not found" in str(exc_info.value)
+
+    async def test_unauthorized_refreshes_and_retries_once(self, drive_service):
+        """A 401 refreshes the credentials and retries the request once."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(401, json={"error": {"message": "expired"}})
+            return httpx.Response(200, json={"id": "abc"})
+
+        with (
+            patch.object(async_http, "_get_client", return_value=_mock_client(handler)),
+            patch.object(
+                async_http, "_refresh_credentials", new=AsyncMock()
+            ) as refresh,
+        ):
+            result = await execute_async(drive_service.files().get(fileId="abc"))
+
+        assert result == {"id": "abc"}
+        assert len(calls) == 2
+        refresh.assert_awaited_once()
+
+    async def test_refreshed_token_is_saved_for_current_user(self):
+        """Credentials refreshed mid-call are persisted like get_credentials does."""
+        credentials = Credentials(token="ya29.old")
+
+        async def fake_refresh(creds, persist=None, user_email=None):
+            assert user_email == "user@example.com"
+            persist(creds)
+            return creds
+
+        set_current_user_email("user@example.com")
+        set_fastmcp_session_id("session-1")
+        try:
+            with (
+                patch.object(
+                    async_http, "refresh_credentials_async", side_effect=fake_refresh
+                ),
+                patch("auth.google_auth.save_refreshed_credentials") as save,
+            ):
+                await async_http._refresh_credentials(credentials)
+        finally:
+            set_current_user_email(None)
+            set_fastmcp_session_id(None)
+
+        save.assert_called_once_with(credentials, "user@example.com", "session-1")
+
+    async def test_long_get_uri_becomes_post_override(self, drive_service):
+        """Over-long GET URIs are rewritten the same way execute() does."""
+        seen = {}
+
+        def handler(request):
+            seen["method"] = request.method
+            seen["override"] = request.headers.get("x-http-method-override")
+            return httpx.Response(200, json={"files": []})
+
+        request = drive_service.files().list(q="name = '" + "a" * 3000 + "'")
+        with patch.object(
+            async_http, "_get_client", return_value=_mock_client(handler)
+        ):
+            await execute_async(request)
+
+        assert seen == {"method": "POST", "override": "GET"}
+
+    async def test_ssl_errors_are_surfaced_as_ssl_errors(self, drive_service):
+        """SSL transport failures raise ssl.SSLError so read-only retries apply."""
+
+        def handler(request):
+            try:
+                raise ssl.SSLError("bad record mac")
+            except ssl.SSLError as e:
+                raise httpx.ConnectError("ssl failure") from e
+
+        with patch.object(
+            async_http, "_get_client", return_value=_mock_client(handler)
+        ):
+            with pytest.raises(ssl.SSLError):
+                await execute_async(drive_service.files().get(fileId="abc"))
+
+    async def test_non_http_request_runs_in_thread(self):
+        """Objects that are not HttpRequests fall back to execute() in a thread."""
+        request = MagicMock()
+        request.execute.return_value = {"ok": True}
+
+        result = await execute_async(request)
+
+        assert result == {"ok": True}
+        request.execute.assert_called_once_with()
+
+    async def test_disabled_runs_in_thread(self, drive_service):
+        """WORKSPACE_MCP_ASYNC_HTTP=false keeps the threaded execute() path."""
+        request = drive_service.files().get(fileId="abc")
+        with (
+            patch.object(async_http, "ASYNC_HTTP_ENABLED", False),
+            patch.object(request, "execute", return_value={"id": "abc"}) as execute,
+        ):
+            result = await execute_async(request)
+
+        assert result == {"id": "abc"}
+        execute.assert_called_once_with()
@@ -0,0 +1,86 @@
+"""Tests for the TTLCache primitive."""
+
+from unittest.mock import patch
+
+import pytest
+
+from core.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache get/set, expiry, eviction and stats."""
+
+    def test_get_returns_stored_value(self):
+        """Stored values are returned and counted as hits."""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get_stats()["hits"] == 1
+
+    def test_missing_key_counts_as_miss(self):
+        """Missing keys return the default and count as misses."""
+        cache = TTLCache(maxsize=4, ttl=60)
+
+        assert cache.get("missing", "default") == "default"
+        assert cache.get_stats()["misses"] == 1
+
+    def test_entries_expire(self):
+        """Entries are dropped once their TTL has elapsed."""
+        cache = TTLCache(maxsize=4, ttl=10)
+        with patch("core.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("core.cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+
+        stats = cache.get_stats()
+        assert stats["expirations"] == 1
+        assert stats["size"] == 0
+
+    def test_per_entry_ttl_is_capped_by_cache_ttl(self):
+        """A per-entry TTL longer than the cache TTL is capped."""
+        cache = TTLCache(maxsize=4, ttl=10)
+        with patch("core.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1, ttl=1000)
+        with patch("core.cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+
+    def test_non_positive_entry_ttl_is_not_stored(self):
+        """Values that are already expired are not cached at all."""
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("a", 1, ttl=-5)
+
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_invalidate_where(self):
+        """invalidate_where removes only matching keys."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set(("alice", "gmail"), 1)
+        cache.set(("alice", "drive"), 2)
+        cache.set(("bob", "gmail"), 3)
+
+        removed = cache.invalidate_where(lambda key: key[0] == "alice")
+
+        assert removed == 2
+        assert len(cache) == 1
+        assert cache.get(("bob", "gmail")) == 3
+
+    def test_invalid_configuration(self):
+        """maxsize and ttl must be positive."""
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=0, ttl=60)
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=1, ttl=0)
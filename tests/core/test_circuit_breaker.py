@@ -0,0 +1,217 @@
+"""Tests for per-API circuit breakers."""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+import pytest
+from googleapiclient.errors import HttpError
+
+from core import circuit_breaker
+from core.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    classify_error,
+    get_circuit_breaker,
+    get_circuit_breaker_stats,
+)
+from core.retry import get_retry_budget
+from core.utils import handle_http_errors
+
+
+def _http_error(status):
+    return HttpError(SimpleNamespace(status=status, reason="x"), b"{}")
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers():
+    with patch.dict(circuit_breaker._breakers, clear=True):
+        yield
+
+
+def _trip(breaker):
+    for _ in range(breaker.min_calls):
+        probe = breaker.before_call()
+        breaker.record(True, 0.01, probe)
+
+
+class TestClassifyError:
+    """Tests for deciding which errors count against an API."""
+
+    @pytest.mark.parametrize(
+        "error,expected",
+        [
+            (_http_error(503), True),
+            (_http_error(500), True),
+            (_http_error(404), False),
+            (_http_error(429), False),
+            (httpx.ReadTimeout("slow"), True),
+            (TimeoutError(), True),
+            (ValueError("bad argument"), None),
+        ],
+    )
+    def test_classify(self, error, expected):
+        assert classify_error(error) is expected
+
+    def test_follows_wrapped_errors(self):
+        try:
+            try:
+                raise _http_error(502)
+            except HttpError as e:
+                raise Exception("API error in tool") from e
+        except Exception as wrapped:
+            assert classify_error(wrapped) is True
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_opens_on_failure_rate(self):
+        breaker = CircuitBreaker("sheets", failure_rate=0.5, min_calls=4)
+        for failed in (False, True, False):
+            breaker.record(failed, 0.01, breaker.before_call())
+        assert breaker.state == CLOSED
+
+        breaker.record(True, 0.01, breaker.before_call())
+
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError) as excinfo:
+            breaker.before_call("read_sheet_values")
+        body = json.loads(str(excinfo.value))
+        assert body["code"] == "SERVICE_UNAVAILABLE"
+        assert body["context"]["service"] == "sheets"
+        assert body["context"]["tool"] == "read_sheet_values"
+
+    def test_slow_calls_count_against_api(self):
+        breaker = CircuitBreaker("drive", min_calls=2, slow_call=1.0)
+        for _ in range(2):
+            breaker.record(False, 5.0, breaker.before_call())
+
+        assert breaker.state == OPEN
+
+    def test_neutral_outcomes_are_ignored(self):
+        breaker = CircuitBreaker("drive", min_calls=2)
+        for _ in range(5):
+            breaker.record(None, 0.01, breaker.before_call())
+
+        assert breaker.state == CLOSED
+        assert breaker.get_stats()["window_calls"] == 0
+
+    def test_old_outcomes_leave_the_window(self):
+        breaker = CircuitBreaker("drive", min_calls=2, window=0.05)
+        breaker.record(True, 0.01, breaker.before_call())
+        time.sleep(0.1)
+        breaker.record(True, 0.01, breaker.before_call())
+
+        assert breaker.state == CLOSED
+
+    def test_half_open_probes_close_circuit(self):
+        breaker = CircuitBreaker(
+            "gmail", min_calls=2, open_seconds=0.05, half_open_probes=2
+        )
+        _trip(breaker)
+        time.sleep(0.06)
+
+        assert breaker.state == HALF_OPEN
+        probes = [breaker.before_call(), breaker.before_call()]
+        assert probes == [True, True]
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        for probe in probes:
+            breaker.record(False, 0.01, probe)
+        assert breaker.state == CLOSED
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker("gmail", min_calls=2, open_seconds=0.05)
+        _trip(breaker)
+        time.sleep(0.06)
+
+        breaker.record(True, 0.01, breaker.before_call())
+
+        assert breaker.state == OPEN
+        assert breaker.get_stats()["opened"] == 2
+
+    def test_cancelled_probe_frees_its_slot(self):
+        breaker = CircuitBreaker(
+            "gmail", min_calls=2, open_seconds=0.05, half_open_probes=1
+        )
+        _trip(breaker)
+        time.sleep(0.06)
+
+        breaker.record(None, 0.01, breaker.before_call())
+
+        assert breaker.before_call() is True
+
+
+class TestHandleHttpErrorsBreaker:
+    """handle_http_errors routes calls through the service's breaker."""
+
+    async def test_fails_fast_while_open(self):
+        calls = []
+
+        @handle_http_errors("get_events", is_read_only=True, service_type="calendar")
+        async def tool():
+            calls.append(1)
+            raise _http_error(503)
+
+        breaker = get_circuit_breaker("calendar")
+        breaker.min_calls = 2
+        for _ in range(2):
+            with pytest.raises(Exception, match="API error in get_events"):
+                await tool()
+
+        with pytest.raises(CircuitOpenError):
+            await tool()
+        assert len(calls) == 2
+        stats = get_circuit_breaker_stats()
+        assert stats["degraded"] == ["calendar"]
+        assert stats["services"]["calendar"]["rejected"] == 1
+
+    async def test_client_errors_do_not_open(self):
+        @handle_http_errors("get_doc", is_read_only=True, service_type="drive")
+        async def tool():
+            raise _http_error(404)
+
+        get_circuit_breaker("drive").min_calls = 2
+        for _ in range(3):
+            with pytest.raises(Exception, match="API error in get_doc"):
+                await tool()
+
+        assert get_circuit_breaker("drive").state == CLOSED
+
+    async def test_services_are_isolated(self):
+        _trip(get_circuit_breaker("sheets"))
+
+        @handle_http_errors("list_tasks", is_read_only=True, service_type="tasks")
+        async def tool():
+            return "ok"
+
+        assert await tool() == "ok"
+
+    async def test_pacing_and_backoff_are_not_slow(self):
+        @handle_http_errors("list_files", is_read_only=True, service_type="drive")
+        async def tool(paced, backoff):
+            budget = get_retry_budget()
+            budget.paced_seconds += paced
+            budget.consume(backoff)
+            await asyncio.sleep(0.2)
+            return "ok"
+
+        breaker = get_circuit_breaker("drive")
+        breaker.min_calls = 2
+        breaker.slow_call = 0.15
+        for _ in range(2):
+            assert await tool(0.1, 0.1) == "ok"
+        assert breaker.state == CLOSED
+        assert get_circuit_breaker_stats()["services"]["drive"]["slow"] == 0
+
+        for _ in range(2):
+            assert await tool(0.0, 0.0) == "ok"
+        assert get_circuit_breaker_stats()["services"]["drive"]["slow"] == 2
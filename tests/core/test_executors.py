@@ -0,0 +1,101 @@
+"""Tests for the instrumented I/O and CPU thread pools."""
+
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from core import executors
+from core.executors import InstrumentedExecutor, run_cpu, run_io
+
+_request_user = contextvars.ContextVar("request_user", default=None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_pools():
+    executors.shutdown_executors(wait=True)
+    yield
+    executors.shutdown_executors(wait=True)
+
+
+class TestInstrumentedExecutor:
+    """Tests for queue and thread gauges."""
+
+    def test_queue_depth_and_active_threads(self):
+        executor = InstrumentedExecutor("test", max_workers=1)
+        release = threading.Event()
+        started = threading.Event()
+
+        def block():
+            started.set()
+            release.wait(5)
+
+        first = executor.submit(block)
+        second = executor.submit(lambda: "done")
+        started.wait(5)
+
+        stats = executor.get_stats()
+        assert stats["active"] == 1
+        assert stats["queue_depth"] == 1
+
+        threading.Event().wait(0.02)
+        release.set()
+        assert second.result(5) == "done"
+        first.result(5)
+        stats = executor.get_stats()
+        assert stats["active"] == 0
+        assert stats["queue_depth"] == 0
+        assert stats["completed"] == 2
+        assert stats["wait_seconds_max"] > 0
+        executor.shutdown()
+
+    def test_failures_are_counted(self):
+        executor = InstrumentedExecutor("test", max_workers=1)
+
+        with pytest.raises(ValueError):
+            executor.submit(lambda: (_ for _ in ()).throw(ValueError())).result(5)
+
+        assert executor.get_stats()["failed"] == 1
+        executor.shutdown()
+
+
+class TestRunHelpers:
+    """Tests for run_io and run_cpu."""
+
+    async def test_run_io_uses_dedicated_pool(self):
+        name = await run_io(lambda: threading.current_thread().name)
+
+        assert name.startswith("workspace-mcp-io")
+        assert executors.get_executor_stats("io")["completed"] == 1
+
+    async def test_run_cpu_uses_separate_pool(self):
+        name = await run_cpu(lambda: threading.current_thread().name)
+
+        assert name.startswith("workspace-mcp-cpu")
+        assert executors.get_executor_stats("io")["submitted"] == 0
+
+    async def test_context_is_copied(self):
+        _request_user.set("a@example.com")
+
+        assert await run_io(_request_user.get) == "a@example.com"
+
+    async def test_pool_size_bounds_concurrency(self, monkeypatch):
+        monkeypatch.setattr(executors, "IO_THREADS", 2)
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            threading.Event().wait(0.02)
+            with lock:
+                running -= 1
+
+        await asyncio.gather(*(run_io(work) for _ in range(6)))
+
+        assert peak == 2
+        assert executors.get_executor_stats("io")["max_workers"] == 2
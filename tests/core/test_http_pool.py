@@ -0,0 +1,157 @@
+"""Tests for the pooled httplib2 connections used by googleapiclient services."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import httplib2
+import pytest
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+
+from core.http_pool import HttpConnectionPool, PooledAuthorizedHttp, PooledHttp
+
+
+def _response(status=200):
+    return httplib2.Response({"status": str(status)}), b"{}"
+
+
+class TestHttpConnectionPool:
+    """Tests for HttpConnectionPool."""
+
+    def test_released_connection_is_reused(self):
+        """A released Http object is handed out again."""
+        pool = HttpConnectionPool(size=2, keepalive=30)
+        first = pool.acquire()
+        pool.release(first)
+
+        assert pool.acquire() is first
+        assert pool.get_stats()["reuses"] == 1
+
+    def test_concurrent_holders_get_distinct_connections(self):
+        """Two outstanding checkouts never share an Http object."""
+        pool = HttpConnectionPool(size=2, keepalive=30)
+
+        assert pool.acquire() is not pool.acquire()
+        assert pool.get_stats()["in_use"] == 2
+
+    def test_exhausted_pool_waits_for_release(self):
+        """When every connection is in use, acquire blocks until one is released."""
+        pool = HttpConnectionPool(size=1, keepalive=30)
+        held = pool.acquire()
+        acquired = []
+
+        waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+        waiter.start()
+        waiter.join(timeout=0.1)
+        assert acquired == []
+
+        pool.release(held)
+        waiter.join(timeout=2)
+
+        assert acquired == [held]
+        assert pool.get_stats()["waits"] >= 1
+
+    def test_idle_connections_past_keepalive_are_reset(self):
+        """Connections idle longer than keepalive are closed before reuse."""
+        pool = HttpConnectionPool(size=1, keepalive=10)
+        http = pool.acquire()
+        with patch("core.http_pool.time.monotonic", return_value=100.0):
+            pool.release(http)
+
+        with (
+            patch("core.http_pool.time.monotonic", return_value=200.0),
+            patch.object(http, "close") as close,
+        ):
+            assert pool.acquire() is http
+
+        close.assert_called_once()
+        assert pool.get_stats()["keepalive_expired"] == 1
+
+    def test_failed_request_discards_connection(self):
+        """A connection that raised is closed and not returned to the pool."""
+        pool = HttpConnectionPool(size=1, keepalive=30)
+
+        with pytest.raises(OSError):
+            with pool.connection() as http:
+                failed = http
+                raise OSError("connection reset")
+
+        assert pool.get_stats()["created"] == 0
+        assert pool.acquire() is not failed
+
+    def test_invalid_size(self):
+        """Pool size must be positive."""
+        with pytest.raises(ValueError):
+            HttpConnectionPool(size=0)
+
+
+class TestPooledAuthorizedHttp:
+    """Tests for PooledAuthorizedHttp."""
+
+    def test_is_authorized_http(self):
+        """The pooled object is usable anywhere AuthorizedHttp is expected."""
+        credentials = Credentials(token="ya29.token")
+        authed = PooledAuthorizedHttp(credentials, pool=HttpConnectionPool(size=1))
+
+        assert isinstance(authed, AuthorizedHttp)
+        assert authed.credentials is credentials
+
+    def test_requests_run_on_pooled_connections(self):
+        """Each request checks out a connection and applies credentials."""
+        pool = HttpConnectionPool(size=2, keepalive=30)
+        http = MagicMock()
+        http.request.return_value = _response()
+        pool._idle.append((float("inf"), http))
+        pool._created = 1
+
+        authed = PooledAuthorizedHttp(Credentials(token="ya29.token"), pool=pool)
+        authed.request("https://www.googleapis.com/drive/v3/files")
+
+        _, kwargs = http.request.call_args
+        assert kwargs["headers"]["authorization"] == "Bearer ya29.token"
+        assert pool.get_stats()["in_use"] == 0
+
+    def test_pooled_http_close_keeps_pool(self):
+        """Closing a service's HTTP object leaves shared connections open."""
+        pool = HttpConnectionPool(size=1)
+        PooledHttp(pool).close()
+
+        assert pool.get_stats()["created"] == 0
+
+
+class _ResumeIncompleteHandler(BaseHTTPRequestHandler):
+    """Answers every PUT like a resumable upload that wants more chunks."""
+
+    def do_PUT(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(308)
+        self.send_header("Range", "bytes=0-4")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestResumableUploads:
+    """Pooled connections must pass 308 through like googleapiclient's build_http."""
+
+    def test_308_without_location_is_returned(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _ResumeIncompleteHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            pool = HttpConnectionPool(size=1, timeout=5)
+            response, _ = PooledHttp(pool).request(
+                f"http://127.0.0.1:{server.server_port}/upload",
+                "PUT",
+                body=b"hello",
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert response.status == 308
+        assert response["range"] == "bytes=0-4"
+        assert 308 not in pool.acquire().redirect_codes
@@ -0,0 +1,98 @@
+"""Tests for registering tools from the manifest and loading them on first call."""
+
+import sys
+import textwrap
+
+import pytest
+from fastmcp import FastMCP
+
+from core import lazy_tools, tool_manifest
+from core.lazy_tools import LazyTool, register_lazy_tools
+from core.tool_manifest import build_manifest, import_tool_modules
+from core.tool_registry import set_enabled_tools
+
+MODULE = "lazy_fake_tools"
+
+SOURCE = textwrap.dedent(
+    '''
+    from core import lazy_tools
+
+    IMPORTS = []
+    IMPORTS.append(1)
+
+
+    @lazy_tools._server.tool()
+    async def greet(name: str, excited: bool = False) -> str:
+        """Say hello to someone."""
+        return f"hello {name}" + ("!" if excited else "")
+
+
+    @lazy_tools._server.tool()
+    async def wave() -> str:
+        """Wave."""
+        return "wave"
+    '''
+)
+
+
+@pytest.fixture
+def manifest(tmp_path, monkeypatch):
+    (tmp_path / f"{MODULE}.py").write_text(SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setitem(tool_manifest.TOOL_MODULES, "fake", MODULE)
+    monkeypatch.setitem(tool_manifest._MODULE_SERVICES, MODULE, "fake")
+    monkeypatch.setattr(tool_manifest, "_tool_tiers", lambda: {})
+    monkeypatch.setattr(lazy_tools, "_loaded_modules", set())
+    monkeypatch.setattr(lazy_tools, "_module_locks", {})
+    set_enabled_tools(None)
+
+    source_server = FastMCP("source")
+    monkeypatch.setattr(lazy_tools, "_server", source_server)
+    tool_modules = import_tool_modules(source_server, [MODULE])
+    sys.modules.pop(MODULE)
+    yield build_manifest(source_server, tool_modules)
+
+    sys.modules.pop(MODULE, None)
+    set_enabled_tools(None)
+
+
+class TestLazyTools:
+    """Tests for manifest-backed tool registration."""
+
+    async def test_tools_are_listed_without_importing(self, manifest):
+        server = FastMCP("lazy")
+
+        names = register_lazy_tools(server, manifest, ["fake"])
+
+        assert names == ["greet", "wave"]
+        assert MODULE not in sys.modules
+        tools = await server.get_tools()
+        assert isinstance(tools["greet"], LazyTool)
+        assert tools["greet"].parameters == manifest["tools"][0]["parameters"]
+        assert tools["greet"].description == "Say hello to someone."
+
+    async def test_first_call_imports_module_once(self, manifest):
+        server = FastMCP("lazy")
+        register_lazy_tools(server, manifest, ["fake"])
+
+        first = await server._tool_manager.call_tool("greet", {"name": "ada"})
+        second = await server._tool_manager.call_tool("wave", {})
+
+        assert first.content[0].text == "hello ada"
+        assert second.content[0].text == "wave"
+        assert sys.modules[MODULE].IMPORTS == [1]
+        assert not isinstance(server._tool_manager._tools["greet"], LazyTool)
+
+    async def test_disabled_tools_are_skipped_and_stay_removed(self, manifest):
+        server = FastMCP("lazy")
+        set_enabled_tools({"greet"})
+
+        assert register_lazy_tools(server, manifest, ["fake"]) == ["greet"]
+        await server._tool_manager.call_tool("greet", {"name": "ada"})
+
+        assert set(server._tool_manager._tools) == {"greet"}
+
+    def test_unselected_services_are_skipped(self, manifest):
+        server = FastMCP("lazy")
+
+        assert register_lazy_tools(server, manifest, ["docs"]) == []
@@ -0,0 +1,197 @@
+"""Tests for the queued, structured logging pipeline."""
+
+import json
+import logging
+import sys
+import threading
+
+import pytest
+
+from core.context import set_current_user_email
+from core.log_formatter import EnhancedLogFormatter
+from core.log_pipeline import (
+    ContextQueueHandler,
+    JsonLogFormatter,
+    LogSampler,
+    configure_log_pipeline,
+    get_log_pipeline_stats,
+    parse_sampling,
+    stop_log_pipeline,
+)
+from core.tracing import InMemorySpanExporter, configure_tracing, start_span
+
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+        self.threads = []
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+        self.threads.append(threading.current_thread().name)
+
+
+@pytest.fixture
+def pipeline_logger():
+    logger = logging.getLogger("tests.log_pipeline")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    capture = _Capture()
+    logger.addHandler(capture)
+    yield logger, capture
+    stop_log_pipeline()
+    logger.removeHandler(capture)
+    logger.propagate = True
+
+
+def _record(name="x", level=logging.INFO, msg="hello", args=()):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+class TestSampling:
+    """Tests for per-logger sampling."""
+
+    def test_parse_sampling(self):
+        assert parse_sampling("a.b=0.1, c=2,bad,d=x,=1") == {"a.b": 0.1, "c": 1.0}
+
+    def test_children_use_most_specific_rate(self):
+        sampler = LogSampler({"auth": 1.0, "auth.google_auth": 0.0})
+
+        assert sampler.filter(_record("auth.scopes"))
+        assert not sampler.filter(_record("auth.google_auth"))
+        assert not sampler.filter(_record("auth.google_auth.refresh"))
+        assert sampler.filter(_record("core.server"))
+        assert sampler.dropped == 2
+
+    def test_warnings_are_never_sampled(self):
+        sampler = LogSampler({"auth": 0.0})
+
+        assert sampler.filter(_record("auth", logging.WARNING))
+        assert not sampler.filter(_record("auth", logging.DEBUG))
+
+
+class TestQueueHandler:
+    """Tests for deferred formatting and context capture."""
+
+    def test_immutable_args_are_formatted_later(self):
+        handler = ContextQueueHandler(None)
+        record = handler.prepare(_record(msg="%s=%d", args=("a", 1)))
+
+        assert record.args == ("a", 1)
+        assert record.getMessage() == "a=1"
+
+    def test_mutable_args_are_formatted_now(self):
+        handler = ContextQueueHandler(None)
+        scopes = ["a"]
+        record = handler.prepare(_record(msg="scopes %s", args=(scopes,)))
+        scopes.append("b")
+
+        assert record.args is None
+        assert record.getMessage() == "scopes ['a']"
+
+    def test_exception_text_is_captured(self):
+        handler = ContextQueueHandler(None)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                "x", logging.ERROR, __file__, 1, "failed", (), sys.exc_info()
+            )
+        record = handler.prepare(record)
+
+        assert record.exc_info is None
+        assert "ValueError: boom" in record.exc_text
+
+
+class TestPipeline:
+    """Tests for the listener thread and JSON output."""
+
+    def test_json_records_are_written_off_thread(self, pipeline_logger):
+        logger, capture = pipeline_logger
+        memory = InMemorySpanExporter()
+        configure_tracing(memory, processor="simple")
+        try:
+            assert configure_log_pipeline(
+                json_format=True, use_queue=True, sampling={}, logger=logger
+            )
+            set_current_user_email("a@example.com")
+            with start_span("tools/call x") as span:
+                logger.info("Recorded %s", "op-1", extra={"document_id": "doc"})
+            set_current_user_email(None)
+            stop_log_pipeline()
+        finally:
+            configure_tracing(None)
+
+        (line,) = capture.lines
+        entry = json.loads(line)
+        assert entry["message"] == "Recorded op-1"
+        assert entry["level"] == "INFO"
+        assert entry["logger"] == "tests.log_pipeline"
+        assert entry["trace_id"] == span.trace_id
+        assert entry["span_id"] == span.span_id
+        assert entry["user_email"] == "a@example.com"
+        assert entry["document_id"] == "doc"
+        assert capture.threads[0] != threading.current_thread().name
+
+    def test_stop_restores_handlers(self, pipeline_logger):
+        logger, capture = pipeline_logger
+        original = list(logger.handlers)
+        configure_log_pipeline(
+            json_format=False, use_queue=True, sampling={}, logger=logger
+        )
+        assert capture not in logger.handlers
+        assert get_log_pipeline_stats()["queued"] is True
+
+        stop_log_pipeline()
+
+        assert logger.handlers == original
+        assert get_log_pipeline_stats()["queued"] is False
+
+    def test_sampling_without_queue(self, pipeline_logger):
+        logger, capture = pipeline_logger
+        assert not configure_log_pipeline(
+            json_format=False,
+            use_queue=False,
+            sampling={logger.name: 0.0},
+            logger=logger,
+        )
+
+        logger.info("dropped")
+        logger.warning("kept")
+
+        assert capture.lines == ["kept"]
+        assert get_log_pipeline_stats()["sampled_out"] >= 1
+
+
+class TestJsonFormatter:
+    """Tests for JSON formatting outside the queue."""
+
+    def test_formats_exception(self):
+        try:
+            raise RuntimeError("bad")
+        except RuntimeError:
+            record = logging.LogRecord(
+                "x", logging.ERROR, __file__, 1, "oops", (), sys.exc_info()
+            )
+
+        entry = json.loads(JsonLogFormatter().format(record))
+
+        assert entry["message"] == "oops"
+        assert "RuntimeError: bad" in entry["exception"]
+        assert "trace_id" not in entry
+
+
+class TestEnhancedFormatter:
+    """Tests for the console formatter fast path."""
+
+    def test_rewrites_startup_messages_only(self):
+        formatter = EnhancedLogFormatter(use_colors=False)
+        message = "Tool tier filtering: removed 3 tools, 10 enabled"
+
+        assert formatter.format(_record("core.tool_registry", msg=message)) == (
+            "[REGISTRY] Tool filtering complete: 10 tools enabled (3 filtered out)"
+        )
+        assert formatter.format(_record("gdocs.docs_tools", msg=message)) == (
+            f"[DOCS] {message}"
+        )
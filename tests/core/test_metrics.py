@@ -0,0 +1,172 @@
+"""Tests for Prometheus metrics collection and rendering."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+from google.oauth2.credentials import Credentials
+
+from auth import credential_store
+from auth.credential_store import LocalDirectoryCredentialStore
+from auth.discovery_documents import build_service
+from core import async_http
+from core.async_http import execute_async
+from core.metrics import (
+    API_REQUESTS,
+    TOOL_API_REQUESTS,
+    TOOL_DURATION,
+    TOOL_IN_FLIGHT,
+    MetricsRegistry,
+    render_metrics,
+    track_tool_call,
+)
+from core.utils import handle_http_errors
+
+
+@pytest.fixture
+def google():
+    def handler(request):
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404, json={"error": {"message": "not found"}})
+        return httpx.Response(200, json={"id": "abc"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch.object(async_http, "_get_client", return_value=client):
+        yield
+
+
+def _drive():
+    return build_service("drive", "v3", Credentials(token="ya29.valid"))
+
+
+class TestRegistry:
+    """Tests for the text exposition format."""
+
+    def test_counter_and_gauge(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests.", ("status",))
+        gauge = registry.gauge("in_flight", "In flight.")
+        counter.inc("200")
+        counter.inc("200", amount=2)
+        gauge.inc()
+
+        text = registry.render()
+
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{status="200"} 3' in text
+        assert "in_flight 1" in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency", "Latency.", buckets=(0.1, 1))
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value)
+
+        text = registry.render()
+
+        assert 'latency_bucket{le="0.1"} 2' in text
+        assert 'latency_bucket{le="1"} 3' in text
+        assert 'latency_bucket{le="+Inf"} 4' in text
+        assert "latency_count 4" in text
+        assert "latency_sum 3.65" in text
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.counter("c", "C.", ("tool",)).inc('say "hi"\n')
+
+        assert 'c{tool="say \\"hi\\"\\n"} 1' in registry.render()
+
+    def test_wrong_label_count_raises(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("c", "C.", ("a", "b"))
+
+        with pytest.raises(ValueError):
+            counter.inc("only-one")
+
+    def test_failing_collector_is_skipped(self):
+        registry = MetricsRegistry()
+        registry.counter("ok_total", "OK.").inc()
+
+        def broken():
+            raise RuntimeError("boom")
+
+        registry.add_collector(broken)
+
+        assert "ok_total 1" in registry.render()
+
+
+class TestCollection:
+    """Tests for measurements taken by tools and the HTTP layer."""
+
+    async def test_tool_calls_are_measured(self, google):
+        @handle_http_errors("metrics_test_tool", service_type="drive")
+        async def tool():
+            drive = _drive()
+            await execute_async(drive.files().get(fileId="abc"))
+            await execute_async(drive.files().get(fileId="abc"))
+            return "ok"
+
+        before = TOOL_DURATION.get_count("metrics_test_tool", "drive", "success")
+        await tool()
+
+        assert (
+            TOOL_DURATION.get_count("metrics_test_tool", "drive", "success")
+            == before + 1
+        )
+        assert TOOL_IN_FLIGHT.get("metrics_test_tool") == 0
+        text = render_metrics()
+        assert (
+            'workspace_mcp_tool_api_requests_bucket{tool="metrics_test_tool",le="2"} 1'
+            in text
+        )
+
+    async def test_failed_tool_outcome(self):
+        @handle_http_errors("metrics_failing_tool")
+        async def tool():
+            raise ValueError("bad")
+
+        with pytest.raises(Exception):
+            await tool()
+
+        assert TOOL_DURATION.get_count("metrics_failing_tool", "none", "error") == 1
+
+    async def test_api_requests_by_method_and_status(self, google):
+        drive = _drive()
+        before_ok = API_REQUESTS.get("drive", "drive.files.get", "200")
+        before_missing = API_REQUESTS.get("drive", "drive.files.get", "404")
+
+        await execute_async(drive.files().get(fileId="abc"))
+        with pytest.raises(Exception):
+            await execute_async(drive.files().get(fileId="missing"))
+
+        assert API_REQUESTS.get("drive", "drive.files.get", "200") == before_ok + 1
+        assert API_REQUESTS.get("drive", "drive.files.get", "404") == before_missing + 1
+
+    def test_tool_call_without_requests_is_recorded(self):
+        with track_tool_call("nested_tool"):
+            pass
+
+        assert TOOL_API_REQUESTS.get_count("nested_tool") == 1
+
+    def test_component_stats_are_exported(self):
+        text = render_metrics()
+
+        for name in (
+            "workspace_mcp_cache_hit_ratio",
+            "workspace_mcp_token_refreshes_total",
+            "workspace_mcp_google_api_retries_total",
+            "workspace_mcp_rate_limit_wait_seconds_total",
+            "workspace_mcp_executor_queue_depth",
+        ):
+            assert f"# TYPE {name}" in text
+
+    def test_credential_cache_is_exported(self, tmp_path):
+        store = LocalDirectoryCredentialStore(str(tmp_path))
+        store.store_credential("user@example.com", Credentials(token="ya29.token"))
+        store.get_credential("user@example.com")
+
+        with patch.object(credential_store, "_credential_store", store):
+            text = render_metrics()
+
+        assert 'workspace_mcp_cache_hits_total{cache="credentials"} 1' in text
+
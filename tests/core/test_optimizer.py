@@ -0,0 +1,178 @@
+"""Tests for ToolOptimizer embedding and hybrid search."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("sentence_transformers")
+
+from core import optimizer  # noqa: E402
+from core.optimizer import ToolOptimizer  # noqa: E402
+
+
+class FakeModel:
+    loads = 0
+    encoded: list = []
+
+    def __init__(self, name):
+        FakeModel.loads += 1
+
+    def encode(self, texts, convert_to_numpy=True):
+        FakeModel.encoded.extend(texts)
+        return np.array(
+            [[len(text), sum(map(ord, text)) % 97, 1.0] for text in texts],
+            dtype=np.float32,
+        )
+
+
+def _tools(**descriptions):
+    return {
+        name: {"name": name, "description": description, "service": "docs"}
+        for name, description in descriptions.items()
+    }
+
+
+@pytest.fixture(autouse=True)
+def fake_model(monkeypatch):
+    monkeypatch.setattr(optimizer, "SentenceTransformer", FakeModel)
+    FakeModel.loads = 0
+    FakeModel.encoded = []
+
+
+def _start(cache_dir, tools, search_mode="semantic"):
+    tool_optimizer = ToolOptimizer(cache_dir=str(cache_dir), search_mode=search_mode)
+    tool_optimizer.initialize(tools, {})
+    return tool_optimizer
+
+
+class TestEmbeddingCache:
+    """Tests for reusing tool embeddings across starts."""
+
+    def test_unchanged_tools_start_without_the_model(self, tmp_path):
+        tools = _tools(create_doc="Create a doc.", get_doc="Read a doc.")
+        first = _start(tmp_path, tools)
+        FakeModel.loads = 0
+
+        second = _start(tmp_path, tools)
+
+        assert FakeModel.loads == 0
+        assert isinstance(second.embeddings, np.memmap)
+        np.testing.assert_array_equal(second.embeddings, first.embeddings)
+
+    def test_only_new_or_changed_tools_are_encoded(self, tmp_path):
+        first = _start(tmp_path, _tools(create_doc="Create a doc.", get_doc="Read a doc."))
+        FakeModel.encoded = []
+
+        second = _start(
+            tmp_path,
+            _tools(get_doc="Read a doc.", create_doc="Create a blank doc.", new="New."),
+        )
+
+        assert FakeModel.encoded == ["create_doc: Create a blank doc.", "new: New."]
+        np.testing.assert_array_equal(second.embeddings[0], first.embeddings[1])
+        assert len(list(tmp_path.glob("*.npy"))) == 1
+
+    def test_first_search_loads_the_model(self, tmp_path):
+        tools = _tools(create_doc="Create a doc.", get_doc="Read a doc.")
+        _start(tmp_path, tools)
+        tool_optimizer = _start(tmp_path, tools)
+
+        results = tool_optimizer.find_similar_tools("create_doc: Create a doc.", 1)
+
+        assert FakeModel.loads == 2
+        assert results[0]["name"] == "create_doc"
+
+    def test_other_model_or_corrupt_cache_is_ignored(self, tmp_path):
+        tools = _tools(create_doc="Create a doc.")
+        _start(tmp_path, tools)
+        for path in tmp_path.glob("*.npy"):
+            path.write_bytes(b"garbage")
+        FakeModel.encoded = []
+
+        _start(tmp_path, tools)
+        ToolOptimizer(model_name="other-model", cache_dir=str(tmp_path)).initialize(
+            tools, {}
+        )
+
+        assert FakeModel.encoded == ["create_doc: Create a doc."] * 2
+
+
+class TestSearch:
+    """Tests for top-k search and the query embedding cache."""
+
+    @pytest.fixture
+    def tool_optimizer(self, tmp_path):
+        return _start(
+            tmp_path,
+            _tools(
+                create_doc="Create a doc.",
+                get_doc="Read a doc.",
+                send_message="Send an email message.",
+                list_events="List calendar events.",
+            ),
+        )
+
+    def test_matches_full_cosine_ranking(self, tool_optimizer):
+        query = "create a new document"
+        query_vector = FakeModel("").encode([query])[0]
+        similarities = tool_optimizer.embeddings @ query_vector / (
+            np.linalg.norm(tool_optimizer.embeddings, axis=1)
+            * np.linalg.norm(query_vector)
+        )
+        expected = [tool_optimizer.tool_names[i] for i in np.argsort(-similarities)[:3]]
+
+        results = tool_optimizer.find_similar_tools(query, 3)
+
+        assert [result["name"] for result in results] == expected
+        assert [result["score"] for result in results] == pytest.approx(
+            sorted(similarities, reverse=True)[:3], rel=1e-5
+        )
+
+    def test_top_k_is_bounded(self, tool_optimizer):
+        assert len(tool_optimizer.find_similar_tools("doc", 50)) == 4
+        assert tool_optimizer.find_similar_tools("doc", 0) == []
+
+    def test_batched_search_matches_single_queries(self, tool_optimizer):
+        queries = ["send email", "calendar", "send email"]
+        FakeModel.encoded = []
+
+        batched = tool_optimizer.find_similar_tools_many(queries, 2)
+
+        assert FakeModel.encoded == ["send email", "calendar"]
+        for query, results in zip(queries, batched):
+            single = tool_optimizer.find_similar_tools(query, 2)
+            assert [r["name"] for r in results] == [r["name"] for r in single]
+            assert [r["score"] for r in results] == pytest.approx(
+                [r["score"] for r in single]
+            )
+
+    def test_repeated_queries_are_not_re_encoded(self, tool_optimizer):
+        tool_optimizer.find_similar_tools("read a doc")
+        FakeModel.encoded = []
+
+        tool_optimizer.find_similar_tools("read a doc")
+
+        assert FakeModel.encoded == []
+
+
+class TestHybridSearch:
+    """Tests for blending embedding and BM25 scores."""
+
+    def test_blends_cosine_and_scaled_bm25(self, tmp_path):
+        tools = _tools(
+            create_doc="Create a doc.",
+            send_message="Send an email message.",
+            list_events="List calendar events.",
+        )
+        semantic = _start(tmp_path, tools)
+        hybrid = _start(tmp_path, tools, search_mode="hybrid")
+        weight = optimizer.SEMANTIC_WEIGHT
+
+        cosine = {r["name"]: r["score"] for r in semantic.find_similar_tools("calendar")}
+        blended = {r["name"]: r["score"] for r in hybrid.find_similar_tools("calendar")}
+
+        assert blended["list_events"] == pytest.approx(
+            weight * cosine["list_events"] + (1 - weight), rel=1e-5
+        )
+        assert blended["create_doc"] == pytest.approx(
+            weight * cosine["create_doc"], rel=1e-5
+        )
@@ -0,0 +1,184 @@
+"""Tests for per-user, per-API request pacing."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from core import rate_limit
+from core.cache import TTLCache
+from core.context import set_current_user_email
+from core.rate_limit import RateLimiter, TokenBucket, api_for_uri
+from core.retry import retry_budget
+
+
+class TestApiForUri:
+    """Tests for attributing request URIs to APIs."""
+
+    @pytest.mark.parametrize(
+        "uri,api",
+        [
+            ("https://sheets.googleapis.com/v4/spreadsheets/abc", "sheets"),
+            ("https://gmail.googleapis.com/gmail/v1/users/me/messages", "gmail"),
+            ("https://www.googleapis.com/drive/v3/files?q=x", "drive"),
+            ("https://www.googleapis.com/upload/drive/v3/files", "drive"),
+            ("https://www.googleapis.com/calendar/v3/calendars", "calendar"),
+            ("https://example.com/drive/v3/files", None),
+        ],
+    )
+    def test_api_for_uri(self, uri, api):
+        assert api_for_uri(uri) == api
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_up_to_capacity_is_free(self):
+        bucket = TokenBucket(rate_per_minute=600)
+
+        assert all(bucket.reserve() == 0 for _ in range(60))
+        assert bucket.reserve() > 0
+
+    @pytest.mark.parametrize("quota", [1, 60, 600, 12000])
+    def test_first_minute_admits_about_the_quota(self, quota):
+        """A new bucket's burst plus a minute of refill stays near the quota."""
+        bucket = TokenBucket(rate_per_minute=quota)
+
+        admitted = 0
+        while bucket.reserve() < 60:
+            admitted += 1
+
+        assert quota <= admitted <= max(quota * 1.1, quota + 1) + 1
+
+    def test_waits_grow_once_empty(self):
+        """Callers past the burst are spaced at the refill rate, in order."""
+        bucket = TokenBucket(rate_per_minute=60, capacity=1)
+        bucket.reserve()
+
+        first = bucket.reserve()
+        second = bucket.reserve()
+
+        assert first == pytest.approx(1.0, abs=0.05)
+        assert second == pytest.approx(2.0, abs=0.05)
+
+    def test_refund(self):
+        bucket = TokenBucket(rate_per_minute=60, capacity=1)
+        bucket.reserve()
+        bucket.refund()
+
+        assert bucket.reserve() == 0
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate_per_minute=0)
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    async def test_paces_requests_beyond_quota(self):
+        limiter = RateLimiter(limits={"sheets": 600}, enabled=True)
+        limiter._bucket("a@example.com", "sheets").capacity = 1
+        limiter._bucket("a@example.com", "sheets")._tokens = 1
+
+        started = time.monotonic()
+        waits = [
+            await limiter.acquire("sheets", user="a@example.com") for _ in range(3)
+        ]
+
+        assert waits[0] == 0
+        # 600/minute = one request every 0.1s
+        assert time.monotonic() - started == pytest.approx(0.2, abs=0.08)
+        stats = limiter.get_stats()
+        assert stats["apis"]["sheets"]["requests"] == 3
+        assert stats["apis"]["sheets"]["throttled"] == 2
+        assert stats["wait_seconds"] > 0
+
+    async def test_buckets_are_per_user(self):
+        limiter = RateLimiter(limits={"sheets": 1}, enabled=True)
+
+        assert await limiter.acquire("sheets", user="a@example.com") == 0
+        assert await limiter.acquire("sheets", user="b@example.com") == 0
+        assert limiter.get_stats()["buckets"] == 2
+
+    async def test_user_comes_from_context(self):
+        limiter = RateLimiter(limits={"sheets": 1}, enabled=True)
+        set_current_user_email("ctx@example.com")
+        try:
+            await limiter.acquire("sheets")
+        finally:
+            set_current_user_email(None)
+
+        assert limiter._buckets.get(("ctx@example.com", "sheets")) is not None
+
+    async def test_busy_bucket_outlives_ttl(self):
+        """Only idle buckets expire, so a busy user never gets a fresh burst."""
+        limiter = RateLimiter(limits={"sheets": 600}, enabled=True)
+        limiter._buckets = TTLCache(maxsize=10, ttl=0.1)
+        bucket = limiter._bucket("a@example.com", "sheets")
+
+        for _ in range(4):
+            await asyncio.sleep(0.05)
+            await limiter.acquire("sheets", user="a@example.com")
+
+        assert limiter._bucket("a@example.com", "sheets") is bucket
+
+    async def test_write_limit_is_separate(self):
+        limiter = RateLimiter(limits={"docs": 1, "docs.write": 1}, enabled=True)
+
+        assert await limiter.acquire("docs", "GET", user="a@example.com") == 0
+        assert await limiter.acquire("docs", "POST", user="a@example.com") == 0
+
+    async def test_unconfigured_and_disabled_are_free(self):
+        limiter = RateLimiter(limits={"sheets": 1}, enabled=True)
+        assert await limiter.acquire("tasks", user="a@example.com") == 0
+        assert await limiter.acquire(None) == 0
+
+        disabled = RateLimiter(limits={"sheets": 1}, enabled=False)
+        for _ in range(3):
+            assert await disabled.acquire("sheets", user="a@example.com") == 0
+
+    async def test_cancelled_wait_refunds_token(self):
+        limiter = RateLimiter(limits={"sheets": 60}, enabled=True)
+        bucket = limiter._bucket("a@example.com", "sheets")
+        bucket._tokens = 0
+
+        task = asyncio.create_task(limiter.acquire("sheets", user="a@example.com"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert bucket._tokens > -0.5
+
+
+class TestConfiguration:
+    """Tests for limit configuration."""
+
+    def test_env_overrides(self, monkeypatch):
+        monkeypatch.setenv("WORKSPACE_MCP_RATE_LIMITS", "sheets=120, tasks=30,bad")
+
+        limits = rate_limit.configured_rate_limits()
+
+        assert limits["sheets"] == 120
+        assert limits["tasks"] == 30
+        assert limits["gmail"] == rate_limit.DEFAULT_RATE_LIMITS["gmail"]
+
+    async def test_acquire_for_request_skips_non_requests(self):
+        assert await rate_limit.acquire_for_request(SimpleNamespace()) == (None, 0.0)
+
+    async def test_acquire_for_request_records_wait_on_retry_budget(self, monkeypatch):
+        limiter = RateLimiter(limits={"sheets": 600}, enabled=True)
+        limiter._bucket("anonymous", "sheets")._tokens = 0
+        monkeypatch.setattr(rate_limit, "_rate_limiter", limiter)
+        request = SimpleNamespace(
+            uri="https://sheets.googleapis.com/v4/spreadsheets/abc", method="GET"
+        )
+
+        with retry_budget("read_sheet_values") as budget:
+            api, waited = await rate_limit.acquire_for_request(request)
+
+        assert api == "sheets"
+        assert waited > 0
+        assert budget.paced_seconds == waited
@@ -0,0 +1,236 @@
+"""Tests for the validated GET response cache."""
+
+import os
+from unittest.mock import patch
+
+import httpx
+import pytest
+from google.oauth2.credentials import Credentials
+
+from auth.discovery_documents import build_service
+from core import async_http
+from core.async_http import execute_async
+from core.context import set_current_user_email
+from core.response_cache import (
+    DRIVE_VERSION,
+    INLINE_REVISION,
+    CachedResponse,
+    ResponseCache,
+    revision_source,
+)
+
+
+class _FakeGoogle:
+    """Serves Docs, Sheets, Drive and Calendar GETs with changeable revisions."""
+
+    def __init__(self):
+        self.requests = []
+        self.doc_revision = "rev-1"
+        self.sheet_version = "7"
+        self.calendar_etag = '"etag-1"'
+        self.drive_probe_status = 200
+
+    def handler(self, request):
+        url = request.url
+        self.requests.append((url.host, url.path, dict(url.params)))
+        if url.host == "docs.googleapis.com":
+            if url.params.get("fields") == "revisionId":
+                return httpx.Response(200, json={"revisionId": self.doc_revision})
+            return httpx.Response(
+                200,
+                json={"documentId": "doc1", "revisionId": self.doc_revision},
+            )
+        if url.host == "sheets.googleapis.com":
+            return httpx.Response(200, json={"spreadsheetId": "s1", "v": 1})
+        if url.path.startswith("/drive/v3/files/"):
+            if self.drive_probe_status != 200:
+                return httpx.Response(self.drive_probe_status, json={})
+            return httpx.Response(200, json={"version": self.sheet_version})
+        if url.path.startswith("/calendar/v3/"):
+            if request.headers.get("if-none-match") == self.calendar_etag:
+                return httpx.Response(304)
+            return httpx.Response(
+                200, json={"items": []}, headers={"ETag": self.calendar_etag}
+            )
+        return httpx.Response(404)
+
+    def full_fetches(self, host):
+        return [r for r in self.requests if r[0] == host and "fields" not in r[2]]
+
+
+@pytest.fixture
+def google():
+    fake = _FakeGoogle()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(fake.handler))
+    with patch.object(async_http, "_get_client", return_value=client):
+        yield fake
+
+
+@pytest.fixture
+def cache():
+    fresh = ResponseCache(max_bytes=1024 * 1024, disk_dir=None)
+    with patch.object(async_http, "get_response_cache", return_value=fresh):
+        yield fresh
+
+
+@pytest.fixture
+def user():
+    set_current_user_email("a@example.com")
+    yield "a@example.com"
+    set_current_user_email(None)
+
+
+def _service(name, version):
+    return build_service(name, version, Credentials(token="ya29.valid"))
+
+
+class TestRevisionSource:
+    """Tests for choosing how a URI is revalidated."""
+
+    def test_docs_use_inline_revision(self):
+        source = revision_source(
+            "https://docs.googleapis.com/v1/documents/doc1?includeTabsContent=true"
+        )
+
+        assert source.kind == INLINE_REVISION
+        assert source.probe_uri == (
+            "https://docs.googleapis.com/v1/documents/doc1?fields=revisionId"
+        )
+
+    def test_sheets_use_drive_version(self):
+        source = revision_source(
+            "https://sheets.googleapis.com/v4/spreadsheets/s1/values/A1%3AB2"
+        )
+
+        assert source.kind == DRIVE_VERSION
+        assert source.file_id == "s1"
+        assert "/drive/v3/files/s1?fields=version" in source.probe_uri
+
+    @pytest.mark.parametrize(
+        "uri",
+        [
+            "https://forms.googleapis.com/v1/forms/f1/responses",
+            "https://www.googleapis.com/calendar/v3/users/me/calendarList",
+        ],
+    )
+    def test_other_uris_have_no_revision(self, uri):
+        assert revision_source(uri) is None
+
+
+class TestResponseCache:
+    """Tests for the cache tiers."""
+
+    def test_lru_eviction_by_bytes(self):
+        cache = ResponseCache(max_bytes=4000, max_entry_bytes=4000, disk_dir=None)
+        for key in ("a", "b", "c"):
+            cache.set(key, CachedResponse({"status": "200"}, b"x" * 800, etag="e"))
+        cache.get("a")
+        cache.set("d", CachedResponse({"status": "200"}, b"x" * 800, etag="e"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get_stats()["memory_bytes"] <= 4000
+
+    def test_oversized_entries_are_not_cached(self):
+        cache = ResponseCache(max_bytes=3000, max_entry_bytes=1000, disk_dir=None)
+
+        assert cache.set("a", CachedResponse({}, b"x" * 2000, etag="e")) is False
+        assert cache.get("a") is None
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        disk_dir = str(tmp_path / "responses")
+        first = ResponseCache(disk_dir=disk_dir)
+        first.set(
+            ("a@example.com", "uri"),
+            CachedResponse({"status": "200"}, b"body", etag='"e"'),
+        )
+
+        second = ResponseCache(disk_dir=disk_dir)
+        entry = second.get(("a@example.com", "uri"))
+
+        assert entry.content == b"body"
+        assert entry.etag == '"e"'
+        assert second.get_stats()["disk_hits"] == 1
+        assert os.stat(disk_dir).st_mode & 0o777 == 0o700
+        for name in os.listdir(disk_dir):
+            assert os.stat(os.path.join(disk_dir, name)).st_mode & 0o777 == 0o600
+
+    def test_disk_tier_evicts_oldest(self, tmp_path):
+        cache = ResponseCache(disk_dir=str(tmp_path), disk_max_bytes=1500)
+        for key in ("a", "b", "c"):
+            cache.set(key, CachedResponse({}, b"x" * 600, etag="e"))
+
+        assert len(os.listdir(tmp_path)) == 2
+        assert cache.get_stats()["disk_bytes"] <= 1500
+
+
+class TestExecuteAsyncCaching:
+    """Tests for cached GETs through execute_async."""
+
+    async def test_docs_served_from_cache_while_revision_unchanged(
+        self, google, cache, user
+    ):
+        docs = _service("docs", "v1")
+
+        first = await execute_async(docs.documents().get(documentId="doc1"))
+        second = await execute_async(docs.documents().get(documentId="doc1"))
+
+        assert first == second
+        assert len(google.full_fetches("docs.googleapis.com")) == 1
+        assert cache.get_stats()["revision_hits"] == 1
+
+        google.doc_revision = "rev-2"
+        third = await execute_async(docs.documents().get(documentId="doc1"))
+
+        assert third["revisionId"] == "rev-2"
+        assert len(google.full_fetches("docs.googleapis.com")) == 2
+        assert cache.get_stats()["stale"] == 1
+
+    async def test_sheets_cached_after_second_read(self, google, cache, user):
+        sheets = _service("sheets", "v4")
+
+        for _ in range(3):
+            await execute_async(sheets.spreadsheets().get(spreadsheetId="s1"))
+
+        # First read is not cached; second probes then fetches; third is a hit
+        assert len(google.full_fetches("sheets.googleapis.com")) == 2
+        assert cache.get_stats()["revision_hits"] == 1
+
+    async def test_refused_drive_probe_falls_back_to_fetch(self, google, cache, user):
+        sheets = _service("sheets", "v4")
+        google.drive_probe_status = 403
+
+        for _ in range(3):
+            result = await execute_async(sheets.spreadsheets().get(spreadsheetId="s1"))
+
+        assert result["spreadsheetId"] == "s1"
+        assert len(google.full_fetches("sheets.googleapis.com")) == 3
+        drive_probes = [r for r in google.requests if r[1].startswith("/drive/")]
+        assert len(drive_probes) == 1
+
+    async def test_etag_revalidation(self, google, cache, user):
+        calendar = _service("calendar", "v3")
+
+        await execute_async(calendar.calendarList().list())
+        result = await execute_async(calendar.calendarList().list())
+
+        assert result == {"items": []}
+        assert cache.get_stats()["etag_hits"] == 1
+
+    async def test_not_cached_without_user(self, google, cache):
+        docs = _service("docs", "v1")
+
+        for _ in range(2):
+            await execute_async(docs.documents().get(documentId="doc1"))
+
+        assert len(google.full_fetches("docs.googleapis.com")) == 2
+        assert cache.get_stats()["memory_entries"] == 0
+
+    async def test_entries_are_per_user(self, google, cache, user):
+        docs = _service("docs", "v1")
+        await execute_async(docs.documents().get(documentId="doc1"))
+
+        set_current_user_email("b@example.com")
+        await execute_async(docs.documents().get(documentId="doc1"))
+
+        assert len(google.full_fetches("docs.googleapis.com")) == 2
@@ -0,0 +1,185 @@
+"""Tests for the Google API request retry policy."""
+
+import email.utils
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+from google.oauth2.credentials import Credentials
+from googleapiclient.errors import HttpError
+
+from auth.discovery_documents import build_service
+from core import async_http, retry
+from core.async_http import execute_async
+from core.retry import (
+    backoff_delay,
+    get_retry_budget,
+    get_retry_stats,
+    is_retryable,
+    parse_retry_after,
+    retry_budget,
+)
+from core.utils import handle_http_errors
+
+RATE_LIMIT_403 = b'{"error": {"errors": [{"reason": "userRateLimitExceeded"}]}}'
+
+
+@pytest.fixture
+def drive_service():
+    return build_service("drive", "v3", Credentials(token="ya29.valid"))
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    """Record backoff delays instead of sleeping."""
+    delays = []
+
+    async def fake_sleep(delay, status, uri):
+        delays.append(delay)
+
+    with patch.object(async_http, "sleep_before_retry", side_effect=fake_sleep):
+        yield delays
+
+
+def _responses(handler_statuses, headers=None, body=b"{}"):
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        status = handler_statuses[min(len(calls) - 1, len(handler_statuses) - 1)]
+        if status == 200:
+            return httpx.Response(200, json={"id": "abc"})
+        return httpx.Response(status, content=body, headers=headers or {})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return calls, patch.object(async_http, "_get_client", return_value=client)
+
+
+class TestRetryPolicy:
+    """Tests for the retry decision helpers."""
+
+    @pytest.mark.parametrize(
+        "status,content,method,read_only,expected",
+        [
+            (429, b"", "POST", False, True),
+            (403, RATE_LIMIT_403, "POST", False, True),
+            (403, b'{"error": "forbidden"}', "GET", True, False),
+            (503, b"", "GET", False, True),
+            (503, b"", "DELETE", False, True),
+            (503, b"", "POST", False, False),
+            (503, b"", "POST", True, True),
+            (400, b"", "GET", True, False),
+            (404, b"", "GET", True, False),
+        ],
+    )
+    def test_is_retryable(self, status, content, method, read_only, expected):
+        assert is_retryable(status, content, method, read_only) is expected
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        future = email.utils.formatdate(time.time() + 10, usegmt=True)
+        assert 8 <= parse_retry_after(future) <= 10
+
+    def test_backoff_has_full_jitter_and_cap(self):
+        delays = [backoff_delay(3, base_delay=1, max_delay=5) for _ in range(200)]
+
+        assert all(0 <= d <= 5 for d in delays)
+        assert max(delays) - min(delays) > 1
+
+
+class TestExecuteAsyncRetries:
+    """Tests for retries applied by execute_async."""
+
+    async def test_retries_server_error_for_get(self, drive_service, no_sleep):
+        calls, client = _responses([503, 503, 200])
+
+        with client:
+            result = await execute_async(drive_service.files().get(fileId="abc"))
+
+        assert result == {"id": "abc"}
+        assert len(calls) == 3
+        assert len(no_sleep) == 2
+
+    async def test_does_not_retry_server_error_for_write(self, drive_service, no_sleep):
+        calls, client = _responses([503, 200])
+
+        with client, pytest.raises(HttpError):
+            await execute_async(drive_service.files().create(body={"name": "x"}))
+
+        assert calls == ["POST"]
+
+    async def test_retries_rate_limited_write(self, drive_service, no_sleep):
+        """Quota rejections are safe to resend even for writes."""
+        calls, client = _responses([403, 200], body=RATE_LIMIT_403)
+
+        with client:
+            await execute_async(drive_service.files().create(body={"name": "x"}))
+
+        assert calls == ["POST", "POST"]
+
+    async def test_honours_retry_after(self, drive_service, no_sleep):
+        calls, client = _responses([429, 200], headers={"Retry-After": "3"})
+
+        with client:
+            await execute_async(drive_service.files().get(fileId="abc"))
+
+        assert no_sleep == [3.0]
+
+    async def test_long_retry_after_is_not_waited(self, drive_service, no_sleep):
+        calls, client = _responses([429, 200], headers={"Retry-After": "3600"})
+
+        with client, pytest.raises(HttpError):
+            await execute_async(drive_service.files().get(fileId="abc"))
+
+        assert no_sleep == []
+
+    async def test_gives_up_after_max_attempts(self, drive_service):
+        calls, client = _responses([503])
+
+        with client, pytest.raises(HttpError):
+            await execute_async(drive_service.files().get(fileId="abc"))
+
+        assert len(calls) == retry.RETRY_MAX_ATTEMPTS
+
+    async def test_budget_is_shared_across_requests(self, drive_service):
+        """A tool call cannot retry more than its budget across all its requests."""
+        calls, client = _responses([503])
+
+        with client, retry_budget("bulk_tool", read_only=True) as budget:
+            budget.remaining = 2
+            for _ in range(2):
+                with pytest.raises(HttpError):
+                    await execute_async(drive_service.files().get(fileId="abc"))
+
+        # 2 first attempts + 2 budgeted retries
+        assert len(calls) == 4
+        assert budget.used == 2
+        assert get_retry_stats()["tools"]["bulk_tool"]["retries"] >= 2
+
+    async def test_read_only_tool_retries_post(self, drive_service, no_sleep):
+        calls, client = _responses([500, 200])
+
+        with client, retry_budget("read_tool", read_only=True):
+            await execute_async(drive_service.files().create(body={"name": "x"}))
+
+        assert calls == ["POST", "POST"]
+
+
+class TestHandleHttpErrorsBudget:
+    """handle_http_errors gives each tool call its own budget."""
+
+    async def test_budget_set_for_call_and_reset_after(self):
+        seen = {}
+
+        @handle_http_errors("my_tool", is_read_only=True)
+        async def tool():
+            seen["budget"] = get_retry_budget()
+            return "ok"
+
+        assert await tool() == "ok"
+        assert seen["budget"].tool_name == "my_tool"
+        assert seen["budget"].read_only is True
+        assert get_retry_budget() is None
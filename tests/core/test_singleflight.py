@@ -0,0 +1,173 @@
+"""Tests for coalescing identical concurrent read-only tool calls."""
+
+import asyncio
+import inspect
+from unittest.mock import patch
+
+import pytest
+
+from core import singleflight
+from core.singleflight import SingleFlight, call_key
+from core.utils import handle_http_errors
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    async def test_concurrent_calls_share_one_execution(self):
+        group = SingleFlight()
+        executions = []
+
+        async def fetch():
+            executions.append(1)
+            await asyncio.sleep(0.02)
+            return "content"
+
+        results = await asyncio.gather(*(group.do("k", fetch) for _ in range(5)))
+
+        assert results == ["content"] * 5
+        assert len(executions) == 1
+        assert group.get_stats() == {
+            "calls": 5,
+            "executions": 1,
+            "coalesced": 4,
+            "in_flight": 0,
+        }
+
+    async def test_sequential_calls_are_not_cached(self):
+        group = SingleFlight()
+        executions = []
+
+        async def fetch():
+            executions.append(1)
+            return len(executions)
+
+        assert await group.do("k", fetch) == 1
+        assert await group.do("k", fetch) == 2
+
+    async def test_exception_reaches_every_caller(self):
+        group = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            group.do("k", fail), group.do("k", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    async def test_one_caller_cancelling_does_not_cancel_others(self):
+        group = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return "content"
+
+        first = asyncio.create_task(group.do("k", fetch))
+        second = asyncio.create_task(group.do("k", fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == "content"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    async def test_call_cancelled_when_every_caller_leaves(self):
+        group = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.create_task(group.do("k", fetch))
+        await started.wait()
+        caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+        assert group.get_stats()["in_flight"] == 0
+
+
+class TestCallKey:
+    """Tests for building coalescing keys."""
+
+    @staticmethod
+    def _signature():
+        def tool(user_google_email: str, document_id: str, format: str = "plain"):
+            pass
+
+        return inspect.signature(tool)
+
+    def test_argument_style_does_not_matter(self):
+        sig = self._signature()
+
+        positional = call_key("get_doc", sig, ("a@example.com", "doc1"), {})
+        keyword = call_key(
+            "get_doc",
+            sig,
+            (),
+            {"document_id": "doc1", "user_google_email": "a@example.com"},
+        )
+        explicit_default = call_key(
+            "get_doc", sig, ("a@example.com", "doc1"), {"format": "plain"}
+        )
+
+        assert positional == keyword == explicit_default
+
+    def test_different_arguments_or_users_differ(self):
+        sig = self._signature()
+
+        assert call_key("get_doc", sig, ("a@example.com", "doc1"), {}) != call_key(
+            "get_doc", sig, ("b@example.com", "doc1"), {}
+        )
+        assert call_key("get_doc", sig, ("a@example.com", "doc1"), {}) != call_key(
+            "get_doc", sig, ("a@example.com", "doc2"), {}
+        )
+
+    def test_injected_credentials_are_never_shared(self):
+        with patch.object(
+            singleflight, "get_injected_oauth_credentials", return_value={"t": 1}
+        ):
+            assert call_key("get_doc", self._signature(), ("a", "b"), {}) is None
+
+
+class TestHandleHttpErrorsCoalescing:
+    """handle_http_errors coalesces read-only tools only."""
+
+    async def test_read_only_tool_is_coalesced(self):
+        executions = []
+
+        @handle_http_errors("read_sheet_values", is_read_only=True)
+        async def tool(user_google_email: str, spreadsheet_id: str):
+            executions.append(spreadsheet_id)
+            await asyncio.sleep(0.02)
+            return f"values of {spreadsheet_id}"
+
+        results = await asyncio.gather(
+            tool(user_google_email="a@example.com", spreadsheet_id="s1"),
+            tool("a@example.com", "s1"),
+            tool(user_google_email="a@example.com", spreadsheet_id="s2"),
+        )
+
+        assert results == ["values of s1", "values of s1", "values of s2"]
+        assert sorted(executions) == ["s1", "s2"]
+
+    async def test_write_tool_is_not_coalesced(self):
+        executions = []
+
+        @handle_http_errors("append_values")
+        async def tool(user_google_email: str, spreadsheet_id: str):
+            executions.append(spreadsheet_id)
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        await asyncio.gather(*(tool("a@example.com", "s1") for _ in range(3)))
+
+        assert len(executions) == 3
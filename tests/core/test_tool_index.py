@@ -0,0 +1,78 @@
+"""Tests for the lexical tool index and lexical optimizer search."""
+
+import pytest
+
+from core.optimizer import ToolOptimizer
+from core.tool_index import LexicalToolIndex, tokenize
+
+TOOLS = {
+    "send_gmail_message": {
+        "description": "Send an email message via Gmail.",
+        "inputSchema": {"properties": {"to": {}, "subject": {}, "body": {}}},
+    },
+    "list_calendar_events": {
+        "description": "List events from a Google Calendar.",
+        "inputSchema": {"properties": {"calendar_id": {}, "timeMin": {}}},
+    },
+    "create_doc": {
+        "description": "Create a new Google Doc.",
+        "inputSchema": {"properties": {"title": {}, "content": {}}},
+    },
+    "search_drive_files": {
+        "description": "Search for files in Google Drive.",
+        "inputSchema": {"properties": {"query": {}, "page_size": {}}},
+    },
+}
+
+
+class TestTokenize:
+    def test_splits_words_case_and_underscores(self):
+        assert tokenize("list_calendar_events timeMin HTMLParser") == [
+            "list", "calendar", "event", "time", "min", "html", "parser",
+        ]
+
+    def test_drops_stopwords_and_keeps_double_s(self):
+        assert tokenize("Send an email to the address") == ["send", "email", "address"]
+
+
+class TestLexicalToolIndex:
+    @pytest.fixture
+    def index(self):
+        return LexicalToolIndex(TOOLS)
+
+    def test_ranks_name_matches_first(self, index):
+        assert index.search("send an email")[0][0] == "send_gmail_message"
+        assert index.search("upcoming calendar events")[0][0] == "list_calendar_events"
+
+    def test_matches_parameter_names(self, index):
+        assert index.search("page size")[0][0] == "search_drive_files"
+
+    def test_unknown_terms_and_top_k(self, index):
+        assert index.search("spreadsheet") == []
+        assert len(index.search("google", 2)) == 2
+        assert index.search("google", 0) == []
+
+    def test_scores_are_descending(self, index):
+        scores = [score for _, score in index.search("google doc")]
+
+        assert scores == sorted(scores, reverse=True)
+        assert all(score > 0 for score in scores)
+
+
+class TestLexicalOptimizer:
+    def test_searches_without_embeddings(self, tmp_path):
+        optimizer = ToolOptimizer(cache_dir=str(tmp_path), search_mode="lexical")
+        optimizer.initialize(
+            {name: {"name": name, **tool} for name, tool in TOOLS.items()}, {}
+        )
+
+        results = optimizer.find_similar_tools_many(["create a document", "email"], 1)
+
+        assert optimizer.embedding_model is None
+        assert optimizer.embeddings is None
+        assert [r[0]["name"] for r in results] == ["create_doc", "send_gmail_message"]
+        assert results[0][0]["excerpt"] == "Create a new Google Doc."
+
+    def test_rejects_unknown_mode(self):
+        with pytest.raises(ValueError):
+            ToolOptimizer(search_mode="fuzzy")
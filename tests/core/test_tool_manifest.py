@@ -0,0 +1,195 @@
+"""Tests for the tool schema manifest."""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from fastmcp import FastMCP
+
+from core import lazy_tools, tool_manifest
+from core.tool_manifest import (
+    MANIFEST_FORMAT_VERSION,
+    build_manifest,
+    import_tool_modules,
+    load_manifest,
+    manifest_drift,
+    optimizer_definitions,
+    write_manifest,
+)
+
+MODULE = "manifest_fake_tools"
+HELPERS = "manifest_fake_helpers"
+
+# Like core.comments: defines tools on behalf of the module that calls it
+HELPERS_SOURCE = textwrap.dedent(
+    '''
+    from core import lazy_tools
+
+
+    def create_helper_tools():
+        @lazy_tools._server.tool()
+        async def helper() -> str:
+            """Registered by a factory."""
+            return "helper"
+    '''
+)
+
+SOURCE = textwrap.dedent(
+    '''
+    from core import lazy_tools
+    from manifest_fake_helpers import create_helper_tools
+
+
+    @lazy_tools._server.tool()
+    async def greet(name: str, excited: bool = False) -> str:
+        """Say hello to someone."""
+        return f"hello {name}" + ("!" if excited else "")
+
+
+    @lazy_tools._server.tool()
+    async def wave() -> str:
+        """Wave."""
+        return "wave"
+
+
+    create_helper_tools()
+    '''
+)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def manifest(tmp_path, monkeypatch):
+    (tmp_path / f"{MODULE}.py").write_text(SOURCE)
+    (tmp_path / f"{HELPERS}.py").write_text(HELPERS_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setitem(tool_manifest.TOOL_MODULES, "fake", MODULE)
+    monkeypatch.setitem(tool_manifest._MODULE_SERVICES, MODULE, "fake")
+    monkeypatch.setattr(tool_manifest, "_tool_tiers", lambda: {"greet": "core"})
+    server = FastMCP("source")
+    monkeypatch.setattr(lazy_tools, "_server", server)
+
+    @server.tool()
+    def outside() -> str:
+        """Registered outside the service modules, like start_google_auth."""
+        return "outside"
+
+    tool_modules = import_tool_modules(server, [MODULE])
+    sys.modules.pop(MODULE)
+    sys.modules.pop(HELPERS)
+    return build_manifest(server, tool_modules)
+
+
+class TestManifest:
+    """Tests for building, writing and reading the manifest."""
+
+    def test_build_captures_schemas_services_and_tiers(self, manifest):
+        greet, helper, wave = manifest["tools"]
+
+        assert manifest["format_version"] == MANIFEST_FORMAT_VERSION
+        assert greet["name"] == "greet"
+        assert greet["service"] == "fake"
+        assert greet["module"] == MODULE
+        assert greet["tier"] == "core"
+        assert greet["description"] == "Say hello to someone."
+        assert greet["parameters"]["required"] == ["name"]
+        assert wave["tier"] is None
+        # Attributed to the module being imported, not the factory's module
+        assert helper["module"] == MODULE
+        assert helper["service"] == "fake"
+
+    def test_tools_registered_outside_service_modules_are_skipped(self, manifest):
+        assert [tool["name"] for tool in manifest["tools"]] == [
+            "greet",
+            "helper",
+            "wave",
+        ]
+
+    def test_round_trip(self, manifest, tmp_path):
+        path = tmp_path / "manifest.json"
+        write_manifest(manifest, path)
+
+        assert load_manifest(path) == manifest
+
+    def test_missing_invalid_or_other_format(self, tmp_path):
+        assert load_manifest(tmp_path / "missing.json") is None
+        bad = tmp_path / "bad.json"
+        bad.write_text("not json")
+        assert load_manifest(bad) is None
+        old = tmp_path / "old.json"
+        old.write_text(json.dumps({"format_version": 0, "tools": []}))
+        assert load_manifest(old) is None
+
+    def test_drift_ignores_server_version(self, manifest):
+        other = json.loads(json.dumps(manifest))
+        other["server_version"] = "99.0"
+        assert manifest_drift(manifest, other) == []
+
+        other["tools"][0]["description"] = "Changed."
+        other["tools"].pop()
+        other["tools"].append({"name": "new_tool"})
+
+        assert manifest_drift(manifest, other) == [
+            "missing tool: wave",
+            "unexpected tool: new_tool",
+            "changed tool: greet (description)",
+        ]
+
+    def test_optimizer_definitions(self, manifest):
+        definitions = optimizer_definitions(manifest, {"greet"})
+
+        assert definitions == {
+            "greet": {
+                "name": "greet",
+                "description": "Say hello to someone.",
+                "inputSchema": manifest["tools"][0]["parameters"],
+                "service": "fake",
+            }
+        }
+
+
+def test_manifest_matches_code():
+    """Fails when a tool changed without regenerating core/tool_manifest.json."""
+    result = subprocess.run(
+        [sys.executable, "-m", "core.tool_manifest", "check"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_manifest_lists_every_tool_the_modules_register():
+    """Eager and lazy startup must list the same tools (see core.comments)."""
+    script = textwrap.dedent(
+        """
+        import json
+        from core.server import server
+        from core.tool_manifest import build_manifest, import_tool_modules
+
+        before = set(server._tool_manager._tools)
+        manifest = build_manifest(server, import_tool_modules(server))
+        print(json.dumps({
+            "manifest": sorted(tool["name"] for tool in manifest["tools"]),
+            "registry": sorted(set(server._tool_manager._tools) - before),
+        }))
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    assert result.returncode == 0, result.stderr
+    names = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert names["manifest"] == names["registry"]
+    assert "read_document_comments" in names["manifest"]
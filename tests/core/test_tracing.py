@@ -0,0 +1,269 @@
+"""Tests for tool-call and Google API tracing."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from google.oauth2.credentials import Credentials
+
+from auth import service_cache
+from auth.auth_info_middleware import AuthInfoMiddleware
+from auth.discovery_documents import build_service
+from core import async_http, tracing
+from core.async_http import execute_async
+from core.tracing import (
+    STATUS_ERROR,
+    BatchSpanProcessor,
+    FileSpanExporter,
+    InMemorySpanExporter,
+    OtlpHttpSpanExporter,
+    Span,
+    configure_tracing,
+    parse_traceparent,
+    start_span,
+    traced,
+)
+
+TRACEPARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+@pytest.fixture
+def exporter():
+    memory = InMemorySpanExporter()
+    configure_tracing(memory, processor="simple")
+    yield memory
+    configure_tracing(None)
+
+
+def _by_name(spans):
+    return {span.name: span for span in spans}
+
+
+class TestSpans:
+    """Tests for span nesting, errors and sampling."""
+
+    def test_children_share_trace_and_point_at_parent(self, exporter):
+        with start_span("root") as root:
+            with start_span("child", {"k": "v"}) as child:
+                pass
+
+        spans = _by_name(exporter.get_finished_spans())
+        assert spans["child"].trace_id == root.trace_id
+        assert spans["child"].parent_span_id == root.span_id
+        assert spans["root"].parent_span_id is None
+        assert child.attributes == {"k": "v"}
+        assert child.end_ns >= child.start_ns
+
+    def test_exception_is_recorded(self, exporter):
+        with pytest.raises(ValueError):
+            with start_span("failing"):
+                raise ValueError("bad input")
+
+        (span,) = exporter.get_finished_spans()
+        assert span.status_code == STATUS_ERROR
+        assert span.events[0]["attributes"]["exception.message"] == "bad input"
+
+    def test_disabled_tracing_yields_none(self):
+        configure_tracing(None)
+
+        with start_span("anything") as span:
+            assert span is None
+
+    def test_unsampled_trace_records_nothing(self):
+        memory = InMemorySpanExporter()
+        configure_tracing(memory, sample_ratio=0.0, processor="simple")
+        try:
+            with start_span("root"):
+                with start_span("child") as child:
+                    child.set_attribute("k", "v")
+        finally:
+            configure_tracing(None)
+
+        assert memory.get_finished_spans() == []
+        assert child.attributes == {}
+
+    def test_sampled_remote_parent_overrides_ratio(self):
+        memory = InMemorySpanExporter()
+        configure_tracing(memory, sample_ratio=0.0, processor="simple")
+        try:
+            with start_span("tools/call x", traceparent=TRACEPARENT):
+                pass
+        finally:
+            configure_tracing(None)
+
+        (span,) = memory.get_finished_spans()
+        assert span.trace_id == "0af7651916cd43dd8448eb211c80319c"
+        assert span.parent_span_id == "b7ad6b7169203331"
+
+    @pytest.mark.parametrize(
+        "header",
+        [
+            None,
+            "garbage",
+            "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331",
+            "00-00000000000000000000000000000000-b7ad6b7169203331-01",
+            "00-0af7651916cd43dd8448eb211c80319c-xyz-01",
+        ],
+    )
+    def test_invalid_traceparent_is_ignored(self, header):
+        assert parse_traceparent(header) is None
+
+    async def test_traced_decorator(self, exporter):
+        @traced("sync_step")
+        def sync_step(x):
+            return x * 2
+
+        @traced()
+        async def async_step():
+            return sync_step(2)
+
+        assert await async_step() == 4
+
+        spans = _by_name(exporter.get_finished_spans())
+        parent = spans[f"{__name__}.{async_step.__qualname__}"]
+        assert spans["sync_step"].parent_span_id == parent.span_id
+
+
+class TestExporters:
+    """Tests for the batch processor and OTLP/JSON exporters."""
+
+    def _span(self):
+        span = Span("op", "a" * 32, "b" * 16, attributes={"n": 3, "ok": True})
+        span.end_ns = span.start_ns + 1000
+        return span
+
+    def test_batch_processor_flushes_in_background(self):
+        memory = InMemorySpanExporter()
+        processor = BatchSpanProcessor(memory, schedule_delay=60)
+        try:
+            processor.on_end(self._span())
+            processor.force_flush()
+            assert len(memory.get_finished_spans()) == 1
+        finally:
+            processor.shutdown()
+
+    def test_batch_processor_drops_when_full(self):
+        memory = InMemorySpanExporter()
+        processor = BatchSpanProcessor(memory, max_queue_size=1, schedule_delay=60)
+        dropped = tracing.get_tracing_stats()["spans_dropped"]
+        with processor._condition:
+            processor.on_end(self._span())
+            processor.on_end(self._span())
+        processor.shutdown()
+
+        assert tracing.get_tracing_stats()["spans_dropped"] == dropped + 1
+        assert len(memory.get_finished_spans()) == 1
+
+    def test_file_exporter_writes_otlp_json_lines(self, tmp_path):
+        path = tmp_path / "traces.jsonl"
+        exporter = FileSpanExporter(str(path))
+
+        exporter.export([self._span()])
+        exporter.export([self._span()])
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        resource_spans = json.loads(lines[0])["resourceSpans"][0]
+        (span,) = resource_spans["scopeSpans"][0]["spans"]
+        assert span["traceId"] == "a" * 32
+        assert {"key": "n", "value": {"intValue": "3"}} in span["attributes"]
+        assert {"key": "ok", "value": {"boolValue": True}} in span["attributes"]
+
+    def test_otlp_exporter_posts_json(self, monkeypatch):
+        monkeypatch.setenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://collector:4318/")
+        monkeypatch.setenv("OTEL_EXPORTER_OTLP_HEADERS", "authorization=Bearer%20x")
+        exporter = OtlpHttpSpanExporter()
+        response = MagicMock(status=200)
+        response.__enter__.return_value = response
+
+        with patch.object(
+            tracing.urllib.request, "urlopen", return_value=response
+        ) as urlopen:
+            assert exporter.export([self._span()]) is True
+
+        request = urlopen.call_args[0][0]
+        assert request.full_url == "http://collector:4318/v1/traces"
+        assert request.get_header("Authorization") == "Bearer x"
+        assert json.loads(request.data)["resourceSpans"]
+
+    def test_otlp_exporter_reports_failure(self):
+        exporter = OtlpHttpSpanExporter("http://collector:4318/v1/traces")
+
+        with patch.object(
+            tracing.urllib.request, "urlopen", side_effect=OSError("refused")
+        ):
+            assert exporter.export([self._span()]) is False
+
+
+class TestInstrumentation:
+    """Tests for spans emitted by the middleware, auth and HTTP layers."""
+
+    @pytest.fixture
+    def google(self):
+        statuses = []
+
+        def handler(request):
+            status = statuses.pop(0) if statuses else 200
+            return httpx.Response(status, json={"id": "abc"})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch.object(async_http, "_get_client", return_value=client):
+            yield statuses
+
+    async def test_tool_call_span_parents_api_requests(self, exporter, google):
+        middleware = AuthInfoMiddleware()
+        context = SimpleNamespace(
+            message=SimpleNamespace(name="get_drive_file"), fastmcp_context=None
+        )
+
+        async def call_next(ctx):
+            drive = build_service("drive", "v3", Credentials(token="ya29.valid"))
+            return await execute_async(drive.files().get(fileId="abc"))
+
+        await middleware.on_call_tool(context, call_next)
+
+        spans = _by_name(exporter.get_finished_spans())
+        tool = spans["tools/call get_drive_file"]
+        request = spans["google.api drive.files.get"]
+        assert request.parent_span_id == tool.span_id
+        assert request.attributes["http.response.status_code"] == 200
+        assert request.attributes["server.address"] == "www.googleapis.com"
+        assert tool.attributes["mcp.tool.name"] == "get_drive_file"
+
+    async def test_retries_are_annotated(self, exporter, google):
+        google.extend([503])
+        drive = build_service("drive", "v3", Credentials(token="ya29.valid"))
+
+        async def no_sleep(delay, status, uri):
+            pass
+
+        with patch.object(async_http, "sleep_before_retry", side_effect=no_sleep):
+            await execute_async(drive.files().get(fileId="abc"))
+
+        (span,) = [
+            s for s in exporter.get_finished_spans() if s.name.startswith("google")
+        ]
+        assert span.attributes["google.api.retries"] == 1
+        assert span.events[0]["name"] == "retry"
+
+    def test_service_build_span(self, exporter):
+        service_cache.clear_service_cache()
+        credentials = Credentials(token="ya29.valid")
+
+        with patch.object(service_cache, "build_service", return_value=object()):
+            service_cache.get_or_build_service(
+                "drive", "v3", credentials, "a@example.com"
+            )
+            service_cache.get_or_build_service(
+                "drive", "v3", credentials, "a@example.com"
+            )
+        service_cache.clear_service_cache()
+
+        builds = [
+            s
+            for s in exporter.get_finished_spans()
+            if s.name == "service.build drive v3"
+        ]
+        assert len(builds) == 1
@@ -197,6 +197,48 @@ class ToolTester:
             raise
 
 
+def list_manifest_tools(manifest: Dict[str, Any]) -> None:
+    """Print all tools from the tool manifest, without importing them."""
+    print("\n📋 Available Tools:")
+    print("=" * 60)
+    for entry in manifest["tools"]:
+        desc = (
+            entry["description"].split("\n")[0]
+            if entry["description"]
+            else "No description"
+        )
+        tier = f" [{entry['service']}, {entry['tier']}]" if entry.get("tier") else ""
+        print(f"  • {entry['name']}{tier}")
+        print(f"    {desc}")
+        print()
+
+
+def get_manifest_tool_info(manifest: Dict[str, Any], tool_name: str) -> None:
+    """Print a tool's description and parameters from the tool manifest."""
+    entry = next((t for t in manifest["tools"] if t["name"] == tool_name), None)
+    if entry is None:
+        print(f"❌ Tool '{tool_name}' not found.")
+        return
+
+    print(f"\n🔧 Tool: {tool_name}")
+    print("=" * 60)
+    print(f"Service: {entry['service']}  Tier: {entry.get('tier') or 'none'}")
+    print(f"Description: {entry['description']}")
+    print("\nParameters:")
+    schema = entry["parameters"] or {}
+    required = set(schema.get("required", []))
+    for param_name, param in schema.get("properties", {}).items():
+        param_type = param.get("type") or " | ".join(
+            option.get("type", "Any") for option in param.get("anyOf", [])
+        )
+        if param_name in required:
+            default = ""
+        else:
+            default = f" = {param.get('default')}"
+        print(f"  • {param_name}: {param_type or 'Any'}{default}")
+    print()
+
+
 def interactive_mode(tester: ToolTester):
     """Run an interactive REPL for testing tools."""
     print("\n🎯 Interactive Test Mode")
@@ -430,6 +472,19 @@ def main():
 
         return tool_kwargs
 
+    # Listing and describing tools only needs metadata: read the manifest
+    # instead of importing every tool module
+    if (args.list or args.info) and not (args.interactive or args.tool):
+        from core.tool_manifest import load_manifest
+
+        manifest = load_manifest()
+        if manifest is not None:
+            if args.list:
+                list_manifest_tools(manifest)
+            else:
+                get_manifest_tool_info(manifest, args.info)
+            return
+
     # Initialize server
     print("🔧 Initializing server...")
     try: